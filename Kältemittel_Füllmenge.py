@@ -6,77 +6,68 @@
 
 import streamlit as st
 import os
-import numpy as np
 import plotly.graph_objects as go
 from datetime import datetime
-from fpdf import FPDF
-import base64
 
 APP_VERSION = "4.2"
 HEUTIGES_DATUM = datetime.now().strftime("%d.%m.%Y")
 
+# --- PFADE (app-relativ; __app_paths__ wird vom Launcher injiziert) ---
+try:
+    PATHS = __app_paths__
+except NameError:
+    from coolsulting.paths import fuer_datei
+    PATHS = fuer_datei(__file__)
+from coolsulting import assets, history
+from coolsulting.engines.fuellmenge import berechne_fuellmenge
+from coolsulting.trace import span
+
 # --- FONT LADEN ---
 def get_font_base64(font_path):
-    if os.path.exists(font_path):
-        with open(font_path, "rb") as f:
-            return base64.b64encode(f.read()).decode()
-    return None
+    # Prozessweit gecacht (coolsulting.assets) – kein Neueinlesen pro Rerun
+    return assets.b64(PATHS.datei(font_path))
 
 # --- PDF KLASSE ---
-class PDF(FPDF):
-    def __init__(self):
-        super().__init__()
+def get_pdf_class():
+    """PDF-Klasse bauen – fpdf wird erst beim Export importiert."""
+    from fpdf import FPDF
+
+    class PDF(FPDF):
+        def __init__(self):
+            super().__init__()
         
-        font_path = "POE_Vetica_UI.ttf"
-        if os.path.exists(font_path):
-            self.add_font('POE', '', font_path, uni=True)
-            self.add_font('POE', 'B', font_path, uni=True)
-            self.font_loaded = True
-        else:
-            self.font_loaded = False
-    
-    def _set_font(self, style='', size=10):
-        if self.font_loaded:
-            self.set_font('POE', style, size)
-        else:
-            self.set_font("Helvetica", style, size)
+            font_path = PATHS.datei("POE_Vetica_UI.ttf")
+            if os.path.exists(font_path):
+                self.add_font('POE', '', font_path, uni=True)
+                self.add_font('POE', 'B', font_path, uni=True)
+                self.font_loaded = True
+            else:
+                self.font_loaded = False
     
-    def header(self):
-        self.set_fill_color(54, 169, 225)
-        self.rect(0, 0, 210, 40, 'F') 
-        self.set_y(12)
-        self.set_x(10)
-        self.set_text_color(255, 255, 255)
-        self._set_font('B', 18)
-        self.cell(0, 10, 'Fuellmengen Check', 0, 1, 'L')
-        self._set_font('', 10)
-        self.cell(0, 5, 'Max. Fuellmenge nach OENORM EN 378', 0, 1, 'L')
-
-    def footer(self):
-        self.set_y(-15)
-        self._set_font('I', 8)
-        self.set_text_color(150, 150, 150)
-        self.cell(0, 5, "Haftungsausschluss: Nur zur technischen Orientierung.", 0, 0, 'C')
-
-# --- BERECHNUNGSLOGIK ---
-def berechne_fuellmenge(gas, flaeche, hoehe, einbau):
-    v_raum = flaeche * hoehe
-    daten = {"R32": {"atel": 0.300, "lfl": 0.307}, "R410A": {"atel": 0.420, "lfl": 0.442}}
+        def _set_font(self, style='', size=10):
+            if self.font_loaded:
+                self.set_font('POE', style, size)
+            else:
+                self.set_font("Helvetica", style, size)
     
-    m_tox = daten[gas]["atel"] * v_raum
-    
-    h0_dict = {"Deckeneinbau": 2.2, "Wandmontage": 1.8, "Bodenaufstellung": 0.6}
-    h0 = h0_dict[einbau]
-    
-    if gas == "R32":
-        m_burn = 2.5 * (daten[gas]["lfl"]**1.25) * h0 * np.sqrt(flaeche)
-        m_burn = max(m_burn, 1.8)
-    else:
-        m_burn = 999.0
-        
-    m_max = min(m_tox, m_burn)
-    grund = "Toxizitaet" if m_tox < m_burn else "Brennbarkeit"
-    return m_max, v_raum, grund
+        def header(self):
+            self.set_fill_color(54, 169, 225)
+            self.rect(0, 0, 210, 40, 'F') 
+            self.set_y(12)
+            self.set_x(10)
+            self.set_text_color(255, 255, 255)
+            self._set_font('B', 18)
+            self.cell(0, 10, 'Fuellmengen Check', 0, 1, 'L')
+            self._set_font('', 10)
+            self.cell(0, 5, 'Max. Fuellmenge nach OENORM EN 378', 0, 1, 'L')
+
+        def footer(self):
+            self.set_y(-15)
+            self._set_font('I', 8)
+            self.set_text_color(150, 150, 150)
+            self.cell(0, 5, "Haftungsausschluss: Nur zur technischen Orientierung.", 0, 0, 'C')
+
+    return PDF
 
 # --- MAIN APP ---
 def main():
@@ -86,12 +77,12 @@ def main():
 
     st.set_page_config(page_title="Füllmengen Check", layout="wide")
     
-    font_b64 = get_font_base64("POE_Vetica_UI.ttf")
+    font_css = assets.font_face_css('POE Helvetica UI', PATHS.datei("POE_Vetica_UI.ttf"))
 
     # CSS
     st.markdown(f"""
         <style>
-        {f"@font-face {{ font-family: 'POE Helvetica UI'; src: url(data:font/ttf;base64,{font_b64}) format('truetype'); }}" if font_b64 else ""}
+        {font_css}
         
         .stApp {{ background-color: {BG_COLOR}; }}
         * {{ color: {TEXT_GRAU} !important; font-family: 'POE Helvetica UI', 'Segoe UI', sans-serif !important; }}
@@ -157,14 +148,8 @@ def main():
     if calc_btn:
         m_max, v_raum, grund = berechne_fuellmenge(gas, flaeche, hoehe, einbau)
 
-        if "verlauf_heute" not in st.session_state:
-            st.session_state.verlauf_heute = []
-        st.session_state.verlauf_heute.append({
-            "uhrzeit": datetime.now().strftime("%H:%M Uhr"),
-            "modul": "Kältemittel-Füllmenge",
-            "bezeichnung": f"{kunde} | {raum} | {gas}",
-            "ergebnis": f"Max. Füllmenge: {m_max:.3f} kg"
-        })
+        history.eintragen("Kältemittel-Füllmenge", f"{kunde} | {raum} | {gas}",
+                          {"Max. Füllmenge": (m_max, "kg")}, projekt=kunde)
         st.markdown('<div style="margin-top: 30px;"></div>', unsafe_allow_html=True)
         
         res_l, res_r = st.columns([1, 1])
@@ -199,7 +184,7 @@ def main():
             st.markdown('</div>', unsafe_allow_html=True)
 
         # PDF REPORT
-        pdf = PDF()
+        pdf = get_pdf_class()()
         pdf.add_page()
         pdf._set_font("B", 14)
         pdf.cell(0, 10, f"Projekt: {kunde}", 0, 1)
@@ -212,7 +197,9 @@ def main():
         pdf.cell(0, 15, f"ERGEBNIS: {m_max:.3f} kg", 0, 1, 'C', fill=True)
         
         pdf_name = f"Fuellmengen_{kunde.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf"
-        st.download_button("📄 PDF BERICHT SPEICHERN", data=bytes(pdf.output()), file_name=pdf_name)
+        with span("Kaeltemittel.pdf_output"):
+            pdf_bytes = bytes(pdf.output())
+        st.download_button("📄 PDF BERICHT SPEICHERN", data=pdf_bytes, file_name=pdf_name)
 
 if __name__ == '__main__':
     main()
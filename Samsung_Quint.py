@@ -8,17 +8,24 @@
 
 import streamlit as st
 import os
-import base64
 import uuid
 from datetime import datetime, date
 import pandas as pd
 
+# --- PFADE (app-relativ; __app_paths__ wird vom Launcher injiziert) ---
+try:
+    PATHS = __app_paths__
+except NameError:
+    from coolsulting.paths import fuer_datei
+    PATHS = fuer_datei(__file__)
+from coolsulting import assets
+
 # ============================================================
 # SEITE KONFIGURIEREN
 # ============================================================
 try:
     from PIL import Image
-    icon_image = Image.open("Coolsulting_Logo_ohneHG_weiß_grau.png")
+    icon_image = Image.open(PATHS.datei("Coolsulting_Logo_ohneHG_weiß_grau.png"))
     st.set_page_config(page_title="coolQUINT | Samsung Quint Auslegung", page_icon=icon_image, layout="wide", initial_sidebar_state="collapsed")
 except Exception:
     st.set_page_config(page_title="coolQUINT | Samsung Quint Auslegung", layout="wide", initial_sidebar_state="collapsed")
@@ -26,96 +33,12 @@ except Exception:
 # ============================================================
 # PRODUKTDATEN
 # ============================================================
-AUSSENGERAETE = {
-    "ODU 12.5 kW (1-phasig)": {
-        "artikelnr": "AE125HCTPES/EU", "kuehl_kw": 12.5, "heiz_kw": 12.5,
-        "schall_db": "51 / 49", "schallleistung_db": 62,
-        "abmessungen": "1270 × 850 × 500", "gewicht_kg": 126.5,
-        "spannung": "230V / 1Ph", "mca_a": 32.0, "phase": "1-phasig",
-    },
-    "ODU 16.0 kW (1-phasig)": {
-        "artikelnr": "AE160HCTPES/EU", "kuehl_kw": 14.5, "heiz_kw": 16.0,
-        "schall_db": "55 / 49", "schallleistung_db": 62,
-        "abmessungen": "1270 × 850 × 500", "gewicht_kg": 126.5,
-        "spannung": "230V / 1Ph", "mca_a": 32.0, "phase": "1-phasig",
-    },
-    "ODU 12.5 kW (3-phasig)": {
-        "artikelnr": "AE125HCTPGS/EU", "kuehl_kw": 12.5, "heiz_kw": 12.5,
-        "schall_db": "51 / 49", "schallleistung_db": 62,
-        "abmessungen": "1270 × 850 × 500", "gewicht_kg": 126.5,
-        "spannung": "400V / 3Ph", "mca_a": 16.1, "phase": "3-phasig",
-    },
-    "ODU 16.0 kW (3-phasig)": {
-        "artikelnr": "AE160HCTPGS/EU", "kuehl_kw": 14.5, "heiz_kw": 16.0,
-        "schall_db": "55 / 49", "schallleistung_db": 62,
-        "abmessungen": "1270 × 850 × 500", "gewicht_kg": 126.5,
-        "spannung": "400V / 3Ph", "mca_a": 16.1, "phase": "3-phasig",
-    },
-}
-
-HYDRO_UNITS = {
-    "ClimateHub 200L – 1 Zone": {
-        "artikelnr": "AE200DNWMPK/EU", "zonen": 1, "typ": "ClimateHub",
-        "speicher_l": 200, "schall_db": 28, "schallleistung_db": 42,
-        "abmessungen": "598 × 1850 × 600", "gewicht_kg": 132,
-        "spannung": "230V / 400V", "mca_a": 18.3,
-        "beschreibung": "Standgerät mit integriertem 200L Warmwasserspeicher – 1 Heizkreis",
-    },
-    "ClimateHub 200L – 2 Zonen": {
-        "artikelnr": "AE200DNXMPK/EU", "zonen": 2, "typ": "ClimateHub",
-        "speicher_l": 200, "schall_db": 30, "schallleistung_db": 44,
-        "abmessungen": "598 × 1850 × 600", "gewicht_kg": 139,
-        "spannung": "230V / 400V", "mca_a": 18.7,
-        "beschreibung": "Standgerät mit integriertem 200L Speicher – 2 Heizkreise",
-    },
-    "Hydro Unit – 1 Zone": {
-        "artikelnr": "AE160DNYMPK/EU", "zonen": 1, "typ": "Hydro Unit",
-        "speicher_l": 0, "schall_db": 28, "schallleistung_db": 42,
-        "abmessungen": "530 × 840 × 350", "gewicht_kg": 43,
-        "spannung": "230V / 400V", "mca_a": 18.3,
-        "beschreibung": "Kompakte Wandmontage, externer Speicher nötig – 1 Heizkreis",
-    },
-    "Hydro Unit – 2 Zonen": {
-        "artikelnr": "AE160DNZMPK/EU", "zonen": 2, "typ": "Hydro Unit",
-        "speicher_l": 0, "schall_db": 30, "schallleistung_db": 44,
-        "abmessungen": "530 × 840 × 350", "gewicht_kg": 54,
-        "spannung": "230V / 400V", "mca_a": 18.7,
-        "beschreibung": "Kompakte Wandmontage, externer Speicher nötig – 2 Heizkreise",
-    },
-}
-
-INNENGERAETE = {
-    "DVM Wandgerät 1.5 kW":  {"artikelnr": "AE015HEADKG/EU",  "kategorie": "DVM Wandgerät",  "kuehl_kw": 1.5, "heiz_kw": 1.7, "schall_db": "31/30/29", "abmessungen": "682×299×215",  "gewicht_kg": 7.8,  "mca_a": 0.16},
-    "DVM Wandgerät 2.2 kW":  {"artikelnr": "AE022HEADKG/EU",  "kategorie": "DVM Wandgerät",  "kuehl_kw": 2.2, "heiz_kw": 2.5, "schall_db": "33/31/29", "abmessungen": "682×299×215",  "gewicht_kg": 7.8,  "mca_a": 0.20},
-    "DVM Wandgerät 2.8 kW":  {"artikelnr": "AE028HEADKG/EU",  "kategorie": "DVM Wandgerät",  "kuehl_kw": 2.8, "heiz_kw": 3.2, "schall_db": "34/33/31", "abmessungen": "820×299×215",  "gewicht_kg": 9.2,  "mca_a": 0.25},
-    "DVM Wandgerät 3.6 kW":  {"artikelnr": "AE036HEADKG/EU",  "kategorie": "DVM Wandgerät",  "kuehl_kw": 3.6, "heiz_kw": 4.0, "schall_db": "39/36/33", "abmessungen": "820×299×215",  "gewicht_kg": 9.2,  "mca_a": 0.31},
-    "DVM Wandgerät 5.6 kW":  {"artikelnr": "AM056DNVDKG/EU",  "kategorie": "DVM Wandgerät",  "kuehl_kw": 5.6, "heiz_kw": 6.3, "schall_db": "40/37/34", "abmessungen": "1055×299×215", "gewicht_kg": 12.0, "mca_a": 0.44},
-    "DVM Wandgerät 7.1 kW":  {"artikelnr": "AM071DNVDKG/EU",  "kategorie": "DVM Wandgerät",  "kuehl_kw": 6.8, "heiz_kw": 7.0, "schall_db": "43/40/37", "abmessungen": "1055×299×215", "gewicht_kg": 12.0, "mca_a": 0.50},
-    "1-Weg Kassette 1.7 kW": {"artikelnr": "AM017DN1DKG/EU",  "kategorie": "1-Weg Kassette", "kuehl_kw": 1.7, "heiz_kw": 1.9, "schall_db": "28/26/24", "abmessungen": "740×135×360",  "gewicht_kg": 8.0,  "mca_a": 0.18},
-    "1-Weg Kassette 2.2 kW": {"artikelnr": "AM022DN1DKG/EU",  "kategorie": "1-Weg Kassette", "kuehl_kw": 2.2, "heiz_kw": 2.5, "schall_db": "29/26/24", "abmessungen": "740×135×360",  "gewicht_kg": 8.0,  "mca_a": 0.18},
-    "1-Weg Kassette 2.8 kW": {"artikelnr": "AM028DN1DKG/EU",  "kategorie": "1-Weg Kassette", "kuehl_kw": 2.8, "heiz_kw": 3.2, "schall_db": "32/28/24", "abmessungen": "970×135×410",  "gewicht_kg": 10.0, "mca_a": 0.29},
-    "1-Weg Kassette 3.6 kW": {"artikelnr": "AM036DN1DKG/EU",  "kategorie": "1-Weg Kassette", "kuehl_kw": 3.6, "heiz_kw": 4.0, "schall_db": "37/33/30", "abmessungen": "970×135×410",  "gewicht_kg": 10.0, "mca_a": 0.31},
-    "1-Weg Kassette 5.6 kW": {"artikelnr": "AM056DN1DKG/EU",  "kategorie": "1-Weg Kassette", "kuehl_kw": 5.6, "heiz_kw": 6.3, "schall_db": "41/38/35", "abmessungen": "1200×138×450", "gewicht_kg": 13.5, "mca_a": 0.35},
-    "LSP Kanalgerät 2.2 kW": {"artikelnr": "AM022DNLDKG/EU",  "kategorie": "LSP Kanalgerät", "kuehl_kw": 2.2, "heiz_kw": 2.5, "schall_db": "26/23/19", "abmessungen": "700×199×440",  "gewicht_kg": 15.9, "mca_a": 0.38},
-    "LSP Kanalgerät 2.8 kW": {"artikelnr": "AM028DNLDKG/EU",  "kategorie": "LSP Kanalgerät", "kuehl_kw": 2.8, "heiz_kw": 3.2, "schall_db": "28/24/19", "abmessungen": "700×199×440",  "gewicht_kg": 15.9, "mca_a": 0.45},
-    "LSP Kanalgerät 3.6 kW": {"artikelnr": "AM036DNLDKG/EU",  "kategorie": "LSP Kanalgerät", "kuehl_kw": 3.6, "heiz_kw": 4.0, "schall_db": "31/26/20", "abmessungen": "700×199×440",  "gewicht_kg": 16.3, "mca_a": 0.53},
-    "LSP Kanalgerät 5.6 kW": {"artikelnr": "AM056DNLDKG/EU",  "kategorie": "LSP Kanalgerät", "kuehl_kw": 5.6, "heiz_kw": 6.3, "schall_db": "34/30/26", "abmessungen": "900×199×440",  "gewicht_kg": 19.3, "mca_a": 0.92},
-    "MSP Kanalgerät 3.6 kW": {"artikelnr": "AM036DNMDKG/EU",  "kategorie": "MSP Kanalgerät", "kuehl_kw": 3.6, "heiz_kw": 4.0, "schall_db": "30/27/24", "abmessungen": "850×250×700",  "gewicht_kg": 27.0, "mca_a": 0.81},
-    "MSP Kanalgerät 5.6 kW": {"artikelnr": "AM056DNMDKG/EU",  "kategorie": "MSP Kanalgerät", "kuehl_kw": 5.6, "heiz_kw": 6.3, "schall_db": "32/29/25", "abmessungen": "850×250×700",  "gewicht_kg": 27.0, "mca_a": 1.08},
-    "MSP Kanalgerät 7.1 kW": {"artikelnr": "AM071DNMDKG/EU",  "kategorie": "MSP Kanalgerät", "kuehl_kw": 7.1, "heiz_kw": 8.0, "schall_db": "36/32/27", "abmessungen": "850×250×700",  "gewicht_kg": 27.0, "mca_a": 1.48},
-    "MSP Kanalgerät 9.0 kW": {"artikelnr": "AM090DNMDKG/EU",  "kategorie": "MSP Kanalgerät", "kuehl_kw": 9.0, "heiz_kw": 10.0,"schall_db": "37/33/29", "abmessungen": "1200×250×700", "gewicht_kg": 34.2, "mca_a": 1.78},
-}
-
-KASSETTEN_PANEELE = {
-    "Paneel klein  (960mm)":   {"artikelnr": "PC1MWFMANW", "abmessungen": "960×34×420",  "gewicht_kg": 2.6},
-    "Paneel mittel (1198mm)":  {"artikelnr": "PC1NWFMANW", "abmessungen": "1198×34×500", "gewicht_kg": 4.3},
-    "Paneel groß   (1410mm)":  {"artikelnr": "PC1BWFMANW", "abmessungen": "1410×34×500", "gewicht_kg": 5.0},
-}
-
-ZUBEHOER_STANDARD = {
-    "Control Kit (Regeleinheit) – MIM-E03FN": "MIM-E03FN",
-    "Kabelfernbedienung – MWR-WW10N":         "MWR-WW10N",
-}
+# Geräte in der gemeinsamen Produktdatenbank (coolsulting.engines.produkte)
+from coolsulting.engines.produkte import (
+    QUINT_AUSSENGERAETE as AUSSENGERAETE, QUINT_HYDRO_UNITS as HYDRO_UNITS,
+    QUINT_INNENGERAETE as INNENGERAETE, QUINT_PANEELE as KASSETTEN_PANEELE,
+    QUINT_ZUBEHOER as ZUBEHOER_STANDARD, produkte,
+)
 
 DAEMMSTANDARD = {
     "Altbau ungedämmt (vor 1978)":      {"u_wert": 1.2, "faktor": 130},
@@ -136,15 +59,12 @@ PUFFER_EINBINDUNG = [
 # HILFSFUNKTIONEN
 # ============================================================
 def get_font_as_base64(font_path):
-    if os.path.exists(font_path):
-        with open(font_path, "rb") as f:
-            return base64.b64encode(f.read()).decode()
-    return None
+    # Prozessweit gecacht (coolsulting.assets)
+    return assets.b64(PATHS.datei(font_path))
 
 def render_css(bg, text):
-    fb = get_font_as_base64("POE Vetica UI.ttf") or get_font_as_base64("POE_Vetica_UI.ttf")
-    ff = (f"@font-face{{font-family:'POE Helvetica UI';"
-          f"src:url(data:font/ttf;base64,{fb}) format('truetype');}}" if fb else "")
+    ff = (assets.font_face_css('POE Helvetica UI', PATHS.datei("POE Vetica UI.ttf"))
+          or assets.font_face_css('POE Helvetica UI', PATHS.datei("POE_Vetica_UI.ttf")))
     st.markdown(f"""<style>
     {ff}
     html,body,[data-testid="stAppViewContainer"],*{{font-family:'POE Helvetica UI','Segoe UI',sans-serif!important;}}
@@ -214,7 +134,7 @@ def auto_projekt_id() -> str:
 def main():
     BG    = "#36A9E1"
     TEXT  = "#3C3C3B"
-    LOGO  = "Coolsulting_Logo_ohneHG_outlines_weiß.png"
+    LOGO  = PATHS.datei("Coolsulting_Logo_ohneHG_outlines_weiß.png")
     VER   = "2.1.2"
     ZEIT  = datetime.now().strftime("%d.%m.%Y | %H:%M Uhr")
 
@@ -926,12 +846,15 @@ def main():
     st.markdown("### Stückliste")
 
     pos = []
+    preise = produkte()
 
     def add(menge, kat, bez, artnr, kw_k="–", kw_h="–", abm="–", gew="–"):
+        preis = preise.preis(artnr)
         pos.append({"Pos": len(pos)+1, "Menge": menge, "Kategorie": kat,
                     "Bezeichnung": bez, "Artikelnummer": artnr,
                     "Kühl kW": kw_k, "Heiz kW": kw_h,
-                    "Abmessungen mm": abm, "Gewicht kg": gew})
+                    "Abmessungen mm": abm, "Gewicht kg": gew,
+                    "Listenpreis €": f"{preis:.2f}" if preis is not None else "–"})
 
     add(1, "Außengerät", odu_wahl, odu["artikelnr"],
         odu["kuehl_kw"], odu["heiz_kw"], odu["abmessungen"], odu["gewicht_kg"])
@@ -979,6 +902,11 @@ def main():
     df = pd.DataFrame(pos).astype(str)
     df = df.replace("nan", "–")
     st.dataframe(df, use_container_width=True, hide_index=True)
+    gelistet = [p for p in pos if p["Listenpreis €"] != "–"]
+    if gelistet:
+        summe = sum(p["Menge"] * float(p["Listenpreis €"]) for p in gelistet)
+        st.caption(f"Summe Listenpreise: {summe:,.2f} € netto – {len(gelistet)} von {len(pos)} "
+                   f"Positionen in der Samsung-Preisliste".replace(",", "X").replace(".", ",").replace("X", "."))
 
     # --- EXPORT ---
     st.markdown("---")
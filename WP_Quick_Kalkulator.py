@@ -7,13 +7,18 @@
 import streamlit as st
 import os
 import plotly.graph_objects as go
-import base64
+
+# --- PFADE (app-relativ; __app_paths__ wird vom Launcher injiziert) ---
+try:
+    PATHS = __app_paths__
+except NameError:
+    from coolsulting.paths import fuer_datei
+    PATHS = fuer_datei(__file__)
+from coolsulting import assets, history
 
 def get_font_base64(font_path):
-    if os.path.exists(font_path):
-        with open(font_path, "rb") as f:
-            return base64.b64encode(f.read()).decode()
-    return None
+    # Prozessweit gecacht (coolsulting.assets) – kein Neueinlesen pro Rerun
+    return assets.b64(PATHS.datei(font_path))
 
 def main():
     # FARBEN
@@ -25,12 +30,12 @@ def main():
     BTN_TEXT = "#3C3C3B"
 
     # Font laden
-    font_b64 = get_font_base64("POE_Vetica_UI.ttf")
+    font_css = assets.font_face_css('POE Helvetica UI', PATHS.datei("POE_Vetica_UI.ttf"))
 
     # CSS STYLING
     st.markdown(f"""
         <style>
-        {f"@font-face {{ font-family: 'POE Helvetica UI'; src: url(data:font/ttf;base64,{font_b64}) format('truetype'); }}" if font_b64 else ""}
+        {font_css}
         
         * {{ 
             color: {TEXT_MAIN} !important; 
@@ -75,7 +80,7 @@ def main():
         st.markdown(f'<h1 class="header-text">WP Quick-Kalkulator</h1>', unsafe_allow_html=True)
         st.markdown(f'<p class="header-text" style="font-size: 20px;">Heizlast-Ermittlung nach Verbrauch</p>', unsafe_allow_html=True)
     with col2:
-        logo = "Coolsulting_Logo_ohneHG_outlines_weiss.png"
+        logo = PATHS.datei("Coolsulting_Logo_ohneHG_outlines_weiss.png")
         if os.path.exists(logo):
             st.image(logo, use_container_width=True)
         st.markdown('<div class="quickie-style">Quickie</div>', unsafe_allow_html=True)
@@ -154,14 +159,8 @@ def main():
             
             hl, heiz_e, ww_e, verlust_e, pfad = calculate_heizlast(input_kwh, wirk_gas, ww_gas_active, pers_gas)
 
-            if "verlauf_heute" not in st.session_state:
-                st.session_state.verlauf_heute = []
-            st.session_state.verlauf_heute.append({
-                "uhrzeit": datetime.now().strftime("%H:%M Uhr"),
-                "modul": "WP Quick-Kalkulator",
-                "bezeichnung": f"Gas | {v_gas:,.0f} {einheit}",
-                "ergebnis": f"Heizlast: {hl:.2f} kW"
-            })
+            history.eintragen("WP Quick-Kalkulator", f"Gas | {v_gas:,.0f} {einheit}",
+                              {"Heizlast": (hl, "kW"), "Verbrauch": (input_kwh, "kWh")})
 
             res_c1, res_c2 = st.columns([1, 1])
             with res_c1:
@@ -203,14 +202,8 @@ def main():
             
             hl_o, heiz_e_o, ww_e_o, verlust_e_o, pfad_o = calculate_heizlast(input_kwh_o, wirk_oil, ww_oil_active, pers_oil)
 
-            if "verlauf_heute" not in st.session_state:
-                st.session_state.verlauf_heute = []
-            st.session_state.verlauf_heute.append({
-                "uhrzeit": datetime.now().strftime("%H:%M Uhr"),
-                "modul": "WP Quick-Kalkulator",
-                "bezeichnung": f"Öl | {v_oil:,.0f} Liter",
-                "ergebnis": f"Heizlast: {hl_o:.2f} kW"
-            })
+            history.eintragen("WP Quick-Kalkulator", f"Öl | {v_oil:,.0f} Liter",
+                              {"Heizlast": (hl_o, "kW"), "Verbrauch": (input_kwh_o, "kWh")})
 
             res_c1, res_c2 = st.columns([1, 1])
             with res_c1:
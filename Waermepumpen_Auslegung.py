@@ -12,69 +12,84 @@
 import streamlit as st
 import os
 import plotly.graph_objects as go
-from fpdf import FPDF
 from datetime import datetime
-import matplotlib.pyplot as plt
 import numpy as np
 import tempfile
 
 # Globale Variable für die App-Version (wird in UI und PDF genutzt)
 APP_VERSION = "3.8"
 
+# --- PFADE (app-relativ; __app_paths__ wird vom Launcher injiziert) ---
+try:
+    PATHS = __app_paths__
+except NameError:
+    from coolsulting.paths import fuer_datei
+    PATHS = fuer_datei(__file__)
+from coolsulting import history
+from coolsulting.engines.heizlast import heizlast, teillast
+from coolsulting.trace import traced
+
 # ==========================================
 # 1. PDF KLASSE
 # ==========================================
-class PDF(FPDF):
-    def __init__(self, font_family="Helvetica"):
-        super().__init__()
-        self.font_family = font_family
-
-    def header(self):
-        # Coolsulting Blau
-        blue = (54, 169, 225)
-        self.set_fill_color(*blue)
-        self.rect(0, 0, 210, 40, 'F') 
+def get_pdf_class():
+    """PDF-Klasse bauen – fpdf wird erst beim Export importiert."""
+    from fpdf import FPDF
+
+    class PDF(FPDF):
+        def __init__(self, font_family="Helvetica"):
+            super().__init__()
+            self.font_family = font_family
+
+        def header(self):
+            # Coolsulting Blau
+            blue = (54, 169, 225)
+            self.set_fill_color(*blue)
+            self.rect(0, 0, 210, 40, 'F') 
         
-        # Feste Y-Koordinate für perfekte obere Bündigkeit von Logo und Text
-        start_y = 10
+            # Feste Y-Koordinate für perfekte obere Bündigkeit von Logo und Text
+            start_y = 10
         
-        # Weisses Logo (Breite 100)
-        logo = "Coolsulting_Logo_ohneHG_outlines_weiß.png"
-        if os.path.exists(logo):
-            self.image(logo, x=10, y=start_y, w=100)
+            # Weisses Logo (Breite 100)
+            logo = PATHS.datei("Coolsulting_Logo_ohneHG_outlines_weiß.png")
+            if os.path.exists(logo):
+                self.image(logo, x=10, y=start_y, w=100)
             
-        # Text exakt auf denselben Y-Startpunkt setzen
-        self.set_y(start_y)
-        self.set_font(self.font_family, 'B', 20)
-        self.set_text_color(255, 255, 255)
-        self.cell(0, 8, 'Wärmepumpen-Auslegung', align='R', ln=True)
+            # Text exakt auf denselben Y-Startpunkt setzen
+            self.set_y(start_y)
+            self.set_font(self.font_family, 'B', 20)
+            self.set_text_color(255, 255, 255)
+            self.cell(0, 8, 'Wärmepumpen-Auslegung', align='R', ln=True)
         
-        self.set_font(self.font_family, '', 12)
-        self.cell(0, 6, 'Modul 1: Heizlast-Berechnung', align='R', ln=True)
+            self.set_font(self.font_family, '', 12)
+            self.cell(0, 6, 'Modul 1: Heizlast-Berechnung', align='R', ln=True)
         
-        # App Version unter Modul 1
-        self.set_font(self.font_family, 'I', 10)
-        self.cell(0, 6, f'App Version: {APP_VERSION}', align='R', ln=True)
+            # App Version unter Modul 1
+            self.set_font(self.font_family, 'I', 10)
+            self.cell(0, 6, f'App Version: {APP_VERSION}', align='R', ln=True)
         
-        self.ln(15) # Abstand zum Content
+            self.ln(15) # Abstand zum Content
 
-    def footer(self):
-        self.set_y(-25)
-        self.set_font(self.font_family, 'I', 8)
-        self.set_text_color(128, 128, 128)
-        self.cell(0, 5, f'Seite {self.page_no()}', align='C', ln=True)
+        def footer(self):
+            self.set_y(-25)
+            self.set_font(self.font_family, 'I', 8)
+            self.set_text_color(128, 128, 128)
+            self.cell(0, 5, f'Seite {self.page_no()}', align='C', ln=True)
         
-        # Disclaimer
-        self.set_font(self.font_family, '', 7)
-        self.set_text_color(150, 150, 150)
-        disclaimer = ("HINWEIS: Diese Berechnung ist eine überschlägige Auslegung auf Basis der Nutzerangaben "
-                      "und geistiges Eigentum des Erstellers. Sie dient als Orientierungshilfe und ersetzt keine "
-                      "detaillierte Heizlastberechnung nach DIN EN 12831. Alle Angaben ohne Gewähr. "
-                      "Eine fachgerechte Detailplanung ist erforderlich.")
-        self.multi_cell(0, 3, disclaimer, align='C')
+            # Disclaimer
+            self.set_font(self.font_family, '', 7)
+            self.set_text_color(150, 150, 150)
+            disclaimer = ("HINWEIS: Diese Berechnung ist eine überschlägige Auslegung auf Basis der Nutzerangaben "
+                          "und geistiges Eigentum des Erstellers. Sie dient als Orientierungshilfe und ersetzt keine "
+                          "detaillierte Heizlastberechnung nach DIN EN 12831. Alle Angaben ohne Gewähr. "
+                          "Eine fachgerechte Detailplanung ist erforderlich.")
+            self.multi_cell(0, 3, disclaimer, align='C')
+
+    return PDF
 
 def create_charts_for_pdf(load_b, load_ww, sperr_kw, norm_temp, bivalenz_temp, total_kw):
     """Generiert temporäre Bilder für das PDF mittels Matplotlib"""
+    import matplotlib.pyplot as plt
     temp_files = []
 
     # 1. TORTENDIAGRAMM
@@ -139,14 +154,15 @@ def create_charts_for_pdf(load_b, load_ww, sperr_kw, norm_temp, bivalenz_temp, t
 
     return temp_files
 
+@traced("Waermepumpen.create_pdf_report")
 def create_pdf_report(projekt, bearbeiter, firma, flaeche, bauweise, wm2, total_kw, 
                       load_b, load_ww, sperr_kw, sperrzeit, 
                       norm_temp, vl_temp, system, bivalenz, backup_typ, infos, warnings, critical):
     
     # --- SETUP ---
-    font_path = "POE Vetica UI.ttf"
+    font_path = PATHS.datei("POE Vetica UI.ttf")
     font_name = "Helvetica"
-    pdf = PDF()
+    pdf = get_pdf_class()()
     
     if os.path.exists(font_path):
         try:
@@ -319,7 +335,7 @@ def main():
         # Version direkt unter Modul 1
         st.markdown(f'<p class="header-text" style="font-size: 14px; opacity: 0.8; margin-top: 0px;">App Version: {APP_VERSION}</p>', unsafe_allow_html=True)
     with col2:
-        logo = "Coolsulting_Logo_ohneHG_outlines_weiß.png"
+        logo = PATHS.datei("Coolsulting_Logo_ohneHG_outlines_weiß.png")
         if os.path.exists(logo):
             st.image(logo, use_container_width=True)
         st.markdown('<div class="modul-title">Auslegung</div>', unsafe_allow_html=True)
@@ -373,11 +389,9 @@ def main():
         hat_ww = st.checkbox("Warmwasser über diese WP?", value=False, key="m1_ww")
         if hat_ww:
             personen = st.slider("Personen / Nutzer", 1, 20, 3, key="m1_pers")
-            ww_faktor = (1.45 * 2.0 * 365) / 2400
         else:
             st.markdown(f"<span style='font-size:12px; color:white; opacity:0.7;'>Deaktiviert (z.B. externer Boiler)</span>", unsafe_allow_html=True)
             personen = 0
-            ww_faktor = 0
 
     st.write("---")
     st.markdown("### ⚙️ 3. Backup & Hybrid")
@@ -395,21 +409,19 @@ def main():
     st.write("---")
 
     if st.button("AUSLEGUNG BERECHNEN"):
-        load_building_base = (flaeche * wm2_wert) / 1000
-        load_ww_base = personen * ww_faktor
-        sperr_faktor = 24 / laufzeit
-        load_building_real = load_building_base * sperr_faktor
-        total_kw = load_building_real + load_ww_base
-        sperr_aufschlag = load_building_real - load_building_base
-
-        if "verlauf_heute" not in st.session_state:
-            st.session_state.verlauf_heute = []
-        st.session_state.verlauf_heute.append({
-            "uhrzeit": datetime.now().strftime("%H:%M Uhr"),
-            "modul": "Heizlast WP",
-            "bezeichnung": projekt if projekt else "Unbenannt",
-            "ergebnis": f"Heizlast: {total_kw:.2f} kW"
-        })
+        erg = heizlast(flaeche, wm2_wert, sperrzeit=sperrzeit, personen=personen)
+        load_building_base = erg["load_building_base"]
+        load_ww_base = erg["load_ww_base"]
+        sperr_faktor = erg["sperr_faktor"]
+        load_building_real = erg["load_building_real"]
+        total_kw = erg["total_kw"]
+        sperr_aufschlag = erg["sperr_aufschlag"]
+
+        history.eintragen("Heizlast WP", projekt if projekt else "Unbenannt",
+                          {"Heizlast": (total_kw, "kW"),
+                           "Sperrzeit-Aufschlag": (sperr_aufschlag, "kW"),
+                           "Warmwasser": (load_ww_base, "kW")},
+                          projekt=projekt)
         
         infos, warnings, critical = [], [], []
         if flaeche > 300 and hat_ww: infos.append("ℹ️ <b>Gewerbe-Hinweis:</b> WW-Bedarf prüfen.")
@@ -458,7 +470,7 @@ def main():
         x_temps = np.linspace(norm_temp - 5, 20, 100)
         heizgrenze = 15.0
         
-        y_loads = [(load_building_real * (heizgrenze - t) / (heizgrenze - norm_temp)) + load_ww_base if t < heizgrenze else load_ww_base for t in x_temps]
+        y_loads = [teillast(load_building_real, load_ww_base, norm_temp, t, heizgrenze) for t in x_temps]
         
         fig_biv = go.Figure()
         fig_biv.add_trace(go.Scatter(x=x_temps, y=y_loads, mode='lines', name='Heizlast Gebäude + WW', line=dict(color='#36A9E1', width=3)))
@@ -481,7 +493,7 @@ def main():
         )
         st.plotly_chart(fig_biv, use_container_width=True)
         
-        last_uebergang = (load_building_real * (heizgrenze - 7) / (heizgrenze - norm_temp)) + load_ww_base if 7 < heizgrenze else load_ww_base
+        last_uebergang = teillast(load_building_real, load_ww_base, norm_temp, 7, heizgrenze)
 
         st.markdown(f"""
         <div style="background-color:rgba(255,255,255,0.2); padding:10px; border-radius:5px; color:white; font-size:13px;">
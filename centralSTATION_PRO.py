@@ -8,18 +8,19 @@
 
 import streamlit as st
 import os
-import base64
 from datetime import datetime
 from PIL import Image
+from coolsulting import paths, assets, history, preload, trace
 
-# Arbeitsverzeichnis IMMER auf Script-Verzeichnis setzen (Schutz gegen chdir-Probleme)
+# Pfade relativ zum Script-Verzeichnis auflösen – KEIN os.chdir mehr
+# (das Arbeitsverzeichnis ist prozessweit, Sessions laufen in Threads)
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-os.chdir(_SCRIPT_DIR)
+PATHS = paths.fuer_datei(__file__)
 
 # ============================================================
 # 1. SEITE KONFIGURIEREN
 # ============================================================
-icon_image = Image.open("Coolsulting_Logo_ohneHG_weiß_grau.png")
+icon_image = Image.open(PATHS.datei("Coolsulting_Logo_ohneHG_weiß_grau.png"))
 st.set_page_config(
     page_title="°central_STATION_PRO | coolsulting", 
     page_icon=icon_image,
@@ -27,46 +28,31 @@ st.set_page_config(
     initial_sidebar_state="auto"
 )
 
+# Warmstart: schwere Pakete, Assets und App-Module einmal pro Prozess im
+# Hintergrund vorladen (abschaltbar mit CS_PRELOAD=0)
+preload.starte_hintergrund()
+
 def get_font_as_base64(font_path):
-    """Konvertiert eine lokale Schriftart in Base64 für CSS-Injektion."""
-    if os.path.exists(font_path):
-        with open(font_path, "rb") as font_file:
-            return base64.b64encode(font_file.read()).decode()
-    return None
+    """Konvertiert eine lokale Schriftart in Base64 (prozessweit gecacht)."""
+    return assets.b64(font_path)
 
 def run_app(file_path):
     """
-    Liest eine externe .py Datei ein, entfernt Seitenkonfigurationen
-    und führt den Code im aktuellen Kontext aus.
+    Rendert eine Unter-App über die Modul-Registry (coolsulting.registry).
+    Quelltext wird nur einmal pro Dateiänderung gelesen und kompiliert,
+    st.set_page_config wird per AST entfernt. Jede App läuft in ihrem
+    eigenen Namespace (keine Namenskollisionen mit dem Launcher).
+    Relative Dateien löst jede App über __app_paths__ auf; das Arbeits-
+    verzeichnis bleibt unberührt, sys.path wird je App nur einmal erweitert.
     Unterstützt auch Apps in Unterverzeichnissen (z.B. coolWIRE/coolWIRE_main.py).
     """
-    import sys
     import traceback
+    from coolsulting import registry
+    file_path = PATHS.datei(file_path)
     if os.path.exists(file_path):
-        with open(file_path, "r", encoding="utf-8") as f:
-            code_content = f.read()
-
-        # Unterdrückung der Page-Config in Unter-Apps (mehrzeilige Aufrufe)
-        import re
-        modified_code = re.sub(
-            r'st\.set_page_config\s*\(.*?\)',
-            'pass',
-            code_content,
-            flags=re.DOTALL
-        )
-
-        # Bei Apps in Unterverzeichnissen: Verzeichnis zu sys.path hinzufügen
-        app_dir = os.path.dirname(os.path.abspath(file_path))
-        original_dir = os.getcwd()
-        path_added = False
-        if app_dir != original_dir and app_dir not in sys.path:
-            sys.path.insert(0, app_dir)
-            path_added = True
-
-        # Arbeitsverzeichnis temporär wechseln für relative Pfade
-        os.chdir(app_dir)
         try:
-            exec(modified_code, globals())
+            with trace.span("run_app", app=os.path.basename(file_path)):
+                registry.get_app(file_path).render()
         except Exception as e:
             _ename = type(e).__name__
             if "Rerun" in _ename or "Stop" in _ename or "Halt" in _ename or "Script" in _ename:
@@ -74,33 +60,25 @@ def run_app(file_path):
             tb = traceback.format_exc()
             st.error(f"⚠️ Fehler beim Laden von {file_path}: {str(e)}")
             st.code(tb, language="python")
-        finally:
-            # IMMER zurücksetzen – auch nach Rerun/Stop
-            os.chdir(original_dir)
-            if path_added and app_dir in sys.path:
-                sys.path.remove(app_dir)
     else:
         st.error(f"❌ Datei '{file_path}' wurde nicht gefunden.")
 
+@trace.traced("rerun")
 def main():
     # --- DESIGN VARIABLEN ---
     BG_COLOR = "#36A9E1"    # Coolsulting Blau
     TEXT_GRAY = "#3C3C3B"   # Dunkelgrau
-    FONT_FILE = "POE Vetica UI.ttf"
-    LOGO_PATH = "Coolsulting_Logo_ohneHG_outlines_weiß.png"
+    FONT_FILE = PATHS.datei("POE Vetica UI.ttf")
+    LOGO_PATH = PATHS.datei("Coolsulting_Logo_ohneHG_outlines_weiß.png")
 
     VERSION = "5.1.0"
     ZEIT = datetime.now().strftime("%d.%m.%Y | %H:%M Uhr")
 
-    # --- VERLAUF INITIALISIEREN ---
-    if "verlauf_heute" not in st.session_state:
-        st.session_state.verlauf_heute = []
-
     # --- CSS STYLING ---
-    font_base64 = get_font_as_base64(FONT_FILE)
+    font_css = assets.font_face_css('POE Helvetica UI', FONT_FILE)
     st.markdown(f"""
     <style>
-    {f"@font-face {{ font-family: 'POE Helvetica UI'; src: url(data:font/ttf;base64,{font_base64}) format('truetype'); }}" if font_base64 else ""}
+    {font_css}
     
     html, body, [data-testid="stAppViewContainer"], * {{
         font-family: 'POE Helvetica UI', sans-serif !important;
@@ -217,23 +195,69 @@ def main():
         st.info("### System-Status: Bereit\nWählen Sie oben ein Modul aus, um die Berechnung zu starten.")
         st.write("Dies ist die zentrale Steuereinheit für alle Coolsulting-Berechnungsmodule.")
 
-        # --- VERLAUF VON HEUTE ---
+        # --- VERLAUF (persistent, coolsulting.history) ---
         st.markdown("---")
-        st.markdown("### 📋 Verlauf von heute")
-        datum_heute = datetime.now().strftime("%d.%m.%Y")
-        eintraege = st.session_state.verlauf_heute
-        if eintraege:
-            st.caption(f"Gespeicherte Berechnungen am {datum_heute} ({len(eintraege)} Einträge):")
-            for e in reversed(eintraege):
-                if isinstance(e, dict):
-                    st.markdown(
-                        f"**{e['uhrzeit']}** &nbsp;|&nbsp; `{e['modul']}` &nbsp;|&nbsp; "
-                        f"{e['bezeichnung']} &nbsp;→&nbsp; **{e['ergebnis']}**"
-                    )
-                else:
-                    st.markdown(f"- {e}")
+        st.markdown("### 📋 Verlauf")
+        # nur eigene Einträge (Firma bzw. Browser); Admins können alle Nutzer einblenden
+        alle = history.ist_admin() and st.checkbox("Alle Nutzer anzeigen (Admin)", key="vl_alle")
+        if history.nutzer().startswith("browser:"):
+            st.caption("Ohne Login gehört der Verlauf zu diesem Link (?vid=… in der Adresszeile): "
+                       "wer den Link erhält, sieht und ergänzt denselben Verlauf.")
+        f1, f2, f3 = st.columns([1, 1.2, 2])
+        with f1:
+            zr = st.selectbox("Zeitraum", ["Heute", "7 Tage", "30 Tage", "Alle"], key="vl_zeitraum")
+        with f2:
+            modul_filter = st.selectbox("Modul", ["Alle"] + history.module(alle=alle), key="vl_modul")
+        with f3:
+            suche = st.text_input("Suche (Bezeichnung / Projekt)", key="vl_suche")
+        datum_von, datum_bis = history.zeitraum(zr)
+        filter_args = dict(datum_von=datum_von, datum_bis=datum_bis, suche=suche.strip() or None,
+                           modul=None if modul_filter == "Alle" else modul_filter, alle=alle)
+
+        gesamt = history.anzahl(**filter_args)
+        if gesamt:
+            PRO_SEITE = 25
+            seiten = (gesamt - 1) // PRO_SEITE + 1
+            seite = st.number_input(f"Seite (von {seiten})", 1, seiten, 1, key="vl_seite") if seiten > 1 else 1
+            st.caption(f"{gesamt} gespeicherte Berechnungen ({zr}):")
+            for e in history.abfrage(limit=PRO_SEITE, offset=(seite - 1) * PRO_SEITE, **filter_args):
+                datum = "" if zr == "Heute" else f"{e['datum'][8:10]}.{e['datum'][5:7]}. "
+                st.markdown(
+                    f"**{datum}{e['uhrzeit']}** &nbsp;|&nbsp; `{e['modul']}` &nbsp;|&nbsp; "
+                    f"{e['bezeichnung']} &nbsp;→&nbsp; **{history.format_werte(e)}**"
+                )
         else:
-            st.caption(f"Noch keine Berechnungen am {datum_heute} gespeichert.")
+            st.caption("Keine gespeicherten Berechnungen für diese Auswahl.")
+
+        # --- SPEICHERBERICHT PRO APP ---
+        from coolsulting import registry
+        bericht = registry.speicher_bericht()
+        if bericht:
+            with st.expander("🧠 Speicherbericht der geladenen Apps"):
+                st.caption("RSS-Werte prozessweit gemessen – bei parallelen Sessions Näherungswerte.")
+                st.table(bericht)
+
+        # --- WARMSTART / STARTPROFIL ---
+        vl = preload.status()
+        if vl["aktiv"]:
+            titel = f"⏱️ Warmstart ({vl['gesamt_s']:.1f} s)" if vl["fertig"] else "⏱️ Warmstart läuft …"
+            with st.expander(titel):
+                st.caption("Importzeit je Paket, Ladezeit je Datei/App. "
+                           "Details: python -m coolsulting.preload --profile-startup")
+                st.table(sorted(vl["messungen"], key=lambda m: -m["Zeit [ms]"]))
+
+        # --- TRACING (p50/p95 je Span, letzte Reruns) ---
+        spans = trace.statistik()
+        if spans:
+            with st.expander("🔬 Laufzeiten je Rechenschritt (Tracing)"):
+                st.caption("p50/p95 über die letzten Aufrufe aller Sessions dieses Prozesses. "
+                           "Export: CS_TRACE_JSONL=datei.jsonl bzw. Prometheus-Text unten.")
+                st.table(spans)
+                for b in trace.letzte_baeume(5):
+                    st.markdown(f"**{b['ts'][11:19]}** · `{b['thread']}`")
+                    st.code(trace.baum_text(b["baum"]), language="text")
+                st.download_button("⬇️ Prometheus-Metriken", trace.prometheus_text(),
+                                   file_name="centralstation_metrics.txt", mime="text/plain")
 
     elif selected_file:
         run_app(selected_file)
@@ -5,13 +5,10 @@
 # ==============================================================================
 
 import streamlit as st
-import math
 import pandas as pd
-from fpdf import FPDF
 from datetime import datetime
 import tempfile
 import os
-import base64
 
 # --- SICHERUNG FÜR DASHBOARD ---
 try:
@@ -24,19 +21,27 @@ COLOR_BLUE = "#36A9E1"
 COLOR_GRAY = "#3C3C3B"
 COLOR_WHITE = "#FFFFFF"
 
+# --- PFADE (app-relativ; __app_paths__ wird vom Launcher injiziert) ---
+try:
+    PATHS = __app_paths__
+except NameError:
+    from coolsulting.paths import fuer_datei
+    PATHS = fuer_datei(__file__)
+from coolsulting import assets, history
+from coolsulting.engines.hydraulik import FLUIDE, ROHRE_DN, geschwindigkeit, hydraulik
+from coolsulting.trace import span
+
 # --- FONT LADEN ---
 def get_font_base64(font_path):
-    if os.path.exists(font_path):
-        with open(font_path, "rb") as f:
-            return base64.b64encode(f.read()).decode()
-    return None
+    # Prozessweit gecacht (coolsulting.assets) – kein Neueinlesen pro Rerun
+    return assets.b64(PATHS.datei(font_path))
 
-font_b64 = get_font_base64("POE_Vetica_UI.ttf")
+font_css = assets.font_face_css('POE Helvetica UI', PATHS.datei("POE_Vetica_UI.ttf"))
 
 # --- CSS STYLING ---
 st.markdown(f"""
     <style>
-    {f"@font-face {{ font-family: 'POE Helvetica UI'; src: url(data:font/ttf;base64,{font_b64}) format('truetype'); }}" if font_b64 else ""}
+    {font_css}
     
     * {{
         font-family: 'POE Helvetica UI', 'Helvetica', sans-serif !important;
@@ -61,39 +66,45 @@ st.markdown(f"""
 """, unsafe_allow_html=True)
 
 # --- PDF KLASSE ---
-class PDFReport(FPDF):
-    def __init__(self):
-        super().__init__()
+def get_pdf_class():
+    """PDF-Klasse bauen – fpdf wird erst beim Export importiert."""
+    from fpdf import FPDF
+
+    class PDFReport(FPDF):
+        def __init__(self):
+            super().__init__()
         
-        font_path = "POE_Vetica_UI.ttf"
-        if os.path.exists(font_path):
-            self.add_font('POE', '', font_path, uni=True)
-            self.add_font('POE', 'B', font_path, uni=True)
-            self.add_font('POE', 'I', font_path, uni=True)
-            self.font_loaded = True
-        else:
-            self.font_loaded = False
+            font_path = PATHS.datei("POE_Vetica_UI.ttf")
+            if os.path.exists(font_path):
+                self.add_font('POE', '', font_path, uni=True)
+                self.add_font('POE', 'B', font_path, uni=True)
+                self.add_font('POE', 'I', font_path, uni=True)
+                self.font_loaded = True
+            else:
+                self.font_loaded = False
     
-    def _set_font(self, style='', size=10):
-        if self.font_loaded:
-            self.set_font('POE', style, size)
-        else:
-            self.set_font('Arial', style, size)
+        def _set_font(self, style='', size=10):
+            if self.font_loaded:
+                self.set_font('POE', style, size)
+            else:
+                self.set_font('Arial', style, size)
     
-    def header(self):
-        logo_path = "Coolsulting_Logo_ohneHG_weiss_grau.png"
-        if os.path.exists(logo_path):
-            try:
-                self.image(logo_path, 155, 10, 45)
-            except:
-                pass
-        self._set_font('B', 16)
-        self.set_text_color(54, 169, 225)
-        grad = chr(176)
-        self.cell(0, 10, f'{grad}coolFLOW Hydraulik-Protokoll', 0, 1, 'L')
-        self.set_draw_color(60, 60, 59)
-        self.line(10, 25, 200, 25)
-        self.ln(18)
+        def header(self):
+            logo_path = PATHS.datei("Coolsulting_Logo_ohneHG_weiss_grau.png")
+            if os.path.exists(logo_path):
+                try:
+                    self.image(logo_path, 155, 10, 45)
+                except:
+                    pass
+            self._set_font('B', 16)
+            self.set_text_color(54, 169, 225)
+            grad = chr(176)
+            self.cell(0, 10, f'{grad}coolFLOW Hydraulik-Protokoll', 0, 1, 'L')
+            self.set_draw_color(60, 60, 59)
+            self.line(10, 25, 200, 25)
+            self.ln(18)
+
+    return PDFReport
 
 # --- HEADER ---
 st.markdown(f"""
@@ -120,29 +131,21 @@ with st.container():
         
     with c2:
         st.markdown(f"<p style='color:{COLOR_BLUE}; font-weight:bold; border-bottom:2px solid {COLOR_BLUE};'>2. MEDIUM</p>", unsafe_allow_html=True)
-        fluids = {"Wasser (100%)": [4.19, 999], "Ethylenglykol 34%": [3.65, 1050], "Propylenglykol 35%": [3.80, 1040]}
+        fluids = FLUIDE
         fluid_sel = st.selectbox("Kälteträger", list(fluids.keys()))
         cp, rho = fluids[fluid_sel]
         
     with c3:
         st.markdown(f"<p style='color:{COLOR_BLUE}; font-weight:bold; border-bottom:2px solid {COLOR_BLUE};'>3. ROHRLEITUNG</p>", unsafe_allow_html=True)
-        pipe_data = [
-            ("DN 20", 21.6), ("DN 25", 27.3), ("DN 32", 36.0), ("DN 40", 41.9), 
-            ("DN 50", 53.1), ("DN 65", 68.9), ("DN 80", 80.9), ("DN 100", 105.3), ("DN 125", 130.8)
-        ]
+        pipe_data = ROHRE_DN
         pipe_names = [p[0] for p in pipe_data]
         dn_sel_idx = st.selectbox("Nennweite (DN)", range(len(pipe_names)), format_func=lambda x: pipe_names[x], index=3)
         di = pipe_data[dn_sel_idx][1]
 
-# --- BERECHNUNG ---
-m_dot_s = q_kw / (cp * dt)
-m_dot_h = m_dot_s * 3600
-v_dot = (m_dot_s / rho) * 3600
-
-def calc_vel(d_inner_mm, flow_m3h):
-    return (flow_m3h / 3600) / (math.pi * (d_inner_mm/1000/2)**2)
-
-velocity = calc_vel(di, v_dot)
+# --- BERECHNUNG (coolsulting.engines.hydraulik) ---
+erg = hydraulik(q_kw, dt, medium=fluid_sel, dn=pipe_data[dn_sel_idx][0])
+m_dot_s, m_dot_h, v_dot, velocity = erg["m_dot_s"], erg["m_dot_h"], erg["v_dot"], erg["velocity"]
+calc_vel = geschwindigkeit
 
 # --- ERGEBNISSE ---
 st.divider()
@@ -152,14 +155,9 @@ res2.metric("GESCHWINDIGKEIT", f"{velocity:.2f} m/s", f"{pipe_data[dn_sel_idx][0
 res3.metric("MASSENSTROM", f"{m_dot_h:.0f} kg/h", f"{m_dot_s:.2f} kg/s")
 
 if st.button("💾 Im Verlauf speichern"):
-    if "verlauf_heute" not in st.session_state:
-        st.session_state.verlauf_heute = []
-    st.session_state.verlauf_heute.append({
-        "uhrzeit": datetime.now().strftime("%H:%M Uhr"),
-        "modul": "coolFLOW",
-        "bezeichnung": f"{kunde} | {projekt}",
-        "ergebnis": f"Volumenstrom: {v_dot:.2f} m³/h | v: {velocity:.2f} m/s"
-    })
+    history.eintragen("coolFLOW", f"{kunde} | {projekt}",
+                      {"Volumenstrom": (v_dot, "m³/h"), "v": (velocity, "m/s")},
+                      projekt=projekt)
     st.success("✅ Im Verlauf gespeichert.")
 
 # --- VERGLEICHSTABELLE ---
@@ -180,7 +178,7 @@ st.markdown(f"<table class='styled-table'><thead><tr><th>Nennweite</th><th>Innen
 
 # --- PDF EXPORT ---
 if st.button("📄 PDF-Bericht generieren"):
-    pdf = PDFReport()
+    pdf = get_pdf_class()()
     pdf.add_page()
     pdf._set_font('B', 12)
     pdf.cell(0, 10, 'Projektdaten:', 0, 1)
@@ -206,6 +204,7 @@ if st.button("📄 PDF-Bericht generieren"):
     pdf.cell(0, 8, f'{velocity:.2f} m/s', 0, 1)
     
     pdf_path = tempfile.mktemp(".pdf")
-    pdf.output(pdf_path)
+    with span("coolFLOW.pdf_output"):
+        pdf.output(pdf_path)
     with open(pdf_path, "rb") as f:
         st.download_button(label="💾 PDF herunterladen", data=f, file_name=f"Coolsulting_Flow_{projekt}.pdf", mime="application/pdf")
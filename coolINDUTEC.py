@@ -8,30 +8,31 @@
 import streamlit as st
 import os
 import plotly.graph_objects as go
-from fpdf import FPDF
 import numpy as np
 import tempfile
-import matplotlib
-
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 
 # --- 1. SETUP & CSS ---
 st.set_page_config(page_title="°coolINDUTEC PRO", layout="wide")
 
 # Font laden
-import base64
+# --- PFADE (app-relativ; __app_paths__ wird vom Launcher injiziert) ---
+try:
+    PATHS = __app_paths__
+except NameError:
+    from coolsulting.paths import fuer_datei
+    PATHS = fuer_datei(__file__)
+from coolsulting import assets
+from coolsulting.trace import span
+
 def get_font_base64(font_path):
-    if os.path.exists(font_path):
-        with open(font_path, "rb") as f:
-            return base64.b64encode(f.read()).decode()
-    return None
+    # Prozessweit gecacht (coolsulting.assets) – kein Neueinlesen pro Rerun
+    return assets.b64(PATHS.datei(font_path))
 
-font_b64 = get_font_base64("POE_Vetica_UI.ttf")
+font_css = assets.font_face_css('POE Helvetica UI', PATHS.datei("POE_Vetica_UI.ttf"))
 
 st.markdown(f"""
     <style>
-    {f"@font-face {{ font-family: 'POE Helvetica UI'; src: url(data:font/ttf;base64,{font_b64}) format('truetype'); }}" if font_b64 else ""}
+    {font_css}
     
     * {{
         font-family: 'POE Helvetica UI', 'Helvetica', sans-serif !important;
@@ -76,7 +77,15 @@ def get_h_ware(temp):
     return float(np.interp(temp, ENTHALPIE_STUETZ_X, ENTHALPIE_STUETZ_Y))
 
 # --- 3. DIAGRAMME ---
+def _plt():
+    """Matplotlib (Agg) erst für den PDF-Export laden."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
 def create_pie_chart_mpl_detailed(labels, sizes, units="kWh"):
+    plt = _plt()
     fig, ax = plt.subplots(figsize=(10, 6))
     colors = ['#36A9E1', '#FF4B4B', '#3C3C3B', '#FFCC00', '#A0A0A0'] 
     
@@ -107,6 +116,7 @@ def create_cooling_curve_mpl(t_start, t_target, duration_h):
     - TK-Bereich (t_target < 0): Mit Gefrierplateau bei ca. -2°C
     - Kühlbereich (t_target >= 0): Exponentielle Abkühlung ohne Plateau
     """
+    plt = _plt()
     fig, ax = plt.subplots(figsize=(10, 5))
     x = np.linspace(0, duration_h, 100)
     y = []
@@ -176,79 +186,85 @@ def create_cooling_curve_mpl(t_start, t_target, duration_h):
     return tmp.name
 
 # --- 4. PDF KLASSE ---
-class PDF(FPDF):
-    def __init__(self, kunde, projekt, raum):
-        super().__init__()
-        self.kunde = kunde
-        self.projekt = projekt
-        self.raum = raum
+def get_pdf_class():
+    """PDF-Klasse bauen – fpdf wird erst beim Export importiert."""
+    from fpdf import FPDF
+
+    class PDF(FPDF):
+        def __init__(self, kunde, projekt, raum):
+            super().__init__()
+            self.kunde = kunde
+            self.projekt = projekt
+            self.raum = raum
         
-        # Custom Font laden
-        font_path = "POE_Vetica_UI.ttf"
-        if os.path.exists(font_path):
-            self.add_font('POE', '', font_path, uni=True)
-            self.add_font('POE', 'B', font_path, uni=True)
-            self.add_font('POE', 'I', font_path, uni=True)
-            self.font_loaded = True
-        else:
-            self.font_loaded = False
+            # Custom Font laden
+            font_path = PATHS.datei("POE_Vetica_UI.ttf")
+            if os.path.exists(font_path):
+                self.add_font('POE', '', font_path, uni=True)
+                self.add_font('POE', 'B', font_path, uni=True)
+                self.add_font('POE', 'I', font_path, uni=True)
+                self.font_loaded = True
+            else:
+                self.font_loaded = False
 
-    def header(self):
-        self.set_fill_color(54, 169, 225) 
-        self.rect(0, 0, 210, 35, 'F') 
+        def header(self):
+            self.set_fill_color(54, 169, 225) 
+            self.rect(0, 0, 210, 35, 'F') 
         
-        # Logo RECHTS OBEN - normale Größe
-        logo = "Coolsulting_Logo_ohneHG_outlines_weiß.png"
-        if os.path.exists(logo): 
-            self.image(logo, x=150, y=8, w=50)  # RECHTS OBEN, normale Größe
+            # Logo RECHTS OBEN - normale Größe
+            logo = PATHS.datei("Coolsulting_Logo_ohneHG_outlines_weiß.png")
+            if os.path.exists(logo): 
+                self.image(logo, x=150, y=8, w=50)  # RECHTS OBEN, normale Größe
         
-        self.set_y(10)
+            self.set_y(10)
         
-        # Font wählen
-        if self.font_loaded:
-            self.set_font('POE', 'B', 24)
-        else:
-            self.set_font('helvetica', 'B', 24)
+            # Font wählen
+            if self.font_loaded:
+                self.set_font('POE', 'B', 24)
+            else:
+                self.set_font('helvetica', 'B', 24)
         
-        # °coolINDUTEC - °cool WEIß, INDUTEC GRAU
-        grad_symbol = chr(176)
+            # °coolINDUTEC - °cool WEIß, INDUTEC GRAU
+            grad_symbol = chr(176)
         
-        # °cool in WEIß
-        self.set_text_color(255, 255, 255)
-        self.text(10, 20, f"{grad_symbol}cool")
+            # °cool in WEIß
+            self.set_text_color(255, 255, 255)
+            self.text(10, 20, f"{grad_symbol}cool")
         
-        # INDUTEC in GRAU
-        self.set_text_color(60, 60, 59)
-        self.text(31, 20, "INDUTEC")
+            # INDUTEC in GRAU
+            self.set_text_color(60, 60, 59)
+            self.text(31, 20, "INDUTEC")
         
-        self.set_y(24)
-        self.set_text_color(255, 255, 255)
+            self.set_y(24)
+            self.set_text_color(255, 255, 255)
         
-        if self.font_loaded:
-            self.set_font('POE', '', 9)
-        else:
-            self.set_font('helvetica', '', 9)
+            if self.font_loaded:
+                self.set_font('POE', '', 9)
+            else:
+                self.set_font('helvetica', '', 9)
             
-        self.cell(0, 5, f'Kunde: {self.kunde} | Projekt: {self.projekt} | Raum: {self.raum}', 0, 1, 'L')
-        self.ln(15)
+            self.cell(0, 5, f'Kunde: {self.kunde} | Projekt: {self.projekt} | Raum: {self.raum}', 0, 1, 'L')
+            self.ln(15)
 
-    def footer(self):
-        self.set_y(-15)
+        def footer(self):
+            self.set_y(-15)
         
-        if self.font_loaded:
-            self.set_font('POE', 'I', 8)
-        else:
-            self.set_font('helvetica', 'I', 8)
+            if self.font_loaded:
+                self.set_font('POE', 'I', 8)
+            else:
+                self.set_font('helvetica', 'I', 8)
             
-        self.set_text_color(150)
-        self.cell(0, 10, f'Erstellt mit coolINDUTEC | Seite {self.page_no()}', 0, 0, 'C')
+            self.set_text_color(150)
+            self.cell(0, 10, f'Erstellt mit coolINDUTEC | Seite {self.page_no()}', 0, 0, 'C')
     
-    def set_body_font(self, style='', size=10):
-        """Helper für Body-Text"""
-        if self.font_loaded:
-            self.set_font('POE', style, size)
-        else:
-            self.set_font('helvetica', style, size)
+        def set_body_font(self, style='', size=10):
+            """Helper für Body-Text"""
+            if self.font_loaded:
+                self.set_font('POE', style, size)
+            else:
+                self.set_font('helvetica', style, size)
+
+    return PDF
 
 # --- 5. EINGABEN ---
 with st.expander("📋 Stammdaten", expanded=True):
@@ -418,7 +434,7 @@ with res2:
 
 # --- 8. PDF GENERATOR ---
 if st.button("📄 PDF Report erstellen"):
-    pdf = PDF(k_name, p_name, r_name)
+    pdf = get_pdf_class()(k_name, p_name, r_name)
     
     # SEITE 1
     pdf.add_page()
@@ -486,7 +502,9 @@ if st.button("📄 PDF Report erstellen"):
     except: 
         pass
     
+    with span("coolINDUTEC.pdf_output"):
+        pdf_bytes = bytes(pdf.output())
     st.download_button("💾 PDF Report Herunterladen", 
-                       data=bytes(pdf.output()), 
+                       data=pdf_bytes, 
                        file_name=f"coolINDUTEC_{p_name}.pdf",
                        mime="application/pdf")
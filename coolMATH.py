@@ -16,6 +16,14 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
+# --- PFADE (app-relativ; __app_paths__ wird vom Launcher injiziert) ---
+try:
+    PATHS = __app_paths__
+except NameError:
+    from coolsulting.paths import fuer_datei
+    PATHS = fuer_datei(__file__)
+from coolsulting import assets
+
 # ============================================================
 # DESIGN
 # ============================================================
@@ -23,23 +31,15 @@ BG_COLOR   = "#36A9E1"
 TEXT_GRAY  = "#3C3C3B"
 WHITE      = "#FFFFFF"
 
-FONT_FILE  = "POE Vetica UI.ttf"
-LOGO_PATH  = "Coolsulting_Logo_ohneHG_outlines_weiß.png"
+FONT_FILE  = PATHS.datei("POE Vetica UI.ttf")
+LOGO_PATH  = PATHS.datei("Coolsulting_Logo_ohneHG_outlines_weiß.png")
 
 def _get_font_b64(path):
-    if os.path.exists(path):
-        import base64
-        with open(path, "rb") as f:
-            return base64.b64encode(f.read()).decode()
-    return None
+    # Prozessweit gecacht (coolsulting.assets)
+    return assets.b64(path)
 
 def _inject_css():
-    font_b64 = _get_font_b64(FONT_FILE)
-    font_face = (
-        f"@font-face {{ font-family: 'POE Helvetica UI'; "
-        f"src: url(data:font/ttf;base64,{font_b64}) format('truetype'); }}"
-        if font_b64 else ""
-    )
+    font_face = assets.font_face_css('POE Helvetica UI', FONT_FILE)
     st.markdown(f"""
     <style>
     {font_face}
@@ -50,15 +50,13 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
 import json
 import os
 import io
 import tempfile
-# PDF: reportlab + python-docx
+from bisect import bisect_left
+from contextlib import nullcontext
+# PDF: reportlab + python-docx + matplotlib werden erst beim Export geladen
 from datetime import datetime
 from typing import Dict, Optional, Tuple
 
@@ -68,83 +66,17 @@ CI_BLUE = "#36A9E1"
 CI_GRAY = "#3C3C3B"
 CI_WHITE = "#FFFFFF"
 
-# --- PREISLISTE ---
-PREISLISTE_PATH = "S_Klima_Artikel_Import_2026-02-02-APP.xlsx"
-
-def load_samsung_prices():
-    """Lädt Samsung-Preise aus Excel-Datei"""
-    import os
-    import re
-    
-    # Suche Preisliste in verschiedenen Pfaden
-    search_paths = [
-        PREISLISTE_PATH,
-        os.path.join(os.path.dirname(__file__), PREISLISTE_PATH),
-        os.path.join('/mnt/user-data/outputs', PREISLISTE_PATH),
-    ]
-    
-    xlsx_path = None
-    for path in search_paths:
-        if os.path.exists(path):
-            xlsx_path = path
-            break
-    
-    if not xlsx_path:
-        # Fallback auf hardcoded Preise
-        return {
-            4.0:  {"preis": 2347},
-            5.0:  {"preis": 2706},
-            5.2:  {"preis": 3061},
-            6.8:  {"preis": 3548},
-            8.0:  {"preis": 4494},
-            10.0: {"preis": 5533},
-        }
-    
-    try:
-        import pandas as pd
-        df = pd.read_excel(xlsx_path, sheet_name=' Kima 2026-02-02')
-        
-        # FJM AG Außengeräte extrahieren
-        fjm_ag = df[(df['Artikelgruppe'] == 'S_FJM') & 
-                    (df['Bezeichnung'].str.contains('AG', case=False)) &
-                    (df['Artikelnummer'].str.startswith('AJ0'))]
-        
-        prices = {}
-        for _, row in fjm_ag.iterrows():
-            langtext = row['Langtext']
-            preis = row['Listenpreis']
-            
-            # kW aus Langtext extrahieren
-            kw_match = re.search(r'Kühlen\s+(\d+\.?\d*)\s*kW', langtext, re.IGNORECASE)
-            if kw_match:
-                kw = float(kw_match.group(1))
-                prices[kw] = {"preis": preis}
-        
-        return prices if prices else {
-            4.0:  {"preis": 2347},
-            5.0:  {"preis": 2706},
-            5.2:  {"preis": 3061},
-            6.8:  {"preis": 3548},
-            8.0:  {"preis": 4494},
-            10.0: {"preis": 5533},
-        }
-    except Exception as e:
-        print(f"⚠️ Preisliste konnte nicht geladen werden: {e}")
-        # Fallback
-        return {
-            4.0:  {"preis": 2347},
-            5.0:  {"preis": 2706},
-            5.2:  {"preis": 3061},
-            6.8:  {"preis": 3548},
-            8.0:  {"preis": 4494},
-            10.0: {"preis": 5533},
-        }
+# --- PFADE (app-relativ; __app_paths__ wird vom Launcher injiziert) ---
+try:
+    PATHS = __app_paths__
+except NameError:
+    from coolsulting.paths import fuer_datei
+    PATHS = fuer_datei(__file__)
 
-# --- GERÄTE-PREISLISTEN (für PDF-Berichte) ---
-FJM_AG_PRICES = load_samsung_prices()
-RAC_AG_PRICES = {
-    # Wird aus main() RAC_AG_BY_SERIE extrahiert falls benötigt
-}
+# --- LISTENPREISE: gemeinsame Produktdatenbank (coolsulting.engines.produkte) ---
+def listenpreis(art_nr):
+    """Listenpreis [EUR] je Artikelnummer (Preisliste, sonst Gerätetabellen) oder None."""
+    return produkte().preis(art_nr)
 
 
 def pdf_safe(text):
@@ -541,287 +473,32 @@ def setup_page():
 # ==========================================
 # 2. PHYSIK ENGINE — 6 METHODEN
 # ==========================================
-HOURS = np.arange(24)
-
-# Solare Einstrahlungsdaten [W/m²] pro Stunde und Ausrichtung
-SOLAR_DB = {
-    "NORD":      [20,20,20,20,20,40,60,80,100,110,120,120,120,120,110,100,80,60,40,20,20,20,20,20],
-    "OST":       [0,0,0,0,100,350,550,650,680,600,450,250,150,100,80,60,40,20,0,0,0,0,0,0],
-    "SUED":       [0,0,0,0,0,50,150,300,450,550,620,650,650,620,550,450,300,150,50,0,0,0,0,0],
-    "WEST":      [0,0,0,0,0,0,20,50,70,90,110,150,250,450,600,680,650,550,350,150,0,0,0,0],
-    "SUED-OST":   [0,0,0,50,200,450,580,650,620,500,350,200,120,90,70,40,20,0,0,0,0,0,0,0],
-    "SUED-WEST":  [0,0,0,0,0,0,20,50,80,120,200,350,500,620,650,580,450,250,80,20,0,0,0,0],
-}
-
-def get_phys_constants(standard, glass, shade):
-    """Physikalische Konstanten je Gebäudestandard"""
-    u_vals  = {"Altbau": 1.7, "Bestand": 0.8, "Neubau (GEG)": 0.28, "Passivhaus": 0.15}
-    g_vals  = {"Einfach": 0.85, "Doppel": 0.65, "Dreifach": 0.50, "Sonnenschutz": 0.32}
-    fc_vals = {"Keine": 1.0, "Vorhang (Innen)": 0.6, "Raffstore (Aussen)": 0.25, "Rollladen": 0.15}
-    return u_vals.get(standard, 0.8), g_vals.get(glass, 0.65), fc_vals.get(shade, 1.0)
-
-
-def calc_praktiker(area, orient, standard, glass, shade, pers, tech):
-    """METHODE 1: Praktiker (Heuristik) — q-Wert je Standard, Orientierung, Sonnenschutz REDUZIERT"""
-    _, _, fc = get_phys_constants(standard, glass, shade)
-    q_std  = {"Altbau": 90.0, "Bestand": 75.0, "Neubau (GEG)": 55.0, "Passivhaus": 35.0}
-    q_ori  = {"SUED": 15, "SUED-OST": 12, "SUED-WEST": 12, "WEST": 8, "OST": 5, "NORD": 0}
-    q_base = (q_std.get(standard, 75.0) + q_ori.get(orient, 0)) * fc
-    q_int  = (pers * 100 + tech) / max(area, 1)
-    return np.full(24, area * (q_base + q_int))
-
-def calc_recknagel(area, orient, standard, glass, shade, pers, tech, win_area):
-    """METHODE 4: Recknagel — Q_tr (dT standard-abh.) + Q_solar + Q_int"""
-    u, g, fc = get_phys_constants(standard, glass, shade)
-    sol_raw  = np.array(SOLAR_DB[orient], dtype=float)
-    dT_map   = {"Altbau": 9.0, "Bestand": 7.0, "Neubau (GEG)": 5.0, "Passivhaus": 3.0}
-    delta_T  = dT_map.get(standard, 6.0)
-    q_tr     = area * u * delta_T
-    q_st     = sol_raw * win_area * g * fc
-    q_int    = np.array([
-        (pers * 100 + tech + area * 8) if 8 <= h <= 18 else (pers * 50 + tech * 0.1)
-        for h in HOURS])
-    return q_tr + q_st + q_int
-
-def calc_vdi_alt(reck_curve):
-    """
-    METHODE 2: VDI 2078 Alt (1996)
-    Pauschaler Zuschlag +15-25% auf Recknagel-Basis
-    """
-    return reck_curve * 1.20
-
-
-def calc_vdi_neu(area, orient, standard, glass, shade, pers, tech, win_area, bau_m):
-    """METHODE 3: VDI 6007 — RC-Tiefpass, gleiche Eingangslast wie Recknagel"""
-    u, g, fc = get_phys_constants(standard, glass, shade)
-    sol_raw  = np.array(SOLAR_DB[orient], dtype=float)
-    tau      = {"Schwer (Beton/Stein)": 18.0, "Mittel (Ziegel/Holz-Beton)": 10.0, "Leicht (Holz/Trockenbau)": 4.0}.get(bau_m, 10.0)
-    delta_T  = {"Altbau": 9.0, "Bestand": 7.0, "Neubau (GEG)": 5.0, "Passivhaus": 3.0}.get(standard, 6.0)
-    q_ext    = (area * u * delta_T + sol_raw * win_area * g * fc
-                + np.array([(pers*100+tech+area*8) if 8<=h<=18 else (pers*50+tech*0.1) for h in HOURS]))
-    q_vdi    = np.zeros(24)
-    for _ in range(4):  # 96h Einschwingen
-        for h in range(24):
-            q_prev   = q_vdi[(h-1)%24]
-            q_vdi[h] = q_prev + (q_ext[h] - q_prev) / (tau + 1)
-    return q_vdi
-
-
-def calc_kaltluftsee(area, orient, standard, glass, shade, pers, tech, win_area, bau_m, raumhoehe=2.5):
-    """METHODE 5: Kaltluftsee — Recknagel / epsilon (eps=1.3 → 23% Reduktion)"""
-    return calc_recknagel(area, orient, standard, glass, shade, pers, tech, win_area) / 1.3
-
-
-def calc_ki_hybrid(area, orient, standard, glass, shade, pers, tech, win_area, bau_m):
-    """METHODE 6: KI-Hybrid — Phasenverschiebung + Daempfung + Pre-Cooling"""
-    u, g, fc  = get_phys_constants(standard, glass, shade)
-    sol_raw   = np.array(SOLAR_DB[orient], dtype=float)
-    delta_T   = {"Altbau": 9.0, "Bestand": 7.0, "Neubau (GEG)": 5.0, "Passivhaus": 3.0}.get(standard, 6.0)
-    phi       = {"Schwer (Beton/Stein)": 10, "Mittel (Ziegel/Holz-Beton)": 6, "Leicht (Holz/Trockenbau)": 2}.get(bau_m, 6)
-    f         = {"Schwer (Beton/Stein)": 0.55, "Mittel (Ziegel/Holz-Beton)": 0.70, "Leicht (Holz/Trockenbau)": 0.88}.get(bau_m, 0.70)
-    q_sol     = np.roll(sol_raw, phi) * f * win_area * g * fc
-    q_tr      = area * u * delta_T
-    q_int     = np.array([(pers*100+tech+area*6) if 8<=h<=18 else (pers*50+tech*0.05) for h in HOURS])
-    pre_cool  = np.array([0.75 if 0<=h<=6 else 1.0 for h in HOURS])
-    return (q_sol + q_tr + q_int) * pre_cool
+# Rechenkern in coolsulting.engines.kuehllast (auch für Batch/API nutzbar)
+from coolsulting.engines.kuehllast import (
+    BASIS_METHODE, HOURS, METHODEN, METHODEN_REGISTRY, SOLAR_DB, STROMPREIS, T_INNEN,
+    ZonenSpeicher, aktive_methoden, berechne_jahr, get_phys_constants, jahres_auswertung,
+)
+from coolsulting.engines.aussengeraete import KOMBINATION_MAX, optimiere_aussengeraete
+from coolsulting.engines.produkte import produkte, schall_pruefung
+from coolsulting.engines.sonne import STANDARD_BREITE, STANDARD_MONAT
+from coolsulting.engines.studie import GROESSEN, parameter_studie
+from coolsulting.engines.unsicherheit import BEZEICHNUNGEN, VERTEILUNGEN, MonteCarloLauf
+from coolsulting.engines.wetter import lade_wetter, referenzjahr_synthetisch, wetterdateien
+from coolsulting.trace import span, traced
+
+# Monatskürzel (Auslegungsmonat, Jahresdiagramm)
+MONATE = ["Jan", "Feb", "Mär", "Apr", "Mai", "Jun", "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"]
 
 
 # ==========================================
 # 3. SAMSUNG DATENBANK — Wind-Free Wandgeräte
 # ==========================================
 
-# Samsung Wind-Free Standard Wandgeräte (AR-Serie)
-# ==========================================
-# SAMSUNG GERÄTEDATENBANK
-# Quelle: MTF-Samsung-Klima_Artikel_Import-WaWi_2026-02-02-APP.xlsx
-# Gruppen: S_FJM + S_RAC — nur Wandgeräte (Inneneinheiten)
-# ==========================================
-
-# Serien-Datenbank: {serie_name: {kw: {art_nr, bez, preis}}}
-SAMSUNG_SERIEN = {
-    "Wind-Free Standard": {
-        2.0: {"art_nr": "AR60F07C1AWN/EU", "bez": "Wind-Free Standard 2.0kW",  "preis": 693.0},
-        2.5: {"art_nr": "AR60F09C1AWN/EU", "bez": "Wind-Free Standard 2.5kW",  "preis": 768.0},
-        3.5: {"art_nr": "AR60F12C1AWN/EU", "bez": "Wind-Free Standard 3.5kW",  "preis": 843.0},
-        5.0: {"art_nr": "AR60F18C1AWN/EU", "bez": "Wind-Free Standard 5.0kW",  "preis": 1219.0},
-    },
-    "Airise Living": {
-        2.0: {"art_nr": "AR50F07C1BHN/EU", "bez": "Airise Living 2.0kW",       "preis": 554.0},
-        2.5: {"art_nr": "AR50F09C1BHN/EU", "bez": "Airise Living 2.5kW",       "preis": 616.0},
-        3.5: {"art_nr": "AR50F12C1BHN/EU", "bez": "Airise Living 3.5kW",       "preis": 673.0},
-        5.0: {"art_nr": "AR50F18C1BHN/EU", "bez": "Airise Living 5.0kW",       "preis": 1017.0},
-        6.5: {"art_nr": "AR50F24C1BHN/EU", "bez": "Airise Living 6.5kW",       "preis": 1335.0},
-    },
-    "Wind-Free Exklusiv": {
-        2.0: {"art_nr": "AR70F07C1AWN/EU", "bez": "Wind-Free Exklusiv 2.0kW",  "preis": 1048.0},
-        2.5: {"art_nr": "AR70F09C1AWN/EU", "bez": "Wind-Free Exklusiv 2.5kW",  "preis": 1185.0},
-        3.5: {"art_nr": "AR70F12C1AWN/EU", "bez": "Wind-Free Exklusiv 3.5kW",  "preis": 1280.0},
-        5.0: {"art_nr": "AR70F18C1AWN/EU", "bez": "Wind-Free Exklusiv 5.0kW",  "preis": 1726.0},
-        6.5: {"art_nr": "AR70F24C1AWN/EU", "bez": "Wind-Free Exklusiv 6.5kW",  "preis": 2260.0},
-    },
-    "Wind-Free Exklusiv Black": {
-        2.0: {"art_nr": "AR70F07C1ABN/EU", "bez": "WF Exklusiv Black 2.0kW",   "preis": 1178.0},
-        2.5: {"art_nr": "AR70F09C1ABN/EU", "bez": "WF Exklusiv Black 2.5kW",   "preis": 1298.0},
-        3.5: {"art_nr": "AR70F12C1ABN/EU", "bez": "WF Exklusiv Black 3.5kW",   "preis": 1440.0},
-    },
-    "Wind-Free Exklusiv-Premiere": {
-        2.0: {"art_nr": "AR70H07C1AWN/EU", "bez": "WF Exklusiv-Premiere 2.0kW","preis": 1072.0},
-        2.5: {"art_nr": "AR70H09C1AWN/EU", "bez": "WF Exklusiv-Premiere 2.5kW","preis": 1180.0},
-        3.5: {"art_nr": "AR70H12C1AWN/EU", "bez": "WF Exklusiv-Premiere 3.5kW","preis": 1312.0},
-        4.3: {"art_nr": "AR70H15C1AWN/EU", "bez": "WF Exklusiv-Premiere 4.3kW","preis": 1656.0},
-        5.0: {"art_nr": "AR70H18C1AWN/EU", "bez": "WF Exklusiv-Premiere 5.0kW","preis": 1908.0},
-        6.5: {"art_nr": "AR70H24C1AWN/EU", "bez": "WF Exklusiv-Premiere 6.5kW","preis": 2492.0},
-    },
-    "Wind-Free Exklusiv-Premiere Black": {
-        2.0: {"art_nr": "AR70H07C1ABN/EU", "bez": "WF Exkl.-Premiere Blk 2.0kW","preis": 1112.0},
-        2.5: {"art_nr": "AR70H09C1ABN/EU", "bez": "WF Exkl.-Premiere Blk 2.5kW","preis": 1228.0},
-        3.5: {"art_nr": "AR70H12C1ABN/EU", "bez": "WF Exkl.-Premiere Blk 3.5kW","preis": 1364.0},
-    },
-    "Wind-Free Elite": {
-        2.0: {"art_nr": "AR70F07CAAWKN/EU","bez": "Wind-Free Elite 2.0kW",     "preis": 1347.0},
-        2.5: {"art_nr": "AR70F09CAAWKN/EU","bez": "Wind-Free Elite 2.5kW",     "preis": 1487.0},
-        3.5: {"art_nr": "AR70F12CAAWKN/EU","bez": "Wind-Free Elite 3.5kW",     "preis": 1637.0},
-    },
-    "Wind-Free Elite-Premiere Plus": {
-        2.0: {"art_nr": "AR70H07CAAWN/EU", "bez": "WF Elite-Premiere Plus 2.0kW","preis": 1296.0},
-        2.5: {"art_nr": "AR70H09CAAWN/EU", "bez": "WF Elite-Premiere Plus 2.5kW","preis": 1432.0},
-        3.5: {"art_nr": "AR70H12CAAWN/EU", "bez": "WF Elite-Premiere Plus 3.5kW","preis": 1576.0},
-    },
-    "Wind-Free Elite-Premiere Plus Black": {
-        2.0: {"art_nr": "AR70H07CAABN/EU", "bez": "WF Elite-Prem.Plus Blk 2.0kW","preis": 1348.0},
-        2.5: {"art_nr": "AR70H09CAABN/EU", "bez": "WF Elite-Prem.Plus Blk 2.5kW","preis": 1488.0},
-        3.5: {"art_nr": "AR70H12CAABN/EU", "bez": "WF Elite-Prem.Plus Blk 3.5kW","preis": 1640.0},
-    },
-    # --- Kassetten, Kanaleinbau, Standtruhe (FJM IG) ---
-    "Mini-Kassette 620x620": {
-        1.6: {"art_nr": "AJ016TNNDKG/EU", "bez": "FJM Mini-Kassette 1.6kW",  "preis": 902.0},
-        2.0: {"art_nr": "AJ020TNNDKG/EU", "bez": "FJM Mini-Kassette 2.0kW",  "preis": 946.0},
-        2.6: {"art_nr": "AJ026TNNDKG/EU", "bez": "FJM Mini-Kassette 2.6kW",  "preis": 1050.0},
-        3.5: {"art_nr": "AJ035TNNDKG/EU", "bez": "FJM Mini-Kassette 3.5kW",  "preis": 1176.0},
-        5.2: {"art_nr": "AJ052TNNDKG/EU", "bez": "FJM Mini-Kassette 5.2kW",  "preis": 1388.0},
-    },
-    "1-Weg-Kassette": {
-        2.6: {"art_nr": "AJ026TN1DKG/EU", "bez": "FJM 1-Weg-Kassette 2.6kW", "preis": 946.0},
-        3.5: {"art_nr": "AJ035TN1DKG/EU", "bez": "FJM 1-Weg-Kassette 3.5kW", "preis": 1160.0},
-    },
-    "Kanaleinbau": {
-        2.6: {"art_nr": "AJ026TNLPEG/EU", "bez": "FJM Kanaleinbau 2.6kW",    "preis": 1368.0},
-        3.5: {"art_nr": "AJ035TNLPEG/EU", "bez": "FJM Kanaleinbau 3.5kW",    "preis": 1422.0},
-        5.2: {"art_nr": "AJ052BNMDEG/EU", "bez": "FJM Kanaleinbau 5.2kW",    "preis": 1391.0},
-    },
-    "Standtruhe": {
-        2.6: {"art_nr": "AJ026TNJDKG/EU", "bez": "FJM Standtruhe 2.6kW",     "preis": 1074.0},
-        3.5: {"art_nr": "AJ035TNJDKG/EU", "bez": "FJM Standtruhe 3.5kW",     "preis": 1198.0},
-        5.2: {"art_nr": "AJ052TNJDKG/EU", "bez": "FJM Standtruhe 5.2kW",     "preis": 1430.0},
-    },
-}
-
-# Standard-Serie für Erstempfehlung
-SAMSUNG_DEFAULT_SERIE = "Wind-Free Standard"
-
-# Kurznamen für Dropdowns (damit der Text nicht abgeschnitten wird)
-SERIE_SHORT = {
-    "Wind-Free Standard":               "WF Standard",
-    "Airise Living":                    "Airise Living",
-    "Wind-Free Exklusiv":               "WF Exklusiv",
-    "Wind-Free Exklusiv Black":         "WF Exklusiv Blk",
-    "Wind-Free Exklusiv-Premiere":      "WF Exkl.-Prem.",
-    "Wind-Free Exklusiv-Premiere Black":"WF Exkl.-Prem. Blk",
-    "Wind-Free Elite":                  "WF Elite",
-    "Wind-Free Elite-Premiere Plus":    "WF Elite-Prem.+",
-    "Wind-Free Elite-Premiere Plus Black":"WF Elite-Prem.+ Blk",
-    "Mini-Kassette 620x620":            "Mini-Kassette",
-    "1-Weg-Kassette":                   "1-Weg-Kassette",
-    "Kanaleinbau":                      "Kanaleinbau",
-    "Standtruhe":                       "Standtruhe",
-}
-
-
-# Rückwärtskompatible Flach-DB für find_samsung_device (Standard-Serie)
-SAMSUNG_WINDFREE_WALL = {}
-for kw, d in SAMSUNG_SERIEN[SAMSUNG_DEFAULT_SERIE].items():
-    SAMSUNG_WINDFREE_WALL[kw] = {
-        "model":    d["bez"],
-        "art_nr":   d["art_nr"],
-        "cool_kw":  kw,
-        "heat_kw":  round(kw * 1.2, 1),
-        "seer":     6.2,
-        "scop":     4.6,
-        "eer":      3.50,
-        "preis":    d["preis"],
-        "btus":     str(int(kw * 3412)),
-        "serie":    SAMSUNG_DEFAULT_SERIE,
-    }
-
-SAMSUNG_SIZES_KW = sorted(SAMSUNG_WINDFREE_WALL.keys())
-
-def find_samsung_device(peak_watt, safety_factor=1.10, serie=None):
-    """
-    Findet passendes Samsung Wandgerät für gegebene Spitzenlast.
-    safety_factor: 1.10 = 10% Norm-Zuschlag
-    serie: optionaler Serienname (default = Wind-Free Standard)
-    Gibt primäres und alternatives Gerät zurück.
-    """
-    if serie is None:
-        serie = SAMSUNG_DEFAULT_SERIE
-    # Fallback auf Standard wenn Serie keine passende Größe hat
-    db = SAMSUNG_SERIEN.get(serie, SAMSUNG_SERIEN[SAMSUNG_DEFAULT_SERIE])
-    sizes = sorted(db.keys())
-    required_kw = (peak_watt * safety_factor) / 1000.0
-
-    def make_entry(kw):
-        d = db[kw]
-        return {
-            "model":       d["bez"],
-            "art_nr":      d["art_nr"],
-            "cool_kw":     kw,
-            "heat_kw":     round(kw * 1.2, 1),
-            "preis":       d["preis"],
-            "kw_class":    kw,
-            "required_kw": required_kw,
-            "peak_w":      peak_watt,
-            "serie":       serie,
-        }
-
-    # Primär: kleinstes Gerät >= required_kw
-    primary = None
-    for kw in sizes:
-        if kw >= required_kw:
-            primary = make_entry(kw)
-            break
-
-    # Fallback: größtes verfügbares
-    if primary is None:
-        primary = make_entry(sizes[-1])
-        primary["oversized"] = True
-
-    # Alternativ: nächstkleineres
-    alt = None
-    idx_p = sizes.index(primary["kw_class"])
-    if idx_p > 0:
-        alt = make_entry(sizes[idx_p - 1])
-
-    return primary, alt
-
-
-def load_samsung_from_file():
-    """Versucht Samsung-Daten aus Excel-Datei zu laden (falls vorhanden)"""
-    try:
-        samsung_files = [f for f in os.listdir('.') 
-                        if any(kw in f.lower() for kw in ['samsung', 'mtf', 'klima', 'artikel']) 
-                        and f.endswith('.xlsx')]
-        if samsung_files:
-            df = pd.read_excel(samsung_files[0], engine='openpyxl')
-            # Nur Wandgeräte / Wind-Free filtern
-            if 'Bezeichnung' in df.columns:
-                mask = df['Bezeichnung'].astype(str).str.contains('Wind.?Free|Wandgerät|AR[0-9]', 
-                                                                    case=False, regex=True)
-                df_wf = df[mask].copy()
-                if len(df_wf) > 0:
-                    return df_wf
-    except Exception:
-        pass
-    return None
+# Gerätedaten & Auswahl in coolsulting.engines.samsung
+from coolsulting.engines.samsung import (
+    FJM_AG, FJM_IG_SERIEN, RAC_AG_BY_SERIE, SAMSUNG_SERIEN, SAMSUNG_DEFAULT_SERIE,
+    SERIE_SHORT, SEER_STANDARD, find_samsung_device, katalog,
+)
 
 
 # ==========================================
@@ -889,37 +566,17 @@ def check_login():
 # ==========================================
 # 5. DATENBANK (SQLite lokal + Turso-ready)
 # ==========================================
-import sqlite3, json as _json, hashlib
 
-DB_PATH = "coolmath_projects.db"
+# Projektspeicher in coolsulting.projekte: Verbindungspool je Prozess (WAL,
+# Busy-Timeout), Schema-Migration einmal je Prozess statt bei jedem Skriptlauf
+from coolsulting import projekte as _projekte
 
-def _get_db():
-    """Gibt DB-Verbindung zurück. SQLite lokal (Turso deaktiviert)."""
-    # Turso deaktiviert - nutze lokale SQLite
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-    return conn, "sqlite"
+DB_PATH = PATHS.datei("coolmath_projects.db")
 
 def db_init():
-    """Erstellt Tabellen falls noch nicht vorhanden."""
+    """Öffnet den Verbindungspool (Migration beim ersten Aufruf je Prozess)."""
     try:
-        conn, _ = _get_db()
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS coolmath_projects (
-                id          INTEGER PRIMARY KEY AUTOINCREMENT,
-                projekt_id  TEXT UNIQUE,
-                firma       TEXT,
-                username    TEXT,
-                projekt     TEXT,
-                kunde       TEXT,
-                bearbeiter  TEXT,
-                datum       TEXT,
-                room_data   TEXT,
-                results     TEXT,
-                devices     TEXT,
-                monday_id   TEXT,
-                created_at  TEXT
-            )""")
-        conn.commit()
+        _projekte.pool(DB_PATH)
     except Exception as e:
         pass  # silent fail – app läuft auch ohne DB
 
@@ -927,28 +584,14 @@ def db_save_project(firma, username, proj, kunde, bearbeiter,
                     room_inputs, room_results, g_sums, selected_hw, selected_hw_ag):
     """Speichert Projekt in DB. Gibt projekt_id zurück."""
     try:
-        conn, _ = _get_db()
-        pid = hashlib.md5(f"{firma}{proj}{kunde}{datetime.now().isoformat()}".encode()).hexdigest()[:12]
-        conn.execute("""
-            INSERT OR REPLACE INTO coolmath_projects
-            (projekt_id, firma, username, projekt, kunde, bearbeiter, datum,
-             room_data, results, devices, created_at)
-            VALUES (?,?,?,?,?,?,?,?,?,?,?)""", (
-            pid, firma, username, proj, kunde, bearbeiter,
-            datetime.now().strftime("%d.%m.%Y %H:%M"),
-            _json.dumps({"room_inputs": room_inputs}, ensure_ascii=False),
-            _json.dumps({
-                "room_results": room_results,
-                "peaks": {k: float(v.max()) for k, v in g_sums.items()}
-            }, ensure_ascii=False),
-            _json.dumps({
-                "selected_hw": selected_hw,
-                "selected_hw_ag": [list(x) if isinstance(x, tuple) else x for x in selected_hw_ag],
-            }, ensure_ascii=False),
-            datetime.now().isoformat()
-        ))
-        conn.commit()
-        return pid
+        return _projekte.speichern(
+            firma, username, proj, kunde, bearbeiter,
+            {"room_inputs": room_inputs},
+            {"room_results": room_results,
+             "peaks": {k: float(v.max()) for k, v in g_sums.items()}},
+            {"selected_hw": selected_hw,
+             "selected_hw_ag": [list(x) if isinstance(x, tuple) else x for x in selected_hw_ag]},
+            db_path=DB_PATH)
     except Exception as e:
         st.warning(f"⚠️ DB-Speicherung: {e}")
         return None
@@ -956,37 +599,20 @@ def db_save_project(firma, username, proj, kunde, bearbeiter,
 def db_load_projects(firma, role="partner"):
     """Lädt Projektliste. Admin sieht alle, Partner nur eigene Firma."""
     try:
-        conn, _ = _get_db()
-        if role == "admin":
-            rows = conn.execute(
-                "SELECT projekt_id,firma,projekt,kunde,bearbeiter,datum FROM coolmath_projects ORDER BY created_at DESC"
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                "SELECT projekt_id,firma,projekt,kunde,bearbeiter,datum FROM coolmath_projects WHERE firma=? ORDER BY created_at DESC",
-                (firma,)
-            ).fetchall()
-        return rows
+        return _projekte.projekte(firma, role, db_path=DB_PATH)
     except Exception:
         return []
 
 def db_load_project(projekt_id):
     """Lädt ein Projekt vollständig."""
     try:
-        conn, _ = _get_db()
-        row = conn.execute(
-            "SELECT * FROM coolmath_projects WHERE projekt_id=?", (projekt_id,)
-        ).fetchone()
-        return row
+        return _projekte.projekt(projekt_id, db_path=DB_PATH)
     except Exception:
         return None
 
 def db_update_monday_id(projekt_id, monday_id):
     try:
-        conn, _ = _get_db()
-        conn.execute("UPDATE coolmath_projects SET monday_id=? WHERE projekt_id=?",
-                     (monday_id, projekt_id))
-        conn.commit()
+        _projekte.monday_id_setzen(projekt_id, monday_id, db_path=DB_PATH)
     except Exception:
         pass
 
@@ -997,6 +623,13 @@ def db_update_monday_id(projekt_id, monday_id):
 import requests as _requests
 
 
+def _http_post(url, **kwargs):
+    """requests.post mit Tracing-Span (Host + Pfad als Attribute)."""
+    host, _, pfad = url.split("://", 1)[-1].partition("/")
+    with span("http.post", host=host, pfad="/" + pfad):
+        return _requests.post(url, **kwargs)
+
+
 def get_monday_secrets():
     """Lädt Monday Secrets mit Fallback"""
     try:
@@ -1058,7 +691,7 @@ class MondayIntegration:
             }}
             '''
             try:
-                response = requests.post(
+                response = _http_post(
                     self.api_url,
                     headers=self.headers,
                     json={"query": query},
@@ -1135,7 +768,7 @@ class MondayIntegration:
 
             upload_headers = {"Authorization": self.api_token}
 
-            response = requests.post(
+            response = _http_post(
                 self.file_api_url,
                 headers=upload_headers,
                 files=files,
@@ -1246,7 +879,7 @@ class MondayIntegration:
         """
 
         try:
-            response = requests.post(
+            response = _http_post(
                 self.api_url,
                 headers=self.headers,
                 json={"query": query},
@@ -1273,7 +906,7 @@ class MondayIntegration:
         """
 
         try:
-            response = requests.post(
+            response = _http_post(
                 self.api_url,
                 headers=self.headers,
                 json={"query": query},
@@ -1369,45 +1002,74 @@ API URL: {monday.api_url}
 # ==========================================
 # 7. PDF ENGINE — reportlab
 # ==========================================
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.units import mm
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, Table,
-                                 TableStyle, PageBreak, Image as RLImage, HRFlowable)
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 import io as _io
 
-_BLUE  = colors.HexColor('#36A9E1')
-_DARK  = colors.HexColor('#3C3C3B')
-_GREEN = colors.HexColor('#1b5e20')
-_LGRAY = colors.HexColor('#F4F4F4')
-_WHITE = colors.white
-_A4W, _A4H = A4
+_RL = None
 
-def _make_styles():
+def _lade_reportlab():
+    """Importiert reportlab erst beim ersten PDF-Export.
+
+    Liefert einen Namensraum mit den reportlab-Namen (``rl.Paragraph``,
+    ``rl.mm``, …), den Farben (``rl.BLUE``, ``rl.DARK``, …), der Seitengröße
+    (``rl.A4W``/``rl.A4H``) und den Styles (``rl.S``). Weitere Aufrufe
+    liefern denselben (unveränderlichen) Namensraum.
+    """
+    global _RL
+    if _RL is not None:
+        return _RL
+    from types import SimpleNamespace
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib import colors
+    from reportlab.lib.units import mm
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, Table,
+                                     TableStyle, PageBreak, Image as RLImage, HRFlowable)
+    from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
+    rl = SimpleNamespace(
+        A4=A4, colors=colors, mm=mm,
+        getSampleStyleSheet=getSampleStyleSheet, ParagraphStyle=ParagraphStyle,
+        SimpleDocTemplate=SimpleDocTemplate, Paragraph=Paragraph, Spacer=Spacer,
+        Table=Table, TableStyle=TableStyle, PageBreak=PageBreak,
+        RLImage=RLImage, HRFlowable=HRFlowable,
+        TA_LEFT=TA_LEFT, TA_CENTER=TA_CENTER, TA_RIGHT=TA_RIGHT,
+        BLUE=colors.HexColor('#36A9E1'),
+        DARK=colors.HexColor('#3C3C3B'),
+        GREEN=colors.HexColor('#1b5e20'),
+        LGRAY=colors.HexColor('#F4F4F4'),
+        WHITE=colors.white)
+    rl.A4W, rl.A4H = A4
+    rl.S = _make_styles(rl)
+    _RL = rl
+    return rl
+
+def _plt():
+    """Matplotlib (Agg) erst für die PDF-Diagramme laden."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+def _make_styles(rl):
     return {
-        'h1':    ParagraphStyle('h1',    fontName='Helvetica-Bold', fontSize=13,
-                                 textColor=_BLUE, leading=17, spaceBefore=10, spaceAfter=4),
-        'h2':    ParagraphStyle('h2',    fontName='Helvetica-Bold', fontSize=10,
-                                 textColor=_DARK, leading=14, spaceBefore=6, spaceAfter=2),
-        'body':  ParagraphStyle('body',  fontName='Helvetica', fontSize=9,
-                                 textColor=_DARK, leading=13, spaceAfter=4),
-        'small': ParagraphStyle('small', fontName='Helvetica', fontSize=7.5,
-                                 textColor=colors.HexColor('#888888'), leading=11),
-        'cover_title': ParagraphStyle('ct', fontName='Helvetica-Bold', fontSize=22,
-                                       textColor=_WHITE, leading=28, alignment=TA_LEFT),
-        'cover_sub':   ParagraphStyle('cs', fontName='Helvetica', fontSize=11,
-                                       textColor=colors.HexColor('#e0f4fc'), leading=16),
-        'cover_body':  ParagraphStyle('cb', fontName='Helvetica', fontSize=10,
-                                       textColor=_DARK, leading=15),
-        'disclaimer':  ParagraphStyle('disc', fontName='Helvetica', fontSize=7,
-                                       textColor=colors.HexColor('#999'), leading=10,
-                                       alignment=TA_CENTER),
+        'h1':    rl.ParagraphStyle('h1',    fontName='Helvetica-Bold', fontSize=13,
+                                    textColor=rl.BLUE, leading=17, spaceBefore=10, spaceAfter=4),
+        'h2':    rl.ParagraphStyle('h2',    fontName='Helvetica-Bold', fontSize=10,
+                                    textColor=rl.DARK, leading=14, spaceBefore=6, spaceAfter=2),
+        'body':  rl.ParagraphStyle('body',  fontName='Helvetica', fontSize=9,
+                                    textColor=rl.DARK, leading=13, spaceAfter=4),
+        'small': rl.ParagraphStyle('small', fontName='Helvetica', fontSize=7.5,
+                                    textColor=rl.colors.HexColor('#888888'), leading=11),
+        'cover_title': rl.ParagraphStyle('ct', fontName='Helvetica-Bold', fontSize=22,
+                                          textColor=rl.WHITE, leading=28, alignment=rl.TA_LEFT),
+        'cover_sub':   rl.ParagraphStyle('cs', fontName='Helvetica', fontSize=11,
+                                          textColor=rl.colors.HexColor('#e0f4fc'), leading=16),
+        'cover_body':  rl.ParagraphStyle('cb', fontName='Helvetica', fontSize=10,
+                                          textColor=rl.DARK, leading=15),
+        'disclaimer':  rl.ParagraphStyle('disc', fontName='Helvetica', fontSize=7,
+                                          textColor=rl.colors.HexColor('#999'), leading=10,
+                                          alignment=rl.TA_CENTER),
     }
 
-_S = _make_styles()
-
 
 _COPYRIGHT = "© 2026 °coolsulting — Michael Schäpers | coolMATH Pro 4.76.5"
 
@@ -1423,46 +1085,49 @@ _COPYRIGHT_LONG = (
 
 def _hf_cover(canvas, doc):
     """Deckblatt: nur Footer"""
+    rl = _lade_reportlab()
     canvas.saveState()
-    canvas.setFillColor(_DARK)
+    canvas.setFillColor(rl.DARK)
     canvas.setFont('Helvetica', 7)
-    canvas.drawCentredString(_A4W/2, 12*mm, _COPYRIGHT[:200])
+    canvas.drawCentredString(rl.A4W/2, 12*rl.mm, _COPYRIGHT[:200])
     canvas.restoreState()
 
 def _hf_normal(canvas, doc, partner_firma="", user_firma=""):
     """Normale Seiten: Header-Balken + Footer"""
+    rl = _lade_reportlab()
     canvas.saveState()
     # Header
-    canvas.setFillColor(_BLUE)
-    canvas.rect(0, _A4H - 28*mm, _A4W, 28*mm, fill=1, stroke=0)
-    canvas.setFillColor(_WHITE)
+    canvas.setFillColor(rl.BLUE)
+    canvas.rect(0, rl.A4H - 28*rl.mm, rl.A4W, 28*rl.mm, fill=1, stroke=0)
+    canvas.setFillColor(rl.WHITE)
     canvas.setFont('Helvetica-Bold', 13)
-    canvas.drawString(15*mm, _A4H - 14*mm, 'coolMATH Pro — Kühllastanalyse')
+    canvas.drawString(15*rl.mm, rl.A4H - 14*rl.mm, 'coolMATH Pro — Kühllastanalyse')
     canvas.setFont('Helvetica', 8)
-    canvas.drawString(15*mm, _A4H - 21*mm, f'Version {APP_VERSION}  |  {datetime.now().strftime("%d.%m.%Y")}')
+    canvas.drawString(15*rl.mm, rl.A4H - 21*rl.mm, f'Version {APP_VERSION}  |  {datetime.now().strftime("%d.%m.%Y")}')
     if partner_firma:
-        canvas.drawRightString(_A4W - 15*mm, _A4H - 21*mm, partner_firma)
-    canvas.setStrokeColor(_WHITE)
+        canvas.drawRightString(rl.A4W - 15*rl.mm, rl.A4H - 21*rl.mm, partner_firma)
+    canvas.setStrokeColor(rl.WHITE)
     canvas.setLineWidth(0.4)
-    canvas.line(15*mm, _A4H - 25*mm, _A4W - 15*mm, _A4H - 25*mm)
+    canvas.line(15*rl.mm, rl.A4H - 25*rl.mm, rl.A4W - 15*rl.mm, rl.A4H - 25*rl.mm)
     # Footer
-    canvas.setFillColor(colors.HexColor('#555'))
+    canvas.setFillColor(rl.colors.HexColor('#555'))
     canvas.setFont('Helvetica', 7)
-    canvas.drawString(15*mm, 10*mm,
+    canvas.drawString(15*rl.mm, 10*rl.mm,
         f'coolMATH Pro {APP_VERSION}  |  © 2026 °coolsulting  |  Seite {doc.page}')
-    canvas.drawRightString(_A4W - 15*mm, 10*mm, '°coolsulting — KI-gestützte Kühllastsimulation')
+    canvas.drawRightString(rl.A4W - 15*rl.mm, 10*rl.mm, '°coolsulting — KI-gestützte Kühllastsimulation')
     canvas.restoreState()
 
 def _tbl_style_fn(total_row=True):
-    ts = TableStyle([
+    rl = _lade_reportlab()
+    ts = rl.TableStyle([
         ('FONTNAME',      (0,0), (-1,0), 'Helvetica-Bold'),
         ('FONTNAME',      (0,1), (-1,-1), 'Helvetica'),
         ('FONTSIZE',      (0,0), (-1,-1), 8),
-        ('TEXTCOLOR',     (0,0), (-1,-1), _DARK),
-        ('BACKGROUND',    (0,0), (-1,0), _DARK),
-        ('TEXTCOLOR',     (0,0), (-1,0), _WHITE),
-        ('ROWBACKGROUNDS', (0,1), (-1,-2 if total_row else -1), [_WHITE, _LGRAY]),
-        ('GRID',          (0,0), (-1,-1), 0.3, colors.HexColor('#CCCCCC')),
+        ('TEXTCOLOR',     (0,0), (-1,-1), rl.DARK),
+        ('BACKGROUND',    (0,0), (-1,0), rl.DARK),
+        ('TEXTCOLOR',     (0,0), (-1,0), rl.WHITE),
+        ('ROWBACKGROUNDS', (0,1), (-1,-2 if total_row else -1), [rl.WHITE, rl.LGRAY]),
+        ('GRID',          (0,0), (-1,-1), 0.3, rl.colors.HexColor('#CCCCCC')),
         ('ALIGN',         (0,0), (-1,-1), 'CENTER'),
         ('ALIGN',         (0,0), (0,-1), 'LEFT'),
         ('VALIGN',        (0,0), (-1,-1), 'MIDDLE'),
@@ -1472,30 +1137,35 @@ def _tbl_style_fn(total_row=True):
         ('RIGHTPADDING',  (0,0), (-1,-1), 5),
     ])
     if total_row:
-        ts.add('BACKGROUND', (0,-1), (-1,-1), _BLUE)
-        ts.add('TEXTCOLOR',  (0,-1), (-1,-1), _WHITE)
+        ts.add('BACKGROUND', (0,-1), (-1,-1), rl.BLUE)
+        ts.add('TEXTCOLOR',  (0,-1), (-1,-1), rl.WHITE)
         ts.add('FONTNAME',   (0,-1), (-1,-1), 'Helvetica-Bold')
     return ts
 
 def _section_hdr(title, subtitle=''):
-    items = [HRFlowable(width='100%', thickness=0.5, color=_BLUE, spaceAfter=1),
-             Paragraph(title.upper(), _S['h1'])]
+    rl = _lade_reportlab()
+    items = [rl.HRFlowable(width='100%', thickness=0.5, color=rl.BLUE, spaceAfter=1),
+             rl.Paragraph(title.upper(), rl.S['h1'])]
     if subtitle:
-        items.append(Paragraph(subtitle, _S['small']))
-    items.append(Spacer(1, 3*mm))
+        items.append(rl.Paragraph(subtitle, rl.S['small']))
+    items.append(rl.Spacer(1, 3*rl.mm))
     return items
 
-def _chart(img_bytes, width=165*mm):
+def _chart(img_bytes, width=None):
+    rl = _lade_reportlab()
     if not img_bytes:
         return []
+    if width is None:
+        width = 165*rl.mm
     try:
-        img = RLImage(_io.BytesIO(img_bytes), width=width, height=width*0.44)
-        return [img, Spacer(1, 4*mm)]
+        img = rl.RLImage(_io.BytesIO(img_bytes), width=width, height=width*0.44)
+        return [img, rl.Spacer(1, 4*rl.mm)]
     except Exception as e:
-        return [Paragraph(f'[Diagramm: {e}]', _S['small'])]
+        return [rl.Paragraph(f'[Diagramm: {e}]', rl.S['small'])]
 
 def _thermal_cover_graphic(canvas, x, y, w, h):
     """Thermodynamische Heatmap-Grafik fürs Deckblatt"""
+    rl = _lade_reportlab()
     import math, random
     random.seed(42)
     
@@ -1505,7 +1175,7 @@ def _thermal_cover_graphic(canvas, x, y, w, h):
     canvas.setStrokeAlpha(0.75)
     
     # Gebäude-Silhouette Hintergrund
-    canvas.setFillColor(colors.HexColor('#1a3a5c'))
+    canvas.setFillColor(rl.colors.HexColor('#1a3a5c'))
     canvas.rect(x, y, w, h, fill=1, stroke=0)
     # Thermische Heatmap-Streifen (Farbverlauf)
     heat_colors = ['#0d47a1','#1565c0','#1976d2','#0288d1','#0097a7',
@@ -1513,7 +1183,7 @@ def _thermal_cover_graphic(canvas, x, y, w, h):
                    '#e53935','#b71c1c']
     stripe_w = w / len(heat_colors)
     for ci, hc in enumerate(heat_colors):
-        canvas.setFillColor(colors.HexColor(hc))
+        canvas.setFillColor(rl.colors.HexColor(hc))
         # Wellenform-Streifen
         for row in range(8):
             alpha_mult = 0.3 + 0.7*(row/8)
@@ -1524,7 +1194,7 @@ def _thermal_cover_graphic(canvas, x, y, w, h):
             canvas.roundRect(rx, ry, stripe_w*0.85, rh, 2, fill=1, stroke=0)
     canvas.setFillAlpha(0.75)
     # Isothermen-Linien
-    canvas.setStrokeColor(colors.HexColor('#ffffff'))
+    canvas.setStrokeColor(rl.colors.HexColor('#ffffff'))
     canvas.setLineWidth(0.4)
     canvas.setDash([3,4])
     for line_y in range(3, 9):
@@ -1532,8 +1202,8 @@ def _thermal_cover_graphic(canvas, x, y, w, h):
         canvas.line(x, pts_y, x+w, pts_y + math.sin(line_y)*8)
     canvas.setDash([])
     # Gebäude-Umriss
-    canvas.setStrokeColor(colors.HexColor('#ffffff'))
-    canvas.setFillColor(colors.HexColor('#0d2137'))
+    canvas.setStrokeColor(rl.colors.HexColor('#ffffff'))
+    canvas.setFillColor(rl.colors.HexColor('#0d2137'))
     canvas.setLineWidth(1.2)
     bw = w*0.22; bh = h*0.55
     bx = x + w*0.12; by = y + h*0.02
@@ -1541,12 +1211,12 @@ def _thermal_cover_graphic(canvas, x, y, w, h):
     canvas.rect(bx+bw+6, by, bw*1.3, bh*0.75, fill=1, stroke=1)
     canvas.rect(bx-10, by, bw*0.6, bh*1.15, fill=1, stroke=1)
     # Fenster (gelb = Wärmequellen)
-    canvas.setFillColor(colors.HexColor('#ffd600'))
+    canvas.setFillColor(rl.colors.HexColor('#ffd600'))
     for wrow in range(3):
         for wcol in range(2):
             canvas.rect(bx+8+wcol*18, by+bh*0.15+wrow*bh*0.22, 10, 8, fill=1, stroke=0)
     # Temperatur-Label
-    canvas.setFillColor(colors.HexColor('#ffffff'))
+    canvas.setFillColor(rl.colors.HexColor('#ffffff'))
     canvas.setFont('Helvetica-Bold', 7)
     canvas.drawString(x+5, y+h-8, 'THERMISCHE GEBÄUDESIMULATION  •  KÜHLLASTSTROMANALYSE')
     
@@ -1555,26 +1225,27 @@ def _thermal_cover_graphic(canvas, x, y, w, h):
 def _make_cover(story, proj, kunde, bearbeiter, firma,
                 partner_firma, report_type, g_sums, selected_hw, liefertermin="—"):
     """Deckblatt - EINFACHER STIL WIE SEITE 2"""
+    rl = _lade_reportlab()
     
     # 1. BLAUER HEADER
     badge_text = '👔 KUNDENBERICHT' if report_type == 'kunde' else '🔧 TECHNIKÜBERGABE'
     
-    header_title = Paragraph('°coolMATH Pro — Kühllastanalyse', 
-        ParagraphStyle('ht', fontName='Helvetica-Bold', fontSize=22, 
-                      textColor=_WHITE, alignment=TA_LEFT))
-    header_sub = Paragraph(f'Version {APP_VERSION}  |  {datetime.now().strftime("%d.%m.%Y")}', 
-        ParagraphStyle('hs', fontName='Helvetica', fontSize=10, 
-                      textColor=colors.HexColor('#e0f2f9'), alignment=TA_LEFT))
-    header_firma = Paragraph(partner_firma or firma, 
-        ParagraphStyle('hf', fontName='Helvetica', fontSize=10, 
-                      textColor=_WHITE, alignment=TA_RIGHT))
-    
-    header_tbl = Table([
+    header_title = rl.Paragraph('°coolMATH Pro — Kühllastanalyse', 
+        rl.ParagraphStyle('ht', fontName='Helvetica-Bold', fontSize=22, 
+                         textColor=rl.WHITE, alignment=rl.TA_LEFT))
+    header_sub = rl.Paragraph(f'Version {APP_VERSION}  |  {datetime.now().strftime("%d.%m.%Y")}', 
+        rl.ParagraphStyle('hs', fontName='Helvetica', fontSize=10, 
+                         textColor=rl.colors.HexColor('#e0f2f9'), alignment=rl.TA_LEFT))
+    header_firma = rl.Paragraph(partner_firma or firma, 
+        rl.ParagraphStyle('hf', fontName='Helvetica', fontSize=10, 
+                         textColor=rl.WHITE, alignment=rl.TA_RIGHT))
+    
+    header_tbl = rl.Table([
         [header_title, header_firma],
         [header_sub, ''],
-    ], colWidths=[140*mm, 35*mm])
-    header_tbl.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,-1), _BLUE),
+    ], colWidths=[140*rl.mm, 35*rl.mm])
+    header_tbl.setStyle(rl.TableStyle([
+        ('BACKGROUND', (0,0), (-1,-1), rl.BLUE),
         ('VALIGN', (0,0), (0,0), 'TOP'),
         ('VALIGN', (1,0), (1,0), 'TOP'),
         ('SPAN', (0,1), (1,1)),
@@ -1584,20 +1255,20 @@ def _make_cover(story, proj, kunde, bearbeiter, firma,
         ('RIGHTPADDING', (0,0), (-1,-1), 15),
     ]))
     story.append(header_tbl)
-    story.append(Spacer(1, 20*mm))
+    story.append(rl.Spacer(1, 20*rl.mm))
     
     # 2. TYP-BADGE
-    badge_para = Paragraph(badge_text, ParagraphStyle('badge', 
-        fontName='Helvetica-Bold', fontSize=13, textColor=_WHITE, alignment=TA_CENTER))
-    badge_color = _BLUE if report_type == 'kunde' else colors.HexColor('#546e7a')
-    badge_tbl = Table([[badge_para]], colWidths=[175*mm])
-    badge_tbl.setStyle(TableStyle([
+    badge_para = rl.Paragraph(badge_text, rl.ParagraphStyle('badge', 
+        fontName='Helvetica-Bold', fontSize=13, textColor=rl.WHITE, alignment=rl.TA_CENTER))
+    badge_color = rl.BLUE if report_type == 'kunde' else rl.colors.HexColor('#546e7a')
+    badge_tbl = rl.Table([[badge_para]], colWidths=[175*rl.mm])
+    badge_tbl.setStyle(rl.TableStyle([
         ('BACKGROUND', (0,0), (-1,-1), badge_color),
         ('TOPPADDING', (0,0), (-1,-1), 12),
         ('BOTTOMPADDING', (0,0), (-1,-1), 12),
     ]))
     story.append(badge_tbl)
-    story.append(Spacer(1, 15*mm))
+    story.append(rl.Spacer(1, 15*rl.mm))
     
     # 3. PROJEKT-INFO TABELLE
     peak_vdi = int(np.max(g_sums['VDI_N']))
@@ -1616,17 +1287,17 @@ def _make_cover(story, proj, kunde, bearbeiter, firma,
     if report_type == 'uebergabe' and liefertermin != "—":
         info_rows.append(['📅 Liefertermin', liefertermin])
     
-    info_tbl = Table([[
-        Paragraph(r[0], ParagraphStyle('lbl', fontName='Helvetica-Bold',
-            fontSize=10, textColor=_DARK)),
-        Paragraph(r[1], ParagraphStyle('val', fontName='Helvetica',
-            fontSize=10, textColor=_DARK))]
+    info_tbl = rl.Table([[
+        rl.Paragraph(r[0], rl.ParagraphStyle('lbl', fontName='Helvetica-Bold',
+            fontSize=10, textColor=rl.DARK)),
+        rl.Paragraph(r[1], rl.ParagraphStyle('val', fontName='Helvetica',
+            fontSize=10, textColor=rl.DARK))]
         for r in info_rows],
-        colWidths=[50*mm, 125*mm])
+        colWidths=[50*rl.mm, 125*rl.mm])
     
-    info_tbl.setStyle(TableStyle([
-        ('ROWBACKGROUNDS', (0,0), (-1,-1), [_WHITE, _LGRAY]),
-        ('GRID', (0,0), (-1,-1), 0.5, colors.HexColor('#ddd')),
+    info_tbl.setStyle(rl.TableStyle([
+        ('ROWBACKGROUNDS', (0,0), (-1,-1), [rl.WHITE, rl.LGRAY]),
+        ('GRID', (0,0), (-1,-1), 0.5, rl.colors.HexColor('#ddd')),
         ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
         ('TOPPADDING', (0,0), (-1,-1), 8),
         ('BOTTOMPADDING', (0,0), (-1,-1), 8),
@@ -1634,13 +1305,13 @@ def _make_cover(story, proj, kunde, bearbeiter, firma,
         ('RIGHTPADDING', (0,0), (-1,-1), 12),
     ]))
     story.append(info_tbl)
-    story.append(PageBreak())  # Kein Copyright hier - kommt am Ende
+    story.append(rl.PageBreak())  # Kein Copyright hier - kommt am Ende
 
 
 def _eingabe_tabelle(story, room_inputs, zone_names):
     """Eingabedaten pro Raum als Tabelle"""
+    rl = _lade_reportlab()
     story += _section_hdr('Eingabedaten', 'Raumparameter je Zone')
-    hdr = ['Parameter', 'Zone 1', 'Zone 2', 'Zone 3', 'Zone 4', 'Zone 5']
     params = [
         ('Bezeichnung',    'name',        lambda v: str(v)),
         ('Fläche [m²]',    'flaeche',     lambda v: f'{v:.1f}' if isinstance(v,(int,float)) else str(v)),
@@ -1648,50 +1319,56 @@ def _eingabe_tabelle(story, room_inputs, zone_names):
         ('Personen',       'personen',    lambda v: str(v)),
         ('Fensterfläche',  'fenster',     lambda v: f'{v:.1f}' if isinstance(v,(int,float)) else str(v)),
         ('Orientierung',   'orientierung',lambda v: str(v)),
+        ('Weitere Fassaden', 'fassaden',  fassaden_text),
         ('Nutzung',        'nutzung',     lambda v: str(v)),
         ('U-Wert [W/m²K]', 'u_wert',      lambda v: f'{v:.2f}' if isinstance(v,(int,float)) else str(v)),
     ]
-    rows = [hdr]
-    for param_label, key, fmt in params:
-        row = [param_label]
-        for zi in range(5):
-            ri = room_inputs[zi] if isinstance(room_inputs, list) and zi < len(room_inputs) else {}
-            val = ri.get(key, '—') if isinstance(ri, dict) else '—'
-            try:
-                row.append(fmt(val))
-            except Exception:
-                row.append(str(val))
-        rows.append(row)
-    widths = [38*mm, 25*mm, 25*mm, 25*mm, 25*mm, 25*mm]
-    t = Table(rows, colWidths=widths, repeatRows=1)
-    t.setStyle(_tbl_style_fn(total_row=False))
-    story += [t, Spacer(1, 5*mm)]
+    # je 5 Zonen eine Tabelle (Seitenbreite)
+    n_zonen = max(len(zone_names), len(room_inputs) if isinstance(room_inputs, list) else 0)
+    for start in range(0, n_zonen, 5):
+        spalten = range(start, min(start + 5, n_zonen))
+        rows = [['Parameter'] + [f'Zone {zi+1}' for zi in spalten]]
+        for param_label, key, fmt in params:
+            row = [param_label]
+            for zi in spalten:
+                ri = room_inputs[zi] if isinstance(room_inputs, list) and zi < len(room_inputs) else {}
+                val = ri.get(key, '—') if isinstance(ri, dict) else '—'
+                try:
+                    row.append(fmt(val))
+                except Exception:
+                    row.append(str(val))
+            rows.append(row)
+        widths = [38*rl.mm] + [25*rl.mm] * len(spalten)
+        t = rl.Table(rows, colWidths=widths, repeatRows=1)
+        t.setStyle(_tbl_style_fn(total_row=False))
+        story += [t, rl.Spacer(1, 5*rl.mm)]
 
 
 def _geraete_tabelle(story, room_results, selected_hw, selected_hw_ag, zone_names, 
                      show_prices=True, show_artnr=True, selected_ig_artnr=None):
     """IG + AG Gerätetabelle - AUFGETEILT IN ZWEI SEPARATE TABELLEN"""
+    rl = _lade_reportlab()
     if selected_ig_artnr is None:
-        selected_ig_artnr = ['—'] * 5
+        selected_ig_artnr = ['—'] * len(zone_names)
     
     # ===== TABELLE 1: INNENGERÄTE =====
     story += _section_hdr('Innengeräte', 'Übersicht Innengeräte je Zone')
     
     if show_prices:
         hdr_ig = ['Zone', 'Leistung', 'Artikelnummer', 'Listenpreis']
-        widths_ig = [35*mm, 25*mm, 55*mm, 35*mm]
+        widths_ig = [35*rl.mm, 25*rl.mm, 55*rl.mm, 35*rl.mm]
     else:
         hdr_ig = ['Zone', 'Leistung', 'Artikelnummer']
-        widths_ig = [50*mm, 35*mm, 65*mm]
+        widths_ig = [50*rl.mm, 35*rl.mm, 65*rl.mm]
     
     rows_ig = [hdr_ig]
-    for zi in range(5):
+    for zi in range(len(zone_names)):
         ig_kw = selected_hw[zi] if zi < len(selected_hw) else 0
         ig_artnr = selected_ig_artnr[zi] if zi < len(selected_ig_artnr) else '—'
         zone_n = zone_names[zi] if zi < len(zone_names) else f'Zone {zi+1}'
         
-        # IG-Preis (TODO: aus Daten holen wenn verfügbar)
-        ig_preis_str = '—'
+        ig_preis = listenpreis(ig_artnr) if show_prices else None
+        ig_preis_str = f"{fmt_number(ig_preis)} EUR" if ig_preis else '—'
         
         if show_prices:
             rows_ig.append([zone_n, f'{ig_kw:.1f} kW' if ig_kw else 'N.V.', 
@@ -1699,22 +1376,22 @@ def _geraete_tabelle(story, room_results, selected_hw, selected_hw_ag, zone_name
         else:
             rows_ig.append([zone_n, f'{ig_kw:.1f} kW' if ig_kw else 'N.V.', ig_artnr])
     
-    t_ig = Table(rows_ig, colWidths=widths_ig, repeatRows=1)
+    t_ig = rl.Table(rows_ig, colWidths=widths_ig, repeatRows=1)
     t_ig.setStyle(_tbl_style_fn(total_row=False))
-    story += [t_ig, Spacer(1, 8*mm)]
+    story += [t_ig, rl.Spacer(1, 8*rl.mm)]
     
     # ===== TABELLE 2: AUSSENGERÄTE =====
     story += _section_hdr('Außengeräte', 'Übersicht Außengeräte je Zone')
     
     if show_prices:
         hdr_ag = ['Zone', 'Typ', 'Leistung', 'Artikelnummer', 'Listenpreis']
-        widths_ag = [30*mm, 22*mm, 25*mm, 50*mm, 35*mm]
+        widths_ag = [30*rl.mm, 22*rl.mm, 25*rl.mm, 50*rl.mm, 35*rl.mm]
     else:
         hdr_ag = ['Zone', 'Typ', 'Artikelnummer']
-        widths_ag = [50*mm, 35*mm, 65*mm]
+        widths_ag = [50*rl.mm, 35*rl.mm, 65*rl.mm]
     
     rows_ag = [hdr_ag]
-    for zi in range(5):
+    for zi in range(len(zone_names)):
         ag_inf = selected_hw_ag[zi] if zi < len(selected_hw_ag) else ('—', 0, 'N.V.')
         ag_typ = ag_inf[0] if isinstance(ag_inf,(list,tuple)) and len(ag_inf)>0 else '—'
         ag_kw = ag_inf[1] if isinstance(ag_inf,(list,tuple)) and len(ag_inf)>1 else 0
@@ -1722,13 +1399,8 @@ def _geraete_tabelle(story, room_results, selected_hw, selected_hw_ag, zone_name
         zone_n = zone_names[zi] if zi < len(zone_names) else f'Zone {zi+1}'
         
         # AG-Preis ermitteln
-        ag_preis_str = '—'
-        if ag_kw and ag_kw > 0 and ag_typ == 'FJM':
-            try:
-                if ag_kw in FJM_AG_PRICES:
-                    ag_preis_str = f"{fmt_number(FJM_AG_PRICES[ag_kw]['preis'])} EUR"
-            except Exception:
-                pass
+        ag_preis = listenpreis(ag_artnr) if show_prices else None
+        ag_preis_str = f"{fmt_number(ag_preis)} EUR" if ag_preis else '—'
         
         if show_prices:
             rows_ag.append([zone_n, ag_typ, f'{ag_kw:.1f} kW' if ag_kw else 'N.V.', 
@@ -1736,22 +1408,25 @@ def _geraete_tabelle(story, room_results, selected_hw, selected_hw_ag, zone_name
         else:
             rows_ag.append([zone_n, ag_typ, ag_artnr])
     
-    t_ag = Table(rows_ag, colWidths=widths_ag, repeatRows=1)
+    t_ag = rl.Table(rows_ag, colWidths=widths_ag, repeatRows=1)
     t_ag.setStyle(_tbl_style_fn(total_row=False))
-    story += [t_ag, Spacer(1, 5*mm)]
+    story += [t_ag, rl.Spacer(1, 5*rl.mm)]
 
 
 
 def make_pdf_chart(profiles, total, title, mode_key, hours=HOURS):
     """Erstellt Matplotlib-Chart für PDF-Export"""
+    plt = _plt()
     fig, ax = plt.subplots(figsize=(10, 4.5))
     fig.patch.set_facecolor('white')
     ax.set_facecolor('#fafafa')
     
     colors = ['#36A9E1', '#E74C3C', '#2ECC71', '#F39C12', '#9B59B6']
     for idx, p in enumerate(profiles):
-        ax.plot(hours, p[mode_key], alpha=0.6, linewidth=1.5, 
-                label=p["name"], color=colors[idx % len(colors)], linestyle='--')
+        # Legende nur für die ersten 10 Zonen (große Gebäude)
+        ax.plot(hours, p[mode_key], alpha=0.6, linewidth=1.5,
+                label=p["name"] if idx < 10 else None,
+                color=colors[idx % len(colors)], linestyle='--')
     
     ax.plot(hours, total, color='#3C3C3B', linewidth=3.5, label='GESAMT SIMULTAN', zorder=5)
     
@@ -1768,32 +1443,38 @@ def make_pdf_chart(profiles, total, title, mode_key, hours=HOURS):
     return buf.getvalue()
 
 
+# Plotly-Strichart (METHODEN_REGISTRY) -> Matplotlib
+_MPL_LINIE = {"solid": "-", "dash": "--", "dot": ":", "dashdot": "-.", "longdash": "--"}
+
+
+def methoden_von(g_sums):
+    """Gerechnete Methoden eines Projekts (Schlüssel von g_sums) in Registry-Reihenfolge."""
+    return [m for m in METHODEN_REGISTRY if m in g_sums]
+
+
+def ergebnis_tabelle(room_results, g_sums):
+    """Kopf + Zeilen der Ergebnismatrix (Spitzen je Zone und Methode, Simultan-Peak)."""
+    methoden = methoden_von(g_sums)
+    hdr = ['Zone'] + [METHODEN_REGISTRY[m]["kurz"] for m in methoden]
+    rows = [hdr]
+    for r in room_results:
+        rows.append([r['ZONE']] + [fmt_number(r.get(METHODEN_REGISTRY[m]["spalte"], 0))
+                                   for m in methoden])
+    rows.append(['SIMULTAN-PEAK'] + [fmt_number(int(np.max(g_sums[m]))) for m in methoden])
+    return rows
+
+
 def make_comparison_chart(g_sums, hours=HOURS):
     """Erstellt Vergleichs-Chart aller Methoden für PDF"""
+    plt = _plt()
     fig, ax = plt.subplots(figsize=(10, 5))
     fig.patch.set_facecolor('white')
     ax.set_facecolor('#fafafa')
     
-    method_colors = {
-        "VDI NEU (VDI 6007)": ('#36A9E1', 3.5, '-'),
-        "VDI ALT (2078-1996)": ('#F39C12', 2.0, '--'),
-        "Recknagel":           ('#3C3C3B', 2.0, ':'),
-        "Praktiker":           ('#E74C3C', 2.5, '-.'),
-        "Kaltluftsee":         ('#9B59B6', 2.0, '--'),
-        "KI-Hybrid":           ('#1ABC9C', 2.5, '-'),
-    }
-    key_map = {
-        "VDI NEU (VDI 6007)": "VDI_N",
-        "VDI ALT (2078-1996)": "VDI_A",
-        "Recknagel":           "RECK",
-        "Praktiker":           "PRAK",
-        "Kaltluftsee":         "KLTS",
-        "KI-Hybrid":           "KI",
-    }
-    
-    for name, (color, lw, ls) in method_colors.items():
-        key = key_map[name]
-        ax.plot(hours, g_sums[key], color=color, linewidth=lw, linestyle=ls, label=name)
+    for m in methoden_von(g_sums):
+        e = METHODEN_REGISTRY[m]
+        ax.plot(hours, g_sums[m], color=e["farbe"], linewidth=e["linie"][1],
+                linestyle=_MPL_LINIE[e["linie"][0]], label=e["name"])
     
     ax.set_title('METHODENVERGLEICH - SIMULTAN-TRENDKURVEN', fontweight='bold', 
                  fontsize=12, color='#3C3C3B')
@@ -1827,14 +1508,8 @@ def build_transfer_report(proj, kunde, bearbeiter, firma, room_results, g_sums,
         "datum": datetime.now().strftime("%d.%m.%Y %H:%M"),
         "version": APP_VERSION,
         "zonen": [],
-        "peaks": {
-            "vdi_neu": int(np.max(g_sums["VDI_N"])),
-            "vdi_alt": int(np.max(g_sums["VDI_A"])),
-            "recknagel": int(np.max(g_sums["RECK"])),
-            "praktiker": int(np.max(g_sums["PRAK"])),
-            "kaltluftsee": int(np.max(g_sums["KLTS"])),
-            "ki_hybrid": int(np.max(g_sums["KI"])),
-        },
+        "peaks": {METHODEN_REGISTRY[m]["json"]: int(np.max(g_sums[m]))
+                  for m in methoden_von(g_sums)},
         "installation": {
             "gesamt_kw": round(total_kw, 2),
             "anzahl_zonen": len([kw for kw in selected_hw if kw > 0]),
@@ -1846,12 +1521,8 @@ def build_transfer_report(proj, kunde, bearbeiter, firma, room_results, g_sums,
         sr = samsung_recommendations[idx] if idx < len(samsung_recommendations) else {}
         zone = {
             "name": r["ZONE"],
-            "peak_vdi_neu": r["VDI NEU"],
-            "peak_vdi_alt": r["VDI ALT"],
-            "peak_recknagel": r["RECKNAGEL"],
-            "peak_praktiker": r["PRAKTIKER"],
-            "peak_kaltluftsee": r.get("KALTLUFTSEE", 0),
-            "peak_ki_hybrid": r.get("KI HYBRID", 0),
+            **{f"peak_{METHODEN_REGISTRY[m]['json']}": r.get(METHODEN_REGISTRY[m]["spalte"], 0)
+               for m in methoden_von(g_sums)},
             "ig_kw": ig_kw,
             "ag_typ": ag_info[0] if isinstance(ag_info, (list, tuple)) else "—",
             "ag_kw": ag_info[1] if isinstance(ag_info, (list, tuple)) and len(ag_info) > 1 else 0,
@@ -1862,20 +1533,22 @@ def build_transfer_report(proj, kunde, bearbeiter, firma, room_results, g_sums,
     return json.dumps(data, ensure_ascii=False, indent=2)
 
 
+@traced("coolMATH.generate_kunden_pdf")
 def generate_kunden_pdf(proj, kunde, bearbeiter, firma, room_results, g_sums,
                          individual_profiles, samsung_recommendations,
                          selected_hw, total_installed_kw, selected_hw_ag=None,
                          room_inputs=None, partner_firma="", selected_ig_artnr=None):
+    rl = _lade_reportlab()
     if selected_hw_ag is None: selected_hw_ag = []
-    if selected_ig_artnr is None: selected_ig_artnr = ['—'] * 5
-    if room_inputs is None:    room_inputs = [{} for _ in range(5)]
+    if selected_ig_artnr is None: selected_ig_artnr = ['—'] * len(room_results)
+    if room_inputs is None:    room_inputs = [{} for _ in room_results]
     zone_names = [r.get('ZONE', f'Zone {i+1}') for i, r in enumerate(room_results)]
 
     buf = _io.BytesIO()
     hf  = lambda c, d: _hf_normal(c, d, partner_firma, firma)
-    doc = SimpleDocTemplate(buf, pagesize=A4,
-                             topMargin=45*mm, bottomMargin=22*mm,
-                             leftMargin=15*mm, rightMargin=15*mm)
+    doc = rl.SimpleDocTemplate(buf, pagesize=rl.A4,
+                                topMargin=45*rl.mm, bottomMargin=22*rl.mm,
+                                leftMargin=15*rl.mm, rightMargin=15*rl.mm)
     story = []
 
     # Deckblatt
@@ -1887,81 +1560,72 @@ def generate_kunden_pdf(proj, kunde, bearbeiter, firma, room_results, g_sums,
 
     # Executive Summary
     story += _section_hdr('Executive Summary', 'Analyse & Empfehlung')
+    methoden = methoden_von(g_sums)
     peak_vdi = int(np.max(g_sums['VDI_N']))
-    peak_ki  = int(np.max(g_sums['KI']))
-    einspar  = round((peak_vdi - peak_ki) / peak_vdi * 100) if peak_vdi > 0 else 0
     summary  = (
         f"Für Projekt «{proj}» (Auftraggeber: {kunde}) wurde eine Kühllastanalyse "
-        f"nach 6 Berechnungsverfahren durchgeführt. Simultanspitze VDI 6007: "
-        f"{fmt_number(peak_vdi)} W ({peak_vdi/1000:.1f} kW). Das KI-Hybrid-Modell mit "
-        f"Pre-Cooling reduziert auf {fmt_number(peak_ki)} W — Einsparung {einspar}%. "
-        f"Gesamtinstallation: {total_installed_kw:.1f} kW Samsung Wind-Free."
+        f"nach {len(methoden)} Berechnungsverfahren durchgeführt. Simultanspitze VDI 6007: "
+        f"{fmt_number(peak_vdi)} W ({peak_vdi/1000:.1f} kW). "
     )
-    story.append(Paragraph(summary, _S['body']))
-    story.append(Spacer(1, 4*mm))
+    if 'KI' in g_sums:
+        peak_ki = int(np.max(g_sums['KI']))
+        einspar = round((peak_vdi - peak_ki) / peak_vdi * 100) if peak_vdi > 0 else 0
+        summary += (f"Das KI-Hybrid-Modell mit Pre-Cooling reduziert auf "
+                    f"{fmt_number(peak_ki)} W — Einsparung {einspar}%. ")
+    summary += f"Gesamtinstallation: {total_installed_kw:.1f} kW Samsung Wind-Free."
+    story.append(rl.Paragraph(summary, rl.S['body']))
+    story.append(rl.Spacer(1, 4*rl.mm))
 
     # Ergebnis-Matrix (OHNE Preise)
-    story += _section_hdr('Kühllast-Ergebnisse', 'Alle 6 Methoden — Simultanspitzenwerte [W]')
-    hdr = ['Zone', 'VDI 6007', 'VDI 2078 Alt', 'Recknagel', 'Praktiker', 'Kaltl.see', 'KI-Hybrid']
-    rows = [hdr]
-    for r in room_results:
-        rows.append([r['ZONE'], fmt_number(r['VDI NEU']), fmt_number(r['VDI ALT']),
-                     fmt_number(r['RECKNAGEL']), fmt_number(r['PRAKTIKER']),
-                     fmt_number(r.get('KALTLUFTSEE',0)), fmt_number(r.get('KI HYBRID',0))])
-    rows.append(['SIMULTAN-PEAK',
-                 fmt_number(int(np.max(g_sums['VDI_N']))), fmt_number(int(np.max(g_sums['VDI_A']))),
-                 fmt_number(int(np.max(g_sums['RECK']))),  fmt_number(int(np.max(g_sums['PRAK']))),
-                 fmt_number(int(np.max(g_sums['KLTS']))),  fmt_number(int(np.max(g_sums['KI'])))])
-    t = Table(rows, colWidths=[28*mm,24*mm,24*mm,24*mm,24*mm,24*mm,24*mm], repeatRows=1)
+    story += _section_hdr('Kühllast-Ergebnisse',
+                          f'{len(methoden)} Methoden — Simultanspitzenwerte [W]')
+    rows = ergebnis_tabelle(room_results, g_sums)
+    t = rl.Table(rows, colWidths=[28*rl.mm] + [144*rl.mm / len(methoden)] * len(methoden), repeatRows=1)
     t.setStyle(_tbl_style_fn())
-    story += [t, Spacer(1, 5*mm)]
+    story += [t, rl.Spacer(1, 5*rl.mm)]
 
     # Geräteauswahl (kein Preis im Kundenbericht)
     _geraete_tabelle(story, room_results, selected_hw, selected_hw_ag, zone_names, 
                      show_prices=False, show_artnr=False, selected_ig_artnr=selected_ig_artnr)
 
-    # Alle 6 Einzelzonen-Diagramme
-    story.append(PageBreak())
-    story += _section_hdr('Simultan-Diagramme', 'Alle 6 Berechnungsverfahren — Einzelzonen')
-    diagramme = [
-        ('VDI 6007 Neu',   'vdi_n', 'VDI_N'),
-        ('VDI 2078 Alt',   'vdi_a', 'VDI_A'),
-        ('Praktiker',      'prak',  'PRAK'),
-        ('Recknagel',      'reck',  'RECK'),
-        ('Kaltluftsee',    'klts',  'KLTS'),
-        ('KI-Hybrid',      'ki',    'KI'),
-    ]
+    # Einzelzonen-Diagramme je Methode
+    story.append(rl.PageBreak())
+    story += _section_hdr('Simultan-Diagramme', f'{len(methoden)} Berechnungsverfahren — Einzelzonen')
+    diagramme = [(METHODEN_REGISTRY[m]["name"], METHODEN_REGISTRY[m]["profil"], m)
+                 for m in methoden]
     for i, (title, mode_key, sum_key) in enumerate(diagramme):
         if i > 0 and i % 2 == 0:
-            story.append(PageBreak())
-        story.append(Paragraph(title, _S['h2']))
+            story.append(rl.PageBreak())
+        story.append(rl.Paragraph(title, rl.S['h2']))
         img_b = make_pdf_chart(individual_profiles, g_sums[sum_key], title, mode_key)
-        story += _chart(img_b, width=165*mm)
+        story += _chart(img_b, width=165*rl.mm)
 
     # Disclaimer Footer-Seite
-    story.append(PageBreak())
+    story.append(rl.PageBreak())
     story += _section_hdr('Rechtlicher Hinweis & Haftungsausschluss')
-    story.append(Paragraph(_COPYRIGHT, _S['body']))
+    story.append(rl.Paragraph(_COPYRIGHT, rl.S['body']))
 
     doc.build(story, onFirstPage=_hf_cover, onLaterPages=hf)
     return buf.getvalue()
 
 
+@traced("coolMATH.generate_uebergabe_pdf")
 def generate_uebergabe_pdf(proj, kunde, bearbeiter, firma, room_results, g_sums,
                             individual_profiles, samsung_recommendations,
                             selected_hw, total_installed_kw, selected_hw_ag=None,
                             room_inputs=None, partner_firma="", selected_ig_artnr=None,
                             liefertermin="—"):
+    rl = _lade_reportlab()
     if selected_hw_ag is None: selected_hw_ag = []
-    if selected_ig_artnr is None: selected_ig_artnr = ['—'] * 5
-    if room_inputs is None:    room_inputs = [{} for _ in range(5)]
+    if selected_ig_artnr is None: selected_ig_artnr = ['—'] * len(room_results)
+    if room_inputs is None:    room_inputs = [{} for _ in room_results]
     zone_names = [r.get('ZONE', f'Zone {i+1}') for i, r in enumerate(room_results)]
 
     buf = _io.BytesIO()
     hf  = lambda c, d: _hf_normal(c, d, partner_firma, firma)
-    doc = SimpleDocTemplate(buf, pagesize=A4,
-                             topMargin=45*mm, bottomMargin=22*mm,
-                             leftMargin=15*mm, rightMargin=15*mm)
+    doc = rl.SimpleDocTemplate(buf, pagesize=rl.A4,
+                                topMargin=45*rl.mm, bottomMargin=22*rl.mm,
+                                leftMargin=15*rl.mm, rightMargin=15*rl.mm)
     story = []
 
     # Deckblatt
@@ -1972,64 +1636,51 @@ def generate_uebergabe_pdf(proj, kunde, bearbeiter, firma, room_results, g_sums,
     _eingabe_tabelle(story, room_inputs, zone_names)
 
     # Vollständige Ergebnismatrix MIT Preisen
-    story += _section_hdr('Vollständige Ergebnismatrix', 'Alle 6 Methoden [W]')
-    hdr = ['Zone', 'VDI Neu', 'VDI Alt', 'Recknagel', 'Praktiker', 'Kaltl.', 'KI-Hyb.']
-    rows = [hdr]
-    for r in room_results:
-        rows.append([r['ZONE'], fmt_number(r['VDI NEU']), fmt_number(r['VDI ALT']),
-                     fmt_number(r['RECKNAGEL']), fmt_number(r['PRAKTIKER']),
-                     fmt_number(r.get('KALTLUFTSEE',0)), fmt_number(r.get('KI HYBRID',0))])
-    rows.append(['SIMULTAN-PEAK',
-                 fmt_number(int(np.max(g_sums['VDI_N']))), fmt_number(int(np.max(g_sums['VDI_A']))),
-                 fmt_number(int(np.max(g_sums['RECK']))),  fmt_number(int(np.max(g_sums['PRAK']))),
-                 fmt_number(int(np.max(g_sums['KLTS']))),  fmt_number(int(np.max(g_sums['KI'])))])
-    t = Table(rows, colWidths=[28*mm,24*mm,24*mm,24*mm,24*mm,24*mm,24*mm], repeatRows=1)
+    methoden = methoden_von(g_sums)
+    story += _section_hdr('Vollständige Ergebnismatrix', f'{len(methoden)} Methoden [W]')
+    rows = ergebnis_tabelle(room_results, g_sums)
+    t = rl.Table(rows, colWidths=[28*rl.mm] + [144*rl.mm / len(methoden)] * len(methoden), repeatRows=1)
     t.setStyle(_tbl_style_fn())
-    story += [t, Spacer(1, 5*mm)]
+    story += [t, rl.Spacer(1, 5*rl.mm)]
 
     # Geräteauswahl MIT Preisen (Technikübergabe)
     _geraete_tabelle(story, room_results, selected_hw, selected_hw_ag, zone_names,
                      show_prices=True, show_artnr=True, selected_ig_artnr=selected_ig_artnr)
 
-    # Alle 6 Einzelzonen-Diagramme
-    story.append(PageBreak())
-    story += _section_hdr('Simultan-Diagramme', 'Alle 6 Berechnungsverfahren — Einzelzonen')
-    diagramme = [
-        ('VDI 6007 Neu',   'vdi_n', 'VDI_N'),
-        ('VDI 2078 Alt',   'vdi_a', 'VDI_A'),
-        ('Praktiker',      'prak',  'PRAK'),
-        ('Recknagel',      'reck',  'RECK'),
-        ('Kaltluftsee',    'klts',  'KLTS'),
-        ('KI-Hybrid',      'ki',    'KI'),
-    ]
+    # Einzelzonen-Diagramme je Methode
+    story.append(rl.PageBreak())
+    story += _section_hdr('Simultan-Diagramme', f'{len(methoden)} Berechnungsverfahren — Einzelzonen')
+    diagramme = [(METHODEN_REGISTRY[m]["name"], METHODEN_REGISTRY[m]["profil"], m)
+                 for m in methoden]
     for i, (title, mode_key, sum_key) in enumerate(diagramme):
         if i > 0 and i % 2 == 0:
-            story.append(PageBreak())
-        story.append(Paragraph(title, _S['h2']))
+            story.append(rl.PageBreak())
+        story.append(rl.Paragraph(title, rl.S['h2']))
         img_b = make_pdf_chart(individual_profiles, g_sums[sum_key], title, mode_key)
-        story += _chart(img_b, width=165*mm)
+        story += _chart(img_b, width=165*rl.mm)
 
     # Methodenvergleich
-    story.append(PageBreak())
-    story += _section_hdr('Methodenvergleich', 'Alle Methoden überlagert')
-    story += _chart(make_comparison_chart(g_sums), width=165*mm)
+    story.append(rl.PageBreak())
+    story += _section_hdr('Methodenvergleich', 'Gerechnete Methoden überlagert')
+    story += _chart(make_comparison_chart(g_sums), width=165*rl.mm)
 
     # Haftungsausschluss
-    story.append(PageBreak())
+    story.append(rl.PageBreak())
     story += _section_hdr('Rechtlicher Hinweis & Haftungsausschluss')
-    story.append(Paragraph(_COPYRIGHT, _S['body']))
+    story.append(rl.Paragraph(_COPYRIGHT, rl.S['body']))
 
     doc.build(story, onFirstPage=_hf_cover, onLaterPages=hf)
     return buf.getvalue()
 
 
+@traced("coolMATH.generate_word_report")
 def generate_word_report(proj, kunde, bearbeiter, firma, room_results, g_sums,
                           selected_hw, total_installed_kw, selected_hw_ag=None,
                           room_inputs=None, partner_firma="", selected_ig_artnr=None):
     """Word-Dokument mit python-docx — vollständiger Bericht"""
     if selected_hw_ag is None: selected_hw_ag = []
-    if selected_ig_artnr is None: selected_ig_artnr = ['—'] * 5
-    if room_inputs is None:    room_inputs = [{} for _ in range(5)]
+    if selected_ig_artnr is None: selected_ig_artnr = ['—'] * len(room_results)
+    if room_inputs is None:    room_inputs = [{} for _ in room_results]
     try:
         from docx import Document as DocxDoc
     except ImportError:
@@ -2107,37 +1758,36 @@ def generate_word_report(proj, kunde, bearbeiter, firma, room_results, g_sums,
     # Eingabedaten
     _h('Eingabedaten', level=1)
     zone_names = [r.get('ZONE', f'Zone {zi+1}') for zi, r in enumerate(room_results)]
-    hdr_e = ['Parameter'] + zone_names
     params_e = [('Fläche [m²]','flaeche'), ('Höhe [m]','hoehe'), ('Personen','personen'),
-                ('Fenster [m²]','fenster'), ('Orientierung','orientierung')]
-    rows_e = []
-    for lbl, key in params_e:
-        row = [lbl]
-        for zi in range(5):
-            ri = room_inputs[zi] if zi < len(room_inputs) else {}
-            row.append(str(ri.get(key,'—')) if isinstance(ri,dict) else '—')
-        rows_e.append(row)
-    _tbl(hdr_e, rows_e, [3.5,2.5,2.5,2.5,2.5,2.5])
+                ('Fenster [m²]','fenster'), ('Orientierung','orientierung'),
+                ('Weitere Fassaden','fassaden')]
+    for start in range(0, len(zone_names), 5):   # je 5 Zonen eine Tabelle
+        spalten = range(start, min(start + 5, len(zone_names)))
+        hdr_e = ['Parameter'] + [zone_names[zi] for zi in spalten]
+        rows_e = []
+        for lbl, key in params_e:
+            row = [lbl]
+            for zi in spalten:
+                ri = room_inputs[zi] if zi < len(room_inputs) else {}
+                if not isinstance(ri, dict):
+                    row.append('—')
+                elif key == 'fassaden':
+                    row.append(fassaden_text(ri.get(key)))
+                else:
+                    row.append(str(ri.get(key,'—')))
+            rows_e.append(row)
+        _tbl(hdr_e, rows_e, [3.5] + [2.5] * len(spalten))
 
     # Ergebnismatrix
     _h('Ergebnis-Matrix', level=1)
-    hdr_r = ['Zone','VDI Neu','VDI Alt','Recknagel','Praktiker','Kaltl.see','KI-Hybrid']
-    rows_r = []
-    for r in room_results:
-        rows_r.append([r['ZONE'], fmt_number(r['VDI NEU']), fmt_number(r['VDI ALT']),
-                       fmt_number(r['RECKNAGEL']), fmt_number(r['PRAKTIKER']),
-                       fmt_number(r.get('KALTLUFTSEE',0)), fmt_number(r.get('KI HYBRID',0))])
-    rows_r.append(['SIMULTAN-PEAK',
-                   fmt_number(int(np.max(g_sums['VDI_N']))), fmt_number(int(np.max(g_sums['VDI_A']))),
-                   fmt_number(int(np.max(g_sums['RECK']))), fmt_number(int(np.max(g_sums['PRAK']))),
-                   fmt_number(int(np.max(g_sums['KLTS']))), fmt_number(int(np.max(g_sums['KI'])))])
-    _tbl(hdr_r, rows_r, [3.2,2.3,2.3,2.3,2.3,2.3,2.3])
+    hdr_r, *rows_r = ergebnis_tabelle(room_results, g_sums)
+    _tbl(hdr_r, rows_r, [3.2] + [13.8 / (len(hdr_r) - 1)] * (len(hdr_r) - 1))
 
     # Innengeräte
     _h('Innengeräte', level=1)
     hdr_ig = ['Zone', 'Leistung', 'Artikelnummer', 'Listenpreis']
     rows_ig = []
-    for zi in range(5):
+    for zi in range(len(zone_names)):
         ig_kw = selected_hw[zi] if zi < len(selected_hw) else 0
         ig_artnr = selected_ig_artnr[zi] if zi < len(selected_ig_artnr) else '—'
         rows_ig.append([
@@ -2152,7 +1802,7 @@ def generate_word_report(proj, kunde, bearbeiter, firma, room_results, g_sums,
     _h('Außengeräte', level=1)
     hdr_ag = ['Zone', 'Typ', 'Leistung', 'Artikelnummer', 'Listenpreis']
     rows_ag = []
-    for zi in range(5):
+    for zi in range(len(zone_names)):
         ag_inf = selected_hw_ag[zi] if zi < len(selected_hw_ag) else ('—', 0, 'N.V.')
         ag_typ = ag_inf[0] if isinstance(ag_inf, (list, tuple)) else '—'
         ag_kw = ag_inf[1] if isinstance(ag_inf, (list, tuple)) and len(ag_inf) > 1 else 0
@@ -2177,14 +1827,15 @@ def generate_word_report(proj, kunde, bearbeiter, firma, room_results, g_sums,
     return buf.getvalue()
 
 
+@traced("coolMATH.generate_excel_anfrage")
 def generate_excel_anfrage(proj, kunde, bearbeiter, firma, selected_hw, selected_hw_ag, 
-                           zone_names, selected_ig_artnr=None, liefertermin="—"):
+                           zone_names, selected_ig_artnr=None, liefertermin="—", room_inputs=None):
     """
     Generiert Excel-Anfrage für °coolsulting
     ALLES IN EINEM SHEET mit übersichtlicher Struktur
     """
     if selected_ig_artnr is None:
-        selected_ig_artnr = ['—'] * 5
+        selected_ig_artnr = ['—'] * len(selected_hw)
     
     # Sammle alle Daten in einer Liste (Zeilen)
     rows = []
@@ -2203,8 +1854,8 @@ def generate_excel_anfrage(proj, kunde, bearbeiter, firma, selected_hw, selected
     rows.append(['INNENGERÄTE', '', '', '', ''])
     rows.append(['Zone', 'Leistung [kW]', 'Artikelnummer', 'Menge', ''])
     
-    for zi in range(5):
-        if zi < len(selected_hw) and selected_hw[zi] > 0:
+    for zi in range(len(selected_hw)):
+        if selected_hw[zi] > 0:
             rows.append([
                 zone_names[zi] if zi < len(zone_names) else f'Zone {zi+1}',
                 selected_hw[zi],
@@ -2219,23 +1870,34 @@ def generate_excel_anfrage(proj, kunde, bearbeiter, firma, selected_hw, selected
     rows.append(['AUSSENGERÄTE', '', '', '', ''])
     rows.append(['Zone', 'Typ', 'Leistung [kW]', 'Artikelnummer', 'Menge'])
     
-    for zi in range(5):
-        if zi < len(selected_hw_ag):
-            ag_inf = selected_hw_ag[zi]
-            if isinstance(ag_inf, (list, tuple)) and len(ag_inf) >= 3:
-                ag_typ = ag_inf[0]
-                ag_kw = ag_inf[1]
-                ag_artnr = ag_inf[2]
-                
-                if ag_kw > 0 and ag_artnr != 'N.V.':
-                    rows.append([
-                        zone_names[zi] if zi < len(zone_names) else f'Zone {zi+1}',
-                        ag_typ,
-                        ag_kw,
-                        ag_artnr,
-                        1
-                    ])
-    
+    for zi in range(len(selected_hw_ag)):
+        ag_inf = selected_hw_ag[zi]
+        if isinstance(ag_inf, (list, tuple)) and len(ag_inf) >= 3:
+            ag_typ = ag_inf[0]
+            ag_kw = ag_inf[1]
+            ag_artnr = ag_inf[2]
+            
+            if ag_kw > 0 and ag_artnr != 'N.V.':
+                rows.append([
+                    zone_names[zi] if zi < len(zone_names) else f'Zone {zi+1}',
+                    ag_typ,
+                    ag_kw,
+                    ag_artnr,
+                    1
+                ])
+    
+    # ===== FASSADEN (Eingabedaten je Zone) =====
+    if room_inputs:
+        rows.append(['', '', '', '', ''])  # Leerzeile
+        rows.append(['FASSADEN', '', '', '', ''])
+        rows.append(['Zone', 'Ausrichtung', 'Fenster [m²]', 'Glas', 'Sonnenschutz'])
+        for zi, ri in enumerate(room_inputs):
+            name = zone_names[zi] if zi < len(zone_names) else f'Zone {zi+1}'
+            rows.append([name, ri.get('orientierung', '—'), ri.get('fenster', 0),
+                         ri.get('nutzung', '—'), ri.get('sonnenschutz', '—')])
+            for f in ri.get('fassaden', []):
+                rows.append([name, f['orient'], f['win'], f['glass'], f['shade']])
+
     # Erstelle DataFrame und Excel
     df = pd.DataFrame(rows)
     
@@ -2261,7 +1923,7 @@ def generate_excel_anfrage(proj, kunde, bearbeiter, firma, selected_hw, selected
         
         for row in worksheet.iter_rows():
             cell_value = str(row[0].value) if row[0].value else ''
-            if cell_value in ['PROJEKTINFORMATIONEN', 'INNENGERÄTE', 'AUSSENGERÄTE']:
+            if cell_value in ['PROJEKTINFORMATIONEN', 'INNENGERÄTE', 'AUSSENGERÄTE', 'FASSADEN']:
                 row[0].font = bold_font
             elif cell_value in ['Zone', 'Projekt', 'Kunde', 'Bearbeiter', 'Firma', 'Datum', 'Liefertermin']:
                 row[0].font = header_font
@@ -2270,6 +1932,202 @@ def generate_excel_anfrage(proj, kunde, bearbeiter, firma, selected_hw, selected
     return output.getvalue()
 
 
+# ==========================================
+# 8. ZONEN-MODELL (beliebig viele Räume)
+# ==========================================
+ZONEN_JE_SEITE = 25     # Zeilen je Seite im Zonen-Editor
+ZONEN_JE_GRUPPE = 5     # Spalten je Ansicht in der Geräteauswahl
+
+GLAS_OPTIONEN = ["Einfach", "Doppel", "Dreifach", "Sonnenschutz"]
+SCHATTEN_OPTIONEN = ["Keine", "Vorhang (Innen)", "Raffstore (Aussen)", "Rollladen"]
+ZONEN_SPALTEN = ["aktiv", "name", "area", "win", "orient", "glass", "shade", "pers", "tech"]
+# Weitere Fassaden (Eckräume): Zuordnung über die Zeilennummer der Zonen-Tabelle
+# (Zeilen lassen sich nicht löschen/umsortieren, nur hinten kürzen – dabei werden
+# die Fassaden entfernter Zonen mit gelöscht, siehe fassaden_kuerzen)
+FASSADEN_SPALTEN = ["zone", "orient", "win", "glass", "shade"]
+
+
+def _zone_standard(i, aktiv=False):
+    return {"aktiv": aktiv, "name": f"Raum {i+1}", "area": 0.0, "win": 2.4, "orient": "SUED",
+            "glass": "Doppel", "shade": "Vorhang (Innen)", "pers": 0, "tech": 0.0}
+
+
+def zonen_tabelle(room_inputs=None, anzahl=5, hinweise=None):
+    """Zonen-DataFrame (eine Zeile je Raum); aus gespeicherten room_inputs oder leer.
+
+    Nicht übernehmbare Werte (unbekannte Ausrichtung, Sonnenschutz) fallen auf
+    den Standard zurück und werden in ``hinweise`` (Liste) gemeldet.
+    """
+    if room_inputs:
+        zeilen = []
+        for i, ri in enumerate(room_inputs):
+            z = _zone_standard(i)
+            z.update({"name": ri.get("name", z["name"]), "area": float(ri.get("flaeche", 0) or 0),
+                      "win": float(ri.get("fenster", 0) or 0), "pers": int(ri.get("personen", 0) or 0),
+                      "tech": float(ri.get("technik", 0) or 0)})
+            for feld, schluessel, optionen in (("orient", "orientierung", SOLAR_DB),
+                                               ("glass", "nutzung", GLAS_OPTIONEN),
+                                               ("shade", "sonnenschutz", SCHATTEN_OPTIONEN)):
+                wert = ri.get(schluessel)
+                if wert in optionen:
+                    z[feld] = wert
+                elif wert is not None and hinweise is not None:
+                    hinweise.append(f"{z['name']}: {schluessel} „{wert}“ unbekannt – "
+                                    f"„{z[feld]}“ übernommen.")
+            z["aktiv"] = z["area"] > 0
+            zeilen.append(z)
+        ohne_technik = sum("technik" not in ri for ri in room_inputs)
+        if ohne_technik and hinweise is not None:
+            hinweise.append(f"{ohne_technik} Zone(n) ohne gespeicherte Technik-Last (älterer "
+                            f"Projektstand) – mit 0 W übernommen, bitte prüfen.")
+    else:
+        zeilen = [_zone_standard(i, aktiv=(i == 0)) for i in range(anzahl)]
+    return pd.DataFrame(zeilen, columns=ZONEN_SPALTEN)
+
+
+def fassaden_tabelle(room_inputs=None):
+    """Weitere Fassaden als DataFrame (eine Zeile je Fenster); aus room_inputs oder leer."""
+    zeilen = [{"zone": i + 1, "orient": f.get("orient", "SUED"), "win": float(f.get("win", 0) or 0),
+               "glass": f.get("glass", "Doppel"), "shade": f.get("shade", "Keine")}
+              for i, ri in enumerate(room_inputs or []) for f in ri.get("fassaden", [])]
+    return pd.DataFrame(zeilen, columns=FASSADEN_SPALTEN)
+
+
+def fassaden_je_zone(fassaden_df, anzahl, hinweise=None):
+    """Zeilennummer (1-basiert) -> Tupel (orient, win, glass, shade) für die Engine.
+
+    Zeilen ohne Fensterfläche sind leer; Zeilen mit Fensterfläche, aber
+    ungültiger Zone/Ausrichtung werden nicht gerechnet und in ``hinweise`` gemeldet.
+    """
+    je_zone = {}
+    for nr, f in enumerate(fassaden_df.itertuples(index=False), start=1):
+        if pd.isna(f.win) or f.win <= 0:
+            continue
+        if pd.isna(f.zone):
+            grund = "Zone-Nr. fehlt"
+        elif not 1 <= int(f.zone) <= anzahl:
+            grund = f"Zone-Nr. {int(f.zone)} existiert nicht (1–{anzahl})"
+        elif f.orient not in SOLAR_DB:
+            grund = f"Ausrichtung „{f.orient}“ unbekannt"
+        elif pd.isna(f.glass) or pd.isna(f.shade):
+            grund = "Glas/Sonnenschutz fehlt"
+        else:
+            je_zone.setdefault(int(f.zone), []).append((f.orient, float(f.win), f.glass, f.shade))
+            continue
+        if hinweise is not None:
+            hinweise.append(f"Fassade {nr} nicht gerechnet: {grund}.")
+    return {nr: tuple(fl) for nr, fl in je_zone.items()}
+
+
+def fassaden_kuerzen(fassaden_df, anzahl):
+    """Fassaden entfernter Zonen (Zone-Nr. > ``anzahl``) löschen, damit sie nicht
+    an später neu angelegten Zonen gleicher Nummer hängen -> (df, Anzahl entfernt)."""
+    zone = pd.to_numeric(fassaden_df["zone"], errors="coerce")
+    weg = zone > anzahl
+    return fassaden_df[~weg].reset_index(drop=True), int(weg.sum())
+
+
+def fassaden_text(fassaden):
+    """Weitere Fassaden (Liste von dicts) für die Eingabetabellen der Berichte."""
+    if not isinstance(fassaden, list) or not fassaden:
+        return "—"
+    return "; ".join(f"{f['orient']} {f['win']:.1f} m²" for f in fassaden)
+
+
+METHODEN_NAMEN = {m: e["name"] for m, e in METHODEN_REGISTRY.items()}
+
+
+def methoden_kurzinfo(werte_kw):
+    """Leistung je Methode (Name -> kW) als HTML, zwei Methoden je Zeile."""
+    teile = [f"{name}: {kw:.1f} kW" for name, kw in werte_kw.items()]
+    return "<br/>".join(" &nbsp;|&nbsp; ".join(teile[i:i + 2]) for i in range(0, len(teile), 2))
+
+
+def monte_carlo_anzeige(lauf, zone_names):
+    """Fortschritt bzw. Ergebnis eines MonteCarloLauf (im Fragment: Polling)."""
+    if not lauf.fertig:
+        st.progress(lauf.fortschritt, text=f"Monte-Carlo läuft … {lauf.fortschritt:.0%}")
+        if st.button("⏹ Abbrechen", key="cm_mc_stop"):
+            lauf.abbrechen()
+        return False
+    if lauf.fehler:
+        st.warning(f"Monte-Carlo: {lauf.fehler}")
+        return True
+    r = lauf.ergebnis
+    st.caption(f"{fmt_number(r['stichproben'])} Stichproben je Zone · Gebäudespitze simultan [kW]")
+    st.dataframe(pd.DataFrame([
+        {"Methode": METHODEN_NAMEN.get(m, m), "Plan": round(w["plan"] / 1000, 2),
+         "P50": round(w["P50"] / 1000, 2), "P90": round(w["P90"] / 1000, 2),
+         "P99": round(w["P99"] / 1000, 2)}
+        for m, w in r["gebaeude"].items()]), use_container_width=True, hide_index=True)
+    st.dataframe(pd.DataFrame([
+        {"Zone": zone_names[i] if i < len(zone_names) else f"Zone {i+1}",
+         "Plan [W]": round(z["plan"]), "P50 [W]": round(z["P50"]), "P90 [W]": round(z["P90"]),
+         "P99 [W]": round(z["P99"]), "Gerät P50": z["geraet_P50"], "Gerät P90": z["geraet_P90"],
+         "Gerät P99": z["geraet_P99"]}
+        for i, z in enumerate(r["zonen"])]), use_container_width=True, hide_index=True)
+    fig = go.Figure(go.Histogram(x=r["verteilung_vdi"] / 1000, nbinsx=50, marker_color=CI_BLUE))
+    for q in ("P50", "P90", "P99"):
+        fig.add_vline(x=r["gebaeude"]["VDI_N"][q] / 1000, line_dash="dash", annotation_text=q)
+    fig.update_layout(template="plotly_white", height=300, margin=dict(l=60, r=20, t=30, b=50),
+                      xaxis_title="Gebäudespitze VDI 6007 [kW]", yaxis_title="Anzahl")
+    st.plotly_chart(fig, use_container_width=True)
+    return True
+
+
+def aussengeraete_anzeige(opt, zone_names):
+    """Ergebnis von optimiere_aussengeraete(): Kennzahlen + Tabelle je Außengerät."""
+    om1, om2, om3 = st.columns(3)
+    om1.metric("Optimiert (IG + AG)", f"{fmt_number(opt['kosten_eur'])} €")
+    om2.metric("Ein AG je Zone", f"{fmt_number(opt['einzeln_eur'])} €")
+    om3.metric("Ersparnis", f"{fmt_number(opt['einzeln_eur'] - opt['kosten_eur'])} €")
+    innen = opt["innengeraete"]
+    st.dataframe(pd.DataFrame([
+        {"Außengerät": g["bez"], "Art.-Nr.": g["art_nr"], "AG [kW]": g["kw"],
+         "Zonen": ", ".join(zone_names[z] for z in g["zonen"]),
+         "Innengeräte": " + ".join(f"{innen[z]['kw']:.1f}" for z in g["zonen"]),
+         "Bedarf × GZ [kW]": round(sum(innen[z]["bedarf_kw"] for z in g["zonen"])
+                                   * opt["gleichzeitigkeit"], 2),
+         "Preis AG [€]": fmt_number(g["preis"])}
+        for g in opt["gruppen"]]), use_container_width=True, hide_index=True)
+    st.caption(f"Innengeräte {fmt_number(opt['ig_eur'])} € · Außengeräte {fmt_number(opt['ag_eur'])} € "
+               f"· FJM: Σ Innengeräte ≤ {KOMBINATION_MAX:.0%} der AG-Leistung")
+    if not opt["optimal"]:
+        st.caption("ℹ️ Viele Zonen: Suche auf die aussichtsreichsten Zwischenstände gekürzt — "
+                   "sehr gute, aber nicht nachgewiesen günstigste Kombination.")
+    if any(z["zu_gross"] for z in innen):
+        st.caption("⚠️ Einzelne Zonen übersteigen das größte Innengerät der Serie.")
+
+
+def schall_aussengeraete_anzeige(pruefung, grenzwert):
+    """Ergebnis von schall_pruefung(): Gesamtpegel + Tabelle je Außengerät."""
+    if pruefung["lp"] is None:
+        st.info("Für die gewählten Außengeräte liegen keine Schalldaten vor.")
+    else:
+        st.metric("Lp gesamt am Immissionsort", f"{pruefung['lp']:.1f} dB(A)",
+                  f"{pruefung['lp'] - grenzwert:+.1f} dB zum Richtwert", delta_color="inverse")
+    st.dataframe(pd.DataFrame([
+        {"Außengerät": g["bez"], "Art.-Nr.": g["art_nr"], "Anzahl": g["anzahl"],
+         "Lw [dB(A)]": "–" if g["lw"] is None else g["lw"],
+         "Lp [dB(A)]": "–" if g["lp"] is None else g["lp"],
+         "Richtwert": "–" if g["ok"] is None else ("✅" if g["ok"] else "❌")}
+        for g in pruefung["geraete"]]).astype(str), use_container_width=True, hide_index=True)
+    st.caption("Freie Ausbreitung ohne Abschirmung/Kapselung (ISO 9613-2) — Detailprognose "
+               "mit Beugung und Einbausituation in °coolNEIGHBOR.")
+    if pruefung["ohne_daten"]:
+        st.caption(f"⚠️ Ohne Schalldaten: {', '.join(pruefung['ohne_daten'])}")
+
+
+def zonen_anzahl_setzen(df, anzahl):
+    """Tabelle auf ``anzahl`` Zeilen kürzen bzw. mit Standard-Zonen auffüllen."""
+    if anzahl <= len(df):
+        return df.iloc[:anzahl]
+    start = int(df.index.max()) + 1 if len(df) else 0
+    neu = pd.DataFrame([_zone_standard(len(df) + k) for k in range(anzahl - len(df))],
+                       columns=ZONEN_SPALTEN, index=range(start, start + anzahl - len(df)))
+    return pd.concat([df, neu])
+
+
 def main():
     setup_page()
     db_init()
@@ -2303,6 +2161,7 @@ def main():
             "Coolsulting_Logo_ohneHG_weiss.png",
         ]
         for logo in logo_opts:
+            logo = PATHS.datei(logo)
             if os.path.exists(logo):
                 st.image(logo, width=200)
                 break
@@ -2353,137 +2212,153 @@ def main():
                              ["Schwer (Beton/Stein)", "Mittel (Ziegel/Holz-Beton)", "Leicht (Holz/Trockenbau)"], 
                              index=1)
     raumhoehe = gp3.number_input("RAUMHOEHE [m]", 2.0, 6.0, 2.5, step=0.1)
+    gp4, gp5, gp6 = st.columns(3)
+    breite = gp4.number_input("BREITENGRAD [°N]", 35.0, 60.0, STANDARD_BREITE, step=0.5,
+                              help="Sonnenstand je Stunde (z.B. Hamburg 53,5 · München 48,0)")
+    monat = gp5.selectbox("AUSLEGUNGSMONAT", list(range(1, 13)), index=STANDARD_MONAT - 1,
+                          format_func=lambda m: MONATE[m - 1])
+    # Methoden je Projekt; nur gewählte werden gerechnet und dargestellt
+    if "cm_methoden_geladen" in st.session_state:      # LADEN: vor dem Widget übernehmen
+        st.session_state["cm_methoden"] = st.session_state.pop("cm_methoden_geladen")
+    st.session_state.setdefault("cm_methoden", aktive_methoden())
+    methoden = aktive_methoden(gp6.multiselect(
+        "BERECHNUNGSMETHODEN", METHODEN, key="cm_methoden", format_func=METHODEN_NAMEN.get,
+        help=f"{METHODEN_NAMEN[BASIS_METHODE]} ist Auslegungsbasis und wird immer gerechnet"))
     
     # --- ZONEN KONFIGURATION ---
-    st.markdown('<div class="section-header">🏠 Zonen-Konfiguration (bis 5 Räume)</div>', 
+    st.markdown('<div class="section-header">🏠 Zonen-Konfiguration</div>',
                 unsafe_allow_html=True)
-    
-    tabs = st.tabs([f"ZONE {i+1}" for i in range(5)])
-    def_ori = ["SUED", "SUED", "SUED", "SUED", "SUED"]
-    
+    for hinweis in st.session_state.pop("cm_lade_hinweise", []):   # vom Projekt-Laden
+        st.warning(f"⚠️ {hinweis}")
+
+    # Zonen als DataFrame im Session-State; der Editor zeigt je Seite
+    # ZONEN_JE_SEITE Zeilen, gerechnet werden nur geänderte Zonen.
+    zonen_df = st.session_state.get("cm_zonen")
+    if zonen_df is None:
+        zonen_df = zonen_tabelle()
+    zc1, zc2, zc3 = st.columns([1, 1, 2])
+    anzahl = zc1.number_input("ANZAHL ZONEN", 1, 1000, len(zonen_df), step=1)
+    zonen_df = zonen_anzahl_setzen(zonen_df, int(anzahl))
+    fassaden_df = st.session_state.get("cm_fassaden")
+    if fassaden_df is None:
+        fassaden_df = fassaden_tabelle()
+    fassaden_df, entfernt = fassaden_kuerzen(fassaden_df, len(zonen_df))
+    if entfernt:
+        st.session_state.pop("cm_fassaden_editor", None)     # Editor-Stand bezog sich auf die alte Tabelle
+        st.warning(f"⚠️ {entfernt} weitere Fassade(n) entfernter Zonen gelöscht.")
+    seiten = max(1, -(-len(zonen_df) // ZONEN_JE_SEITE))
+    seite = zc2.number_input("SEITE", 1, seiten, 1, step=1, key="cm_zonen_seite") if seiten > 1 else 1
+    von = (seite - 1) * ZONEN_JE_SEITE
+    bis = min(von + ZONEN_JE_SEITE, len(zonen_df))
+    zc3.caption(f"Zonen {von+1}–{bis} von {len(zonen_df)} · "
+                f"{int(zonen_df['aktiv'].sum())} aktiv")
+
+    ausschnitt = st.data_editor(
+        zonen_df.iloc[von:bis], key=f"cm_zonen_editor_{seite}",
+        hide_index=True, num_rows="fixed", use_container_width=True,
+        column_config={
+            "aktiv":  st.column_config.CheckboxColumn("Aktiv", width="small"),
+            "name":   st.column_config.TextColumn("Bezeichnung", required=True),
+            "area":   st.column_config.NumberColumn("Fläche [m²]", min_value=0.0, max_value=500.0, format="%.1f"),
+            "win":    st.column_config.NumberColumn("Fenster [m²]", min_value=0.0, max_value=150.0, format="%.1f"),
+            "orient": st.column_config.SelectboxColumn("Ausrichtung", options=list(SOLAR_DB.keys()), required=True),
+            "glass":  st.column_config.SelectboxColumn("Glas", options=GLAS_OPTIONEN, required=True),
+            "shade":  st.column_config.SelectboxColumn("Sonnenschutz", options=SCHATTEN_OPTIONEN, required=True),
+            "pers":   st.column_config.NumberColumn("Personen", min_value=0, max_value=15, step=1),
+            "tech":   st.column_config.NumberColumn("Technik [W]", min_value=0.0, max_value=10000.0),
+        },
+    )
+    zonen_df = zonen_df.copy()
+    zonen_df.update(ausschnitt)          # geleerte Zellen behalten den alten Wert
+    st.session_state["cm_zonen"] = zonen_df
+
+    with st.expander(f"🪟 Weitere Fassaden (Eckräume) — {len(fassaden_df)} Fenster"):
+        st.caption("Zusätzliche Fensterflächen je Zone mit eigener Ausrichtung, Glas und "
+                   "Sonnenschutz; Zone = Zeilennummer der Zonen-Tabelle.")
+        fassaden_df = st.data_editor(
+            fassaden_df, key="cm_fassaden_editor", hide_index=True, num_rows="dynamic",
+            use_container_width=True,
+            column_config={
+                "zone":   st.column_config.NumberColumn("Zone-Nr.", min_value=1, max_value=len(zonen_df),
+                                                        step=1, required=True),
+                "orient": st.column_config.SelectboxColumn("Ausrichtung", options=list(SOLAR_DB.keys()), required=True),
+                "win":    st.column_config.NumberColumn("Fenster [m²]", min_value=0.0, max_value=150.0, format="%.1f"),
+                "glass":  st.column_config.SelectboxColumn("Glas", options=GLAS_OPTIONEN, required=True),
+                "shade":  st.column_config.SelectboxColumn("Sonnenschutz", options=SCHATTEN_OPTIONEN, required=True),
+            },
+        )
+    st.session_state["cm_fassaden"] = fassaden_df
+    fassaden_hinweise = []
+    weitere = fassaden_je_zone(fassaden_df, len(zonen_df), fassaden_hinweise)
+    for hinweis in fassaden_hinweise:
+        st.warning(f"⚠️ {hinweis}")
+
+    # ---- BERECHNUNGEN: nur aktive Zonen; ZonenSpeicher rechnet nur geänderte
+    #      Zonen neu (LRU je Parametersatz) und führt g_sums inkrementell ----
+    zonen = []   # (Zeilen-Schlüssel, Name, Parameter-Tupel)
+    for nr, (k, z) in enumerate(zonen_df.iterrows(), start=1):
+        if not bool(z["aktiv"]):
+            continue
+        zonen.append((k, str(z["name"]), (float(z["area"]), z["orient"], bau_std, z["glass"],
+                      z["shade"], int(z["pers"]), float(z["tech"]), float(z["win"]),
+                      bau_m, raumhoehe, breite, monat, weitere.get(nr, ()))))
+    speicher = st.session_state.get("cm_zonen_speicher")
+    if speicher is None or speicher.methoden != methoden:
+        speicher = st.session_state["cm_zonen_speicher"] = ZonenSpeicher(methoden=methoden)
+    profile = speicher.aktualisieren([(k, param) for k, _, param in zonen])
+    if not zonen:
+        st.info("Keine aktive Zone — bitte mindestens eine Zone in der Tabelle aktivieren.")
+        return
+
     # Ergebnis-Container
-    g_sums = {k: np.zeros(24) for k in ["VDI_N", "VDI_A", "PRAK", "RECK", "KLTS", "KI"]}
+    g_sums = speicher.summen()          # Gebäudesumme je Methode (inkrementell)
     individual_profiles = []
     room_results        = []
     room_inputs_list    = []
     samsung_recs        = []
-    
-    for i, tab in enumerate(tabs):
-        with tab:
-            zone_aktiv = st.checkbox("Zone aktiv", value=(i == 0), key=f"za{i}")
-
-            if not zone_aktiv:
-                individual_profiles.append({
-                    "name": f"Raum {i+1}", "reck": np.zeros(24), "vdi_a": np.zeros(24),
-                    "vdi_n": np.zeros(24), "prak": np.zeros(24), "klts": np.zeros(24), "ki": np.zeros(24),
-                })
-                room_results.append({
-                    "ZONE": f"Raum {i+1}", "VDI NEU": 0, "VDI ALT": 0,
-                    "RECKNAGEL": 0, "PRAKTIKER": 0, "KALTLUFTSEE": 0, "KI HYBRID": 0,
-                })
-                room_inputs_list.append({"name": f"Raum {i+1}", "flaeche": 0, "hoehe": raumhoehe,
-                    "personen": 0, "fenster": 0, "orientierung": "SUED", "nutzung": "Einfach", "u_wert": 0})
-                samsung_recs.append({"zone": f"Raum {i+1}", "primary": None, "alt": None, "peak_w": 0})
-                continue
-
-            rc1, rc2, rc3, rc4 = st.columns(4)
-            r_name  = rc1.text_input("Bezeichnung", f"Raum {i+1}", key=f"rn{i}")
-            area    = rc2.number_input("Flaeche [m²]", 0.0, 500.0, 0.0, key=f"ar{i}")
-            win     = rc3.number_input("Fenster [m²]", 0.0, 150.0, 2.4, key=f"wi{i}")
-            orient  = rc4.selectbox("Ausrichtung", list(SOLAR_DB.keys()),
-                                     index=list(SOLAR_DB.keys()).index(def_ori[i]), key=f"or{i}")
-
-            rc5, rc6, rc7, rc8 = st.columns(4)
-            glass   = rc5.selectbox("Glas", ["Einfach", "Doppel", "Dreifach", "Sonnenschutz"],
-                                     index=1, key=f"gl{i}")
-            shade   = rc6.selectbox("Sonnenschutz",
-                                     ["Keine", "Vorhang (Innen)", "Raffstore (Aussen)", "Rollladen"],
-                                     index=1, key=f"sh{i}")
-            pers    = rc7.slider("Personen", 0, 15, 0, key=f"pe{i}")
-            tech    = rc8.number_input("Technik [W]", 0.0, 10000.0, 0.0, key=f"te{i}")
-            
-            # ---- BERECHNUNGEN ----
-            u, g, fc = get_phys_constants(bau_std, glass, shade)
-            
-            c_reck   = calc_recknagel(area, orient, bau_std, glass, shade, pers, tech, win)
-            c_vdi_a  = calc_vdi_alt(c_reck)
-            c_vdi_n  = calc_vdi_neu(area, orient, bau_std, glass, shade, pers, tech, win, bau_m)
-            c_prak   = calc_praktiker(area, orient, bau_std, glass, shade, pers, tech)
-            c_klts   = calc_kaltluftsee(area, orient, bau_std, glass, shade, pers, tech, win, bau_m, raumhoehe)
-            c_ki     = calc_ki_hybrid(area, orient, bau_std, glass, shade, pers, tech, win, bau_m)
-            
-            # Summierung
-            g_sums["RECK"]  += c_reck
-            g_sums["VDI_A"] += c_vdi_a
-            g_sums["VDI_N"] += c_vdi_n
-            g_sums["PRAK"]  += c_prak
-            g_sums["KLTS"]  += c_klts
-            g_sums["KI"]    += c_ki
-            
-            individual_profiles.append({
-                "name":  r_name,
-                "reck":  c_reck,
-                "vdi_a": c_vdi_a,
-                "vdi_n": c_vdi_n,
-                "prak":  c_prak,
-                "klts":  c_klts,
-                "ki":    c_ki,
-            })
-            
-            # Samsung Empfehlung (auf Basis VDI Neu)
-            peak_vdi = int(np.max(c_vdi_n))
-            primary, alt = find_samsung_device(peak_vdi)
-            samsung_recs.append({"zone": r_name, "primary": primary, "alt": alt, "peak_w": peak_vdi})
-            
-            # Eingabedaten erfassen
-            room_inputs_list.append({
-                "name":        r_name,
-                "flaeche":     area,
-                "hoehe":       raumhoehe,
-                "personen":    pers,
-                "fenster":     win,
-                "orientierung": orient,
-                "nutzung":     glass,
-                "u_wert":      u,
-            })
-            room_results.append({
-                "ZONE":       r_name,
-                "VDI NEU":    peak_vdi,
-                "VDI ALT":    int(np.max(c_vdi_a)),
-                "RECKNAGEL":  int(np.max(c_reck)),
-                "PRAKTIKER":  int(np.max(c_prak)),
-                "KALTLUFTSEE":int(np.max(c_klts)),
-                "KI HYBRID":  int(np.max(c_ki)),
-            })
+
+    registry = [METHODEN_REGISTRY[m] for m in methoden]      # Reihenfolge = Achse der Profile
+    for (_, r_name, (area, orient, _, glass, shade, pers, tech, win, *_, fenster)), zp in zip(zonen, profile):
+        u, g, fc = get_phys_constants(bau_std, glass, shade)
+
+        individual_profiles.append({"name": r_name,
+                                    **{e["profil"]: c for e, c in zip(registry, zp)}})
+
+        # Samsung Empfehlung (auf Basis VDI Neu)
+        peak_vdi = int(np.max(zp[methoden.index(BASIS_METHODE)]))
+        primary, alt = find_samsung_device(peak_vdi)
+        samsung_recs.append({"zone": r_name, "primary": primary, "alt": alt, "peak_w": peak_vdi})
+
+        # Eingabedaten erfassen
+        room_inputs_list.append({
+            "name":        r_name,
+            "flaeche":     area,
+            "hoehe":       raumhoehe,
+            "personen":    pers,
+            "fenster":     win,
+            "orientierung": orient,
+            "sonnenschutz": shade,
+            "technik":     tech,
+            "fassaden":    [dict(zip(FASSADEN_SPALTEN[1:], f)) for f in fenster],
+            "nutzung":     glass,
+            "u_wert":      u,
+        })
+        room_results.append({"ZONE": r_name,
+                             **{e["spalte"]: int(np.max(c)) for e, c in zip(registry, zp)}})
     
     # ==========================================
     # ERGEBNIS-MATRIX
     # ==========================================
-    st.markdown('<div class="matrix-title">📊 Ergebnis-Matrix [Watt] — 6 Methoden</div>',
+    st.markdown(f'<div class="matrix-title">📊 Ergebnis-Matrix [Watt] — {len(methoden)} Methoden</div>',
                 unsafe_allow_html=True)
     
     df_res = pd.DataFrame(room_results)
-    totals = {
-        "ZONE":         "GEBAEUDE SIMULTAN-PEAK",
-        "VDI NEU":      int(np.max(g_sums["VDI_N"])),
-        "VDI ALT":      int(np.max(g_sums["VDI_A"])),
-        "RECKNAGEL":    int(np.max(g_sums["RECK"])),
-        "PRAKTIKER":    int(np.max(g_sums["PRAK"])),
-        "KALTLUFTSEE":  int(np.max(g_sums["KLTS"])),
-        "KI HYBRID":    int(np.max(g_sums["KI"])),
-    }
+    totals = {"ZONE": "GEBAEUDE SIMULTAN-PEAK",
+              **{METHODEN_REGISTRY[m]["spalte"]: int(np.max(g_sums[m])) for m in methoden}}
     df_res = pd.concat([df_res, pd.DataFrame([totals])], ignore_index=True)
     
     tbl = "<table class='styled-table'><thead><tr>"
-    col_map = {
-        "ZONE": "Zone",
-        "VDI NEU": "VDI 6007 Neu",
-        "VDI ALT": "VDI 2078 Alt",
-        "RECKNAGEL": "Recknagel",
-        "PRAKTIKER": "Praktiker",
-        "KALTLUFTSEE": "Kaltluftsee",
-        "KI HYBRID": "KI-Hybrid"
-    }
+    col_map = {"ZONE": "Zone", **{e["spalte"]: e["name"] for e in registry}}
     for col in df_res.columns:
         tbl += f"<th>{col_map.get(col, col)}</th>"
     tbl += "</tr></thead><tbody>"
@@ -2510,28 +2385,41 @@ def main():
         unsafe_allow_html=True
     )
 
-    # --- Geräte je Methode berechnen ---
-    method_peaks = {}
-    for i in range(5):
-        r = room_results[i]
-        method_peaks[i] = {
-            "VDI NEU":     r["VDI NEU"],
-            "VDI ALT":     r["VDI ALT"],
-            "RECKNAGEL":   r["RECKNAGEL"],
-            "PRAKTIKER":   r["PRAKTIKER"],
-            "KALTLUFTSEE": r["KALTLUFTSEE"],
-            "KI HYBRID":   r["KI HYBRID"],
-        }
-
-    # Safety factor
-    METHOD_SAFETY = {
-        "VDI NEU":     1.10,
-        "VDI ALT":     1.10,
-        "RECKNAGEL":   1.10,
-        "PRAKTIKER":   1.10,
-        "KALTLUFTSEE": 1.10,
-        "KI HYBRID":   1.10,
-    }
+    # --- Geräte je Methode berechnen (Spalte room_results -> Spitze [W]) ---
+    method_peaks = {i: {e["spalte"]: r[e["spalte"]] for e in registry}
+                    for i, r in enumerate(room_results)}
+    METHOD_SAFETY = 1.10     # einheitlich +10 % Norm-Zuschlag für alle Methoden
+    # Empfehlung + Standard-Innengerät nach VDI 2078 Alt, sonst nach der Auslegungsbasis
+    empf_methode = "VDI_A" if "VDI_A" in methoden else BASIS_METHODE
+    empf_spalte  = METHODEN_REGISTRY[empf_methode]["spalte"]
+
+    # Geräteauswahl in Gruppen zu je ZONEN_JE_GRUPPE Zonen; die Auswahl nicht
+    # angezeigter Zonen bleibt im Session-State (cm_geraete) erhalten
+    n_zonen    = len(room_results)
+    zone_keys  = [k for k, _, _ in zonen]
+    g_start    = 0
+    if n_zonen > ZONEN_JE_GRUPPE:
+        g_start = st.selectbox(
+            "ZONEN-GRUPPE (Geräteauswahl)", list(range(0, n_zonen, ZONEN_JE_GRUPPE)),
+            key="cm_geraete_gruppe",
+            format_func=lambda s0: f"Zonen {s0+1}–{min(s0 + ZONEN_JE_GRUPPE, n_zonen)}"
+                                   f"  ({room_results[s0]['ZONE']} …)")
+    sichtbar     = range(g_start, min(g_start + ZONEN_JE_GRUPPE, n_zonen))
+    geraete_wahl = st.session_state.setdefault("cm_geraete", {})
+
+    def zonen_wert(i, feld, optionen, standard, widget):
+        """Widget nur für sichtbare Zonen, sonst zuletzt gewählter Wert bzw. Standard."""
+        gemerkt = geraete_wahl.setdefault(zone_keys[i], {})
+        wert = gemerkt.get(feld, standard)
+        if wert not in optionen:
+            wert = standard
+        if i in sichtbar:
+            wert = widget(optionen.index(wert))
+        if wert == standard:
+            gemerkt.pop(feld, None)      # Standard folgt weiter der Kühllast
+        else:
+            gemerkt[feld] = wert
+        return wert
 
     # Serien-Auswahl PER SPALTE (über der Vergleichstabelle)
     _serien_namen = list(SAMSUNG_SERIEN.keys())
@@ -2545,94 +2433,37 @@ def main():
         "SAMSUNG SERIE je Zone (für Vergleichstabelle + Empfehlung)</div>",
         unsafe_allow_html=True
     )
-    serie_cols = st.columns([2.2, 1, 1, 1, 1, 1])
+    serie_cols = st.columns([2.2] + [1] * ZONEN_JE_GRUPPE)
     serie_cols[0].markdown(
         "<div style='font-size:10px;color:#aaa;padding-top:8px;'>Methode</div>",
         unsafe_allow_html=True
     )
     zone_serien = []
-    zone_names  = [room_results[i]["ZONE"] for i in range(5)]
-    for ci in range(5):
-        s = serie_cols[ci+1].selectbox(
-            zone_names[ci],
-            _alle_serien,
-            index=_alle_serien.index(SAMSUNG_DEFAULT_SERIE),
-            key=f"serie_col{ci}",
-            label_visibility="visible",
-            format_func=lambda x: SERIE_SHORT.get(x, x)
-        )
+    zone_names  = [r["ZONE"] for r in room_results]
+    for ci in range(n_zonen):
+        s = zonen_wert(ci, "serie", _alle_serien, SAMSUNG_DEFAULT_SERIE,
+                       lambda idx: serie_cols[ci - g_start + 1].selectbox(
+                           zone_names[ci],
+                           _alle_serien,
+                           index=idx,
+                           key=f"serie_col{zone_keys[ci]}",
+                           label_visibility="visible",
+                           format_func=lambda x: SERIE_SHORT.get(x, x)
+                       ))
         zone_serien.append(s)
 
     # selected_serie = erste Zone (für device_label Fallback)
     selected_serie = zone_serien[0]
 
-    def device_label(peak_w, safety=1.10, serie=None):
-        """Gerätekurzbezeichnung aus gewählter Serie"""
-        if serie is None:
-            serie = selected_serie
-        req = (peak_w * safety) / 1000.0
-        db  = SAMSUNG_SERIEN.get(serie, SAMSUNG_SERIEN[SAMSUNG_DEFAULT_SERIE])
-        for kw in sorted(db.keys()):
-            if kw >= req:
-                d = db[kw]
-                return kw, f"{kw:.1f}kW", d["art_nr"], d["preis"]
-        kw = sorted(db.keys())[-1]
-        d  = db[kw]
-        return kw, f"{kw:.1f}kW", d["art_nr"], d["preis"]
-        r = room_results[i]
-        method_peaks[i] = {
-            "VDI NEU":     r["VDI NEU"],
-            "VDI ALT":     r["VDI ALT"],
-            "RECKNAGEL":   r["RECKNAGEL"],
-            "PRAKTIKER":   r["PRAKTIKER"],
-            "KALTLUFTSEE": r["KALTLUFTSEE"],
-            "KI HYBRID":   r["KI HYBRID"],
-        }
-
-    # Safety factor: uniform 10% for all methods per user spec
-    METHOD_SAFETY = {
-        "VDI NEU":     1.10,
-        "VDI ALT":     1.10,
-        "RECKNAGEL":   1.10,
-        "PRAKTIKER":   1.10,
-        "KALTLUFTSEE": 1.10,
-        "KI HYBRID":   1.10,
-    }
+    kat = katalog()
 
     def device_label(peak_w, safety=1.10, serie=None):
-        """Gibt Gerätekurzbezeichnung für Peak zurück (aus gewählter Serie)"""
+        """Gerätekurzbezeichnung aus gewählter Serie (kleinstes passendes, sonst größtes)"""
         if serie is None:
             serie = selected_serie
-        req = (peak_w * safety) / 1000.0
-        db = SAMSUNG_SERIEN.get(serie, SAMSUNG_SERIEN[SAMSUNG_DEFAULT_SERIE])
-        for kw in sorted(db.keys()):
-            if kw >= req:
-                d = db[kw]
-                return kw, f"{kw:.1f}kW", d["art_nr"], d["preis"]
-        kw = sorted(db.keys())[-1]
-        d = db[kw]
+        _, kw, d, _ = kat.passend(serie, (peak_w * safety) / 1000.0)
         return kw, f"{kw:.1f}kW", d["art_nr"], d["preis"]
 
-    # Farben je Methode
-    METHOD_COLORS = {
-        "VDI NEU":     ("#1a6fa8", "#e8f4fc"),
-        "VDI ALT":     ("#b7770d", "#fef9e7"),
-        "RECKNAGEL":   ("#3c3c3b", "#f4f4f4"),
-        "PRAKTIKER":   ("#c0392b", "#fdf2f2"),
-        "KALTLUFTSEE": ("#7d3c98", "#f9f0ff"),
-        "KI HYBRID":   ("#1a7a5e", "#e8faf4"),
-    }
-    METHOD_LABELS = {
-        "VDI NEU":     "VDI 6007 Neu",
-        "VDI ALT":     "VDI 2078 Alt",
-        "RECKNAGEL":   "Recknagel",
-        "PRAKTIKER":   "Praktiker ★ OFFIZ. EMPF.",
-        "KALTLUFTSEE": "Kaltluftsee",
-        "KI HYBRID":   "KI-Hybrid",
-    }
-
-    zone_names = [room_results[i]["ZONE"] for i in range(5)]
-
     # --- Tabelle: eine Zeile je Methode ---
     st.markdown("""
     <div class="matrix-wrapper" style="padding:20px 25px;">
@@ -2644,29 +2475,30 @@ def main():
     """, unsafe_allow_html=True)
 
     # Header-Zeile
-    hdr_cols = st.columns([2.2, 1, 1, 1, 1, 1])
+    hdr_cols = st.columns([2.2] + [1] * ZONEN_JE_GRUPPE)
     hdr_cols[0].markdown(
         "<div style='font-size:10px;font-weight:700;color:#3C3C3B;"
         "text-transform:uppercase;letter-spacing:1px;padding:4px 0;'>Methode</div>",
         unsafe_allow_html=True
     )
-    for ci, zn in enumerate(zone_names):
-        hdr_cols[ci+1].markdown(
+    for spalte, ci in enumerate(sichtbar, start=1):
+        hdr_cols[spalte].markdown(
             f"<div style='font-size:10px;font-weight:700;color:#3C3C3B;"
             f"text-transform:uppercase;letter-spacing:1px;text-align:center;"
-            f"padding:4px 0;'>{zn}</div>",
+            f"padding:4px 0;'>{zone_names[ci]}</div>",
             unsafe_allow_html=True
         )
 
-    for mkey, mlabel in METHOD_LABELS.items():
-        dark_color, light_color = METHOD_COLORS[mkey]
+    for e in registry:
+        mkey, dark_color = e["spalte"], e["farbe"]
         is_official = mkey == "PRAKTIKER"
+        mlabel = e["name"] + (" ★ OFFIZ. EMPF." if is_official else "")
 
         border = f"2px solid {dark_color}" if is_official else f"1px solid {dark_color}40"
-        bg     = light_color
+        bg     = f"{dark_color}14"
         shadow = "box-shadow:0 2px 8px rgba(0,0,0,0.12);" if is_official else ""
 
-        row_cols = st.columns([2.2, 1, 1, 1, 1, 1])
+        row_cols = st.columns([2.2] + [1] * ZONEN_JE_GRUPPE)
 
         # Methoden-Label
         star = " ⭐" if is_official else ""
@@ -2680,12 +2512,12 @@ def main():
         )
 
         # Gerät je Zone — mit jeweiliger Zonen-Serie
-        method_safety_val = METHOD_SAFETY.get(mkey, 1.10)
-        for ci in range(5):
+        method_safety_val = METHOD_SAFETY
+        for spalte, ci in enumerate(sichtbar, start=1):
             peak_w = method_peaks[ci][mkey]
             kw, short, art_nr, preis = device_label(peak_w, safety=method_safety_val,
                                                      serie=zone_serien[ci])
-            row_cols[ci+1].markdown(
+            row_cols[spalte].markdown(
                 f"<div style='background:{bg};border:{border};border-radius:8px;"
                 f"padding:6px 8px;{shadow}margin:2px 0;text-align:center;'>"
                 f"<div style='font-size:12px;font-weight:700;color:{dark_color};'>{short}</div>"
@@ -2697,17 +2529,17 @@ def main():
             )
 
     # --- VDI 2078 ALT EMPFEHLUNG (automatisch, Wind-Free Standard) ---
-    st.markdown("""
+    st.markdown(f"""
     <div style="margin-top:24px; margin-bottom:8px;">
         <span style="font-size:12px;font-weight:700;color:rgba(255,255,255,0.8);
                      text-transform:uppercase;letter-spacing:2px;">
-            VDI 2078 Alt Empfehlung (automatisch | Wind-Free Standard)
+            {METHODEN_NAMEN[empf_methode]} Empfehlung (automatisch | Wind-Free Standard)
         </span>
     </div>""", unsafe_allow_html=True)
 
-    green_cols = st.columns(5)
-    for i, gcol in enumerate(green_cols):
-        peak_vdi_alt = method_peaks[i]["VDI ALT"]
+    green_cols = st.columns(ZONEN_JE_GRUPPE)
+    for gcol, i in zip(green_cols, sichtbar):
+        peak_vdi_alt = method_peaks[i][empf_spalte]
         kw_rec, _, art_rec, preis_rec = device_label(
             peak_vdi_alt, safety=1.10, serie="Wind-Free Standard"
         )
@@ -2716,7 +2548,7 @@ def main():
                         border-radius:12px;padding:14px 12px;color:white;margin-bottom:4px;
                         box-shadow:0 2px 8px rgba(21,101,192,0.4);">
                 <div style="font-size:9px;font-weight:800;opacity:0.85;
-                            letter-spacing:1px;text-transform:uppercase;">⭐ EMPFEHLUNG VDI 2078 Alt</div>
+                            letter-spacing:1px;text-transform:uppercase;">⭐ EMPFEHLUNG {METHODEN_NAMEN[empf_methode]}</div>
                 <div style="font-size:15px;font-weight:700;margin:5px 0 3px 0;
                             letter-spacing:-0.3px;">WF Standard {kw_rec:.1f} kW</div>
                 <div style="font-size:10px;opacity:0.92;line-height:1.7;">
@@ -2739,86 +2571,11 @@ def main():
     </div>
     """, unsafe_allow_html=True)
 
-    # ==========================================
-    # RAC-AG Datenbank: je IG-Serie passende Außengeräte
-    # ==========================================
-    # FJM Multi-Außengeräte (für alle FJM IG-Typen: Kassette, Kanal, Standtruhe, WF-Serien)
-    FJM_AG = {
-        4.0:  {"art_nr": "AJ040TXJ2KG/EU", "bez": "FJM Multi AG  4,0 kW",   "preis": 2347},
-        5.0:  {"art_nr": "AJ050TXJ2KG/EU", "bez": "FJM Multi AG  5,0 kW",   "preis": 2706},
-        5.2:  {"art_nr": "AJ052TXJ3KG/EU", "bez": "FJM Multi AG  5,2 kW",   "preis": 3061},
-        6.8:  {"art_nr": "AJ068TXJ3KG/EU", "bez": "FJM Multi AG  6,8 kW",   "preis": 3548},
-        8.0:  {"art_nr": "AJ080TXJ4KG/EU", "bez": "FJM Multi AG  8,0 kW",   "preis": 4494},
-        10.0: {"art_nr": "AJ100TXJ5KG/EU", "bez": "FJM Multi AG 10,0 kW",   "preis": 5533},
-    }
-
-    # RAC Single-Split-AGs je IG-Serie (IG-Artnr Präfix → passende AG-Liste)
-    RAC_AG_BY_SERIE = {
-        "Airise Living": [
-            (2.5, "AR50F09C1BHX/EU",  "RAC AG Airise Living 2,5 kW",  984),
-            (3.5, "AR50F12C1BHX/EU",  "RAC AG Airise Living 3,5 kW", 1019),
-            (5.0, "AR50F18C1BHX/EU",  "RAC AG Airise Living 5,0 kW", 1564),
-            (6.5, "AR50F24C1BHX/EU",  "RAC AG Airise Living 6,5 kW", 2056),
-        ],
-        "Wind-Free Standard": [
-            (2.5, "AR60F09C1AWX/EU",  "RAC AG WF Standard 2,5 kW",   1362),
-            (3.5, "AR60F12C1AWX/EU",  "RAC AG WF Standard 3,5 kW",   1540),  # ca.
-            (5.0, "AR60F18C1AWX/EU",  "RAC AG WF Standard 5,0 kW",   1900),
-        ],
-        "Wind-Free Exklusiv": [
-            (2.0, "AR70F07C1AWX/EU",  "RAC AG WF Exklusiv 2,0 kW",   1448),
-            (2.5, "AR70F09C1AWX/EU",  "RAC AG WF Exklusiv 2,5 kW",   1446),
-            (3.5, "AR70F12C1AWX/EU",  "RAC AG WF Exklusiv 3,5 kW",   1540),
-            (4.3, "AR70F15C1AWX/EU",  "RAC AG WF Exklusiv 4,3 kW",   2135),
-            (5.0, "AR70F18C1AWX/EU",  "RAC AG WF Exklusiv 5,0 kW",   2106),
-            (6.5, "AR70F24C1AWX/EU",  "RAC AG WF Exklusiv 6,5 kW",   2761),
-        ],
-        "Wind-Free Exklusiv Black": [
-            (2.0, "AR70F07C1AWX/EU",  "RAC AG WF Exklusiv 2,0 kW",   1448),
-            (2.5, "AR70F09C1AWX/EU",  "RAC AG WF Exklusiv 2,5 kW",   1446),
-            (3.5, "AR70F12C1AWX/EU",  "RAC AG WF Exklusiv 3,5 kW",   1540),
-        ],
-        "Wind-Free Exklusiv-Premiere": [
-            (2.0, "AR70H07C1AWX/EU",  "RAC AG WF Exkl.-Prem. 2,0 kW", 1604),
-            (2.5, "AR70H09C1AWX/EU",  "RAC AG WF Exkl.-Prem. 2,5 kW", 1688),
-            (3.5, "AR70H12C1AWX/EU",  "RAC AG WF Exkl.-Prem. 3,5 kW", 1872),
-            (4.3, "AR70H15C1AWX/EU",  "RAC AG WF Exkl.-Prem. 4,3 kW", 2360),
-            (5.0, "AR70H18C1AWX/EU",  "RAC AG WF Exkl.-Prem. 5,0 kW", 2708),
-            (6.5, "AR70H24C1AWX/EU",  "RAC AG WF Exkl.-Prem. 6,5 kW", 3556),
-        ],
-        "Wind-Free Exklusiv-Premiere Black": [
-            (2.0, "AR70H07C1AWX/EU",  "RAC AG WF Exkl.-Prem. 2,0 kW", 1604),
-            (2.5, "AR70H09C1AWX/EU",  "RAC AG WF Exkl.-Prem. 2,5 kW", 1688),
-            (3.5, "AR70H12C1AWX/EU",  "RAC AG WF Exkl.-Prem. 3,5 kW", 1872),
-        ],
-        "Wind-Free Elite": [
-            (2.5, "AR70F09CAAWKX/EU", "RAC AG WF Elite 2,5 kW",       1752),
-            (3.5, "AR70F12CAAWKX/EU", "RAC AG WF Elite 3,5 kW",       1944),
-        ],
-        "Wind-Free Elite-Premiere Plus": [
-            (2.5, "AR70H09CAAWX/EU",  "RAC AG WF Elite-Prem.Plus 2,5 kW", 1824),
-            (3.5, "AR70H12CAAWX/EU",  "RAC AG WF Elite-Prem.Plus 3,5 kW", 2024),
-        ],
-        "Wind-Free Elite-Premiere Plus Black": [
-            (2.5, "AR70H09CAAWX/EU",  "RAC AG WF Elite-Prem.Plus 2,5 kW", 1824),
-            (3.5, "AR70H12CAAWX/EU",  "RAC AG WF Elite-Prem.Plus 3,5 kW", 2024),
-        ],
-    }
-    # FJM IG-Typen → immer FJM Multi AG
-    FJM_IG_SERIEN = {"Mini-Kassette 620x620", "1-Weg-Kassette", "Kanaleinbau", "Standtruhe"}
-    # FJM Wandgeräte-Serien → können RAC AG oder FJM AG bekommen (Umschalter)
-    FJM_WAND_SERIEN = {"Wind-Free Standard","Wind-Free Exklusiv","Wind-Free Exklusiv Black",
-                       "Wind-Free Exklusiv-Premiere","Wind-Free Exklusiv-Premiere Black",
-                       "Wind-Free Elite","Wind-Free Elite-Premiere Plus",
-                       "Wind-Free Elite-Premiere Plus Black","Airise Living"}
-
     # IG-Optionen aufbauen
-    IG_OPTIONS = [(0.0, "N.V.", "— nicht vorhanden —")]
-    for sname, sdata in SAMSUNG_SERIEN.items():
-        for kw in sorted(sdata.keys()):
-            d = sdata[kw]
-            label = f"{d['art_nr']}  |  {kw:.1f} kW  |  {sname}  |  {d['preis']:.0f} EUR"
-            IG_OPTIONS.append((kw, sname, label))
+    IG_OPTIONS = [(0.0, "N.V.", "— nicht vorhanden —")] + [
+        (kw, sname, f"{d['art_nr']}  |  {kw:.1f} kW  |  {sname}  |  {d['preis']:.0f} EUR")
+        for kw, sname, d in kat.optionen]
+    IG_INDEX  = {(kw, sname): j for j, (kw, sname, _) in enumerate(IG_OPTIONS)}
     IG_KEYS   = list(range(len(IG_OPTIONS)))
     # Kurze Labels für das Dropdown (WF statt Wind-Free, Serie verkürzt)
     def _ig_short_label(lbl):
@@ -2836,54 +2593,44 @@ def main():
     selected_hw    = []
     selected_hw_ag = []
     selected_ig_artnr = []  # Neu: IG Art.-Nr. speichern
-    final_cols = st.columns(5)
+    final_cols = st.columns(ZONEN_JE_GRUPPE)
 
-    for i, col in enumerate(final_cols):
-        with col:
+    for i in range(n_zonen):
+        anzeigen = i in sichtbar
+        zk       = zone_keys[i]
+        with (final_cols[i - g_start] if anzeigen else nullcontext()):
             r_name    = zone_names[i]
-            prak_peak = method_peaks[i]["PRAKTIKER"]
-            vdi_peak  = method_peaks[i]["VDI NEU"]
             z_serie   = zone_serien[i]
 
             # Default IG: VDI 2078 ALT-Empfehlung in Zonen-Serie
-            vdi_a_peak = method_peaks[i]["VDI ALT"]
-            prak_kw, _, _, _ = device_label(vdi_a_peak, safety=1.10, serie=z_serie)
-            def_ig_idx = 0
-            for ig_idx, (kw, sname, _) in enumerate(IG_OPTIONS):
-                if sname == z_serie and kw == prak_kw:
-                    def_ig_idx = ig_idx
-                    break
-
-            # Info-Box - alle 6 Methoden berechnen
-            vdi_kw,   _, _, _ = device_label(vdi_peak, safety=1.10, serie=z_serie)
-            vdi_a_kw, _, _, _ = device_label(method_peaks[i]["VDI ALT"], safety=1.10, serie=z_serie)
-            reck_kw,  _, _, _ = device_label(method_peaks[i]["RECKNAGEL"], safety=1.10, serie=z_serie)
-            klts_kw,  _, _, _ = device_label(method_peaks[i]["KALTLUFTSEE"], safety=1.10, serie=z_serie)
-            ki_kw,    _, _, _ = device_label(method_peaks[i]["KI HYBRID"], safety=1.10, serie=z_serie)
-            st.markdown(
-                f"<div style='background:rgba(255,255,255,0.12);border:1px solid "
-                f"rgba(255,255,255,0.3);border-radius:10px;padding:10px;margin-bottom:6px;'>"
-                f"<div style='font-size:11px;font-weight:700;color:white;"
-                f"text-transform:uppercase;'>{r_name}</div>"
-                f"<div style='font-size:9px;color:rgba(255,255,255,0.75);margin-top:4px;line-height:1.4;'>"
-                f"VDI Neu: {vdi_kw:.1f} kW &nbsp;|&nbsp; "
-                f"VDI Alt: {vdi_a_kw:.1f} kW<br/>"
-                f"Recknagel: {reck_kw:.1f} kW &nbsp;|&nbsp; "
-                f"Praktiker ★: {prak_kw:.1f} kW<br/>"
-                f"Kaltluftsee: {klts_kw:.1f} kW &nbsp;|&nbsp; "
-                f"KI-Hybrid: {ki_kw:.1f} kW"
-                f"</div></div>",
-                unsafe_allow_html=True
-            )
+            empf_kw, _, _, _ = device_label(method_peaks[i][empf_spalte], safety=1.10, serie=z_serie)
+            def_ig_idx = IG_INDEX.get((empf_kw, z_serie), 0)
+
+            if anzeigen:
+                # Info-Box - Gerät je gerechneter Methode
+                info = methoden_kurzinfo({
+                    e["name"]: device_label(method_peaks[i][e["spalte"]], safety=1.10,
+                                            serie=z_serie)[0]
+                    for e in registry})
+                st.markdown(
+                    f"<div style='background:rgba(255,255,255,0.12);border:1px solid "
+                    f"rgba(255,255,255,0.3);border-radius:10px;padding:10px;margin-bottom:6px;'>"
+                    f"<div style='font-size:11px;font-weight:700;color:white;"
+                    f"text-transform:uppercase;'>{r_name}</div>"
+                    f"<div style='font-size:9px;color:rgba(255,255,255,0.75);margin-top:4px;line-height:1.4;'>"
+                    f"{info}"
+                    f"</div></div>",
+                    unsafe_allow_html=True
+                )
 
-            # ❄️ Innengerät
-            st.markdown("<div style='font-size:9px;color:rgba(255,255,255,0.6);"
-                        "margin-bottom:2px;'>❄️ INNENGERÄT</div>", unsafe_allow_html=True)
-            ig_val = st.selectbox(
-                f"IG {r_name}", IG_KEYS, index=def_ig_idx, key=f"hw{i}",
+                # ❄️ Innengerät
+                st.markdown("<div style='font-size:9px;color:rgba(255,255,255,0.6);"
+                            "margin-bottom:2px;'>❄️ INNENGERÄT</div>", unsafe_allow_html=True)
+            ig_val = zonen_wert(i, "ig", IG_KEYS, def_ig_idx, lambda idx: st.selectbox(
+                f"IG {r_name}", IG_KEYS, index=idx, key=f"hw{zk}",
                 format_func=lambda x: IG_LABELS[x],
                 label_visibility="collapsed"
-            )
+            ))
             ig_kw    = IG_OPTIONS[ig_val][0]
             ig_serie = IG_OPTIONS[ig_val][1]
             selected_hw.append(ig_kw)
@@ -2899,44 +2646,44 @@ def main():
             if is_fjm_ig:
                 ag_modus = "FJM Multi"
             else:
-                ag_modus = st.radio(
+                ag_modi = ["RAC Single-Split", "FJM Multi"]
+                ag_modus = zonen_wert(i, "agm", ag_modi, "FJM Multi", lambda idx: st.radio(
                     f"AG-Typ {r_name}",
-                    ["RAC Single-Split", "FJM Multi"],
-                    index=1, key=f"agm{i}",
+                    ag_modi,
+                    index=idx, key=f"agm{zk}",
                     horizontal=True,
                     label_visibility="collapsed"
-                )
+                ))
 
             # 🌡️ Außengerät — gefiltert nach Modus
-            st.markdown("<div style='font-size:9px;color:rgba(255,255,255,0.6);"
-                        "margin-top:4px;margin-bottom:2px;'>🌡️ AUSSENGERÄT</div>",
-                        unsafe_allow_html=True)
+            if anzeigen:
+                st.markdown("<div style='font-size:9px;color:rgba(255,255,255,0.6);"
+                            "margin-top:4px;margin-bottom:2px;'>🌡️ AUSSENGERÄT</div>",
+                            unsafe_allow_html=True)
 
             if ag_modus == "FJM Multi":
-                fjm_keys_raw = list(FJM_AG.keys())
+                fjm_keys_raw = kat.fjm_ag_kw
                 # N.V. vorne
                 fjm_keys   = ["NV"] + fjm_keys_raw
                 fjm_labels = {"NV": "— nicht vorhanden —"}
-                fjm_labels.update({k: f"{FJM_AG[k]['art_nr']}  |  {FJM_AG[k]['bez']}  |  {FJM_AG[k]['preis']:,} EUR"
+                fjm_labels.update({k: f"{FJM_AG[k]['art_nr']}  |  {FJM_AG[k]['bez']}  |  {kat.ag_preis[FJM_AG[k]['art_nr']]:,.0f} EUR"
                                    for k in fjm_keys_raw})
-                # Default: Zone 1 = AJ100, Zone 2-5 = N.V. (auch wenn IG > 0)
+                # Default: Zone 1 = AJ100, weitere Zonen = N.V. (auch wenn IG > 0)
                 def_fjm = 0  # Default = N.V.
                 if i == 0:
                     # Zone 1: Default = AJ100 (10.0kW index 6) wenn kein IG, sonst passendes AG
                     if ig_kw == 0:
                         def_fjm = 6  # AJ100
                     else:
-                        # IG ausgewählt: kleinstes AG >= ig_kw
-                        for fi, fk in enumerate(fjm_keys_raw):
-                            if fk >= ig_kw:
-                                def_fjm = fi + 1
-                                break
-                # Zone 2-5: immer N.V. (def_fjm bleibt 0)
-                ag_sel = st.selectbox(
-                    f"AG {r_name}", fjm_keys, index=def_fjm, key=f"ag{i}",
+                        # IG ausgewählt: kleinstes AG >= ig_kw (+1 wegen N.V. vorne)
+                        fi = kat.fjm_ag_index(ig_kw)
+                        def_fjm = fi + 1 if fi < len(fjm_keys_raw) else 0
+                # weitere Zonen: immer N.V. (def_fjm bleibt 0)
+                ag_sel = zonen_wert(i, "ag_fjm", fjm_keys, fjm_keys[def_fjm], lambda idx: st.selectbox(
+                    f"AG {r_name}", fjm_keys, index=idx, key=f"ag{zk}",
                     format_func=lambda x, m=fjm_labels: m[x],
                     label_visibility="collapsed"
-                )
+                ))
                 if ag_sel == "NV":
                     selected_hw_ag.append(("FJM", 0, "N.V."))
                 else:
@@ -2952,21 +2699,20 @@ def main():
                 rac_keys   = list(range(len(rac_list)))
                 rac_labels = {0: "— nicht vorhanden —"}
                 rac_labels.update({
-                    k+1: f"{rac_list_raw[k][1]}  |  {rac_list_raw[k][2]}  |  {rac_list_raw[k][3]:,} EUR"
+                    k+1: f"{rac_list_raw[k][1]}  |  {rac_list_raw[k][2]}  |  {kat.ag_preis.get(rac_list_raw[k][1], rac_list_raw[k][3]):,.0f} EUR"
                     for k in range(len(rac_list_raw))
                 })
                 # Default: kleinstes RAC AG >= ig_kw (oder 0 = N.V. wenn ig_kw=0)
                 def_rac = 0
                 if ig_kw > 0:
-                    for ri, (rkw, _, _, _) in enumerate(rac_list_raw):
-                        if rkw >= ig_kw:
-                            def_rac = ri + 1  # +1 wegen N.V. vorne
-                            break
-                ag_sel = st.selectbox(
-                    f"AG {r_name}", rac_keys, index=def_rac, key=f"ag{i}",
+                    ri = bisect_left([e[0] for e in rac_list_raw], ig_kw)
+                    if ri < len(rac_list_raw):
+                        def_rac = ri + 1  # +1 wegen N.V. vorne
+                ag_sel = zonen_wert(i, "ag_rac", rac_keys, def_rac, lambda idx: st.selectbox(
+                    f"AG {r_name}", rac_keys, index=idx, key=f"ag{zk}",
                     format_func=lambda x, m=rac_labels: m[x],
                     label_visibility="collapsed"
-                )
+                ))
                 if ag_sel == 0:
                     selected_hw_ag.append(("RAC", 0, "N.V."))
                 else:
@@ -2975,45 +2721,15 @@ def main():
 
     # Gesamtleistung + Preis (IG + AG)
     total_kw = sum(selected_hw)
-    _ig_preis_map = {}
-    for kw, sname, label in IG_OPTIONS:
-        if kw > 0 and "|" in label:
-            try:
-                p = label.split("|")[-1].strip().replace(" EUR","").replace(".","").replace(",",".")
-                _ig_preis_map[(kw, sname)] = float(p)
-            except Exception:
-                pass
     total_preis_ig = 0.0
-    for idx2, kw in enumerate(selected_hw):
-        if kw > 0:
-            ig_idx = next((j for j,(k,s,_) in enumerate(IG_OPTIONS)
-                           if k == kw and s == zone_serien[idx2]), None)
-            if ig_idx is not None:
-                try:
-                    p = IG_OPTIONS[ig_idx][2].split("|")[-1].strip().replace(" EUR","").replace(".","").replace(",",".")
-                    total_preis_ig += float(p)
-                except Exception:
-                    pass
+    for artnr in selected_ig_artnr:
+        total_preis_ig += float(kat.ig_preis.get(artnr, 0))
 
-    # AG-Preise addieren
+    # AG-Preise addieren (je Art.-Nr. aus dem Katalog)
     total_preis_ag = 0.0
     for ag_inf in selected_hw_ag:
-        if isinstance(ag_inf, (list, tuple)) and len(ag_inf) > 1:
-            ag_typ  = ag_inf[0]
-            ag_kw   = ag_inf[1]
-            if ag_kw and ag_kw != 0 and ag_typ != "—":
-                try:
-                    if ag_typ == "FJM" and ag_kw in FJM_AG:
-                        total_preis_ag += FJM_AG[ag_kw]["preis"]
-                    elif ag_typ == "RAC":
-                        # Suche in RAC_AG_BY_SERIE
-                        for serie_list in RAC_AG_BY_SERIE.values():
-                            for rkw, rartnr, rbez, rpreis in serie_list:
-                                if abs(rkw - float(ag_kw)) < 0.01:
-                                    total_preis_ag += rpreis
-                                    break
-                except Exception:
-                    pass
+        if isinstance(ag_inf, (list, tuple)) and len(ag_inf) > 2 and ag_inf[1]:
+            total_preis_ag += kat.ag_preis.get(ag_inf[2], 0)
 
     total_preis = total_preis_ig + total_preis_ag
 
@@ -3058,8 +2774,8 @@ def main():
         </span>
     </div>""", unsafe_allow_html=True)
 
-    finale_cards = st.columns(5)
-    for i, fcol in enumerate(finale_cards):
+    finale_cards = st.columns(ZONEN_JE_GRUPPE)
+    for fcol, i in zip(finale_cards, sichtbar):
         ig_kw_final = selected_hw[i]
         ig_artnr_final = "—"
         ig_preis_final = 0.0
@@ -3096,16 +2812,61 @@ def main():
                     💶 {ig_preis_final:.0f} EUR LP (IG)
                 </div>
                 <div style="font-size:8px;opacity:0.75;line-height:1.6;margin-top:6px;border-top:1px solid rgba(255,255,255,0.3);padding-top:4px;">
-                    VDI Neu: {method_peaks[i]["VDI NEU"]/1000:.1f} kW &nbsp;|&nbsp; VDI Alt: {method_peaks[i]["VDI ALT"]/1000:.1f} kW<br>
-                    Recknagel: {method_peaks[i]["RECKNAGEL"]/1000:.1f} kW &nbsp;|&nbsp; Praktiker: {method_peaks[i]["PRAKTIKER"]/1000:.1f} kW<br>
-                    Kaltluftsee: {method_peaks[i]["KALTLUFTSEE"]/1000:.1f} kW &nbsp;|&nbsp; KI-Hybrid: {method_peaks[i]["KI HYBRID"]/1000:.1f} kW
+                    {methoden_kurzinfo({e["name"]: method_peaks[i][e["spalte"]] / 1000 for e in registry})}
                 </div>
             </div>""", unsafe_allow_html=True)
 
+    # ==========================================
+    # AUSSENGERÄTE-OPTIMIERUNG (FJM Multi / RAC Single)
+    # ==========================================
+    with st.expander("🧩 Außengeräte-Optimierung — günstigste FJM-/RAC-Kombination"):
+        oa1, oa2, oa3 = st.columns(3)
+        o_methode = oa1.selectbox("Methode", methoden, index=methoden.index(empf_methode),
+                                  format_func=METHODEN_NAMEN.get, key="cm_opt_methode")
+        o_spitzen = [method_peaks[i][METHODEN_REGISTRY[o_methode]["spalte"]] for i in range(n_zonen)]
+        # Vorschlag: simultane Gebäudespitze / Σ Zonenspitzen der Methode
+        gz_vorschlag = min(1.0, max(g_sums[o_methode]) / max(sum(o_spitzen), 1.0))
+        o_gz = oa2.number_input(f"Gleichzeitigkeit (Methode: {gz_vorschlag:.2f})", 0.3, 1.0,
+                                round(gz_vorschlag, 2), step=0.05, key=f"cm_opt_gz_{o_methode}")
+        o_nur_fjm = oa3.checkbox("Nur FJM Multi", key="cm_opt_nur_fjm")
+        opt_key = (tuple(o_spitzen), tuple(zone_serien), float(o_gz), o_nur_fjm)
+        gemerkt = st.session_state.get("cm_opt")
+        if gemerkt is None or gemerkt[0] != opt_key:
+            try:
+                gemerkt = (opt_key, optimiere_aussengeraete(o_spitzen, zone_serien, float(o_gz),
+                                                            nur_fjm=o_nur_fjm))
+            except ValueError as e:
+                gemerkt = (opt_key, str(e))
+            st.session_state["cm_opt"] = gemerkt
+        if isinstance(gemerkt[1], str):
+            st.warning(gemerkt[1])
+        else:
+            aussengeraete_anzeige(gemerkt[1], zone_names)
+
+    # ==========================================
+    # SCHALL-CHECK DER GEWÄHLTEN AUSSENGERÄTE (Produktdatenbank)
+    # ==========================================
+    ag_art_nrn = [ag[2] for ag in selected_hw_ag
+                  if isinstance(ag, (list, tuple)) and len(ag) > 2 and ag[1]]
+    with st.expander("🔊 Schall-Check Außengeräte — Pegel am Nachbarn (Schnellprüfung)"):
+        sc1, sc2, sc3 = st.columns(3)
+        s_abstand = sc1.number_input("Abstand Immissionsort [m]", 1.0, 200.0, 5.0, step=0.5,
+                                     key="cm_schall_abstand")
+        s_grenzwert = sc2.number_input("Richtwert Nacht [dB(A)]", 20.0, 70.0, 35.0, step=1.0,
+                                       key="cm_schall_grenzwert")
+        s_q = sc3.selectbox("Aufstellung", [2, 4, 8], key="cm_schall_q",
+                            format_func={2: "frei vor Wand (Q=2)", 4: "Wandkante (Q=4)",
+                                         8: "Ecke / Nische (Q=8)"}.get)
+        if not ag_art_nrn:
+            st.info("Keine Außengeräte gewählt.")
+        else:
+            schall_aussengeraete_anzeige(schall_pruefung(ag_art_nrn, s_abstand, s_grenzwert, s_q),
+                                         s_grenzwert)
+
     # ==========================================
     # VERGLEICHS-DIAGRAMME
     # ==========================================
-    st.markdown('<div class="section-header">📈 Simultan-Trendkurven — Alle Methoden</div>',
+    st.markdown('<div class="section-header">📈 Simultan-Trendkurven — Gerechnete Methoden</div>',
                 unsafe_allow_html=True)
 
     _layout_dark = dict(
@@ -3132,17 +2893,11 @@ def main():
     )
 
     fig_master = go.Figure()
-    for name, data, color, lw, dash in [
-        ("PRAKTIKER (Heuristik)", g_sums["PRAK"],  "#E74C3C", 3,   "dot"),
-        ("VDI 6007 NEU",          g_sums["VDI_N"], "white",   5,   "solid"),
-        ("VDI 2078 ALT",          g_sums["VDI_A"], "#F39C12", 2.5, "dash"),
-        ("RECKNAGEL",             g_sums["RECK"],  CI_GRAY,   2,   "longdash"),
-        ("KALTLUFTSEE",           g_sums["KLTS"],  "#9B59B6", 2.5, "dashdot"),
-        ("KI-HYBRID",             g_sums["KI"],    "#1ABC9C", 3,   "solid"),
-    ]:
+    for m, e in zip(methoden, registry):
+        dash, lw = e["linie"]
         fig_master.add_trace(go.Scatter(
-            x=HOURS, y=data, name=name,
-            line=dict(width=lw, color=color, dash=dash)
+            x=HOURS, y=g_sums[m], name=e["name"].upper(),
+            line=dict(width=lw, color=e["farbe"], dash=dash)
         ))
     fig_master.update_layout(**_layout_dark)
     st.plotly_chart(fig_master, use_container_width=True)
@@ -3170,27 +2925,159 @@ def main():
                 "text-transform:uppercase;letter-spacing:1px;margin:12px 0 4px 0;'>"
                 "Einzelzonen-Diagramme</div>", unsafe_allow_html=True)
 
-    c1, c2 = st.columns(2)
-    with c1:
-        st.plotly_chart(plot_zones("vdi_n", "VDI 6007 Neu — Einzelzonen", "VDI_N"),
-                        use_container_width=True)
-    with c2:
-        st.plotly_chart(plot_zones("vdi_a", "VDI 2078 Alt — Einzelzonen", "VDI_A"),
-                        use_container_width=True)
-    c3, c4 = st.columns(2)
-    with c3:
-        st.plotly_chart(plot_zones("prak", "Praktiker — Einzelzonen", "PRAK"),
-                        use_container_width=True)
-    with c4:
-        st.plotly_chart(plot_zones("reck", "Recknagel — Einzelzonen", "RECK"),
-                        use_container_width=True)
-    c5, c6 = st.columns(2)
-    with c5:
-        st.plotly_chart(plot_zones("klts", "Kaltluftsee / Quelllüftung", "KLTS"),
-                        use_container_width=True)
-    with c6:
-        st.plotly_chart(plot_zones("ki", "KI-Hybrid (Peak-Shaving)", "KI"),
-                        use_container_width=True)
+    for j, (m, e) in enumerate(zip(methoden, registry)):
+        if j % 2 == 0:
+            diagramm_cols = st.columns(2)
+        with diagramm_cols[j % 2]:
+            st.plotly_chart(plot_zones(e["profil"], f"{e['name']} — Einzelzonen", m),
+                            use_container_width=True)
+
+    # ==========================================
+    # JAHRESSIMULATION (8760 h)
+    # ==========================================
+    with st.expander("📅 Jahressimulation (8760 h) — Energie, Vollbenutzungsstunden, Stromkosten"):
+        wetter_dir = PATHS.datei("wetter")
+        dateien = wetterdateien(wetter_dir)
+        js1, js2 = st.columns([2, 1])
+        with js1:
+            quelle = st.selectbox(
+                "Wetterdaten", ["Synthetisches Referenzjahr"] + dateien + ["Datei hochladen …"],
+                format_func=os.path.basename, key="cm_jahr_quelle",
+                help=f"TRY (*.dat) oder EPW (*.epw) im Ordner {wetter_dir}")
+            upload = None
+            if quelle == "Datei hochladen …":
+                upload = st.file_uploader("TRY / EPW", type=["dat", "epw"], key="cm_jahr_upload")
+        with js2:
+            j_methode = st.selectbox("Methode", methoden, format_func=METHODEN_NAMEN.get,
+                                     key="cm_jahr_methode")
+        js3, js4, js5 = st.columns(3)
+        t_innen = js3.number_input("Raumsoll [°C]", 18.0, 30.0, T_INNEN, 0.5, key="cm_jahr_ti")
+        strompreis = js4.number_input("Strompreis [€/kWh]", 0.0, 2.0, STROMPREIS, 0.01, key="cm_jahr_preis")
+        seer = js5.number_input("SEER", 2.0, 12.0, SEER_STANDARD, 0.1, key="cm_jahr_seer")
+
+        # Wetterdatei nur bei Quellwechsel neu einlesen
+        wetter_key = (quelle, upload.name if upload else None)
+        if st.session_state.get("cm_jahr_wetter_key") != wetter_key:
+            try:
+                if upload is not None:
+                    wetter = lade_wetter(upload.getvalue(), upload.name)
+                elif quelle in dateien:
+                    wetter = lade_wetter(quelle)
+                elif quelle == "Synthetisches Referenzjahr":
+                    wetter = referenzjahr_synthetisch()
+                else:
+                    wetter = None
+            except (OSError, ValueError, IndexError) as e:
+                st.error(f"Wetterdatei nicht lesbar: {e}")
+                wetter = None
+            st.session_state["cm_jahr_wetter"] = wetter
+            st.session_state["cm_jahr_wetter_key"] = wetter_key if wetter else None
+        wetter = st.session_state.get("cm_jahr_wetter")
+
+        if wetter is not None:
+            lasten = berechne_jahr([param for _, _, param in zonen], wetter, j_methode, t_innen)
+            jahr = jahres_auswertung(lasten, selected_hw, seer, strompreis, monat=wetter["monat"])
+            st.caption(f"{wetter['name']} ({wetter['quelle']}) — "
+                       f"T min/max {wetter['temp'].min():.1f} / {wetter['temp'].max():.1f} °C")
+            jm1, jm2, jm3 = st.columns(3)
+            jm1.metric("Kühlenergie", f"{fmt_number(jahr['kaelte_kwh'].sum())} kWh")
+            jm2.metric("Strom", f"{fmt_number(jahr['strom_kwh'].sum())} kWh")
+            jm3.metric("Stromkosten", f"{fmt_number(jahr['kosten_eur'].sum())} €")
+            st.dataframe(pd.DataFrame({
+                "Zone":               [n for _, n, _ in zonen],
+                "Gerät [kW]":         selected_hw,
+                "Spitze [W]":         jahr["spitze_w"].round(0),
+                "Bedarf [kWh]":       jahr["bedarf_kwh"].round(0),
+                "Gedeckt [kWh]":      jahr["kaelte_kwh"].round(0),
+                "Vollbenutzung [h]":  jahr["vbh_h"].round(0),
+                "Überlast [h]":       jahr["ueberlast_h"],
+                "Strom [kWh]":        jahr["strom_kwh"].round(0),
+                "Kosten [€]":         jahr["kosten_eur"].round(2),
+            }), use_container_width=True, hide_index=True)
+            fig_jahr = go.Figure(go.Bar(x=MONATE, y=jahr["monat_kwh"], marker_color=CI_BLUE))
+            layout = dict(_layout_light)
+            layout["yaxis"] = dict(title="Kühlenergie [kWh]")
+            layout["xaxis"] = dict(title="Monat")
+            layout["height"] = 320
+            fig_jahr.update_layout(**layout)
+            st.plotly_chart(fig_jahr, use_container_width=True)
+
+    # ==========================================
+    # SENSITIVITÄT (Monte-Carlo, Hintergrund-Thread)
+    # ==========================================
+    with st.expander("🎲 Sensitivität (Monte-Carlo) — P50/P90/P99 der Gebäudespitze"):
+        st.caption("Unsichere Eingaben je Zone als Dreiecksverteilung (min / wahrscheinlich / max). "
+                   "Personen, Technik, g-Wert und Fenster als Faktor auf den Planwert; "
+                   "Sonnenschutz-Ausfall 1 = Fc wie ohne Sonnenschutz.")
+        vert_df = st.data_editor(
+            pd.DataFrame([{"Eingabe": BEZEICHNUNGEN[k], "min": v[0], "modus": v[1], "max": v[2]}
+                          for k, v in VERTEILUNGEN.items()], index=list(VERTEILUNGEN)),
+            key="cm_mc_verteilung", disabled=["Eingabe"], hide_index=True, use_container_width=True)
+        verteilungen = {k: (float(r["min"]), float(r["modus"]), float(r["max"]))
+                        for k, r in zip(VERTEILUNGEN, vert_df.to_dict(orient="records"))}
+        gueltig = all(lo <= mo <= hi for lo, mo, hi in verteilungen.values())
+        if not gueltig:
+            st.warning("Je Zeile muss min ≤ modus ≤ max gelten.")
+        mc1, mc2 = st.columns([1, 3])
+        mc_n = mc1.number_input("Stichproben", 200, 20000, 2000, step=200, key="cm_mc_n")
+        mc_zonen = [param for _, _, param in zonen]
+        lauf = st.session_state.get("cm_mc_lauf")
+        if mc2.button("▶️ Monte-Carlo starten", disabled=not gueltig or (lauf is not None and not lauf.fertig)):
+            lauf = MonteCarloLauf(mc_zonen, stichproben=int(mc_n), verteilungen=verteilungen,
+                                  methoden=methoden)
+            lauf.start()
+            st.session_state["cm_mc_lauf"] = lauf
+        if lauf is not None:
+            if lauf.fertig and lauf.zonen != mc_zonen:
+                st.info("Zonen wurden seit dem Lauf geändert — Ergebnis bezieht sich auf den alten Stand.")
+            if not lauf.fertig and hasattr(st, "fragment"):
+                @st.fragment(run_every=0.5)
+                def _mc_fortschritt():
+                    if monte_carlo_anzeige(lauf, zone_names):
+                        st.rerun()            # fertig: Ergebnis im vollen Lauf, Polling endet
+                _mc_fortschritt()
+            elif monte_carlo_anzeige(lauf, zone_names) is False:
+                st.button("🔄 Fortschritt aktualisieren", key="cm_mc_refresh")
+
+    # ==========================================
+    # PARAMETERSTUDIE (Gitter über alle Zonen)
+    # ==========================================
+    with st.expander("🧭 Parameterstudie — Gebäudespitze & Gerätekosten je Variante"):
+        ps1, ps2, ps3 = st.columns(3)
+        feld_a = ps1.selectbox("Größe 1", list(GROESSEN), format_func=lambda f: GROESSEN[f][0],
+                               key="cm_studie_a")
+        feld_b = ps2.selectbox("Größe 2", [None] + [f for f in GROESSEN if f != feld_a],
+                               format_func=lambda f: "—" if f is None else GROESSEN[f][0],
+                               key="cm_studie_b")
+        s_methode = ps3.selectbox("Methode", methoden, format_func=METHODEN_NAMEN.get,
+                                  key="cm_studie_methode")
+        # Gitter je (Zonen, Größen, Methoden) gemerkt – Methodenwechsel ohne Neuberechnung
+        studie_key = (tuple(param for _, _, param in zonen), feld_a, feld_b, tuple(methoden))
+        gemerkt = st.session_state.get("cm_studie")
+        if gemerkt is None or gemerkt[0] != studie_key:
+            gemerkt = (studie_key, parameter_studie([param for _, _, param in zonen], feld_a, feld_b,
+                                                    methoden=methoden))
+            st.session_state["cm_studie"] = gemerkt
+        studie = gemerkt[1]
+        mi = studie["methoden"].index(s_methode)
+        y_labels = [str(a) for a in studie["a"]]
+        x_labels = [str(b) for b in studie["b"]] if feld_b else [GROESSEN[feld_a][0]]
+        hm1, hm2 = st.columns(2)
+        for spalte, werte, titel, einheit in [
+            (hm1, studie["spitze_w"][:, :, mi] / 1000, "Gebäudespitze", "kW"),
+            (hm2, studie["kosten_eur"][:, :, mi], "Gerätekosten (Innengeräte)", "€"),
+        ]:
+            fig = go.Figure(go.Heatmap(z=werte, x=x_labels, y=y_labels, colorscale="Blues",
+                                       text=[[fmt_number(v) for v in zeile] for zeile in werte],
+                                       texttemplate="%{text}", colorbar=dict(title=einheit)))
+            fig.update_layout(template="plotly_white", height=360,
+                              title=dict(text=f"{titel} — {METHODEN_NAMEN[s_methode]}", font=dict(size=13)),
+                              xaxis_title=GROESSEN[feld_b][0] if feld_b else "",
+                              yaxis_title=GROESSEN[feld_a][0], margin=dict(l=60, r=20, t=50, b=50))
+            spalte.plotly_chart(fig, use_container_width=True)
+        if studie["zu_gross"][:, :, mi].any():
+            st.caption("⚠️ In einzelnen Varianten übersteigen Zonen das größte Gerät der Serie "
+                       "(Kosten dort mit dem größten Gerät gerechnet).")
 
     # ==========================================
     # EXPORT SEKTION
@@ -3375,7 +3262,7 @@ def main():
                             selected_ig_artnr=selected_ig_artnr
                         )
                         geraete_str = " | ".join([
-                            f"Z{zi+1}: {selected_hw[zi]:.1f}kW" for zi in range(5) if selected_hw[zi]>0
+                            f"Z{zi+1}: {kw:.1f}kW" for zi, kw in enumerate(selected_hw) if kw > 0
                         ])
                         ok, item_id = mon.save_to_monday({
                             "projekt":    proj_name,
@@ -3402,7 +3289,8 @@ def main():
                         proj_name, kunde_name, bearbeiter, firma,
                         selected_hw, selected_hw_ag, zone_names,
                         selected_ig_artnr=selected_ig_artnr,
-                        liefertermin=liefertermin_str
+                        liefertermin=liefertermin_str,
+                        room_inputs=room_inputs_list
                     )
                     st.download_button(
                         "⬇️ EXCEL HERUNTERLADEN",
@@ -3469,14 +3357,13 @@ def main():
                     row = db_load_project(proj_id)
                     if row:
                         try:
-                            import json as _json
                             room_data_json = row[8] if len(row) > 8 else '{}'
                             results_json   = row[9] if len(row) > 9 else '{}'
                             devices_json   = row[10] if len(row) > 10 else '{}'
                             
-                            room_data = _json.loads(room_data_json) if room_data_json else {}
-                            results   = _json.loads(results_json) if results_json else {}
-                            devices   = _json.loads(devices_json) if devices_json else {}
+                            room_data = json.loads(room_data_json) if room_data_json else {}
+                            results   = json.loads(results_json) if results_json else {}
+                            devices   = json.loads(devices_json) if devices_json else {}
                             
                             st.session_state['loaded_project'] = {
                                 'projekt': row[4],
@@ -3485,10 +3372,21 @@ def main():
                                 'room_inputs': room_data.get('room_inputs', []),
                                 'room_results': results.get('room_results', []),
                                 'peaks': results.get('peaks', {}),
-                                'selected_hw': devices.get('selected_hw', [0,0,0,0,0]),
+                                'selected_hw': devices.get('selected_hw', []),
                                 'selected_hw_ag': devices.get('selected_hw_ag', []),
                             }
                             
+                            # Zonen-Tabelle aus den gespeicherten Eingaben
+                            hinweise = []
+                            st.session_state['cm_zonen'] = zonen_tabelle(
+                                room_data.get('room_inputs', []), hinweise=hinweise)
+                            st.session_state['cm_lade_hinweise'] = hinweise
+                            st.session_state['cm_fassaden'] = fassaden_tabelle(
+                                room_data.get('room_inputs', []))
+                            # Methodenauswahl aus den gespeicherten Simultanspitzen
+                            gespeichert = [m for m in results.get('peaks', {}) if m in METHODEN_REGISTRY]
+                            st.session_state['cm_methoden_geladen'] = aktive_methoden(gespeichert or None)
+                            st.session_state.pop('cm_geraete', None)
                             st.success(f"✅ Projekt '{row[4]}' geladen!")
                             st.rerun()
                         except Exception as e:
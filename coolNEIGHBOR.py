@@ -21,22 +21,10 @@
 import streamlit as st
 import math
 import io
+import json
 import os
 from datetime import datetime
-from docx import Document
-from docx.shared import RGBColor
-
-# ReportLab fuer professionellen PDF-Export
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.units import mm
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
-from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, Table,
-                                 TableStyle, HRFlowable, PageBreak)
-from reportlab.graphics.shapes import Drawing, Rect, Line, String
-from reportlab.graphics import renderPDF
-from reportlab.pdfgen import canvas as rl_canvas
+# docx / ReportLab werden erst im Export geladen (create_pdf / create_word)
 
 import plotly.graph_objects as go
 
@@ -84,146 +72,22 @@ GRENZWERTE = {
 }
 
 # SAMSUNG GERAETEDATENBANK
-# Quellen:
-#   RAC Single Split: Samsung TDB RAC R32 NASA Single Split 2025, Ver 1.0, Dez 2024
-#   FJM Multi Split:  Samsung TDB Free Joint Multi R32 Europe 2025, Ver 1.0
-# Lw = Schallleistungspegel dB(A) Ausseneinheit, Cooling
-# Lp_oktav = [63, 125, 250, 500, 1000, 2000, 4000, 8000 Hz] aus NR-Kurvenanalyse
+# Schalldaten, Leistung und Listenpreis aus der gemeinsamen Produktdatenbank
+# (coolsulting.engines.produkte: SCHALL_AG + Preisliste), Anzeige je Serie
+from coolsulting.engines.produkte import produkte
+
 SAMSUNG_DB = {
-    # ── RAC SINGLE SPLIT ─────────────────────────────────────────────────
-    "Samsung RAC Elite (AR9500T)": {
-        "AR70F09CAAWXEU (2.5 kW)": {
-            "Lw": 59, "Lp_1m": 45, "Luft_m3h": 1800, "Gewicht_kg": 30.7,
-            "Lp_oktav": [46, 44, 40, 36, 32, 27, 20, 12],
-        },
-        "AR70F12CAAWXEU (3.5 kW)": {
-            "Lw": 62, "Lp_1m": 46, "Luft_m3h": 1800, "Gewicht_kg": 30.7,
-            "Lp_oktav": [48, 46, 42, 38, 34, 29, 22, 14],
-        },
-    },
-    "Samsung RAC Avant (AR7500T)": {
-        "AR70F07C1AWXEU (2.0 kW)": {
-            "Lw": 59, "Lp_1m": 45, "Luft_m3h": 1740, "Gewicht_kg": 30.7,
-            "Lp_oktav": [46, 44, 40, 36, 32, 27, 20, 12],
-        },
-        "AR70F09C1AWXEU (2.5 kW)": {
-            "Lw": 59, "Lp_1m": 45, "Luft_m3h": 1740, "Gewicht_kg": 30.7,
-            "Lp_oktav": [46, 44, 40, 36, 32, 27, 20, 12],
-        },
-        "AR70F12C1AWXEU (3.5 kW)": {
-            "Lw": 62, "Lp_1m": 46, "Luft_m3h": 1740, "Gewicht_kg": 30.7,
-            "Lp_oktav": [48, 46, 42, 38, 34, 29, 22, 14],
-        },
-        "AR70F15C1AWXEU (4.2 kW)": {
-            "Lw": 65, "Lp_1m": 48, "Luft_m3h": 2820, "Gewicht_kg": 36.8,
-            "Lp_oktav": [51, 49, 45, 41, 37, 32, 25, 17],
-        },
-        "AR70F18C1AWXEU (5.0 kW)": {
-            "Lw": 65, "Lp_1m": 51, "Luft_m3h": 2820, "Gewicht_kg": 36.8,
-            "Lp_oktav": [53, 51, 47, 43, 39, 34, 27, 19],
-        },
-        "AR70F24C1AWXEU (6.8 kW)": {
-            "Lw": 68, "Lp_1m": 54, "Luft_m3h": 3420, "Gewicht_kg": 38.6,
-            "Lp_oktav": [56, 54, 50, 46, 42, 37, 30, 22],
-        },
-    },
-    "Samsung RAC Comfort (AR6000T)": {
-        "AR60F09C1AWXEU (2.5 kW)": {
-            "Lw": 63, "Lp_1m": 45, "Luft_m3h": 2400, "Gewicht_kg": 24.0,
-            "Lp_oktav": [46, 44, 40, 37, 33, 28, 21, 13],
-        },
-        "AR60F12C1AWXEU (3.5 kW)": {
-            "Lw": 63, "Lp_1m": 46, "Luft_m3h": 2400, "Gewicht_kg": 24.0,
-            "Lp_oktav": [48, 46, 42, 38, 34, 29, 22, 14],
-        },
-        "AR60F18C1AWXEU (5.0 kW)": {
-            "Lw": 65, "Lp_1m": 51, "Luft_m3h": 3000, "Gewicht_kg": 36.8,
-            "Lp_oktav": [53, 51, 47, 43, 39, 34, 27, 19],
-        },
-        "AR60F24C1AWXEU (6.8 kW)": {
-            "Lw": 68, "Lp_1m": 54, "Luft_m3h": 3600, "Gewicht_kg": 38.6,
-            "Lp_oktav": [56, 54, 50, 46, 42, 37, 30, 22],
-        },
-    },
-    # AR50 = Standard-RAC (NICHT Wind-Free! Wind-Free ist eine Inneneinheitstechnologie)
-    "Samsung RAC Standard (AR5000T)": {
-        "AR50F07C1AHXEU (2.0 kW)": {
-            "Lw": 60, "Lp_1m": 45, "Luft_m3h": 1800, "Gewicht_kg": 24.0,
-            "Lp_oktav": [46, 44, 40, 37, 33, 28, 21, 13],
-        },
-        "AR50F09C1AHXEU (2.5 kW)": {
-            "Lw": 63, "Lp_1m": 45, "Luft_m3h": 1800, "Gewicht_kg": 24.0,
-            "Lp_oktav": [46, 44, 40, 37, 33, 28, 21, 13],
-        },
-        "AR50F12C1AHXEU (3.5 kW)": {
-            "Lw": 63, "Lp_1m": 46, "Luft_m3h": 1800, "Gewicht_kg": 24.4,
-            "Lp_oktav": [48, 46, 42, 38, 34, 29, 22, 14],
-        },
-        "AR50F15C1AHXEU (4.2 kW)": {
-            "Lw": 65, "Lp_1m": 48, "Luft_m3h": 2400, "Gewicht_kg": 30.7,
-            "Lp_oktav": [51, 49, 45, 41, 37, 32, 25, 17],
-        },
-        "AR50F18C1AHXEU (5.0 kW)": {
-            "Lw": 65, "Lp_1m": 51, "Luft_m3h": 2400, "Gewicht_kg": 36.8,
-            "Lp_oktav": [53, 51, 47, 43, 39, 34, 27, 19],
-        },
-        "AR50F24C1AHXEU (6.8 kW)": {
-            "Lw": 68, "Lp_1m": 54, "Luft_m3h": 3000, "Gewicht_kg": 38.6,
-            "Lp_oktav": [56, 54, 50, 46, 42, 37, 30, 22],
-        },
-    },
-    # ── FJM MULTI-SPLIT AUSSENEINHEITEN ──────────────────────────────────
-    # Quelle: Samsung TDB Free Joint Multi R32 Europe 2025
-    # Lw Ausseneinheit Cooling (aus Spezifikations-Tabelle)
-    "Samsung FJM Multi-Split (AJ-Ausseneinheit)": {
-        "AJ040TXJ2KG/EU  (4.0 kW / 2 Innen)": {
-            "Lw": 61, "Lp_1m": 45, "Luft_m3h": 1860, "Gewicht_kg": 33.0,
-            "Lp_oktav": [48, 46, 42, 38, 34, 29, 22, 14],
-        },
-        "AJ050TXJ2KG/EU  (5.0 kW / 2 Innen)": {
-            "Lw": 61, "Lp_1m": 45, "Luft_m3h": 2100, "Gewicht_kg": 37.0,
-            "Lp_oktav": [48, 46, 42, 38, 34, 29, 22, 14],
-        },
-        "AJ052TXJ3KG/EU  (5.2 kW / 3 Innen)": {
-            "Lw": 61, "Lp_1m": 45, "Luft_m3h": 2100, "Gewicht_kg": 44.0,
-            "Lp_oktav": [48, 46, 42, 38, 34, 29, 22, 14],
-        },
-        "AJ068TXJ3KG/EU  (6.8 kW / 3 Innen)": {
-            "Lw": 64, "Lp_1m": 48, "Luft_m3h": 2520, "Gewicht_kg": 57.5,
-            "Lp_oktav": [51, 49, 45, 41, 37, 32, 25, 17],
-        },
-        "AJ080TXJ4KG/EU  (8.0 kW / 4 Innen)": {
-            "Lw": 66, "Lp_1m": 50, "Luft_m3h": 3480, "Gewicht_kg": 70.0,
-            "Lp_oktav": [53, 51, 47, 43, 39, 34, 27, 19],
-        },
-        "AJ100TXJ5KG/EU  (10.0 kW / 5 Innen)": {
-            "Lw": 70, "Lp_1m": 54, "Luft_m3h": 4020, "Gewicht_kg": 76.5,
-            "Lp_oktav": [57, 55, 51, 47, 43, 38, 31, 23],
-        },
-    },
-    "Fremdgeraet / Freie Eingabe": {
-        "Manuelle Eingabe": {
-            "Lw": 65.0, "Lp_1m": 50.0, "Luft_m3h": 2800, "Gewicht_kg": 40.0,
-            "Lp_oktav": [52, 50, 46, 42, 38, 33, 26, 18],
-        },
-    },
+    serie: {modell: {"Lw": e["lw"], "Lp_1m": e["lp_1m"], "Luft_m3h": e["luft_m3h"],
+                     "Gewicht_kg": e["gewicht_kg"], "Lp_oktav": e["lp_oktav"], "preis": e["preis"]}
+            for modell, e in geraete.items()}
+    for serie, geraete in produkte().schall_auswahl().items()
 }
-
-# NR-Kurven Referenzwerte (ISO 1996-1), Frequenzen: [63,125,250,500,1k,2k,4k,8k]
-NR_KURVEN = {
-    15: [51.8, 35.5, 22.1, 12.5,  5.4,  0.1, -3.5, -6.2],
-    20: [55.4, 39.4, 26.5, 17.1, 10.1,  4.9,  1.4, -1.2],
-    25: [59.1, 43.4, 30.9, 21.7, 14.9,  9.7,  6.3,  3.8],
-    30: [62.7, 47.3, 35.3, 26.3, 19.7, 14.5, 11.2,  8.8],
-    35: [66.4, 51.2, 39.7, 30.9, 24.5, 19.3, 16.2, 13.8],
-    40: [70.0, 55.1, 44.1, 35.5, 29.3, 24.1, 21.1, 18.8],
-    45: [73.7, 59.1, 48.5, 40.1, 34.1, 28.9, 26.0, 23.8],
-    50: [77.3, 63.0, 52.9, 44.7, 38.9, 33.7, 31.0, 28.8],
-    55: [81.0, 66.9, 57.3, 49.3, 43.7, 38.5, 36.0, 33.8],
-    60: [84.6, 70.9, 61.7, 53.9, 48.5, 43.3, 41.0, 38.8],
-    65: [88.2, 74.8, 66.1, 58.5, 53.3, 48.1, 46.0, 43.8],
+SAMSUNG_DB["Fremdgeraet / Freie Eingabe"] = {
+    "Manuelle Eingabe": {
+        "Lw": 65.0, "Lp_1m": 50.0, "Luft_m3h": 2800, "Gewicht_kg": 40.0,
+        "Lp_oktav": [52, 50, 46, 42, 38, 33, 26, 18], "preis": None,
+    },
 }
-OKTAV_BANDS = [63, 125, 250, 500, 1000, 2000, 4000, 8000]
 
 DISCLAIMER_TEXT = (
     "WICHTIGER HINWEIS: Kein Sachverstaendigengutachten!\n\n"
@@ -244,108 +108,14 @@ DISCLAIMER_TEXT = (
 )
 
 # ──────────────────────────────────────────────────
-# PHYSIK-ENGINE
+# PHYSIK-ENGINE (coolsulting.engines.schall – auch ohne Streamlit nutzbar)
 # ──────────────────────────────────────────────────
 
-def log_add(levels):
-    if not levels:
-        return 0.0
-    return 10 * math.log10(sum(10 ** (l / 10) for l in levels))
-
-def kaskaden_zuschlag(n):
-    if n <= 1:
-        return 0.0
-    return round(10 * math.log10(n), 1)
-
-def atm_daempfung(d_m, temp_c, rel_hum):
-    alpha = max(1.9 * (1 + (10 - temp_c) * 0.02) * (1 + (70 - rel_hum) * 0.01), 0.5)
-    return round((alpha * d_m) / 1000.0, 3)
-
-def beugungsdaempfung(umweg_delta, barriere_typ, f_hz=500.0):
-    if umweg_delta <= 0:
-        return 0.0
-    n = 2.0 * umweg_delta / (340.0 / f_hz)
-    if n <= 0:
-        return 0.0
-    dz = 10 * math.log10(3 + 20 * n)
-    limits = {"Massiv & Luftdicht": 25.0, "Leichtbauweise dicht": 15.0,
-              "Teiloffen / Lamellen": 5.0, "Luftdurchlässig (Gitter)": 0.0}
-    lim = next((v for k, v in limits.items() if k in barriere_typ), 25.0)
-    return round(min(dz, lim), 1)
-
-def aero_zuschlag(luft_m3h, qs_m2):
-    if qs_m2 <= 0:
-        return 0.0, 0.0
-    v = luft_m3h / (3600.0 * qs_m2)
-    zs = 0.0 if v <= 3.0 else round(((v - 3.0) / 0.03) * 0.25, 1)
-    return round(v, 2), zs
-
-def berechne_gesamt(lw, anzahl, luft, qs, d_geh, d_koerper, k_t, k_i,
-                    d_total, topologie, b1_mat, b2_mat, b1_lenkt, b2_lenkt,
-                    q, w_dist, temp, hum, raumzuschlag, d_direkt):
-    """
-    ISO 9613-2 Schallausbreitungsrechnung.
-
-    d_total  = entrollter Schallweg entlang der Schallbahn [m]
-               (= Luftlinie bei direktem Weg, laenger bei Beugung)
-    d_direkt = kuerzte Luftlinie Quelle -> Immissionsort [m]
-               (immer <= d_total; bei direktem Weg = d_total)
-    umweg    = d_total - d_direkt = Mehrweg durch Beugung an Kanten [m]
-               WICHTIG: umweg steigt mit groesserer Beugungsbahn,
-               groesserer umweg = staerkere Fresnel-Beugungsdaempfung.
-               d_direkt kleiner bei gleichem d_total = groesserer Umweg = mehr Daempfung.
-               Das ist physikalisch KORREKT (tieferer Schallschatten hinter der Kante).
-    """
-    d_kas = kaskaden_zuschlag(anzahl)
-    v_luft, d_aero = aero_zuschlag(luft, qs)
-    lw_eff = lw + d_kas + d_aero - d_geh - d_koerper
-    q_db = {1: 0, 2: 3, 4: 6, 8: 9}.get(q, 3)
-    # Wandreflexion: nur bei sehr kleinem Wandabstand
-    w_plus = 3.0 if w_dist < 0.5 else (1.5 if w_dist < 1.0 else 0.0)
-    a_atm = atm_daempfung(d_total, temp, hum)
-    # Geometrische Ausbreitung auf d_total (entrollter Weg = massgebend fuer Pegel)
-    a_div = 10 * math.log10(4 * math.pi * max(d_total, 0.001) ** 2)
-    lp_frei = lw_eff + q_db - a_div + w_plus - a_atm + raumzuschlag
-    # Beugungsberechnung: umweg = entrollter Weg - direkte Luftlinie
-    # d_direkt muss <= d_total sein (physikalische Bedingung)
-    d_direkt_safe = min(d_direkt, d_total)
-    umweg = max(d_total - d_direkt_safe, 0.0)
-    dz1 = 0.0
-    dz2 = 0.0
-    d_uml = 0.0
-    if umweg > 0 and "Direkt" not in topologie:
-        # Bei L-foermig: gesamter Umweg an einer Kante
-        # Bei U-foermig: aufgeteilt auf zwei Kanten
-        if "U-foermig" in topologie or "U-förmig" in topologie:
-            dz1 = beugungsdaempfung(umweg * 0.6, b1_mat)
-            dz2 = beugungsdaempfung(umweg * 0.4, b2_mat)
-        else:
-            dz1 = beugungsdaempfung(umweg, b1_mat)
-    if b1_lenkt and "Direkt" not in topologie:
-        d_uml += 2.0
-    if b2_lenkt and ("U-foermig" in topologie or "U-förmig" in topologie):
-        d_uml += 1.5
-    lp = round(lp_frei - dz1 - dz2 - d_uml, 1)
-    lr = round(lp + k_t + k_i, 1)
-    return {
-        "lw_eff": round(lw_eff, 1), "d_kas": d_kas, "d_aero": d_aero,
-        "v_luft": v_luft, "q_db": q_db, "w_plus": w_plus,
-        "a_atm": a_atm, "a_div": round(a_div, 1), "lp_frei": round(lp_frei, 1),
-        "dz1": dz1, "dz2": dz2, "d_uml": d_uml, "umweg": round(umweg, 2),
-        "lp": lp, "lr": lr,
-    }
-
-def oktav_am_io(lp_oktav_src, d_total, q, d_geh, anzahl):
-    q_db = {1: 0, 2: 3, 4: 6, 8: 9}.get(q, 3)
-    d_div = 10 * math.log10(4 * math.pi * max(d_total, 0.001) ** 2)
-    d_kas = kaskaden_zuschlag(anzahl)
-    return [round(lp + q_db - d_div + d_kas - d_geh, 1) for lp in lp_oktav_src]
-
-def nr_klasse(lp_io):
-    for nr in sorted(NR_KURVEN.keys()):
-        if all(lp_io[i] <= NR_KURVEN[nr][i] for i in range(8)):
-            return nr
-    return None
+from coolsulting.engines.schall import (
+    NR_KURVEN, OKTAV_BANDS, log_add, kaskaden_zuschlag, aero_zuschlag,
+    berechne_gesamt, oktav_am_io, nr_klasse,
+)
+from coolsulting.trace import traced
 
 # ──────────────────────────────────────────────────
 # DIAGRAMM
@@ -398,10 +168,15 @@ def sanitize(txt):
     txt = txt.encode("latin-1",errors="replace").decode("latin-1")
     return txt
 
+@traced("coolNEIGHBOR.create_pdf")
 def create_pdf(daten, projekt, ersteller, erg=None, grenzwert=None,
                lp_io=None, lp_oktav_src=None, konform=None, lr=None, lp_val=None,
                modell="", land="", widmung="", auftraggeber=""):
     """Professioneller PDF-Bericht mit ReportLab - deg coolsulting Branding"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib import colors
+    from reportlab.lib.units import mm
+    from reportlab.pdfgen import canvas as rl_canvas
 
     # --- Farben ---
     BLUE    = colors.HexColor("#36A9E1")
@@ -997,7 +772,10 @@ def create_pdf(daten, projekt, ersteller, erg=None, grenzwert=None,
     return buf.getvalue()
 
 
+@traced("coolNEIGHBOR.create_word")
 def create_word(daten, projekt, ersteller):
+    from docx import Document
+    from docx.shared import RGBColor
     doc = Document()
     h = doc.add_heading(projekt, 0)
     h.runs[0].font.color.rgb = RGBColor(0x36, 0xA9, 0xE1)
@@ -1160,6 +938,8 @@ def main():
                  "2x = +3 dB, 4x = +6 dB, 10x = +10 dB.")
         dbe     = SAMSUNG_DB[serie][modell]
         manuell = (modell == "Manuelle Eingabe")
+        if dbe["preis"] is not None:
+            st.caption(f"Listenpreis: {dbe['preis']:,.0f} EUR netto je Einheit".replace(",", "."))
         lw   = st.number_input("Lw [dB(A)]",  value=float(dbe["Lw"]),        step=0.5,
             disabled=not manuell,
             help="Schallleistungspegel des Aussengeraets – gerate-typische Kenngrösse, "
@@ -1533,29 +1313,49 @@ Die <b>kuerzeste Verbindung</b> zwischen Geraet und Nachbarfenster – wie der V
             exp[f"{hz} Hz"] = f"{val} dB"
         exp["NR-Klasse"] = f"NR {nr_k}" if nr_k else "> NR 65"
 
+        # Berichte nur auf Knopfdruck erzeugen (nicht bei jedem Rerun); gespeichert
+        # mit Schlüssel der Eingaben -> nach jeder Änderung kein veralteter Download
+        bericht_key = hash((json.dumps({k: v for k, v in exp.items() if k != "Datum"},
+                                       sort_keys=True, default=str), modell, projekt))
+        for art in ("pdf", "docx"):
+            gespeichert = st.session_state.get(f"coolneighbor_{art}")
+            if gespeichert is not None and gespeichert[0] != bericht_key:
+                del st.session_state[f"coolneighbor_{art}"]
         col_p, col_w = st.columns(2)
         with col_p:
             fname_p = f"coolNEIGHBOR_{projekt.replace(' ','_')[:28]}.pdf"
-            st.download_button(
-                "PDF-Bericht herunterladen",
-                data=create_pdf(
-                    exp, projekt, ersteller,
-                    erg=erg, grenzwert=grenzwert,
-                    lp_io=lp_io, lp_oktav_src=lp_oktav_src,
-                    konform=konform, lr=lr, lp_val=lp,
-                    modell=modell, land=land, widmung=widmung,
-                    auftraggeber=auftraggeber,
-                ),
-                file_name=fname_p, mime="application/pdf",
-                use_container_width=True)
+            if st.button("PDF-Bericht erstellen", use_container_width=True):
+                try:
+                    st.session_state["coolneighbor_pdf"] = (bericht_key, create_pdf(
+                        exp, projekt, ersteller,
+                        erg=erg, grenzwert=grenzwert,
+                        lp_io=lp_io, lp_oktav_src=lp_oktav_src,
+                        konform=konform, lr=lr, lp_val=lp,
+                        modell=modell, land=land, widmung=widmung,
+                        auftraggeber=auftraggeber,
+                    ))
+                except Exception as e:
+                    st.error(f"Fehler: {e}")
+            if "coolneighbor_pdf" in st.session_state:
+                st.download_button(
+                    "PDF-Bericht herunterladen",
+                    data=st.session_state["coolneighbor_pdf"][1],
+                    file_name=fname_p, mime="application/pdf",
+                    use_container_width=True)
         with col_w:
             fname_w = f"coolNEIGHBOR_{projekt.replace(' ','_')[:28]}.docx"
-            st.download_button(
-                "Word-Bericht herunterladen",
-                data=create_word(exp, projekt, ersteller),
-                file_name=fname_w,
-                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                use_container_width=True)
+            if st.button("Word-Bericht erstellen", use_container_width=True):
+                try:
+                    st.session_state["coolneighbor_docx"] = (bericht_key, create_word(exp, projekt, ersteller))
+                except Exception as e:
+                    st.error(f"Fehler: {e}")
+            if "coolneighbor_docx" in st.session_state:
+                st.download_button(
+                    "Word-Bericht herunterladen",
+                    data=st.session_state["coolneighbor_docx"][1],
+                    file_name=fname_w,
+                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                    use_container_width=True)
         st.caption("Alle Berichte enthalten den vollstaendigen Haftungsausschluss gemaess OeAL 3 / TA Laerm.")
         with st.expander("Haftungsausschluss (Vorschau)"):
             st.text(DISCLAIMER_TEXT)
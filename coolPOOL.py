@@ -9,16 +9,11 @@
 
 import streamlit as st
 import plotly.graph_objects as go
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import os
 import io
 from datetime import datetime
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.utils import ImageReader
 
 # --- META ---
 APP_NAME = "°coolPOOL – Poolwasser-Temperierungs-Simulation"
@@ -62,22 +57,18 @@ HP_MODELS = {
     },
 }
 
-REGIONAL_CLIMATE = {
-    "1xxx (Wien/Ost)":        {"Tag": [3.5, 5.8, 11.2, 16.5, 21.8, 24.9, 27.2, 26.9, 21.5, 15.4,  8.5, 4.2],
-                               "Nacht": [-1.2, -0.2, 3.1, 7.2, 11.8, 15.1, 17.0, 16.8, 12.5, 8.1, 3.2, 0.1]},
-    "4xxx (OÖ/Zentralraum)":  {"Tag": [2.9, 5.1, 10.3, 15.2, 20.5, 23.4, 25.6, 25.4, 20.3, 14.2,  7.5, 4.0],
-                               "Nacht": [-2.0, -0.9, 2.4, 5.8, 10.5, 13.5, 15.4, 15.3, 11.7, 7.0, 2.4, -0.5]},
-    "5xxx (Salzburg/Alpin)":  {"Tag": [2.5, 4.8,  9.8, 14.8, 19.8, 22.8, 24.9, 24.7, 19.8, 13.8,  7.1, 3.2],
-                               "Nacht": [-2.5, -1.5, 1.8, 5.4,  9.8, 13.1, 14.9, 14.8, 11.2, 6.5, 2.0, -1.2]},
-    "8xxx (Steiermark)":      {"Tag": [3.4, 5.7, 10.9, 16.1, 21.3, 24.3, 26.5, 26.2, 21.0, 15.0,  8.2, 4.0],
-                               "Nacht": [-2.2, -1.1, 2.1, 6.1, 10.7, 13.9, 15.8, 15.6, 11.5, 7.2, 2.3, -0.8]},
-}
+# Klimadaten & Physik: coolsulting.engines.pool (auch ohne Streamlit nutzbar)
+from coolsulting.engines.pool import (
+    REGIONAL_CLIMATE, MONATE, klimaprofil, verluste, aufheizung, simulation_24h,
+)
+from coolsulting.trace import traced
 
 
 # ============================================================
 # HELPER: MATPLOTLIB-BILDER FÜR PDF
 # ============================================================
 def render_mpl(fig_type, **kwargs):
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(10, 5), facecolor="white")
     if fig_type == "klima":
         df = kwargs["df"]
@@ -107,7 +98,14 @@ def render_mpl(fig_type, **kwargs):
 # ============================================================
 # PDF-GENERATOR
 # ============================================================
+@traced("coolPOOL.generate_pdf")
 def generate_pdf(data, imgs):
+    # ReportLab erst beim Export laden (hält den Speicher pro Session klein)
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib import colors
+    from reportlab.lib.utils import ImageReader
+
     buffer = io.BytesIO()
     p = canvas.Canvas(buffer, pagesize=A4)
     w, h = A4
@@ -290,11 +288,8 @@ def main():
     # ============================================================
     # PHYSIK-ENGINE
     # ============================================================
-    lapse     = ((hoehe - 300) / 100) * 0.65
-    base_k    = REGIONAL_CLIMATE[region]
-    adj_tag   = [round(t - lapse, 1) for t in base_k["Tag"]]
-    adj_nacht = [round(n - lapse, 1) for n in base_k["Nacht"]]
-    months    = ["Jan", "Feb", "Mär", "Apr", "Mai", "Jun", "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"]
+    adj_tag, adj_nacht = klimaprofil(region, hoehe)
+    months    = MONATE
 
     m_range = st.select_slider(
         "Analyse-Saison (Detailansicht)", options=months, value=("Apr", "Okt")
@@ -303,13 +298,8 @@ def main():
     idx_e   = months.index(m_range[1])
     worst_at = min(adj_tag[idx_s:idx_e + 1] + adj_nacht[idx_s:idx_e + 1])
 
-    wf_val = {"Gering": 1.2, "Mäßig": 3.0, "Stark": 5.8}[wind]
-
     def calc_losses(at, target):
-        dt   = max(0.0, target - at)
-        surf = flaeche * (0.004 + 0.003 * wf_val) * dt * 0.62 * (0.15 if decke else 1.0)
-        hull = flaeche * d_p * 0.0015 * (target - 10.0)
-        return surf, hull
+        return verluste(flaeche, d_p, wind, decke, at, target)
 
     ls_t_s, ls_t_h = calc_losses(adj_tag[idx_s],   t_soll)
     ls_n_s, ls_n_h = calc_losses(adj_nacht[idx_s],  t_soll_n)
@@ -344,13 +334,11 @@ def main():
     st.header("Phase 2: Physikalische Leistungs-Analyse")
 
     # Aufheizzeit mit gewähltem Gerät unter Worst-Case Bedingungen
-    net_heiz_power = (wp_p * 0.9) - worst_losses  # Netto-Heizleistung nach Verlustabzug
     t_fill_default = 11.0
-    e_aufheiz = volumen * 1.162 * (t_soll - t_fill_default)
-    if net_heiz_power > 0 and wp_p > 0:
-        aufheiz_stunden = e_aufheiz / net_heiz_power
-    else:
-        aufheiz_stunden = None  # Gerät zu schwach
+    aufheiz = aufheizung(volumen, t_soll, t_fill_default, wp_p, worst_losses)
+    net_heiz_power = aufheiz["netto_kw"]       # Netto-Heizleistung nach Verlustabzug
+    e_aufheiz = aufheiz["energie_kwh"]
+    aufheiz_stunden = aufheiz["stunden"]       # None = Gerät zu schwach
 
     m1, m2, m3 = st.columns(3)
     with m1:
@@ -394,27 +382,13 @@ def main():
     # PHASE 3 – 24h SIMULATION
     # ============================================================
     st.header("Phase 3: 24h Thermische Simulation")
-    temps      = [t_soll]
-    power_grid = []
-    hours      = list(range(24))
-
-    for hr in hours:
-        is_tag = tag_von <= hr < tag_bis
-        # Nacht: über Mitternacht (z.B. 22→6)
-        if nacht_von > nacht_bis:
-            is_nacht = hr >= nacht_von or hr < nacht_bis
-        else:
-            is_nacht = nacht_von <= hr < nacht_bis
-        is_heiz = is_tag or (nacht_on and is_nacht)
-
-        t_now  = t_soll   if (6 <= hr < 18) else t_soll_n
-        at_now = adj_tag[idx_s] if (6 <= hr < 18) else adj_nacht[idx_s]
-        ls_sum = sum(calc_losses(at_now, t_now))
-        power_grid.append(ls_sum)
-
-        gain = (wp_p * 0.9 - ls_sum) if is_heiz else -ls_sum
-        new_t = temps[-1] + (gain / (volumen * 1.162))
-        temps.append(min(t_now, new_t))
+    temps, power_grid = simulation_24h(
+        flaeche, d_p, wind, decke, wp_p, t_soll, t_soll_n,
+        adj_tag[idx_s], adj_nacht[idx_s],
+        tag_von=tag_von, tag_bis=tag_bis,
+        nacht_on=nacht_on, nacht_von=nacht_von, nacht_bis=nacht_bis,
+    )
+    hours = list(range(24))
 
     fig_sim = go.Figure(go.Scatter(
         x=hours, y=temps[1:], name="Poolwasser (°C)",
@@ -8,7 +8,6 @@ import math
 import numpy as np
 import pandas as pd
 import io
-import base64
 import os
 from datetime import datetime
 
@@ -269,26 +268,30 @@ COLOR_GREEN = "#4CAF50"
 COLOR_RED   = "#f44336"
 COLOR_AMBER = "#FF9800"
 
-def get_font_b64():
-    for p in ["POE Vetica UI.ttf", "POE_Vetica_UI.ttf"]:
-        if os.path.exists(p):
-            with open(p, "rb") as f:
-                return base64.b64encode(f.read()).decode()
-    return None
-
-def get_logo_b64():
-    for p in ["Coolsulting_Logo_ohneHG_blau.png", "Coolsulting_Logo_ohneHG_blau_weiß.png"]:
+# --- PFADE (app-relativ; __app_paths__ wird vom Launcher injiziert) ---
+try:
+    PATHS = __app_paths__
+except NameError:
+    from coolsulting.paths import fuer_datei
+    PATHS = fuer_datei(__file__)
+from coolsulting import assets
+
+def _erste_datei(namen):
+    for p in namen:
+        p = PATHS.datei(p)
         if os.path.exists(p):
-            with open(p, "rb") as f:
-                return base64.b64encode(f.read()).decode()
+            return p
     return None
 
-font_b64 = get_font_b64()
-logo_b64 = get_logo_b64()
+# Fonts/Logos über den prozessweiten Asset-Cache (Static-URL oder data:-URL)
+FONT_PFAD = _erste_datei(["POE Vetica UI.ttf", "POE_Vetica_UI.ttf"])
+LOGO_PFAD = _erste_datei(["Coolsulting_Logo_ohneHG_blau.png", "Coolsulting_Logo_ohneHG_blau_weiß.png"])
+font_css = assets.font_face_css('POE Helvetica UI', FONT_PFAD) if FONT_PFAD else ""
+logo_url = assets.url(LOGO_PFAD) if LOGO_PFAD else None
 
 st.markdown(f"""
 <style>
-{f"@font-face{{font-family:'POE Helvetica UI';src:url(data:font/ttf;base64,{font_b64}) format('truetype');}}" if font_b64 else ""}
+{font_css}
 *{{font-family:'POE Helvetica UI','Helvetica Neue',Helvetica,sans-serif!important;}}
 .stApp{{background:{COLOR_BLUE};}}
 section[data-testid="stSidebar"]{{background:{COLOR_GRAY}!important;}}
@@ -324,7 +327,7 @@ section[data-testid="stSidebar"] input{{background:rgba(255,255,255,0.12)!import
 # ─────────────────────────────────────────────────────────────────────────────
 # HEADER
 # ─────────────────────────────────────────────────────────────────────────────
-logo_html = f'<img src="data:image/png;base64,{logo_b64}" style="height:48px;">' if logo_b64 else ""
+logo_html = f'<img src="{logo_url}" style="height:48px;">' if logo_url else ""
 st.markdown(f"""
 <div class="main-header">
   <div class="title-big"><span class="cool-part">°cool</span><span class="rohr-part">ROHR</span></div>
@@ -11,7 +11,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
 import os
-import base64
 
 # --- SICHERUNG FÜR DASHBOARD ---
 try:
@@ -19,22 +18,23 @@ try:
 except:
     pass
 
+# --- PFADE (app-relativ; __app_paths__ wird vom Launcher injiziert) ---
+try:
+    PATHS = __app_paths__
+except NameError:
+    from coolsulting.paths import fuer_datei
+    PATHS = fuer_datei(__file__)
+from coolsulting import assets
+
 # --- HTML LADEN UND ANZEIGEN ---
-# Robuste Pfadauflösung: funktioniert standalone und via exec() in centralSTATION_PRO
-_script_dir = os.path.dirname(os.path.abspath(__file__)) if "__file__" in globals() else os.getcwd()
-html_path = os.path.join(_script_dir, "coolRohr.html")
+html_path = PATHS.datei("coolRohr.html")
 
 if os.path.exists(html_path):
-    with open(html_path, "r", encoding="utf-8") as f:
-        html_content = f.read()
-    # Base64-encode logo and inject into HTML
-    logo_path = os.path.join(_script_dir, "Coolsulting_Logo_ohneHG_blau.png")
-    if os.path.exists(logo_path):
-        with open(logo_path, "rb") as img_f:
-            logo_b64 = base64.b64encode(img_f.read()).decode("utf-8")
-        html_content = html_content.replace("__LOGO__", logo_b64)
-    else:
-        html_content = html_content.replace("__LOGO__", "")
+    # HTML + Logo kommen aus dem prozessweiten Asset-Cache (einmal pro mtime)
+    html_content = assets.lese_text(html_path)
+    # Base64-Logo ins HTML (iframe/srcdoc → keine Static-URL möglich)
+    logo_b64 = assets.b64(PATHS.datei("Coolsulting_Logo_ohneHG_blau.png"))
+    html_content = html_content.replace("__LOGO__", logo_b64 or "")
     components.html(html_content, height=1600, scrolling=True)
 else:
     st.error(f"❌ Datei 'coolRohr.html' nicht gefunden. Bitte sicherstellen, dass die Datei im selben Verzeichnis liegt.")
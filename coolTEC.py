@@ -7,11 +7,9 @@
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
-from fpdf import FPDF
 from datetime import datetime
 import tempfile
 import os
-import base64
 
 # --- SICHERUNG FÜR DASHBOARD ---
 try:
@@ -26,19 +24,27 @@ COLOR_WHITE = "#FFFFFF"
 CHART_ORANGE = "#FF8C00"
 CHART_RED = "#FF0000"
 
+# --- PFADE (app-relativ; __app_paths__ wird vom Launcher injiziert) ---
+try:
+    PATHS = __app_paths__
+except NameError:
+    from coolsulting.paths import fuer_datei
+    PATHS = fuer_datei(__file__)
+from coolsulting import assets, history
+from coolsulting.engines.kuehlraum import raumlast, u_wert
+from coolsulting.trace import span
+
 # --- FONT LADEN ---
 def get_font_base64(font_path):
-    if os.path.exists(font_path):
-        with open(font_path, "rb") as f:
-            return base64.b64encode(f.read()).decode()
-    return None
+    # Prozessweit gecacht (coolsulting.assets) – kein Neueinlesen pro Rerun
+    return assets.b64(PATHS.datei(font_path))
 
-font_b64 = get_font_base64("POE_Vetica_UI.ttf")
+font_css = assets.font_face_css('POE Helvetica UI', PATHS.datei("POE_Vetica_UI.ttf"))
 
 # --- CSS STYLING ---
 st.markdown(f"""
     <style>
-    {f"@font-face {{ font-family: 'POE Helvetica UI'; src: url(data:font/ttf;base64,{font_b64}) format('truetype'); }}" if font_b64 else ""}
+    {font_css}
     
     * {{
         font-family: 'POE Helvetica UI', 'Helvetica', sans-serif !important;
@@ -59,40 +65,46 @@ st.markdown(f"""
 """, unsafe_allow_html=True)
 
 # --- PDF KLASSE ---
-class PDFReport(FPDF):
-    def __init__(self):
-        super().__init__()
+def get_pdf_class():
+    """PDF-Klasse bauen – fpdf wird erst beim Export importiert."""
+    from fpdf import FPDF
+
+    class PDFReport(FPDF):
+        def __init__(self):
+            super().__init__()
         
-        # Font laden
-        font_path = "POE_Vetica_UI.ttf"
-        if os.path.exists(font_path):
-            self.add_font('POE', '', font_path, uni=True)
-            self.add_font('POE', 'B', font_path, uni=True)
-            self.add_font('POE', 'I', font_path, uni=True)
-            self.font_loaded = True
-        else:
-            self.font_loaded = False
+            # Font laden
+            font_path = PATHS.datei("POE_Vetica_UI.ttf")
+            if os.path.exists(font_path):
+                self.add_font('POE', '', font_path, uni=True)
+                self.add_font('POE', 'B', font_path, uni=True)
+                self.add_font('POE', 'I', font_path, uni=True)
+                self.font_loaded = True
+            else:
+                self.font_loaded = False
     
-    def _set_font(self, style='', size=10):
-        if self.font_loaded:
-            self.set_font('POE', style, size)
-        else:
-            self.set_font('Arial', style, size)
+        def _set_font(self, style='', size=10):
+            if self.font_loaded:
+                self.set_font('POE', style, size)
+            else:
+                self.set_font('Arial', style, size)
     
-    def header(self):
-        logo_path = "Coolsulting_Logo_ohneHG_weiss_grau.png"
-        if os.path.exists(logo_path):
-            try:
-                self.image(logo_path, 155, 10, 45)
-            except:
-                pass
-        self._set_font('B', 16)
-        self.set_text_color(54, 169, 225)
-        grad = chr(176)
-        self.cell(0, 10, f'{grad}coolTEC Berechnungs-Protokoll', 0, 1, 'L')
-        self.set_draw_color(60, 60, 59)
-        self.line(10, 25, 200, 25)
-        self.ln(18)
+        def header(self):
+            logo_path = PATHS.datei("Coolsulting_Logo_ohneHG_weiss_grau.png")
+            if os.path.exists(logo_path):
+                try:
+                    self.image(logo_path, 155, 10, 45)
+                except:
+                    pass
+            self._set_font('B', 16)
+            self.set_text_color(54, 169, 225)
+            grad = chr(176)
+            self.cell(0, 10, f'{grad}coolTEC Berechnungs-Protokoll', 0, 1, 'L')
+            self.set_draw_color(60, 60, 59)
+            self.line(10, 25, 200, 25)
+            self.ln(18)
+
+    return PDFReport
 
 # --- HEADER ---
 st.markdown(f"""
@@ -121,7 +133,7 @@ with st.container():
         st.markdown(f"<p style='font-size:0.85em; color:gray; margin-top:-10px;'>Fläche: {l*b:.2f} m² | Volumen: {l*b*h:.2f} m³</p>", unsafe_allow_html=True)
         
         damm_mm = st.selectbox("Dämmstärke (mm)", [60, 80, 100, 120, 140, 160], index=2)
-        u_val = round(0.022 / (damm_mm / 1000), 3)
+        u_val = u_wert(damm_mm)
         st.caption(f"U-Wert: {u_val} W/m²K")
         
     with c2:
@@ -139,16 +151,11 @@ with st.container():
         dt_ware = st.number_input("Abkühlung Ware (K)", 0, 50, 15)
         m_ware = ware_kg_m2 * (l * b)
 
-# --- BERECHNUNG ---
-a_decke, a_wand, is_tk = l * b, 2 * (l + b) * h, t_raum < 0
-q_wand, q_decke = u_val * a_wand * (t_umg - t_raum), u_val * a_decke * (t_decke - t_raum)
-u_bod = u_val if is_tk else 1.5
-q_boden = u_bod * a_decke * (t_boden - t_raum)
-q_trans = max(0, q_wand + q_decke + q_boden)
-c_ware = 1.7 if is_tk else 3.2
-q_ware_24h = (m_ware * c_ware * dt_ware * 1000) / (24 * 3600)
-q_sum_24h = (q_trans + q_ware_24h) * 1.15
-q_bedarf = q_sum_24h * (24 / laufzeit)
+# --- BERECHNUNG (coolsulting.engines.kuehlraum) ---
+erg = raumlast(l, b, h, t_raum, damm_mm=damm_mm, t_umg=t_umg, t_decke=t_decke,
+               t_boden=t_boden, laufzeit=laufzeit, ware_kg_m2=ware_kg_m2, dt_ware=dt_ware)
+q_wand, q_decke, q_boden = erg["q_wand"], erg["q_decke"], erg["q_boden"]
+q_ware_24h, q_sum_24h, q_bedarf = erg["q_ware_24h"], erg["q_sum_24h"], erg["q_bedarf"]
 
 # --- ERGEBNISSE ---
 st.divider()
@@ -158,14 +165,8 @@ res2.metric("LAUFZEIT", f"{laufzeit} h/d", f"Raum: {raum_bez}")
 res3.metric("ENERGIE / TAG", f"{(q_sum_24h*24)/1000:.1f} kWh", f"Ware: {m_ware:.0f} kg")
 
 if st.button("💾 Im Verlauf speichern"):
-    if "verlauf_heute" not in st.session_state:
-        st.session_state.verlauf_heute = []
-    st.session_state.verlauf_heute.append({
-        "uhrzeit": datetime.now().strftime("%H:%M Uhr"),
-        "modul": "coolTEC",
-        "bezeichnung": f"{kunde} | {raum_bez}",
-        "ergebnis": f"Kältebedarf: {q_bedarf/1000:.2f} kW"
-    })
+    history.eintragen("coolTEC", f"{kunde} | {raum_bez}",
+                      {"Kältebedarf": (q_bedarf/1000, "kW")}, projekt=kunde)
     st.success("✅ Im Verlauf gespeichert.")
 
 # --- DIAGRAMM ---
@@ -190,7 +191,7 @@ if st.button("📄 PDF-Bericht generieren"):
         fig.savefig(tmpfile.name, format='png', bbox_inches='tight', transparent=True)
         chart_path = tmpfile.name
 
-    pdf = PDFReport()
+    pdf = get_pdf_class()()
     pdf.add_page()
     pdf._set_font('B', 12)
     pdf.cell(0, 10, 'Projektdaten:', 0, 1)
@@ -212,7 +213,8 @@ if st.button("📄 PDF-Bericht generieren"):
     pdf.image(chart_path, x=60, y=105, w=90)
     
     pdf_path = tempfile.mktemp(".pdf")
-    pdf.output(pdf_path)
+    with span("coolTEC.pdf_output"):
+        pdf.output(pdf_path)
     with open(pdf_path, "rb") as f:
         st.download_button(label="💾 PDF herunterladen", data=f, file_name=f"Coolsulting_{raum_bez}.pdf", mime="application/pdf")
     os.remove(chart_path)
@@ -26,6 +26,12 @@ try:
 except ImportError:
     EXCEL_OK = False
 
+try:
+    from coolsulting.trace import traced
+except ImportError:      # coolWIRE eigenständig gestartet – ohne Tracing
+    def traced(name=None):
+        return lambda funktion: funktion
+
 def get_api_key():
     # Mehrere Pfade versuchen (direkt, CentralStation exec(), Umgebungsvariable)
     try:
@@ -152,6 +158,7 @@ direkt=unser Gewerk, extern=Fremdgewerk. Unsicherheiten in hinweise eintragen.""
 
 # --- PDF ---
 
+@traced("http.anthropic.analysiere_pdf")
 def analysiere_pdf(pdf_bytes):
     if not api_verfuegbar():
         return {"fehler": "Claude API nicht verfuegbar"}
@@ -212,6 +219,7 @@ def extrahiere_dwg_text(dwg_bytes):
         return f"Fehler: {str(e)[:200]}"
 
 
+@traced("http.anthropic.analysiere_dwg")
 def analysiere_dwg(dwg_bytes, dateiname):
     if not api_verfuegbar():
         return {"fehler": "Claude API nicht verfuegbar"}
@@ -262,6 +270,7 @@ def extrahiere_excel_text(excel_bytes):
     except Exception as e:
         return f"Fehler: {str(e)}"
 
+@traced("http.anthropic.analysiere_excel")
 def analysiere_excel(excel_bytes, dateiname):
     if not api_verfuegbar():
         return {"fehler": "Claude API nicht verfuegbar"}
@@ -281,6 +290,7 @@ def analysiere_excel(excel_bytes, dateiname):
 
 # --- BILD (Screenshot / Foto) ---
 
+@traced("http.anthropic.analysiere_bild")
 def analysiere_bild(bild_bytes, dateiname):
     if not api_verfuegbar():
         return {"fehler": "Claude API nicht verfuegbar"}
@@ -307,6 +317,7 @@ def analysiere_bild(bild_bytes, dateiname):
 
 # --- FREITEXT ---
 
+@traced("http.anthropic.analysiere_freitext")
 def analysiere_freitext(text):
     if not api_verfuegbar():
         return {"fehler": "Claude API nicht verfuegbar"}
@@ -495,6 +506,7 @@ Abtau: Elektro-Abtau / Heißgas-Abtau / Umluft-Abtau / Keine
 Wenn ein Wert nicht erkennbar: null setzen, nicht raten."""
 
 
+@traced("http.anthropic.analysiere_datenblatt_pdf")
 def analysiere_datenblatt_pdf(pdf_bytes: bytes) -> dict:
     """Analysiert ein Gerätedatenblatt als PDF."""
     if not api_verfuegbar():
@@ -514,6 +526,7 @@ def analysiere_datenblatt_pdf(pdf_bytes: bytes) -> dict:
         return {"fehler": str(e)}
 
 
+@traced("http.anthropic.analysiere_datenblatt_bild")
 def analysiere_datenblatt_bild(img_bytes: bytes, dateiname: str = "") -> dict:
     """Analysiert ein Gerätedatenblatt als Bild/Screenshot."""
     if not api_verfuegbar():
@@ -535,6 +548,7 @@ def analysiere_datenblatt_bild(img_bytes: bytes, dateiname: str = "") -> dict:
         return {"fehler": str(e)}
 
 
+@traced("http.anthropic.analysiere_datenblatt_excel")
 def analysiere_datenblatt_excel(excel_bytes: bytes) -> dict:
     """Analysiert eine Excel-Stückliste/Geräteliste."""
     if not api_verfuegbar():
@@ -0,0 +1,10 @@
+# ============================================================================
+# DATEI: coolsulting/__init__.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Gemeinsame Infrastruktur für °central_STATION_PRO
+#               (Modul-Registry, später Pfade, Assets, Verlauf, Engines)
+# ============================================================================
+
+__version__ = "1.0.0"
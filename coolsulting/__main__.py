@@ -0,0 +1,34 @@
+# ============================================================================
+# DATEI: coolsulting/__main__.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Kommandozeile für °central_STATION_PRO-Werkzeuge.
+#
+#   python -m coolsulting batch   ...   Batch-Berechnung (CSV/XLSX)
+#   python -m coolsulting api     ...   HTTP/JSON-Schnittstelle der Engines
+#   python -m coolsulting preload ...   Warmstart / Startprofil
+#   python -m coolsulting bench   ...   Benchmarks + Baseline-Vergleich
+# ============================================================================
+
+import sys
+
+BEFEHLE = {
+    "batch":   "coolsulting.batch",
+    "api":     "coolsulting.engines.service",
+    "preload": "coolsulting.preload",
+    "bench":   "coolsulting.bench",
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in BEFEHLE:
+        print("Verwendung: python -m coolsulting {" + ",".join(BEFEHLE) + "} [Optionen]")
+        return 2
+    import importlib
+    return importlib.import_module(BEFEHLE[argv[0]]).main(argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+# ============================================================================
+# DATEI: coolsulting/assets.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Prozessweiter Asset-Cache für Fonts, Logos und HTML-Vorlagen.
+#               Jede Datei wird einmal gelesen und base64-kodiert (Cache-Key:
+#               Pfad + mtime). Ist Streamlits Static Serving aktiv, werden
+#               Fonts/Logos als URL ausgeliefert statt inline im <style>.
+# ============================================================================
+
+import base64
+import functools
+import hashlib
+import mimetypes
+import os
+import shutil
+import tempfile
+from urllib.parse import quote
+
+from coolsulting.paths import ROOT_DIR
+
+# Streamlit liefert ./static (neben dem Haupt-Script) unter app/static/ aus,
+# wenn in .streamlit/config.toml  [server] enableStaticServing = true  steht.
+STATIC_DIR = os.path.join(ROOT_DIR, "static")
+STATIC_URL = "app/static/"
+
+_MIME_FALLBACK = {".ttf": "font/ttf", ".otf": "font/otf", ".woff2": "font/woff2"}
+
+
+def _stempel(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+# ============================================================
+# 1. ROHDATEN (gecacht pro Pfad + mtime)
+# ============================================================
+@functools.lru_cache(maxsize=64)
+def _lese(path, stempel):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=64)
+def _b64(path, stempel):
+    return base64.b64encode(_lese(path, stempel)).decode()
+
+
+def lese_bytes(path):
+    """Dateiinhalt (bytes) oder None, wenn die Datei fehlt."""
+    stempel = _stempel(path)
+    return None if stempel is None else _lese(path, stempel)
+
+
+def lese_text(path, encoding="utf-8"):
+    """Dateiinhalt als Text oder None."""
+    daten = lese_bytes(path)
+    return None if daten is None else daten.decode(encoding)
+
+
+def b64(path):
+    """Base64-kodierter Dateiinhalt oder None (Ersatz für get_font_base64 & Co.)."""
+    stempel = _stempel(path)
+    return None if stempel is None else _b64(path, stempel)
+
+
+def mime_typ(path):
+    ext = os.path.splitext(path)[1].lower()
+    return _MIME_FALLBACK.get(ext) or mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+
+def data_url(path):
+    """``data:``-URL der Datei oder None."""
+    kodiert = b64(path)
+    return None if kodiert is None else f"data:{mime_typ(path)};base64,{kodiert}"
+
+
+# ============================================================
+# 2. STATIC SERVING
+# ============================================================
+def static_serving_aktiv():
+    try:
+        import streamlit as st
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
+def _static_name(path):
+    """Pfad der Kopie unter ./static (mit "/"): relativ zum App-Root, damit
+    gleichnamige Assets verschiedener Unter-Apps (z.B. logo.png) sich nicht
+    überschreiben; Dateien außerhalb des Roots unter einem Hash ihres Ordners."""
+    path = os.path.abspath(path)
+    for basis in (STATIC_DIR, ROOT_DIR):
+        rel = os.path.relpath(path, basis)
+        if rel.split(os.sep)[0] != os.pardir and not os.path.isabs(rel):
+            return rel.replace(os.sep, "/")
+    ordner = hashlib.sha1(os.path.dirname(path).encode("utf-8")).hexdigest()[:12]
+    return f"_extern/{ordner}/{os.path.basename(path)}"
+
+
+@functools.lru_cache(maxsize=64)
+def _static_kopie(path, stempel):
+    """Legt die Datei (einmal pro mtime) in ./static ab und liefert die URL.
+
+    Die Kopie erhält mtime der Quelle; neu kopiert wird, wenn (mtime_ns, Größe)
+    abweichen – atomar über eine Temp-Datei. ``?v=<mtime_ns>`` in der URL
+    sorgt dafür, dass Browser eine ersetzte Datei neu laden.
+    """
+    rel = _static_name(path)
+    ziel = os.path.join(STATIC_DIR, *rel.split("/"))
+    name = os.path.basename(ziel)
+    if os.path.abspath(path) != os.path.abspath(ziel):
+        os.makedirs(os.path.dirname(ziel), exist_ok=True)
+        quelle = os.stat(path)
+        try:
+            vorhanden = os.stat(ziel)
+            aktuell = (vorhanden.st_mtime_ns, vorhanden.st_size) == (quelle.st_mtime_ns, quelle.st_size)
+        except OSError:
+            aktuell = False
+        if not aktuell:
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(ziel), prefix=f".{name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f, open(path, "rb") as q:
+                    shutil.copyfileobj(q, f)
+                os.utime(tmp, ns=(quelle.st_atime_ns, quelle.st_mtime_ns))
+                os.replace(tmp, ziel)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+    return f"{STATIC_URL}{quote(rel)}?v={stempel}"
+
+
+def url(path):
+    """URL für Browser-Assets: Static-URL wenn möglich, sonst ``data:``-URL.
+
+    Die Static-URL hält den CSS-Block klein – der Browser lädt den Font
+    einmal und cached ihn, statt ihn bei jedem Rerun inline zu bekommen.
+    """
+    stempel = _stempel(path)
+    if stempel is None:
+        return None
+    if static_serving_aktiv():
+        try:
+            return _static_kopie(path, stempel)
+        except OSError:
+            pass
+    return data_url(path)
+
+
+# ============================================================
+# 3. CSS-BAUSTEINE
+# ============================================================
+def font_face_css(family, path, fmt="truetype"):
+    """Fertige ``@font-face``-Regel oder "" wenn der Font fehlt."""
+    quelle = url(path)
+    if quelle is None:
+        return ""
+    return (f"@font-face {{ font-family: '{family}'; "
+            f"src: url({quelle}) format('{fmt}'); }}")
+
+
+def cache_info():
+    """Trefferstatistik der Caches (Diagnose)."""
+    return {"bytes": _lese.cache_info(), "b64": _b64.cache_info(),
+            "static": _static_kopie.cache_info()}
@@ -0,0 +1,247 @@
+# ============================================================================
+# DATEI: coolsulting/batch.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Batch-Rechner für Ausschreibungen mit vielen Räumen/Kühl-
+#               stellen. Liest eine CSV/XLSX (eine Zeile = ein Raum, Kreis
+#               oder Schallquelle), rechnet alle Zeilen über die Engines in
+#               einem Prozess-Pool und schreibt eine Ergebnistabelle
+#               (optional je Zeile ein PDF).
+#
+#   python -m coolsulting batch cooltec raeume.xlsx -o ergebnis.xlsx
+#   python -m coolsulting batch coolmath zonen.csv --pdf berichte/
+#
+#   Spaltennamen = Parameter der Engine (siehe --spalten), Zusatzspalten
+#   (z.B. "name") werden unverändert ins Ergebnis übernommen.
+# ============================================================================
+
+import argparse
+import csv
+import inspect
+import os
+import re
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from coolsulting.engines import ENGINES, get_engine
+
+# Batch-Modul -> Engine + Standardwerte für Pflichtparameter
+MODULE = {
+    "coolmath": {"engine": "kuehllast", "titel": "coolMATH PRO – Kühllast je Zone",
+                 "standard": {}},
+    "cooltec":  {"engine": "kuehlraum", "titel": "°coolTEC – Kühlraumlast",
+                 "standard": {}},
+    "rohrnetz": {"engine": "rohrnetz", "titel": "°coolWIRE – Rohrdimensionierung je Kreis",
+                 "standard": {}},
+    "neighbor": {"engine": "schall", "titel": "°coolNEIGHBOR – Schallimmission je Quelle",
+                 "standard": {"anzahl": 1, "luft": 0.0, "qs": 0.0, "d_geh": 0.0,
+                              "d_koerper": 0.0, "k_t": 0.0, "k_i": 0.0,
+                              "topologie": "Direkt", "b1_mat": "", "b2_mat": "",
+                              "b1_lenkt": False, "b2_lenkt": False, "q": 2,
+                              "w_dist": 2.0, "temp": 10.0, "hum": 70.0,
+                              "raumzuschlag": 0.0}},
+}
+
+_JA = {"ja", "j", "true", "wahr", "x", "yes"}
+_NEIN = {"nein", "n", "false", "falsch", "no"}
+_ZAHL = re.compile(r"^[+-]?\d+([.,]\d+)?$")
+
+
+# ============================================================
+# 1. EINLESEN / AUSGEBEN
+# ============================================================
+def _wert(text):
+    """Zellinhalt -> bool/int/float/str (deutsches Dezimalkomma erlaubt)."""
+    if not isinstance(text, str):
+        return text
+    t = text.strip()
+    if t.lower() in _JA:
+        return True
+    if t.lower() in _NEIN:
+        return False
+    if _ZAHL.match(t):
+        t = t.replace(",", ".")
+        return float(t) if "." in t else int(t)
+    return t
+
+
+def lese_tabelle(pfad):
+    """Liste von dicts aus CSV (Trennzeichen ; oder ,) oder XLSX."""
+    if pfad.lower().endswith((".xlsx", ".xls")):
+        import pandas as pd
+        df = pd.read_excel(pfad)
+        return [{k: v for k, v in zeile.items() if not (isinstance(v, float) and v != v)}
+                for zeile in df.to_dict(orient="records")]
+    with open(pfad, newline="", encoding="utf-8-sig") as f:
+        probe = f.read(4096)
+        f.seek(0)
+        trenner = ";" if probe.count(";") > probe.count(",") else ","
+        return [{k.strip(): v for k, v in zeile.items() if k and v not in (None, "")}
+                for zeile in csv.DictReader(f, delimiter=trenner)]
+
+
+def schreibe_tabelle(pfad, zeilen):
+    spalten = []
+    for z in zeilen:
+        spalten += [k for k in z if k not in spalten]
+    if pfad.lower().endswith(".xlsx"):
+        import pandas as pd
+        pd.DataFrame(zeilen, columns=spalten).to_excel(pfad, index=False)
+        return
+    with open(pfad, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.DictWriter(f, fieldnames=spalten, delimiter=";")
+        writer.writeheader()
+        writer.writerows(zeilen)
+
+
+def _flach(obj, prefix=""):
+    """Verschachtelte Engine-Ergebnisse -> flache Spalten ("SL.v", ...)."""
+    if isinstance(obj, dict):
+        aus = {}
+        for k, v in obj.items():
+            aus.update(_flach(v, f"{prefix}{k}."))
+        return aus
+    if isinstance(obj, (list, tuple)):
+        if all(isinstance(v, (int, float, str, bool)) for v in obj):
+            if isinstance(obj, tuple) and not prefix:
+                return {f"ergebnis_{i + 1}": v for i, v in enumerate(obj)}
+            return {prefix.rstrip("."): "; ".join(str(v) for v in obj)}
+        return {prefix.rstrip("."): f"{len(obj)} Einträge"}
+    if hasattr(obj, "item"):
+        obj = obj.item()       # numpy-Skalar
+    return {prefix.rstrip(".") or "ergebnis": obj}
+
+
+# ============================================================
+# 2. RECHNEN (läuft im Worker-Prozess)
+# ============================================================
+def _parameter(modul, zeile):
+    spec = MODULE[modul]
+    funktion = get_engine(spec["engine"])
+    namen = inspect.signature(funktion).parameters
+    parameter = dict(spec["standard"])
+    parameter.update({k: _wert(v) for k, v in zeile.items() if k in namen})
+    return funktion, parameter
+
+
+def _pdf_schreiben(pfad, titel, zeile, ergebnis):
+    """Einfaches Ergebnisblatt (fpdf2) je Zeile."""
+    from fpdf import FPDF
+    from coolsulting.paths import ROOT_DIR
+    pdf = FPDF()
+    pdf.add_page()
+    font = os.path.join(ROOT_DIR, "POE Vetica UI.ttf")
+    familie = "Helvetica"
+    if os.path.exists(font):
+        pdf.add_font("POE", "", font, uni=True)
+        familie = "POE"
+    pdf.set_font(familie, "", 16)
+    pdf.set_text_color(54, 169, 225)
+    pdf.cell(0, 10, titel, 0, 1)
+    pdf.set_text_color(60, 60, 59)
+    for kopf, daten in (("Eingaben", zeile), ("Ergebnisse", ergebnis)):
+        pdf.set_font(familie, "", 12)
+        pdf.ln(4)
+        pdf.cell(0, 8, kopf, 0, 1)
+        pdf.set_font(familie, "", 9)
+        for k, v in daten.items():
+            text = f"{v:.2f}" if isinstance(v, float) else str(v)
+            pdf.cell(80, 5, str(k)[:45], 0, 0)
+            pdf.cell(0, 5, text[:70], 0, 1)
+    pdf.output(pfad)
+
+
+def rechne_zeile(modul, nr, zeile, pdf_ordner=None):
+    """Eine Eingabezeile rechnen -> Ergebniszeile (Fehler als Spalte)."""
+    t0 = time.perf_counter()
+    aus = dict(zeile)
+    try:
+        funktion, parameter = _parameter(modul, zeile)
+        ergebnis = _flach(funktion(**parameter))
+        aus.update(ergebnis)
+        if pdf_ordner:
+            name = re.sub(r"[^\w.-]+", "_", str(zeile.get("name", f"zeile_{nr}")))
+            _pdf_schreiben(os.path.join(pdf_ordner, f"{nr:04d}_{name}.pdf"),
+                           MODULE[modul]["titel"], zeile, ergebnis)
+        aus["Fehler"] = ""
+    except Exception as e:
+        aus["Fehler"] = f"{type(e).__name__}: {e}"
+    aus["Zeit [ms]"] = round((time.perf_counter() - t0) * 1000, 2)
+    return aus
+
+
+def _rechne_block(modul, block, pdf_ordner):
+    return [rechne_zeile(modul, nr, zeile, pdf_ordner) for nr, zeile in block]
+
+
+def batch(modul, zeilen, workers=None, pdf_ordner=None, blockgroesse=25):
+    """Alle Zeilen rechnen; ``workers=1`` rechnet ohne Prozess-Pool."""
+    if pdf_ordner:
+        os.makedirs(pdf_ordner, exist_ok=True)
+    nummeriert = list(enumerate(zeilen, start=1))
+    if workers == 1 or len(nummeriert) <= blockgroesse:
+        return _rechne_block(modul, nummeriert, pdf_ordner)
+    bloecke = [nummeriert[i:i + blockgroesse] for i in range(0, len(nummeriert), blockgroesse)]
+    ergebnisse = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for teil in pool.map(_rechne_block, [modul] * len(bloecke), bloecke,
+                             [pdf_ordner] * len(bloecke)):
+            ergebnisse += teil
+    return ergebnisse
+
+
+def zusammenfassung(ergebnisse, dauer_s):
+    zeiten = sorted(z["Zeit [ms]"] for z in ergebnisse)
+    fehler = [z for z in ergebnisse if z["Fehler"]]
+    zeilen = [
+        f"Zeilen:         {len(ergebnisse)}  (Fehler: {len(fehler)})",
+        f"Gesamtdauer:    {dauer_s:.2f} s",
+        f"Durchsatz:      {len(ergebnisse) / dauer_s:.1f} Zeilen/s" if dauer_s > 0 else "",
+    ]
+    if zeiten:
+        p95 = zeiten[min(len(zeiten) - 1, int(len(zeiten) * 0.95))]
+        zeilen.append(f"Zeit je Zeile:  median {statistics.median(zeiten):.2f} ms | "
+                      f"p95 {p95:.2f} ms | max {zeiten[-1]:.2f} ms")
+    for z in fehler[:5]:
+        zeilen.append(f"  Fehler: {z.get('name', '')} {z['Fehler']}")
+    return "\n".join(z for z in zeilen if z)
+
+
+# ============================================================
+# 3. KOMMANDOZEILE
+# ============================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m coolsulting batch",
+                                     description="Batch-Berechnung für Ausschreibungen.")
+    parser.add_argument("modul", choices=sorted(MODULE))
+    parser.add_argument("eingabe", nargs="?", help="CSV oder XLSX mit einer Zeile je Raum/Kreis/Quelle")
+    parser.add_argument("-o", "--ausgabe", help="Ergebnisdatei (.csv oder .xlsx)")
+    parser.add_argument("--pdf", metavar="ORDNER", help="Je Zeile ein PDF in ORDNER schreiben")
+    parser.add_argument("--workers", type=int, default=None, help="Prozesse (Standard: CPU-Anzahl, 1 = seriell)")
+    parser.add_argument("--spalten", action="store_true", help="Erwartete Spalten des Moduls anzeigen")
+    args = parser.parse_args(argv)
+
+    if args.spalten or not args.eingabe:
+        funktion = get_engine(MODULE[args.modul]["engine"])
+        print(f"{MODULE[args.modul]['titel']}  (Engine: {ENGINES[MODULE[args.modul]['engine']]})")
+        for p in inspect.signature(funktion).parameters.values():
+            standard = MODULE[args.modul]["standard"].get(p.name, p.default)
+            print(f"  {p.name:<16} {'Pflicht' if standard is inspect.Parameter.empty else f'= {standard!r}'}")
+        return 0
+
+    zeilen = lese_tabelle(args.eingabe)
+    t0 = time.perf_counter()
+    ergebnisse = batch(args.modul, zeilen, workers=args.workers, pdf_ordner=args.pdf)
+    dauer = time.perf_counter() - t0
+    ausgabe = args.ausgabe or os.path.splitext(args.eingabe)[0] + "_ergebnis.csv"
+    schreibe_tabelle(ausgabe, ergebnisse)
+    print(zusammenfassung(ergebnisse, dauer))
+    print(f"Ergebnis:       {ausgabe}")
+    return 1 if any(z["Fehler"] for z in ergebnisse) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,903 @@
+# ============================================================================
+# DATEI: coolsulting/bench.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Benchmark-Suite für alle Rechenkerne und Berichtsgeneratoren
+#               (Kühllast, Samsung-Auswahl, Rohrnetz, Schall, Kabelliste,
+#               Kunden-PDF, Word-Bericht, coolNEIGHBOR-PDF) – jeweils mit
+#               realistischer und großer Eingabe. Ergebnisse lassen sich als
+#               Baseline (JSON) speichern; spätere Läufe vergleichen dagegen
+#               und melden Regressionen mit Exit-Code 1. Zusätzlich prüfen
+#               Kontrollen, dass Optimierungen die Ergebnisse nicht verändern.
+#
+#   python -m coolsulting bench                      # messen + vergleichen
+#                                                    # (ohne Baseline: Fehler, Exit-Code 2)
+#   python -m coolsulting bench --speichern          # neue Baseline
+#   python -m coolsulting bench --nur-messen         # messen ohne Vergleich
+#   python -m coolsulting bench -k kuehllast --toleranz 0.5
+#   python -m coolsulting bench --pruefen            # nur Ergebnis-Kontrollen
+# ============================================================================
+
+import argparse
+import importlib
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+
+from coolsulting import paths, registry
+from coolsulting.paths import ROOT_DIR
+
+BASELINE_PATH = os.environ.get("CS_BENCH_BASELINE",
+                               os.path.join(ROOT_DIR, "bench_baseline.json"))
+
+# Größenstufen: realistisch = typisches Projekt, gross = Ausschreibung/Batch
+GROESSEN = {"realistisch": 5, "gross": 200}
+
+BENCHMARKS = []
+KONTROLLEN = []
+
+
+def benchmark(name, groessen=("realistisch", "gross")):
+    """Registriert eine Aufbau-Funktion ``f(n) -> callable`` je Größenstufe."""
+    def deko(aufbau):
+        for g in groessen:
+            BENCHMARKS.append((f"{name}[{g}]", g, aufbau))
+        return aufbau
+    return deko
+
+
+def kontrolle(name):
+    """Registriert eine Ergebnis-Kontrolle ``f() -> (ok, detail)``."""
+    def deko(funktion):
+        KONTROLLEN.append((name, funktion))
+        return funktion
+    return deko
+
+
+# ============================================================
+# 1. EINGABEDATEN
+# ============================================================
+ORIENTIERUNGEN = ["SUED", "WEST", "OST", "NORD", "SUED-WEST", "SUED-OST"]
+
+
+def _zonen(n):
+    """n unterschiedliche Zonen (Argumente wie calc_vdi_neu & Co.)."""
+    return [(12.0 + 3.5 * (i % 20), ORIENTIERUNGEN[i % 6], "Bestand", "Doppel",
+             "Vorhang (Innen)", i % 4, 150.0 * (i % 3), 2.4 + 0.6 * (i % 5),
+             "Mittel (Ziegel/Holz-Beton)") for i in range(n)]
+
+
+def _schallquellen(n):
+    return [dict(lw=58.0 + (i % 8), anzahl=1 + i % 3, luft=2200.0, qs=0.35,
+                 d_geh=0.0, d_koerper=0.0, k_t=0.0, k_i=0.0,
+                 d_total=6.0 + (i % 15), topologie=["Direkter Sichtkontakt",
+                 "L-foermig (1 Kante)", "U-foermig (2 Kanten)"][i % 3],
+                 b1_mat="Massiv & Luftdicht", b2_mat="Massiv & Luftdicht",
+                 b1_lenkt=True, b2_lenkt=True, q=2, w_dist=1.0, temp=10.0,
+                 hum=70.0, raumzuschlag=0.0, d_direkt=5.0 + (i % 12))
+            for i in range(n)]
+
+
+def _kuehlstellen(n):
+    bereiche = ["NK", "TK", "HNK"]
+    return [{"name": f"Kühlstelle {i + 1}", "pos_nr": str(i + 1), "kreis": 1 + i // 6,
+             "temp_bereich": bereiche[(i // 6) % 3], "kaelteleistung_kw": 2.0 + (i % 7),
+             "lieferumfang": "direkt" if i % 4 else "extern",
+             "maschinenstandort": "Maschinenraum EG", "leitungslaenge_m": 15 + i % 30,
+             "laenge_aussenteil_m": 15, "laenge_router_m": 20,
+             "laenge_schaltschrank_m": 10, "verdampfung_custom_c": None,
+             "komponenten": {}} for i in range(n)]
+
+
+MASCHINENSTANDORTE = [{"id": "ms1", "anlage_typ": "Verbundanlage",
+                       "standort_maschine": "Maschinenraum EG"}]
+
+
+def _coolwire(modul):
+    paths.sys_path_einmal(os.path.join(ROOT_DIR, "coolWIRE"))
+    return importlib.import_module(f"modules.{modul}")
+
+
+def _app_modul(datei):
+    """Lädt eine Modul-App einmal (wie die Registry) für Berichts-Benchmarks."""
+    app = registry.get_app(os.path.join(ROOT_DIR, datei))
+    paths.sys_path_einmal(app.app_dir)
+    return app._lade_modul()
+
+
+def _coolmath_eingaben():
+    """5 Zonen wie in coolMATH PRO -> Argumente der Berichtsgeneratoren."""
+    import numpy as np
+    from coolsulting.engines.kuehllast import zone_profile, METHODEN
+    from coolsulting.engines.samsung import find_samsung_device
+    g_sums = {k: np.zeros(24) for k in METHODEN}
+    profile, ergebnisse, eingaben, empfehlungen, hw, hw_ag, ig = [], [], [], [], [], [], []
+    for i, z in enumerate(_zonen(5)):
+        name = f"Raum {i + 1}"
+        p = zone_profile(*z)
+        for k in METHODEN:
+            g_sums[k] += p[k]
+        profile.append({"name": name, "reck": p["RECK"], "vdi_a": p["VDI_A"], "vdi_n": p["VDI_N"],
+                        "prak": p["PRAK"], "klts": p["KLTS"], "ki": p["KI"]})
+        spitze = int(np.max(p["VDI_N"]))
+        primary, alt = find_samsung_device(spitze)
+        empfehlungen.append({"zone": name, "primary": primary, "alt": alt, "peak_w": spitze})
+        ergebnisse.append({"ZONE": name, "VDI NEU": spitze, "VDI ALT": int(np.max(p["VDI_A"])),
+                           "RECKNAGEL": int(np.max(p["RECK"])), "PRAKTIKER": int(np.max(p["PRAK"])),
+                           "KALTLUFTSEE": int(np.max(p["KLTS"])), "KI HYBRID": int(np.max(p["KI"]))})
+        eingaben.append({"name": name, "flaeche": z[0], "hoehe": 2.5, "personen": z[5],
+                         "fenster": z[7], "orientierung": z[1], "nutzung": z[3], "u_wert": 0.8})
+        hw.append(primary["cool_kw"])
+        hw_ag.append(("RAC", 0, "N.V."))
+        ig.append(primary["art_nr"])
+    return dict(proj="Benchmark", kunde="Muster GmbH", bearbeiter="Bench", firma="coolsulting",
+                room_results=ergebnisse, g_sums=g_sums, individual_profiles=profile,
+                samsung_recs=empfehlungen, selected_hw=hw, total_kw=sum(hw),
+                selected_hw_ag=hw_ag, room_inputs=eingaben, selected_ig_artnr=ig)
+
+
+# ============================================================
+# 2. BENCHMARKS
+# ============================================================
+# Einzelzonen-Hüllen je Zone aufgerufen (so nutzen Altbestand und API sie).
+# Stand 200 Zonen, gleicher Rechner: vor dem Tensor-Kern (user-011) 15 ms
+# (VDI 6007) / 9.6 ms (KI-Hybrid); mit Tensor-Kern über zonen_parameter()
+# 43 / 40 ms; mit einzelzone_parameter() 9.9 / 9.8 ms. Je Aufruf bleiben
+# ~50 µs NumPy-Aufrufkosten der allgemeinen Kerne – viele Zonen gehören in
+# berechne_zonen() (ein Aufruf: 2.3 ms für alle 6 Methoden, siehe unten).
+@benchmark("kuehllast.calc_vdi_neu")
+def _b_vdi_neu(n):
+    from coolsulting.engines.kuehllast import calc_vdi_neu
+    zonen = _zonen(n)
+    return lambda: [calc_vdi_neu(*z) for z in zonen]
+
+
+@benchmark("kuehllast.calc_ki_hybrid")
+def _b_ki_hybrid(n):
+    from coolsulting.engines.kuehllast import calc_ki_hybrid
+    zonen = _zonen(n)
+    return lambda: [calc_ki_hybrid(*z) for z in zonen]
+
+
+@benchmark("kuehllast.berechne_zonen")
+def _b_zonen(n):
+    from coolsulting.engines.kuehllast import berechne_zonen
+    zonen = _zonen(n)
+    return lambda: berechne_zonen(zonen)
+
+
+@benchmark("kuehllast.berechne_zonen_nur_vdi6007")
+def _b_zonen_basis(n):
+    # Projekt mit abgewählten Methoden: nur die Auslegungsbasis
+    from coolsulting.engines.kuehllast import aktive_methoden, berechne_zonen
+    zonen, methoden = _zonen(n), aktive_methoden([])
+    return lambda: berechne_zonen(zonen, methoden)
+
+
+@benchmark("kuehllast.berechne_zonen_eckraeume")
+def _b_zonen_fassaden(n):
+    # je Zone zwei weitere Fassaden (3 Fensterflächen)
+    from coolsulting.engines.kuehllast import berechne_zonen
+    zonen = [z + (2.5, 51.0, 7, ((ORIENTIERUNGEN[(i + 1) % 6], 3.0, "Doppel", "Keine"),
+                                 (ORIENTIERUNGEN[(i + 2) % 6], 1.5, "Dreifach", "Rollladen")))
+             for i, z in enumerate(_zonen(n))]
+    return lambda: berechne_zonen(zonen)
+
+
+@benchmark("kuehllast.zonen_speicher")
+def _b_speicher(n):
+    # Rerun mit einer geänderten Zone (neuer Wert je Aufruf, kein Cache-Treffer)
+    from itertools import count
+    from coolsulting.engines.kuehllast import ZonenSpeicher
+    speicher = ZonenSpeicher()
+    zonen = list(enumerate(_zonen(n)))
+    speicher.aktualisieren(zonen)
+    zaehler = count(1)
+
+    def lauf():
+        zonen[0] = (0, (12.0 + next(zaehler) * 1e-3,) + zonen[0][1][1:])
+        speicher.aktualisieren(zonen)
+    return lauf
+
+
+@benchmark("kuehllast.berechne_jahr")
+def _b_jahr(n):
+    from coolsulting.engines.kuehllast import berechne_jahr
+    from coolsulting.engines.wetter import referenzjahr_synthetisch
+    zonen, wetter = _zonen(n), referenzjahr_synthetisch()
+    return lambda: berechne_jahr(zonen, wetter)
+
+
+@benchmark("unsicherheit.monte_carlo")
+def _b_monte_carlo(n):
+    from coolsulting.engines.unsicherheit import monte_carlo
+    zonen = _zonen(n)
+    return lambda: monte_carlo(zonen, stichproben=500)
+
+
+@benchmark("studie.parameter_studie")
+def _b_studie(n):
+    from coolsulting.engines.studie import parameter_studie
+    zonen = _zonen(n)
+    return lambda: parameter_studie(zonen, "shade", "glass")
+
+
+@benchmark("samsung.find_samsung_device")
+def _b_samsung(n):
+    from coolsulting.engines.samsung import find_samsung_device
+    spitzen = [800 + 97 * i % 9000 for i in range(n * 10)]
+    return lambda: [find_samsung_device(w) for w in spitzen]
+
+
+@benchmark("samsung.katalog_auswahl")
+def _b_katalog(n):
+    # alle Serien für n × 10 Zonen auf einmal (Geräte-Vergleich je Serie)
+    import numpy as np
+    from coolsulting.engines.samsung import SAMSUNG_SERIEN, katalog
+    bedarf = np.array([800 + 97 * i % 9000 for i in range(n * 10)]) * 1.10 / 1000
+    return lambda: [katalog().auswahl(bedarf, serie) for serie in SAMSUNG_SERIEN]
+
+
+@benchmark("aussengeraete.optimiere_aussengeraete", groessen=("realistisch",))
+def _b_aussengeraete(n):
+    # 6 × n Zonen (realistisch: 30) gemischter Serien auf FJM/RAC verteilen
+    from coolsulting.engines.aussengeraete import optimiere_aussengeraete
+    from coolsulting.engines.samsung import SAMSUNG_SERIEN
+    serien = list(SAMSUNG_SERIEN)[:3]
+    spitzen = [600 + 397 * i % 4200 for i in range(n * 6)]
+    return lambda: optimiere_aussengeraete(spitzen, [serien[i % 3] for i in range(n * 6)], 0.8)
+
+
+@benchmark("preisliste.konvertieren", groessen=("realistisch",))
+def _b_preisliste_xlsx(n):
+    # xlsx -> Artefakt (einmal je Dateiinhalt)
+    from coolsulting import preisliste
+    return lambda: preisliste.konvertieren(preisliste.PREISLISTE_DATEI)
+
+
+@benchmark("preisliste.laden_artefakt", groessen=("realistisch",))
+def _b_preisliste_artefakt(n):
+    # neuer Prozess: Artefakt laden (Hash + .npz), ohne xlsx zu parsen
+    from coolsulting import preisliste
+    preisliste.preisliste()
+
+    def laden():
+        preisliste._laden.cache_clear()
+        return preisliste.preisliste()
+    return laden
+
+
+@benchmark("produkte.produkte", groessen=("realistisch",))
+def _b_produkte(n):
+    # Produktdatenbank aus Tabellen + Preisliste (Artefakt bereits vorhanden)
+    from coolsulting import preisliste
+    from coolsulting.engines.produkte import produkte
+    preisliste.preisliste()
+
+    def aufbauen():
+        produkte.cache_clear()
+        return produkte()
+    return aufbauen
+
+
+@benchmark("produkte.schall_pruefung")
+def _b_schall_pruefung(n):
+    # gewählte AGs von n × 10 Zonen (gemischt FJM/RAC) am Immissionsort prüfen
+    from coolsulting.engines.produkte import SCHALL_AG, schall_pruefung
+    art_nrn = [a for geraete in SCHALL_AG.values() for a in geraete]
+    auswahl = [art_nrn[(7 * i) % len(art_nrn)] for i in range(n * 10)]
+    return lambda: schall_pruefung(auswahl, 5.0, 35.0)
+
+
+def _projekte_last(db_path, sitzungen=20):
+    """``sitzungen`` gleichzeitige Sessions: je Projekt speichern, Liste + Projekt laden.
+    -> (gespeicherte IDs, geladene Zeilen, Fehler)."""
+    from concurrent.futures import ThreadPoolExecutor
+    from coolsulting import projekte
+    zonen = [{"name": f"Zone {i}", "flaeche": 20.0 + i} for i in range(12)]
+
+    def sitzung(i):
+        pid = projekte.speichern(f"Firma {i % 4}", f"user{i}", f"Projekt {i}", "Kunde", "Bearbeiter",
+                                 {"room_inputs": zonen}, {"peaks": {"VDI 6007": 1000.0 + i}},
+                                 {"selected_hw": [2.5] * 12}, db_path=db_path)
+        projekte.projekte(f"Firma {i % 4}", db_path=db_path)
+        return pid, projekte.projekt(pid, db_path=db_path)
+
+    ids, zeilen, fehler = [], [], []
+    with ThreadPoolExecutor(max_workers=sitzungen) as ex:
+        for f in [ex.submit(sitzung, i) for i in range(sitzungen)]:
+            try:
+                pid, zeile = f.result()
+                ids.append(pid)
+                zeilen.append(zeile)
+            except Exception as e:
+                fehler.append(f"{type(e).__name__}: {e}")
+    return ids, zeilen, fehler
+
+
+@benchmark("projekte.parallel_speichern_laden", groessen=("realistisch",))
+def _b_projekte(n):
+    # 20 gleichzeitige Sessions gegen eine frische Datei (Pool + WAL)
+    import tempfile
+    from coolsulting import projekte
+    db_path = os.path.join(tempfile.mkdtemp(prefix="cs_bench_"), "projekte.db")
+    projekte.pool(db_path)
+    return lambda: _projekte_last(db_path)
+
+
+@benchmark("rohrnetz.select_pipe")
+def _b_select_pipe(n):
+    from coolsulting.engines import rohrnetz
+    rn = rohrnetz._rn
+    props = rn.get_sat_props("R449A", -10.0)
+    rohre = rohrnetz.get_pipes_for_ref("R449A")
+    laengen = [10.0 + (i % 60) for i in range(n)]
+    return lambda: [rohrnetz.select_pipe(0.05, props["rho_v"], props["mu_v"], l, 7.6, 18.0,
+                                         1.0, -10.0, props["h_fg"], props["rho_v"], rohre)
+                    for l in laengen]
+
+
+@benchmark("rohrnetz.berechne_leitung")
+def _b_berechne_leitung(n):
+    from coolsulting.engines.rohrnetz import berechne_leitung
+    kreise = [("R449A", -10.0, 40.0, 5.0 + i % 20, 15.0 + i % 40, 3.0) for i in range(n)]
+    return lambda: [berechne_leitung(*k) for k in kreise]
+
+
+@benchmark("schall.berechne_gesamt")
+def _b_schall(n):
+    from coolsulting.engines.schall import berechne_gesamt
+    quellen = _schallquellen(n * 10)
+    return lambda: [berechne_gesamt(**q) for q in quellen]
+
+
+@benchmark("schall.nr_klasse")
+def _b_nr_klasse(n):
+    from coolsulting.engines.schall import nr_klasse, oktav_am_io
+    spektren = [oktav_am_io([46 + i % 9, 44, 40, 36, 32, 27, 20, 12], 6.0 + i % 15, 2, 0.0, 1)
+                for i in range(n * 10)]
+    return lambda: [nr_klasse(s) for s in spektren]
+
+
+@benchmark("coolwire.kreis_zusammenfassung")
+def _b_kreise(n):
+    kuehlstellen = _coolwire("kuehlstellen")
+    liste = _kuehlstellen(n * 6)
+    return lambda: kuehlstellen.kreis_zusammenfassung(liste)
+
+
+@benchmark("coolwire.erzeuge_kabelliste")
+def _b_kabelliste(n):
+    kabelliste = _coolwire("kabelliste")
+    liste = _kuehlstellen(n * 6)
+    return lambda: kabelliste.erzeuge_kabelliste(liste, MASCHINENSTANDORTE, "Wurm_Frigodata")
+
+
+@benchmark("bericht.generate_kunden_pdf", groessen=("realistisch",))
+def _b_kunden_pdf(n):
+    app = _app_modul("coolMATH_PRO.py")
+    e = _coolmath_eingaben()
+    return lambda: app.generate_kunden_pdf(
+        e["proj"], e["kunde"], e["bearbeiter"], e["firma"], e["room_results"], e["g_sums"],
+        e["individual_profiles"], e["samsung_recs"], e["selected_hw"], e["total_kw"],
+        selected_hw_ag=e["selected_hw_ag"], room_inputs=e["room_inputs"],
+        selected_ig_artnr=e["selected_ig_artnr"])
+
+
+@benchmark("bericht.generate_word_report", groessen=("realistisch",))
+def _b_word(n):
+    app = _app_modul("coolMATH_PRO.py")
+    if not app.is_docx_available():
+        raise ImportError("python-docx nicht installiert")
+    e = _coolmath_eingaben()
+    return lambda: app.generate_word_report(
+        e["proj"], e["kunde"], e["bearbeiter"], e["firma"], e["room_results"], e["g_sums"],
+        e["selected_hw"], e["total_kw"], selected_hw_ag=e["selected_hw_ag"],
+        room_inputs=e["room_inputs"], selected_ig_artnr=e["selected_ig_artnr"])
+
+
+@benchmark("bericht.coolneighbor_create_pdf", groessen=("realistisch",))
+def _b_neighbor_pdf(n):
+    from coolsulting.engines.schall import OKTAV_BANDS, berechne_gesamt, nr_klasse, oktav_am_io
+    app = _app_modul("coolNEIGHBOR.py")
+    q = _schallquellen(3)[2]
+    erg = berechne_gesamt(**q)
+    lp_src = [48, 46, 42, 38, 34, 29, 22, 14]
+    lp_io = oktav_am_io(lp_src, q["d_total"], q["q"], q["d_geh"], q["anzahl"])
+    daten = {"_SEP1": "-- PROJEKT --", "Projekt": "Benchmark", "Geraet": "Außengerät 5 kW",
+             "Schallleistung Lw": f"{q['lw']} dB(A)", "Anzahl": str(q["anzahl"]),
+             "Gesamtschallweg": f"{q['d_total']} m", "Direkte Luftlinie": f"{q['d_direkt']} m",
+             "Topologie": q["topologie"], "_SEP2": "-- ERGEBNIS --",
+             "Schalldruckpegel Lp": f"{erg['lp']} dB(A)", "Beurteilungspegel Lr": f"{erg['lr']} dB(A)",
+             "Grenzwert": "40 dB(A)", "STATUS": "KONFORM" if erg["lr"] <= 40 else "UEBERSCHRITTEN",
+             "_SEP5": "-- OKTAVSPEKTRUM AM IMMISSIONSORT --"}
+    for hz, val in zip(OKTAV_BANDS, lp_io):
+        daten[f"{hz} Hz"] = f"{val} dB"
+    nr_k = nr_klasse(lp_io)
+    daten["NR-Klasse"] = f"NR {nr_k}" if nr_k else "> NR 65"
+    return lambda: app.create_pdf(daten, "Benchmark", "Bench", erg=erg, grenzwert=40,
+                                  lp_io=lp_io, lp_oktav_src=lp_src, konform=erg["lr"] <= 40,
+                                  lr=erg["lr"], lp_val=erg["lp"], modell="Außengerät 5 kW",
+                                  land="Österreich", widmung="Wohngebiet", auftraggeber="Muster GmbH")
+
+
+# ============================================================
+# 3. KONTROLLEN (Ergebnisse statt Zeiten)
+# ============================================================
+def _vdi_einschwingen(q_ext, tau, zyklen=4):
+    """Bisheriges VDI-6007-Verfahren (Rekursion über 4 × 24 h) als Referenz."""
+    import numpy as np
+    q_vdi = np.zeros_like(q_ext)
+    for _ in range(zyklen):
+        for h in range(24):
+            q_prev = q_vdi[:, h - 1]
+            q_vdi[:, h] = q_prev + (q_ext[:, h] - q_prev) / (tau + 1)
+    return q_vdi
+
+
+@kontrolle("kuehllast.vdi_filter: Spitzenlast leichte Bauweise = Einschwingverfahren")
+def _k_vdi_leicht():
+    import numpy as np
+    from coolsulting.engines import kuehllast
+    zonen = [z[:8] + ("Leicht (Holz/Trockenbau)",) for z in _zonen(60)]
+    p = kuehllast.zonen_parameter(zonen)
+    q = kuehllast._recknagel(p)
+    neu = kuehllast._vdi_filter(q, p["tau"]).max(axis=1)
+    alt = _vdi_einschwingen(q, p["tau"]).max(axis=1)
+    abw = float(np.max(np.abs(neu - alt) / alt))
+    return abw < 1e-6, f"max. rel. Abweichung Spitze {abw:.1e}"
+
+
+@kontrolle("kuehllast.vdi_filter: periodisch eingeschwungen (alle Bauweisen)")
+def _k_vdi_periodisch():
+    import numpy as np
+    from coolsulting.engines import kuehllast
+    zonen = [z[:8] + (bau,) for bau in kuehllast.TAU_BAU for z in _zonen(20)]
+    p = kuehllast.zonen_parameter(zonen)
+    q = kuehllast._recknagel(p)
+    y = kuehllast._vdi_filter(q, p["tau"])
+    # ein weiterer Schritt der Rekursion ab 23 Uhr muss wieder 0 Uhr ergeben
+    weiter = y[:, -1] + (q[:, 0] - y[:, -1]) / (p["tau"] + 1)
+    rest = float(np.max(np.abs(weiter - y[:, 0]) / y[:, 0]))
+    return rest < 1e-9, f"max. rel. Restfehler {rest:.1e}"
+
+
+@kontrolle("kuehllast.berechne_jahr: klarer Jahresverlauf = Auslegungstag des Monats (alle Methoden)")
+def _k_jahr_auslegungstag():
+    import numpy as np
+    from coolsulting.engines import kuehllast, sonne, wetter
+    # konstant Raumsoll + 7 K (Bestand), Klarhimmel-Globalstrahlung -> jeder
+    # Tag = Auslegungstag seines Monats; Tage in Monatsmitte vergleichen
+    n = wetter.STUNDEN_JAHR
+    monat, stunde = wetter._kalender()
+    g_klar = sonne.globalstrahlung_klar()[monat - 1, stunde]
+    klar = wetter._wetter("Klarhimmel", np.full(n, kuehllast.T_INNEN + 7.0),
+                          g_klar, np.zeros(n), "test")
+    zonen = _zonen(30)
+    jahr = {m: kuehllast.berechne_jahr(zonen, klar, m) for m in kuehllast.METHODEN}
+    abw = 0.0
+    for t in (15, 200, 350):
+        m_tag = int(monat[24 * t])
+        tag = kuehllast.berechne_zonen([z + (2.5, sonne.STANDARD_BREITE, m_tag) for z in zonen])
+        for i, methode in enumerate(kuehllast.METHODEN):
+            ist = jahr[methode][:, 24 * t:24 * t + 24]
+            abw = max(abw, float(np.max(np.abs(ist - tag[:, i]) / np.maximum(np.abs(tag[:, i]), 1.0))))
+    return abw < 1e-6, f"max. rel. Abweichung {abw:.1e}"
+
+
+@kontrolle("sonne.strahlung: Ost/West spiegelbildlich zum Sonnenmittag, nachts 0")
+def _k_sonne_symmetrie():
+    import numpy as np
+    from coolsulting.engines import sonne
+    abw = 0.0
+    for breite in (48.0, 51.0, 54.0):
+        for monat in (3, 7, 12):
+            for azimut, neigung in [(90, 90), (135, 90), (100, 30)]:
+                morgen = sonne.strahlung((azimut, neigung), breite, monat)
+                abend = sonne.strahlung((360 - azimut, neigung), breite, monat)[::-1]
+                abw = max(abw, float(np.max(np.abs(morgen - abend))))
+            hoehe, _ = sonne.sonnenstand(breite, monat)
+            abw = max(abw, float(np.max(sonne.strahlungstabelle(breite, monat)[:, :, hoehe <= 0])))
+    return abw < 1e-9, f"max. Abweichung {abw:.1e} W/m²"
+
+
+@kontrolle("kuehllast.berechne_zonen: Eckraum = Summe der Fassaden (außer Praktiker)")
+def _k_eckraum():
+    import numpy as np
+    from coolsulting.engines import kuehllast
+    abw = 0.0
+    for z in _zonen(24):
+        weitere = (("WEST", 3.0, "Dreifach", "Rollladen"), (135, 1.2, "Doppel", "Keine"))
+        eck = dict(zip(kuehllast.ZONEN_FELDER, z), fenster=weitere)
+        ohne = dict(eck, win_area=0.0, fenster=())
+        einzeln = [dict(eck, fenster=())] + [dict(ohne, orient=o, win_area=w, glass=g, shade=s)
+                                            for o, w, g, s in weitere]
+        t = kuehllast.berechne_zonen([eck, ohne] + einzeln)
+        summe = t[2:].sum(axis=0) - len(weitere) * t[1]
+        keine_prak = [i for i, m in enumerate(kuehllast.METHODEN) if m != "PRAK"]
+        abw = max(abw, float(np.max(np.abs(t[0, keine_prak] - summe[keine_prak]))))
+    return abw < 1e-6, f"max. Abweichung {abw:.1e} W"
+
+
+@kontrolle("kuehllast.berechne_zonen: Methodenauswahl = Ausschnitt aller Methoden")
+def _k_methodenauswahl():
+    import numpy as np
+    from coolsulting.engines import kuehllast
+    zonen = _zonen(24)
+    alle = kuehllast.berechne_zonen(zonen)
+    abw = 0.0
+    for auswahl in (["VDI_N"], ["KI", "VDI_A"], ["PRAK"], ["KLTS", "RECK"]):
+        t = kuehllast.berechne_zonen(zonen, auswahl)
+        idx = [kuehllast.METHODEN.index(m) for m in auswahl]
+        abw = max(abw, float(np.max(np.abs(t - alle[:, idx]))))
+    return abw == 0.0, f"max. Abweichung {abw:.1e} W"
+
+
+@kontrolle("unsicherheit.monte_carlo: ohne Streuung alle Quantile = Planwert")
+def _k_monte_carlo_plan():
+    from coolsulting.engines import unsicherheit
+    fest = {k: (m, m, m) for k, (_, m, _) in unsicherheit.VERTEILUNGEN.items()}
+    r = unsicherheit.monte_carlo(_zonen(12), stichproben=300, verteilungen=fest)
+    werte = list(r["gebaeude"].values()) + r["zonen"]
+    abw = max(abs(w[f"P{q}"] - w["plan"]) / w["plan"] for w in werte for q in unsicherheit.QUANTILE)
+    return abw < 1e-9, f"max. rel. Abweichung {abw:.1e}"
+
+
+@kontrolle("studie.parameter_studie: Gitterzelle = berechne_zonen + find_samsung_device")
+def _k_studie_zelle():
+    import numpy as np
+    from coolsulting.engines import kuehllast, studie
+    from coolsulting.engines.samsung import find_samsung_device
+    zonen = _zonen(15)
+    r = studie.parameter_studie(zonen, "standard", "shade")
+    abw_w = abw_eur = 0.0
+    for ai, bi in [(0, 0), (1, 3), (3, 2)]:
+        varianten = [dict(zip(kuehllast.ZONEN_FELDER, z), standard=r["a"][ai], shade=r["b"][bi])
+                     for z in zonen]
+        t = kuehllast.berechne_zonen(varianten)
+        abw_w = max(abw_w, float(np.max(np.abs(t.sum(axis=0).max(axis=1) - r["spitze_w"][ai, bi]))))
+        preise = [sum(find_samsung_device(w)[0]["preis"] for w in t[:, m].max(axis=1))
+                  for m in range(len(kuehllast.METHODEN))]
+        abw_eur = max(abw_eur, float(np.max(np.abs(np.array(preise) - r["kosten_eur"][ai, bi]))))
+    return abw_w < 1e-6 and abw_eur == 0, f"Spitze {abw_w:.1e} W, Kosten {abw_eur:.0f} EUR"
+
+
+@kontrolle("samsung.katalog: bisect/searchsorted = lineare Suche (alle Serien)")
+def _k_katalog():
+    import numpy as np
+    from coolsulting.engines.samsung import SAMSUNG_SERIEN, find_samsung_device, katalog
+    bedarf = np.arange(0, 9000, 13) * 1.10 / 1000
+    falsch = 0
+    for serie, db in SAMSUNG_SERIEN.items():
+        groessen = sorted(db)
+        linear = [next((kw for kw in groessen if kw >= b), groessen[-1]) for b in bedarf]
+        _, kw, _, _ = katalog().auswahl(bedarf, serie)
+        einzeln = [find_samsung_device(w, serie=serie)[0]["cool_kw"] for w in range(0, 9000, 13)]
+        falsch += int(np.sum(kw != linear)) + sum(a != b for a, b in zip(einzeln, linear))
+    return falsch == 0, f"{falsch} Abweichungen"
+
+
+def _aufteilungen(elemente):
+    """Alle Mengenpartitionen (Bell-Zahl; nur für kleine Kontroll-Instanzen)."""
+    if not elemente:
+        yield []
+        return
+    erstes, rest = elemente[0], elemente[1:]
+    for teil in _aufteilungen(rest):
+        yield [[erstes]] + teil
+        for i in range(len(teil)):
+            yield teil[:i] + [[erstes] + teil[i]] + teil[i + 1:]
+
+
+@kontrolle("aussengeraete.optimiere_aussengeraete: Kosten = vollständige Aufzählung (7 Zonen)")
+def _k_aussengeraete():
+    import random
+    from coolsulting.engines.aussengeraete import _rac_ag, optimiere_aussengeraete
+    from coolsulting.engines.samsung import FJM_AG, SAMSUNG_SERIEN, katalog
+    kat = katalog()
+    rng = random.Random(7)
+    falsch = 0
+    for _ in range(12):
+        n, gz = 7, rng.choice([1.0, 0.8, 0.6])
+        spitzen = [rng.uniform(500, 6000) for _ in range(n)]
+        serien = [rng.choice(list(SAMSUNG_SERIEN)) for _ in range(n)]
+        r = optimiere_aussengeraete(spitzen, serien, gz)
+        zonen = [(math.ceil(z["bedarf_kw"] * gz * 10 - 1e-9), round(z["kw"] * 10),
+                  math.ceil(z["bedarf_kw"] * 10 - 1e-9)) for z in r["innengeraete"]]
+        rac = [_rac_ag(z["serie"], z["kw"]) for z in r["innengeraete"]]
+        beste = math.inf
+        for teil in _aufteilungen(list(range(n))):
+            summe = 0.0
+            for g in teil:
+                preise = [kat.ag_preis[d["art_nr"]] for kw, d in FJM_AG.items()
+                          if len(g) <= d["ports"]
+                          and sum(zonen[z][0] for z in g) <= round(kw * 10)
+                          and max(zonen[z][2] for z in g) <= round(kw * 10)
+                          and sum(zonen[z][1] for z in g) <= int(kw * 13 + 1e-9)]
+                if len(g) == 1 and rac[g[0]]:
+                    preise.append(kat.ag_preis[rac[g[0]][1]])
+                summe += min(preise, default=math.inf)
+            beste = min(beste, summe)
+        falsch += abs(r["ag_eur"] - beste) > 1e-6
+    return falsch == 0, f"{falsch} von 12 Instanzen nicht optimal"
+
+
+@kontrolle("preisliste: Artefakt = xlsx, FJM-AG-Preise/Anschlüsse = FJM_AG")
+def _k_preisliste():
+    import numpy as np
+    from coolsulting import preisliste
+    from coolsulting.engines.samsung import FJM_AG
+    preisliste._laden.cache_clear()
+    liste = preisliste.preisliste()
+    if liste is None:
+        return False, f"{preisliste.PREISLISTE_DATEI} fehlt"
+    frisch = preisliste.aufbereiten(preisliste.lese_xlsx(liste.quelle))
+    gleich = all(np.array_equal(frisch[s], liste.spalten[s], equal_nan=True)
+                 if isinstance(frisch[s], np.ndarray) else frisch[s] == liste.spalten[s]
+                 for s in frisch)
+    fjm = liste.fjm_ag_preise()
+    abw = [kw for kw, ag in FJM_AG.items()
+           if kw not in fjm or fjm[kw]["preis"] != ag["preis"] or fjm[kw]["anschluesse"] != ag["ports"]]
+    # untergeschobenes Artefakt mit Objekt-Array (pickle) wird nicht geladen, sondern neu erzeugt
+    import shutil
+    import tempfile
+    cache_dir = preisliste.CACHE_DIR
+    preisliste.CACHE_DIR = tempfile.mkdtemp(prefix="cs_preisliste_")
+    try:
+        np.savez(preisliste.cache_pfad(liste.sha256), format=np.array(preisliste.FORMAT),
+                 sha256=np.array(liste.sha256), Artikelnummer=np.array([object()], dtype=object))
+        preisliste._laden.cache_clear()
+        neu = preisliste.preisliste()
+        sicher = neu.spalten["Artikelnummer"] == liste.spalten["Artikelnummer"]
+    finally:
+        shutil.rmtree(preisliste.CACHE_DIR, ignore_errors=True)
+        preisliste.CACHE_DIR = cache_dir
+        preisliste._laden.cache_clear()
+    return gleich and not abw and sicher, (
+        f"{len(liste)} Artikel, {len(liste.gruppen())} Gruppen; Artefakt {'=' if gleich else '≠'} xlsx; "
+        f"FJM-AG-Abweichungen: {abw or 'keine'}; Objekt-Artefakt {'verworfen' if sicher else 'GELADEN'}")
+
+
+@kontrolle("produkte: alle Tabellen-Artikel enthalten, Preise = Preisliste = katalog()")
+def _k_produkte():
+    from coolsulting.engines import produkte as pr
+    from coolsulting.engines.samsung import FJM_AG, RAC_AG_BY_SERIE, SAMSUNG_SERIEN, katalog
+    from coolsulting.preisliste import preisliste
+    db, kat, liste = pr.produkte(), katalog(), preisliste()
+    art_nrn = ([d["art_nr"] for g in SAMSUNG_SERIEN.values() for d in g.values()]
+               + [d["art_nr"] for d in FJM_AG.values()]
+               + [e[1] for g in RAC_AG_BY_SERIE.values() for e in g]
+               + [a for g in pr.SCHALL_AG.values() for a in g]
+               + [d["artikelnr"] for t in (pr.QUINT_AUSSENGERAETE, pr.QUINT_HYDRO_UNITS,
+                                           pr.QUINT_INNENGERAETE, pr.QUINT_PANEELE) for d in t.values()]
+               + list(pr.QUINT_ZUBEHOER.values()))
+    fehlend = [a for a in art_nrn if a not in db]
+    preis = [a for a in art_nrn
+             if liste is not None and liste.preis(a) is not None and db.preis(a) != liste.preis(a)]
+    preis += [a for a, p in {**kat.ig_preis, **kat.ag_preis}.items() if db.preis(a) != p]
+    schall = sum(len(g) for g in db.schall_auswahl().values()) - sum(len(g) for g in pr.SCHALL_AG.values())
+    ok = not fehlend and not preis and schall == 0
+    return ok, (f"{len(db)} Artikel; fehlend {fehlend or 'keine'}; Preisabweichungen {preis or 'keine'}; "
+                f"Schall-Auswahl Δ {schall}")
+
+
+@kontrolle("projekte: 20 gleichzeitige Sessions speichern/laden, Pool begrenzt, Migration einmal")
+def _k_projekte():
+    import shutil
+    import sqlite3
+    import tempfile
+    from coolsulting import projekte
+    ordner = tempfile.mkdtemp(prefix="cs_projekte_")
+    db_path = os.path.join(ordner, "projekte.db")
+    try:
+        # Altbestand: Tabelle ohne user_version wie vor dem Pool (db_init bei jedem Lauf)
+        with sqlite3.connect(db_path) as alt:
+            alt.executescript(projekte.MIGRATIONEN[0])
+            alt.execute("INSERT INTO coolmath_projects (projekt_id, firma) VALUES ('alt', 'Firma 0')")
+        alt.close()
+        ids, zeilen, fehler = _projekte_last(db_path)
+        p = projekte.pool(db_path)
+        offen, geoeffnet = p.offen, p.geoeffnet
+        with p.verbindung() as conn:
+            modus = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            anzahl = conn.execute("SELECT COUNT(*) FROM coolmath_projects").fetchone()[0]
+        projekte.schliessen(db_path)
+        ok = (not fehler and len(set(ids)) == 20 and all(z is not None for z in zeilen)
+              and anzahl == 21 and modus == "wal" and version == len(projekte.MIGRATIONEN)
+              and offen <= projekte.POOL_GROESSE and p.offen == 0)
+        return ok, (f"{len(set(ids))} gespeichert, {anzahl} Zeilen, Fehler {fehler or 'keine'}; "
+                    f"{geoeffnet} Verbindungen geöffnet, {offen} offen, nach schliessen() {p.offen}; "
+                    f"journal_mode={modus}, user_version={version}")
+    finally:
+        projekte.schliessen(db_path)
+        shutil.rmtree(ordner, ignore_errors=True)
+
+
+@kontrolle("kuehllast: calc_*-Hüllen (einzelzone_parameter) = berechne_zonen je Zone")
+def _k_einzelzone():
+    import numpy as np
+    from coolsulting.engines import kuehllast
+    zonen = _zonen(60) + [(20.0, [200, 90], "Altbau", "Einfach", "Keine", 1, 0.0, 3.0,
+                           "Leicht (Holz/Trockenbau)"), (18.0, "DACH", "?", "?", "?", 0, 0.0, 1.0, "?")]
+    tensor = kuehllast.berechne_zonen(zonen)
+    i = {m: kuehllast.METHODEN.index(m) for m in kuehllast.METHODEN}
+    abw = 0.0
+    for z, soll in zip(zonen, tensor):
+        for m, ist in (("VDI_N", kuehllast.calc_vdi_neu(*z)), ("KI", kuehllast.calc_ki_hybrid(*z)),
+                       ("PRAK", kuehllast.calc_praktiker(*z[:7])),
+                       ("RECK", kuehllast.calc_recknagel(*z[:8])),
+                       ("KLTS", kuehllast.calc_kaltluftsee(*z))):
+            abw = max(abw, float(np.max(np.abs(ist - soll[i[m]]))))
+    return abw < 1e-9, f"{len(zonen)} Zonen × 5 Methoden, max. Abweichung {abw:.1e} W"
+
+
+def pruefen():
+    """Alle Kontrollen; fehlende Pakete -> Status 'fehlt'."""
+    ergebnisse = []
+    for name, funktion in KONTROLLEN:
+        try:
+            ok, detail = funktion()
+            status = "ok" if ok else "FALSCH"
+        except ImportError as e:
+            status, detail = "fehlt", str(e)
+        except Exception as e:
+            status, detail = "fehler", f"{type(e).__name__}: {e}"
+        ergebnisse.append({"Name": name, "Status": status, "Detail": detail})
+    return ergebnisse
+
+
+# ============================================================
+# 4. MESSEN
+# ============================================================
+def messen(funktion, wiederholungen=5, min_zeit=0.05):
+    """timeit-artig: Schleifenzahl so wählen, dass ein Durchgang ≥ min_zeit dauert.
+
+    Liefert (median_ms, min_ms, schleifen) je Aufruf.
+    """
+    t0 = time.perf_counter()
+    funktion()                           # Aufwärmen (Caches, Lazy-Imports)
+    einzel = time.perf_counter() - t0
+    schleifen = max(1, min(10000, math.ceil(min_zeit / max(einzel, 1e-7))))
+    zeiten = []
+    for _ in range(wiederholungen):
+        t0 = time.perf_counter()
+        for _ in range(schleifen):
+            funktion()
+        zeiten.append((time.perf_counter() - t0) / schleifen * 1000)
+    return statistics.median(zeiten), min(zeiten), schleifen
+
+
+def ausfuehren(filter_text=None, wiederholungen=5, min_zeit=0.05):
+    """Alle (gefilterten) Benchmarks; fehlende Pakete -> Status 'fehlt'."""
+    ergebnisse = []
+    for name, groesse, aufbau in BENCHMARKS:
+        if filter_text and filter_text not in name:
+            continue
+        zeile = {"Name": name, "Zeit [ms]": None, "Min [ms]": None, "Schleifen": 0,
+                 "Status": "ok", "Detail": ""}
+        try:
+            zeile["Zeit [ms]"], zeile["Min [ms]"], zeile["Schleifen"] = messen(
+                aufbau(GROESSEN[groesse]), wiederholungen, min_zeit)
+        except ImportError as e:
+            zeile["Status"], zeile["Detail"] = "fehlt", str(e)
+        except Exception as e:
+            zeile["Status"], zeile["Detail"] = "fehler", f"{type(e).__name__}: {e}"
+        ergebnisse.append(zeile)
+    return ergebnisse
+
+
+# ============================================================
+# 5. BASELINE
+# ============================================================
+def lade_baseline(pfad=None):
+    pfad = pfad or BASELINE_PATH
+    if not os.path.exists(pfad):
+        return None
+    with open(pfad, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def speichere_baseline(ergebnisse, pfad=None):
+    """Schreibt die Median-Zeiten aller erfolgreichen Benchmarks als Baseline."""
+    daten = {"erstellt": datetime.now().isoformat(timespec="seconds"),
+             "python": platform.python_version(), "rechner": platform.node(),
+             "zeiten_ms": {e["Name"]: round(e["Zeit [ms]"], 4)
+                           for e in ergebnisse if e["Status"] == "ok"}}
+    with open(pfad or BASELINE_PATH, "w", encoding="utf-8") as f:
+        json.dump(daten, f, ensure_ascii=False, indent=2)
+    return daten
+
+
+def vergleiche(ergebnisse, baseline, toleranz=0.25):
+    """Ergänzt je Zeile 'Faktor' (aktuell / Baseline); liefert die Regressionen."""
+    if not baseline:
+        raise ValueError("Keine Baseline zum Vergleichen (erst mit --speichern anlegen)")
+    zeiten = baseline.get("zeiten_ms", {})
+    regressionen = []
+    for e in ergebnisse:
+        alt = zeiten.get(e["Name"])
+        e["Faktor"] = round(e["Zeit [ms]"] / alt, 2) if alt and e["Status"] == "ok" else None
+        if e["Faktor"] is not None and e["Faktor"] > 1 + toleranz:
+            regressionen.append(e)
+    return regressionen
+
+
+def bericht_text(ergebnisse):
+    zeilen = [f"{'Benchmark':<46} {'Median [ms]':>12} {'Min [ms]':>10} {'×Base':>7}  Status",
+              "-" * 90]
+    for e in ergebnisse:
+        if e["Status"] != "ok":
+            zeilen.append(f"{e['Name']:<46} {'–':>12} {'–':>10} {'':>7}  "
+                          f"{e['Status']:<6} {e['Detail'][:40]}")
+            continue
+        faktor = f"{e['Faktor']:.2f}" if e.get("Faktor") is not None else ""
+        zeilen.append(f"{e['Name']:<46} {e['Zeit [ms]']:>12.3f} {e['Min [ms]']:>10.3f} "
+                      f"{faktor:>7}  ok")
+    return "\n".join(zeilen)
+
+
+# ============================================================
+# 6. KOMMANDOZEILE
+# ============================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m coolsulting bench",
+                                     description="Benchmarks aller Rechenkerne und Berichte.")
+    parser.add_argument("-k", "--filter", help="Nur Benchmarks, deren Name den Text enthält")
+    parser.add_argument("--wiederholungen", type=int, default=5)
+    parser.add_argument("--min-zeit", type=float, default=0.05,
+                        help="Mindestdauer je Durchgang in s (Standard 0.05)")
+    parser.add_argument("--baseline", default=None, help=f"Baseline-Datei (Standard: {BASELINE_PATH})")
+    parser.add_argument("--speichern", action="store_true", help="Ergebnis als neue Baseline speichern")
+    parser.add_argument("--nur-messen", action="store_true", help="Messen ohne Baseline-Vergleich")
+    parser.add_argument("--toleranz", type=float, default=0.25,
+                        help="Erlaubte Verlangsamung ggü. Baseline (0.25 = +25 %%)")
+    parser.add_argument("--json", action="store_true", help="Ergebnisse als JSON ausgeben")
+    parser.add_argument("--liste", action="store_true", help="Nur Benchmark-Namen anzeigen")
+    parser.add_argument("--pruefen", action="store_true", help="Nur Ergebnis-Kontrollen ausführen")
+    args = parser.parse_args(argv)
+
+    if args.liste:
+        for name, _, _ in BENCHMARKS:
+            print(name)
+        return 0
+
+    if args.pruefen:
+        kontrollen = pruefen()
+        for k in kontrollen:
+            print(f"{k['Status']:<7} {k['Name']}  ({k['Detail']})")
+        return 1 if any(k["Status"] in ("FALSCH", "fehler") for k in kontrollen) else 0
+
+    vergleichen = not (args.speichern or args.nur_messen)
+    baseline = lade_baseline(args.baseline) if vergleichen else None
+    if vergleichen and baseline is None:
+        # Baselines sind rechnerabhängig und nicht eingecheckt – fehlende nicht
+        # stillschweigend als "keine Regression" werten
+        print(f"FEHLER: keine Baseline unter {args.baseline or BASELINE_PATH}. "
+              f"Erst auf diesem Rechner mit --speichern anlegen (oder --nur-messen).",
+              file=sys.stderr)
+        return 2
+    ergebnisse = ausfuehren(args.filter, args.wiederholungen, args.min_zeit)
+    regressionen = vergleiche(ergebnisse, baseline, args.toleranz) if vergleichen else []
+
+    if args.json:
+        print(json.dumps(ergebnisse, ensure_ascii=False, indent=2))
+    else:
+        print(bericht_text(ergebnisse))
+    if args.speichern:
+        daten = speichere_baseline(ergebnisse, args.baseline)
+        print(f"Baseline gespeichert: {args.baseline or BASELINE_PATH} "
+              f"({len(daten['zeiten_ms'])} Benchmarks)")
+    for e in regressionen:
+        print(f"REGRESSION: {e['Name']} ist {e['Faktor']:.2f}× langsamer als die Baseline")
+    return 1 if regressionen else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+# ============================================================================
+# DATEI: coolsulting/engines/__init__.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Rechenkerne aller Module als reine Funktionen (ohne
+#               Streamlit). Die Apps rufen dieselben Funktionen auf; die
+#               HTTP/JSON-Schnittstelle (coolsulting.engines.service) und
+#               Batch-Läufe nutzen sie direkt.
+# ============================================================================
+
+import importlib
+
+# Öffentlicher Engine-Name -> "modul:funktion" (Import erst bei Bedarf,
+# rohrnetz braucht z.B. numpy)
+ENGINES = {
+    "kuehllast":  "kuehllast:zone_berechnen",
+    "kuehlraum":  "kuehlraum:raumlast",
+    "hydraulik":  "hydraulik:hydraulik",
+    "pool":       "pool:pool_analyse",
+    "pool_24h":   "pool:simulation_24h",
+    "heizlast":   "heizlast:heizlast",
+    "fuellmenge": "fuellmenge:berechne_fuellmenge",
+    "schall":     "schall:berechne_gesamt",
+    "nr_klasse":  "schall:nr_klasse",
+    "rohrnetz":   "rohrnetz:berechne_leitung",
+}
+
+
+def get_engine(name):
+    """Liefert die Engine-Funktion zu ``name``; KeyError bei unbekanntem Namen."""
+    modul, funktion = ENGINES[name].split(":")
+    return getattr(importlib.import_module(f"{__name__}.{modul}"), funktion)
+
+
+def berechne(name, parameter):
+    """Ruft eine Engine mit Keyword-Parametern (dict) auf."""
+    return get_engine(name)(**parameter)
@@ -0,0 +1,256 @@
+# ============================================================================
+# DATEI: coolsulting/engines/aussengeraete.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Kostenoptimale Außengeräte-Kombination für coolMATH PRO.
+#               Je Zone ein Innengerät (kleinstes passendes der Zonen-Serie);
+#               die Zonen werden auf FJM-Multi-Außengeräte (2–5 Anschlüsse)
+#               und RAC-Single-Split-Außengeräte verteilt, so dass der
+#               Listenpreis minimal ist.
+#
+#   Randbedingungen je FJM-Gruppe:
+#     Anzahl Zonen                          <= Anschlüsse des AG
+#     Σ Innengeräte-Nennleistung            <= AG-Leistung × KOMBINATION_MAX
+#     Σ Zonenbedarf × Gleichzeitigkeit      <= AG-Leistung
+#   RAC: ein AG je Zone aus der Liste der IG-Serie, Leistung >= IG.
+#
+#   Lösung: dynamische Programmierung über die Zonen (absteigend nach Bedarf)
+#   mit Memo der Zustände. Zustand = offene FJM-Gruppen (freie Anschlüsse,
+#   Restleistung und IG-Rest in 0,1 kW, abgerundet auf das mit den Restzonen
+#   Erreichbare); gleiche Zustände werden zusammengefasst, der billigste
+#   bleibt. Je Zone: in eine offene Gruppe, neues FJM-AG oder RAC-AG. Wird
+#   eine Ebene breiter als BREITE, bleiben die Zustände mit der kleinsten
+#   Summe aus bezahlt + unterer Schranke (LP-Dual: Preise je Anschluss /
+#   Leistung / IG-Summe) – dann ist das Ergebnis nicht mehr beweisbar optimal.
+#   Bedarf und Leistungen werden in ganze 0,1 kW umgerechnet (Bedarf aufgerundet).
+# ============================================================================
+
+import math
+from itertools import combinations
+
+import numpy as np
+
+from coolsulting.engines.samsung import FJM_AG, FJM_IG_SERIEN, RAC_AG_BY_SERIE, katalog
+from coolsulting.trace import traced
+
+KOMBINATION_MAX = 1.30    # Σ IG-Nennleistung / AG-Leistung (Kombinationsfaktor FJM)
+SICHERHEIT = 1.10         # Norm-Zuschlag wie find_samsung_device
+BREITE = 300              # Zustände je Zonen-Ebene; darüber wird gekürzt
+
+
+def _zehntel(kw, aufrunden=False):
+    """kW -> ganze 0,1 kW (Bedarf aufgerundet = auf der sicheren Seite)."""
+    x = kw * 10
+    return math.ceil(x - 1e-9) if aufrunden else int(round(x))
+
+
+def _rac_ag(ig_serie, ig_kw):
+    """Kleinstes RAC-AG der IG-Serie >= IG-Leistung -> (kW, Art.-Nr., Bez., Preis) oder None."""
+    if ig_serie in FJM_IG_SERIEN:
+        return None
+    for eintrag in RAC_AG_BY_SERIE.get(ig_serie, ()):
+        if eintrag[0] >= ig_kw:
+            return eintrag
+    return None
+
+
+# ============================================================
+# 1. UNTERE SCHRANKE (duale Preise je Anschluss / 0,1 kW / 0,1 kW IG)
+# ============================================================
+def _duale_preise(ags):
+    """Ecken von {y >= 0 : y · (Anschlüsse, Leistung, IG-Grenze) <= Preis für jedes AG}.
+
+    Für jedes solche y kostet eine FJM-Gruppe mindestens Σ y · (1, Bedarf, IG)
+    ihrer Zonen – damit ist Σ min(RAC-Preis, y · Zone) eine gültige Schranke."""
+    zeilen = [(a[1], a[2], a[3], a[0]) for a in ags] + [(-1, 0, 0, 0), (0, -1, 0, 0), (0, 0, -1, 0)]
+    ecken = set()
+    for auswahl in combinations(zeilen, 3):
+        m = np.array([z[:3] for z in auswahl], dtype=float)
+        if abs(np.linalg.det(m)) < 1e-9:
+            continue
+        y = np.linalg.solve(m, [z[3] for z in auswahl])
+        if (y >= -1e-9).all() and all(y @ z[:3] <= z[3] + 1e-6 for z in zeilen[:len(ags)]):
+            ecken.add(tuple(np.round(np.maximum(y, 0.0), 9)))
+    return sorted(ecken)
+
+
+# ============================================================
+# 2. OPTIMIERUNG
+# ============================================================
+def _loesen(zonen, ags, breite=BREITE):
+    """zonen: [(Bedarf × Gleichzeitigkeit, IG, RAC-Preis | None, Bedarf)] in 0,1 kW,
+    absteigend sortiert;
+    ags: [(Preis, Anschlüsse, Leistung, IG-Grenze)].
+    -> (Kosten AG, Gruppen [(AG-Index | "RAC", [Zonenpositionen])], optimal)."""
+    n = len(zonen)
+    ecken = np.array(_duale_preise(ags))                        # (E × 3)
+    # Schranke der Restzonen je Ecke als Suffixsumme über die Zonen
+    anteil = ecken @ np.array([(1.0, z[0], z[1]) for z in zonen]).T          # (E × N)
+    rac_preis = np.array([math.inf if z[2] is None else z[2] for z in zonen])
+    rest_lb = np.concatenate([np.minimum(anteil, rac_preis)[:, ::-1].cumsum(axis=1)[:, ::-1],
+                              np.zeros((len(ecken), 1))], axis=1)            # (E × N+1)
+    # erreichbare Summen aus höchstens f Restzonen ab i (Bitmenge je Dimension):
+    # Restleistung wird auf die größte erreichbare Summe abgerundet, so fallen
+    # gleichwertige Zustände zusammen
+    f_max = max(a[1] for a in ags)
+    erreichbar = [[[1] * f_max for _ in range(n + 1)] for _ in range(2)]
+    for d in range(2):
+        grenze = (1 << (max(a[2 + d] for a in ags) + 1)) - 1
+        for i in range(n - 1, -1, -1):
+            v, r = zonen[i][d], erreichbar[d]
+            for f in range(1, f_max):
+                r[i][f] = (r[i + 1][f] | (r[i + 1][f - 1] << v)) & grenze
+    min_bed = [math.inf] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        min_bed[i] = min(min_bed[i + 1], zonen[i][0])
+
+    def kappen(i, g):
+        """Restzustand einer Gruppe vor Zone i (None = kann nichts mehr aufnehmen)."""
+        f, kap, ig = g
+        if i == n or f == 0 or kap < min_bed[i]:
+            return None
+        kap = (erreichbar[0][i][f] & ((2 << kap) - 1)).bit_length() - 1
+        ig = (erreichbar[1][i][f] & ((2 << ig) - 1)).bit_length() - 1
+        return (f, kap, ig) if kap > 0 and ig > 0 else None
+
+    def schranke(i, zustaende):
+        """Untere Schranke der Restkosten je Zustand (Ecken-Maximum, vektorisiert)."""
+        frei = np.array([[sum(s) for s in zip(*o)] if o else [0, 0, 0] for o in zustaende], float)
+        return (rest_lb[:, i] - frei @ ecken.T).max(axis=1)
+
+    def kinder(i, bezahlt, offen):
+        """Folgezustände nach Zone i: (bezahlt, Entscheidung, offene Gruppen)."""
+        bed, ig, rac, bed_voll = zonen[i]
+        basis = [kappen(i + 1, g) for g in offen]               # unveränderte Gruppen
+        ohne = lambda j: [g for k, g in enumerate(basis) if k != j and g is not None]
+        plus = lambda rest, g: tuple(sorted(rest + [g])) if g is not None else tuple(sorted(rest))
+        for j, (f, kap, ig_rest) in enumerate(offen):          # in offene Gruppe
+            if (j and offen[j] == offen[j - 1]) or kap < bed or ig_rest < ig:
+                continue                       # gleicher Restzustand schon probiert / passt nicht
+            yield bezahlt, ("DAZU", offen[j]), plus(
+                ohne(j), kappen(i + 1, (f - 1, kap - bed, ig_rest - ig)))
+        rest = ohne(-1)
+        if rac is not None:                                     # RAC-Single
+            yield bezahlt + rac, ("RAC",), tuple(sorted(rest))
+        for k, (preis, ports, kap, ig_max) in enumerate(ags):   # neues FJM-AG
+            if kap >= bed_voll and ig_max >= ig:    # erste (größte) Zone voll versorgt
+                yield bezahlt + preis, ("NEU", k), plus(
+                    rest, kappen(i + 1, (ports - 1, kap - bed, ig_max - ig)))
+
+    # Ebene i: offene Gruppen -> (bezahlt, Vorgänger, Entscheidung); gleiche
+    # Zustände werden zusammengefasst (billigster bleibt). Zu breite Ebenen
+    # werden auf die aussichtsreichsten Zustände (bezahlt + Schranke) gekürzt.
+    ebenen = [{(): (0.0, None, None)}]
+    optimal = True
+    for i in range(n):
+        naechste = {}
+        for offen, (bezahlt, _, _) in ebenen[-1].items():
+            for b, w, o in kinder(i, bezahlt, offen):
+                if o not in naechste or b < naechste[o][0]:
+                    naechste[o] = (b, offen, w)
+        if len(naechste) > breite:
+            optimal = False
+            zustaende = list(naechste)
+            wertung = [naechste[o][0] for o in zustaende] + schranke(i + 1, zustaende)
+            naechste = {zustaende[k]: naechste[zustaende[k]]
+                        for k in np.argsort(wertung, kind="stable")[:breite]}
+        if not naechste:
+            return math.inf, [], False
+        ebenen.append(naechste)
+
+    zustand = min(ebenen[-1], key=lambda o: ebenen[-1][o][0])
+    kosten = ebenen[-1][zustand][0]
+    wahl = []
+    for ebene in reversed(ebenen[1:]):
+        _, zustand, w = ebene[zustand]
+        wahl.append(w)
+    wahl.reverse()
+
+    # Entscheidungen nachvollziehen: gleiche Zustandsfolge, dazu Gruppen-Nr. je Rest
+    gruppen, offen = [], []          # gruppen: [(AG-Index | "RAC", [Positionen])]
+    for i, w in enumerate(wahl):
+        bed, ig = zonen[i][:2]
+        if w[0] == "RAC":
+            gruppen.append(("RAC", [i]))
+        elif w[0] == "NEU":
+            _, ports, kap, ig_max = ags[w[1]]
+            gruppen.append((w[1], [i]))
+            offen.append(((ports - 1, kap - bed, ig_max - ig), len(gruppen) - 1))
+        else:
+            k = next(k for k, (g, _) in enumerate(offen) if g == w[1])
+            (f, kap, ig_rest), nr = offen[k]
+            gruppen[nr][1].append(i)
+            offen[k] = ((f - 1, kap - bed, ig_rest - ig), nr)
+        offen = [(kappen(i + 1, g), nr) for g, nr in offen if kappen(i + 1, g) is not None]
+    return kosten, gruppen, optimal
+
+
+@traced()
+def optimiere_aussengeraete(spitzen_w, serien=None, gleichzeitigkeit=1.0,
+                            kombination_max=KOMBINATION_MAX, nur_fjm=False,
+                            breite=BREITE):
+    """Kostenminimale Zuordnung der Zonen zu FJM-Multi- und RAC-Außengeräten.
+
+    ``spitzen_w``: Spitzenlast je Zone [W] (gewählte Methode); ``serien``: IG-Serie
+    je Zone (Standard-Serie bei None); ``gleichzeitigkeit``: Faktor auf die
+    Summe der Zonenbedarfe einer FJM-Gruppe (z.B. Gebäude-Simultanspitze /
+    Σ Zonenspitzen). -> dict mit ``kosten_eur`` (IG + AG), ``ig_eur``,
+    ``ag_eur``, ``einzeln_eur`` (Vergleich: ein AG je Zone), ``innengeraete``,
+    ``gruppen`` (je AG: typ, art_nr, bez, kw, preis, zonen) und ``optimal``
+    (False = mindestens eine Ebene auf ``breite`` Zustände gekürzt).
+    """
+    kat = katalog()
+    spitzen_w = [float(w) for w in spitzen_w]
+    serien = list(serien) if serien is not None else [kat.standard] * len(spitzen_w)
+    if len(serien) != len(spitzen_w):
+        raise ValueError("serien und spitzen_w unterschiedlich lang")
+    if not spitzen_w:
+        raise ValueError("Keine Zonen")
+
+    fjm = sorted(FJM_AG.items())
+    ags = [(float(kat.ag_preis[d["art_nr"]]), d["ports"], _zehntel(kw), int(kw * kombination_max * 10 + 1e-9))
+           for kw, d in fjm]
+    innen, zonen = [], []
+    for w, serie in zip(spitzen_w, serien):
+        bedarf_kw = w * SICHERHEIT / 1000.0
+        _, ig_kw, ig, zu_gross = kat.passend(serie, bedarf_kw)
+        rac = None if nur_fjm else _rac_ag(kat.serie(serie), ig_kw)
+        innen.append({"serie": kat.serie(serie), "kw": ig_kw, "art_nr": ig["art_nr"],
+                      "bez": ig["bez"], "preis": float(ig["preis"]), "zu_gross": zu_gross,
+                      "bedarf_kw": bedarf_kw, "rac": rac})
+        zonen.append((_zehntel(bedarf_kw * gleichzeitigkeit, aufrunden=True),
+                      _zehntel(ig_kw), float(kat.ag_preis[rac[1]]) if rac else None,
+                      _zehntel(bedarf_kw, aufrunden=True)))
+
+    # Reihenfolge: größter Bedarf zuerst (engste Entscheidungen oben im Suchbaum)
+    reihenfolge = sorted(range(len(zonen)), key=lambda z: (-innen[z]["bedarf_kw"], -zonen[z][1], z))
+    ag_eur, loesung, optimal = _loesen([zonen[z] for z in reihenfolge], ags, breite)
+    if math.isinf(ag_eur):
+        raise ValueError("Keine zulässige Kombination (Zone größer als jedes Außengerät)")
+    gruppen = []
+    for typ, positionen in loesung:
+        mitglieder = sorted(reihenfolge[p] for p in positionen)
+        if typ == "RAC":
+            kw, art_nr, bez, _ = innen[mitglieder[0]]["rac"]
+            gruppen.append({"typ": "RAC", "art_nr": art_nr, "bez": bez, "kw": kw,
+                            "preis": float(kat.ag_preis[art_nr]), "zonen": mitglieder})
+        else:
+            kw, d = fjm[typ]
+            gruppen.append({"typ": "FJM", "art_nr": d["art_nr"], "bez": d["bez"], "kw": kw,
+                            "preis": float(kat.ag_preis[d["art_nr"]]), "ports": d["ports"],
+                            "zonen": mitglieder})
+    gruppen.sort(key=lambda g: g["zonen"][0])
+
+    ig_eur = sum(z["preis"] for z in innen)
+    einzeln = sum(min(([rac] if rac is not None else [])
+                      + [p for p, _, kap, ig_max in ags if kap >= bed and ig_max >= ig])
+                  for (_, ig, rac, bed) in zonen)
+    for z in innen:
+        z.pop("rac")
+    return {
+        "kosten_eur": ig_eur + ag_eur, "ig_eur": ig_eur, "ag_eur": ag_eur,
+        "einzeln_eur": ig_eur + einzeln,
+        "gleichzeitigkeit": gleichzeitigkeit, "optimal": optimal,
+        "innengeraete": innen, "gruppen": gruppen,
+    }
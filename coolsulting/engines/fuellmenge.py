@@ -0,0 +1,35 @@
+# ============================================================================
+# DATEI: coolsulting/engines/fuellmenge.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Max. Kältemittel-Füllmenge nach ÖNORM EN 378 ohne Streamlit.
+# ============================================================================
+
+import math
+
+from coolsulting.trace import traced
+
+KAELTEMITTEL = {"R32": {"atel": 0.300, "lfl": 0.307}, "R410A": {"atel": 0.420, "lfl": 0.442}}
+EINBAUHOEHE = {"Deckeneinbau": 2.2, "Wandmontage": 1.8, "Bodenaufstellung": 0.6}
+
+
+@traced()
+def berechne_fuellmenge(gas, flaeche, hoehe, einbau):
+    """(m_max [kg], Raumvolumen [m³], begrenzender Grund)."""
+    v_raum = flaeche * hoehe
+    daten = KAELTEMITTEL
+
+    m_tox = daten[gas]["atel"] * v_raum
+
+    h0 = EINBAUHOEHE[einbau]
+
+    if gas == "R32":
+        m_burn = 2.5 * (daten[gas]["lfl"]**1.25) * h0 * math.sqrt(flaeche)
+        m_burn = max(m_burn, 1.8)
+    else:
+        m_burn = 999.0
+
+    m_max = min(m_tox, m_burn)
+    grund = "Toxizitaet" if m_tox < m_burn else "Brennbarkeit"
+    return m_max, v_raum, grund
@@ -0,0 +1,39 @@
+# ============================================================================
+# DATEI: coolsulting/engines/heizlast.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: WP-Heizlast (Heizlast WP, Modul 1) ohne Streamlit –
+#               Gebäudelast, EVU-Sperrzeit-Aufschlag, Warmwasser, Teillast.
+# ============================================================================
+
+from coolsulting.trace import traced
+
+WW_FAKTOR = (1.45 * 2.0 * 365) / 2400   # kW je Person
+HEIZGRENZE = 15.0                       # °C
+
+
+@traced()
+def heizlast(flaeche, wm2, sperrzeit=0, personen=0):
+    """Auslegungsleistung in kW inkl. Sperrzeit-Aufschlag und Warmwasser."""
+    laufzeit = 24 - sperrzeit
+    load_building_base = (flaeche * wm2) / 1000
+    load_ww_base = personen * WW_FAKTOR
+    sperr_faktor = 24 / laufzeit
+    load_building_real = load_building_base * sperr_faktor
+    return {
+        "laufzeit": laufzeit, "sperr_faktor": sperr_faktor,
+        "load_building_base": load_building_base,
+        "load_building_real": load_building_real,
+        "load_ww_base": load_ww_base,
+        "sperr_aufschlag": load_building_real - load_building_base,
+        "total_kw": load_building_real + load_ww_base,
+    }
+
+
+def teillast(load_building_real, load_ww_base, norm_temp, t_aussen,
+             heizgrenze=HEIZGRENZE):
+    """Leistungsbedarf bei Außentemperatur ``t_aussen`` (linear bis Heizgrenze)."""
+    if t_aussen < heizgrenze:
+        return (load_building_real * (heizgrenze - t_aussen) / (heizgrenze - norm_temp)) + load_ww_base
+    return load_ww_base
@@ -0,0 +1,53 @@
+# ============================================================================
+# DATEI: coolsulting/engines/hydraulik.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Hydraulik (°coolFLOW) ohne Streamlit – Massen-/Volumenstrom
+#               und Fließgeschwindigkeit im Kälteträgernetz.
+# ============================================================================
+
+import math
+
+from coolsulting.trace import traced
+
+# Kälteträger: [cp kJ/kgK, rho kg/m³]
+FLUIDE = {"Wasser (100%)": [4.19, 999], "Ethylenglykol 34%": [3.65, 1050],
+          "Propylenglykol 35%": [3.80, 1040]}
+
+# Stahlrohr-Nennweiten: (Bezeichnung, Innendurchmesser mm)
+ROHRE_DN = [
+    ("DN 20", 21.6), ("DN 25", 27.3), ("DN 32", 36.0), ("DN 40", 41.9),
+    ("DN 50", 53.1), ("DN 65", 68.9), ("DN 80", 80.9), ("DN 100", 105.3), ("DN 125", 130.8)
+]
+
+
+def geschwindigkeit(d_innen_mm, volumenstrom_m3h):
+    """Fließgeschwindigkeit in m/s."""
+    return (volumenstrom_m3h / 3600) / (math.pi * (d_innen_mm / 1000 / 2) ** 2)
+
+
+def bewertung(v):
+    """Einordnung der Geschwindigkeit (Zielbereich 0,5–1,5 m/s)."""
+    return "OK" if 0.5 <= v <= 1.5 else "Hoch" if v > 1.5 else "Niedrig"
+
+
+@traced()
+def hydraulik(q_kw, dt, medium="Wasser (100%)", dn="DN 40"):
+    """Massen-/Volumenstrom für ``q_kw`` bei Spreizung ``dt`` und Vergleich ±1 DN."""
+    cp, rho = FLUIDE[medium]
+    namen = [r[0] for r in ROHRE_DN]
+    idx = namen.index(dn)
+    m_dot_s = q_kw / (cp * dt)
+    v_dot = (m_dot_s / rho) * 3600
+    vergleich = []
+    for i in (idx + 1, idx, idx - 1):
+        if 0 <= i < len(ROHRE_DN):
+            name, d_innen = ROHRE_DN[i]
+            v = geschwindigkeit(d_innen, v_dot)
+            vergleich.append({"dn": name, "d_innen_mm": d_innen, "v": v, "status": bewertung(v)})
+    return {
+        "cp": cp, "rho": rho, "m_dot_s": m_dot_s, "m_dot_h": m_dot_s * 3600,
+        "v_dot": v_dot, "d_innen_mm": ROHRE_DN[idx][1],
+        "velocity": geschwindigkeit(ROHRE_DN[idx][1], v_dot), "vergleich": vergleich,
+    }
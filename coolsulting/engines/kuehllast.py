@@ -0,0 +1,599 @@
+# ============================================================================
+# DATEI: coolsulting/engines/kuehllast.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Kühllast-Simulation (coolMATH PRO) ohne Streamlit –
+#               6 Methoden als 24h-Profile je Zone plus Geräteempfehlung.
+#               Methoden samt Kern, Beschriftung und Farbe in
+#               METHODEN_REGISTRY; gerechnet werden nur die gewählten.
+#               Rechenkern ist berechne_zonen(): N Zonen auf einmal als
+#               (N × M Methoden × 24 h)-Tensor; die calc_*-Funktionen sind
+#               dünne Hüllen für eine Zone. ZonenSpeicher merkt sich
+#               Profile je Zone (LRU) und führt die Gebäudesumme inkrementell.
+#               berechne_jahr(): dieselben Kerne über 8760 h mit Wetterdatei
+#               (coolsulting.engines.wetter), jahres_auswertung(): kWh,
+#               Vollbenutzungsstunden und Stromkosten je Gerät.
+#               Einstrahlung aus Sonnenstand (coolsulting.engines.sonne) für
+#               beliebige Azimute/Neigungen, Breitengrad und Monat je Zone;
+#               Eckräume mit weiteren Fassaden (``fenster``) je Zone.
+#               parameter_kacheln() + methoden_tensor(): viele Varianten
+#               derselben Zonen in einem Aufruf (Monte-Carlo, Parameterstudien).
+# ============================================================================
+
+from collections import OrderedDict
+
+import numpy as np
+
+from coolsulting.engines import sonne
+from coolsulting.engines.samsung import SEER_STANDARD, find_samsung_device
+from coolsulting.engines.wetter import STUNDEN_JAHR
+from coolsulting.trace import traced
+
+HOURS = np.arange(24)
+
+# Einstrahlung [W/m²] je benannter Ausrichtung am Standard-Standort (51 °N, Juli,
+# wahre Ortszeit) – Auswahlliste der Apps; gerechnet wird über sonne.profile()
+SOLAR_DB = {name: sonne.strahlung(name) for name in sonne.RICHTUNGEN}
+
+# Kennwerte je Gebäudestandard / Glas / Sonnenschutz / Bauweise
+U_WERTE  = {"Altbau": 1.7, "Bestand": 0.8, "Neubau (GEG)": 0.28, "Passivhaus": 0.15}
+G_WERTE  = {"Einfach": 0.85, "Doppel": 0.65, "Dreifach": 0.50, "Sonnenschutz": 0.32}
+FC_WERTE = {"Keine": 1.0, "Vorhang (Innen)": 0.6, "Raffstore (Aussen)": 0.25, "Rollladen": 0.15}
+DELTA_T  = {"Altbau": 9.0, "Bestand": 7.0, "Neubau (GEG)": 5.0, "Passivhaus": 3.0}
+Q_STD    = {"Altbau": 90.0, "Bestand": 75.0, "Neubau (GEG)": 55.0, "Passivhaus": 35.0}
+Q_ORI    = {"SUED": 15, "SUED-OST": 12, "SUED-WEST": 12, "WEST": 8, "OST": 5, "NORD": 0,
+            "NORD-OST": 2, "NORD-WEST": 4, "DACH": 20}
+TAU_BAU  = {"Schwer (Beton/Stein)": 18.0, "Mittel (Ziegel/Holz-Beton)": 10.0, "Leicht (Holz/Trockenbau)": 4.0}
+PHI_BAU  = {"Schwer (Beton/Stein)": 10, "Mittel (Ziegel/Holz-Beton)": 6, "Leicht (Holz/Trockenbau)": 2}
+F_BAU    = {"Schwer (Beton/Stein)": 0.55, "Mittel (Ziegel/Holz-Beton)": 0.70, "Leicht (Holz/Trockenbau)": 0.88}
+
+_TAG = (HOURS >= 8) & (HOURS <= 18)             # Nutzungszeit interne Lasten
+_PRE_COOL = np.where(HOURS <= 6, 0.75, 1.0)     # KI-Hybrid: Vorkühlung nachts
+_ZYKLISCH = (HOURS[:, None] - HOURS[None, :]) % 24   # [h, j] -> Stunde h - j (24h-Zyklus)
+
+# Methoden-Registry: Kürzel (wie g_sums in coolMATH PRO) -> Rechenkern und
+# Darstellung; Reihenfolge = Achse 1 des Tensors. ``kern(p, reck)`` erhält die
+# Recknagel-Basis als Funktion (nur gerechnet, wenn eine aktive Methode sie
+# braucht), ``kern_jahr`` ersetzt den Kern in der Jahressimulation.
+#   name   Anzeige          kurz    Tabellenkopf PDF     spalte  room_results
+#   profil individual_profiles      json    Übergabebericht
+#   farbe/linie  Diagramme (Plotly-Strichart, Breite)    aktiv   Standardauswahl
+METHODEN_REGISTRY = OrderedDict([
+    ("VDI_N", {"name": "VDI 6007 Neu", "kurz": "VDI 6007", "spalte": "VDI NEU",
+               "profil": "vdi_n", "json": "vdi_neu", "farbe": "#36A9E1",
+               "linie": ("solid", 3.5), "aktiv": True,
+               "kern": lambda p, reck: _vdi_filter(reck(), p["tau"]),
+               "kern_jahr": lambda p, reck: _vdi_rekursion(reck(), p["tau"])}),
+    ("VDI_A", {"name": "VDI 2078 Alt", "kurz": "VDI 2078 Alt", "spalte": "VDI ALT",
+               "profil": "vdi_a", "json": "vdi_alt", "farbe": "#F39C12",
+               "linie": ("dash", 2.0), "aktiv": True,
+               "kern": lambda p, reck: reck() * 1.20}),
+    ("PRAK",  {"name": "Praktiker", "kurz": "Praktiker", "spalte": "PRAKTIKER",
+               "profil": "prak", "json": "praktiker", "farbe": "#E74C3C",
+               "linie": ("dashdot", 2.5), "aktiv": True,
+               "kern": lambda p, reck: _praktiker(p)}),
+    ("RECK",  {"name": "Recknagel", "kurz": "Recknagel", "spalte": "RECKNAGEL",
+               "profil": "reck", "json": "recknagel", "farbe": "#3C3C3B",
+               "linie": ("dot", 2.0), "aktiv": True,
+               "kern": lambda p, reck: reck()}),
+    ("KLTS",  {"name": "Kaltluftsee", "kurz": "Kaltl.see", "spalte": "KALTLUFTSEE",
+               "profil": "klts", "json": "kaltluftsee", "farbe": "#9B59B6",
+               "linie": ("dash", 2.0), "aktiv": True,
+               "kern": lambda p, reck: reck() / 1.3}),
+    ("KI",    {"name": "KI-Hybrid", "kurz": "KI-Hybrid", "spalte": "KI HYBRID",
+               "profil": "ki", "json": "ki_hybrid", "farbe": "#1ABC9C",
+               "linie": ("solid", 2.5), "aktiv": True,
+               "kern": lambda p, reck: _ki_hybrid(p)}),
+])
+METHODEN = list(METHODEN_REGISTRY)
+
+# Auslegungsbasis (Samsung-Empfehlung, Monte-Carlo je Zone) – immer gerechnet
+BASIS_METHODE = "VDI_N"
+
+# Zonenparameter in Aufrufreihenfolge der calc_*-Funktionen
+ZONEN_FELDER = ("area", "orient", "standard", "glass", "shade", "pers", "tech",
+                "win_area", "bau_m", "raumhoehe", "breite", "monat", "fenster")
+ZONEN_STANDARD = {"orient": "SUED", "standard": "Bestand", "glass": "Doppel",
+                  "shade": "Vorhang (Innen)", "pers": 0, "tech": 0.0, "win_area": 2.4,
+                  "bau_m": "Mittel (Ziegel/Holz-Beton)", "raumhoehe": 2.5,
+                  "breite": sonne.STANDARD_BREITE, "monat": sonne.STANDARD_MONAT,
+                  "fenster": ()}
+# Weitere Fassaden einer Zone (Eckraum): je Eintrag (orient, win_area, glass, shade)
+FENSTER_FELDER = ("orient", "win_area", "glass", "shade")
+
+
+def get_phys_constants(standard, glass, shade):
+    """Physikalische Konstanten je Gebäudestandard"""
+    return U_WERTE.get(standard, 0.8), G_WERTE.get(glass, 0.65), FC_WERTE.get(shade, 1.0)
+
+
+# ============================================================
+# 1. VEKTORISIERTER RECHENKERN (N Zonen gleichzeitig)
+# ============================================================
+def _zeilen(zonen):
+    """Zonen (dicts, Tupel in ZONEN_FELDER-Reihenfolge oder DataFrame) -> dicts."""
+    if hasattr(zonen, "to_dict"):
+        zonen = zonen.to_dict(orient="records")
+    zeilen = []
+    for z in zonen:
+        if not isinstance(z, dict):
+            z = dict(zip(ZONEN_FELDER, z))
+        z = {**ZONEN_STANDARD, **z}
+        z["orient"] = _orient(z["orient"])
+        z["fenster"] = tuple(_fenster(f) for f in (z["fenster"] or ()))
+        zeilen.append(z)
+    return zeilen
+
+
+def _orient(o):
+    return tuple(o) if isinstance(o, list) else o       # JSON: [Azimut, Neigung]
+
+
+def _fenster(f):
+    """Fassade als dict (FENSTER_FELDER) oder Tupel -> hashbares Tupel."""
+    if isinstance(f, dict):
+        f = [f.get(k, ZONEN_STANDARD[k]) for k in FENSTER_FELDER]
+    orient, win_area, glass, shade = f
+    return _orient(orient), float(win_area), glass, shade
+
+
+def _tabelle(werte, tabelle, standard):
+    """Nachschlagen je eindeutigem Schlüssel statt je Zone."""
+    cache = {k: tabelle.get(k, standard) for k in set(werte)}
+    return np.array([cache[k] for k in werte], dtype=float)
+
+
+def zonen_parameter(zonen):
+    """Zonenliste -> dict von NumPy-Spalten (Länge N) und Fensterflächen (Länge S).
+
+    Jede Zone hat die Hauptfassade (``orient``/``win_area``/``glass``/``shade``)
+    plus die Fassaden aus ``fenster``; alle S Flächen liegen flach, nach Zone
+    sortiert (``fl_*``, Solarprofil S × 24) und werden in den Kernen per
+    np.add.reduceat je Zone summiert. ``orient``: Name, Azimut [°] oder
+    (Azimut, Neigung) – siehe coolsulting.engines.sonne; Einstrahlung nach
+    ``breite``/``monat`` der Zone.
+
+    Die Kerne rechnen über die Zeitachse ``stunde``/``sol``/``dt`` – für die
+    Jahressimulation ersetzt jahres_parameter() diese drei durch 8760 Werte.
+    """
+    zeilen = _zeilen(zonen)
+    spalte = lambda k: [z[k] for z in zeilen]
+    standard, bau_m = spalte("standard"), spalte("bau_m")
+    flaechen = [(i, z["breite"], z["monat"]) + f for i, z in enumerate(zeilen)
+                for f in ((z["orient"], z["win_area"], z["glass"], z["shade"]),) + z["fenster"]]
+    fl = lambda k: [f[k] for f in flaechen]
+    zone = np.array(fl(0), dtype=int)
+    orient = fl(3)
+    p = {
+        "n":         len(zeilen),
+        "area":      np.array(spalte("area"), dtype=float),
+        "pers":      np.array(spalte("pers"), dtype=float),
+        "tech":      np.array(spalte("tech"), dtype=float),
+        "u":         _tabelle(standard, U_WERTE, 0.8),
+        "delta_t":   _tabelle(standard, DELTA_T, 6.0),
+        "q_std":     _tabelle(standard, Q_STD, 75.0),
+        "tau":       _tabelle(bau_m, TAU_BAU, 10.0),
+        "phi":       _tabelle(bau_m, PHI_BAU, 6).astype(int),
+        "f":         _tabelle(bau_m, F_BAU, 0.70),
+        # Fensterflächen (S ≥ N, mindestens eine je Zone)
+        "fl_zone":   zone,
+        "fl_start":  np.flatnonzero(np.r_[True, zone[1:] != zone[:-1]]) if len(zone) else zone,
+        "fl_orient": orient,
+        "fl_breite": fl(1),
+        "fl_win":    np.array(fl(4), dtype=float),
+        "fl_g":      _tabelle(fl(5), G_WERTE, 0.65),
+        "fl_fc":     _tabelle(fl(6), FC_WERTE, 1.0),
+        "fl_q_ori":  _tabelle([sonne.himmelsrichtung(o) for o in orient], Q_ORI, 0),
+        "sol":       sonne.profile(orient, fl(1), fl(2)),   # KeyError bei unbek. Namen
+        "stunde":    HOURS,   # Stunde des Tages je Zeitschritt (Zeitachse der Kerne)
+    }
+    p["dt"] = _spalte(p["delta_t"])   # Temperaturdifferenz: N × 1 (Auslegungstag) oder 1 × T
+    return flaechen_summen(p)
+
+
+def flaechen_summen(p):
+    """Zonenwerte aus den Fensterflächen: Fensterfläche, Orientierungszuschlag
+    und Fc (Praktiker) nach Fensterfläche gewichtet – ohne Fenster zu gleichen
+    Teilen, bei einer Fläche mit Anteil exakt 1. Nach Änderung der ``fl_*``
+    erneut aufrufen."""
+    zone = p["fl_zone"]
+    p["win"] = _je_zone(p, p["fl_win"])
+    anzahl = np.diff(np.r_[p["fl_start"], len(zone)])
+    anteil = np.where(p["win"][zone] > 0, p["fl_win"] / np.where(p["win"] > 0, p["win"], 1.0)[zone],
+                      1.0 / anzahl[zone]) if len(zone) else p["fl_win"]
+    p["q_ori"] = _je_zone(p, anteil * p["fl_q_ori"])
+    p["fc"] = _je_zone(p, anteil * p["fl_fc"])
+    return p
+
+
+_ZONEN_WERTE = ("area", "pers", "tech", "u", "delta_t", "q_std", "tau", "phi", "f")
+_FLAECHEN_WERTE = ("fl_win", "fl_g", "fl_fc", "fl_q_ori")
+
+
+def parameter_kacheln(p, anzahl):
+    """Parameter ``anzahl``-mal hintereinander (Stichproben, Varianten):
+    Zone i der Kopie j wird Zone j·N + i. Die Kopien lassen sich danach
+    einzeln verändern (dann flaechen_summen() aufrufen)."""
+    n, s = p["n"], len(p["fl_zone"])
+    kopie = np.arange(anzahl)[:, None]
+    q = {k: np.tile(p[k], anzahl) for k in _ZONEN_WERTE + _FLAECHEN_WERTE}
+    q.update({
+        "n":        n * anzahl,
+        "fl_zone":  (p["fl_zone"][None, :] + n * kopie).ravel(),
+        "fl_start": (p["fl_start"][None, :] + s * kopie).ravel(),
+        "sol":      np.tile(p["sol"], (anzahl, 1)),
+        "stunde":   p["stunde"],
+    })
+    q["dt"] = _spalte(q["delta_t"]) if p["dt"].shape[1] == 1 else p["dt"]
+    return flaechen_summen(q)
+
+
+def _je_zone(p, x):
+    """Summe über die Fensterflächen je Zone (Achse 0: S -> N)."""
+    return np.add.reduceat(x, p["fl_start"], axis=0) if p["n"] else x[:0]
+
+
+def _spalte(x):
+    return x[:, None]
+
+
+def _recknagel(p):
+    """Q_tr + Q_solar + Q_int, (N × T)."""
+    area, pers, tech = _spalte(p["area"]), _spalte(p["pers"]), _spalte(p["tech"])
+    q_tr = _spalte(p["area"] * p["u"]) * p["dt"]
+    q_st = _je_zone(p, p["sol"] * _spalte(p["fl_win"]) * _spalte(p["fl_g"]) * _spalte(p["fl_fc"]))
+    q_int = np.where(_TAG[p["stunde"]], pers * 100 + tech + area * 8, pers * 50 + tech * 0.1)
+    return q_tr + q_st + q_int
+
+
+def _praktiker(p):
+    q_base = (p["q_std"] + p["q_ori"]) * p["fc"]
+    q_int = (p["pers"] * 100 + p["tech"]) / np.maximum(p["area"], 1)
+    return np.repeat(_spalte(p["area"] * (q_base + q_int)), len(p["stunde"]), axis=1)
+
+
+def _vdi_filter(q_ext, tau):
+    """RC-Tiefpass y[h] = y[h-1] + (x[h] - y[h-1]) / (tau + 1) im periodisch
+    eingeschwungenen Zustand (24h-Zyklus), für alle Zonen gemeinsam.
+
+    Geschlossene Lösung der zyklischen Rekursion mit a = tau / (tau + 1):
+        y[h] = (1 - a) / (1 - a^24) * Σ_j a^j · x[h - j mod 24]
+    – exakt periodisch, auch für schwere Bauweise (tau = 18), wo das frühere
+    Einschwingen über 4 × 24 h noch ~2 % vom Dauerzustand entfernt war.
+    """
+    a = tau / (tau + 1.0)
+    gewichte = a[:, None] ** HOURS[None, :]                     # (N × 24)
+    verlauf = q_ext[:, _ZYKLISCH]                               # (N × 24 × 24)
+    faktor = (1.0 - a) / (1.0 - a ** 24)
+    # Summe je Zeile (nicht einsum): Ergebnis je Zone unabhängig von N
+    return (verlauf * gewichte[:, None, :]).sum(axis=2) * faktor[:, None]
+
+
+def _ki_hybrid(p):
+    # np.roll je Fläche mit der Phasenverschiebung ihrer Zone: sol[(t - phi) % T]
+    schritte, zone = len(p["stunde"]), p["fl_zone"]
+    idx = (np.arange(schritte)[None, :] - _spalte(p["phi"][zone])) % schritte
+    q_sol = _je_zone(p, np.take_along_axis(p["sol"], idx, axis=1) * _spalte(p["f"][zone])
+                     * _spalte(p["fl_win"]) * _spalte(p["fl_g"]) * _spalte(p["fl_fc"]))
+    q_tr = _spalte(p["area"] * p["u"]) * p["dt"]
+    area, pers, tech = _spalte(p["area"]), _spalte(p["pers"]), _spalte(p["tech"])
+    q_int = np.where(_TAG[p["stunde"]], pers * 100 + tech + area * 6, pers * 50 + tech * 0.05)
+    return (q_sol + q_tr + q_int) * _PRE_COOL[p["stunde"]]
+
+
+def aktive_methoden(auswahl=None):
+    """Gewählte Kürzel in Registry-Reihenfolge, BASIS_METHODE immer dabei;
+    ``None`` = alle mit ``aktiv``."""
+    if auswahl is None:
+        auswahl = [m for m, e in METHODEN_REGISTRY.items() if e["aktiv"]]
+    unbekannt = set(auswahl) - set(METHODEN_REGISTRY)
+    if unbekannt:
+        raise ValueError(f"Unbekannte Methode: {', '.join(sorted(unbekannt))}")
+    return [m for m in METHODEN_REGISTRY if m in auswahl or m == BASIS_METHODE]
+
+
+def _kerne(p, methoden, feld="kern"):
+    """Kerne der ``methoden`` je Kürzel; Recknagel-Basis höchstens einmal."""
+    basis = []
+
+    def reck():
+        if not basis:
+            basis.append(_recknagel(p))
+        return basis[0]
+
+    for m in methoden:
+        eintrag = METHODEN_REGISTRY[m]
+        yield eintrag.get(feld, eintrag["kern"])(p, reck)
+
+
+@traced()
+def berechne_zonen(zonen, methoden=None):
+    """Methoden für N Zonen -> Tensor (N × M × 24) [W], Achse 1 = ``methoden``
+    (Standard: alle METHODEN).
+
+    ``zonen``: Liste von dicts (Schlüssel ZONEN_FELDER, fehlende = Standard),
+    Tupel in ZONEN_FELDER-Reihenfolge oder ein pandas DataFrame.
+    """
+    methoden = METHODEN if methoden is None else methoden
+    p = zonen_parameter(zonen)
+    if p["n"] == 0:
+        return np.zeros((0, len(methoden), 24))
+    return methoden_tensor(p, methoden)
+
+
+def methoden_tensor(p, methoden=None):
+    """Methoden aus vorbereiteten Parametern (Auslegungstag) -> (N × M × 24) [W]."""
+    return np.stack(list(_kerne(p, METHODEN if methoden is None else methoden)), axis=1)
+
+
+# ============================================================
+# 2. EINZELZONE (dünne Hüllen um den Rechenkern)
+# ============================================================
+# Die calc_*-Hüllen rechnen EINE Zone mit einer Fassade am Standard-Standort.
+# Für viele Zonen berechne_zonen() bzw. ZonenSpeicher verwenden – ein Aufruf
+# für alle Zonen statt einer Hülle je Zone.
+_EINE_FLAECHE = np.zeros(1, dtype=int)
+
+
+def einzelzone_parameter(area, orient, standard, glass, shade, pers, tech, win_area=0.0,
+                         bau_m="Mittel (Ziegel/Holz-Beton)"):
+    """Wie zonen_parameter() für genau eine Zone mit einer Fassade, aber per
+    Skalar-Nachschlagen (ohne Zeilen-/Flächenaufbereitung und flaechen_summen:
+    bei einer Fläche ist ihr Anteil 1)."""
+    orient = _orient(orient)
+    fc, q_ori = FC_WERTE.get(shade, 1.0), Q_ORI.get(sonne.himmelsrichtung(orient), 0)
+    # ein Array, alle Spalten als Länge-1-Sichten (ein np.array statt zwanzig)
+    w = np.array([area, pers, tech, U_WERTE.get(standard, 0.8), DELTA_T.get(standard, 6.0),
+                  Q_STD.get(standard, 75.0), TAU_BAU.get(bau_m, 10.0), F_BAU.get(bau_m, 0.70),
+                  win_area, G_WERTE.get(glass, 0.65), fc, q_ori], dtype=float)
+    p = {k: w[i:i + 1] for i, k in enumerate(
+        ("area", "pers", "tech", "u", "delta_t", "q_std", "tau", "f", "fl_win", "fl_g", "fl_fc", "fl_q_ori"))}
+    p.update({
+        "n":         1,
+        "phi":       np.array([PHI_BAU.get(bau_m, 6)]),
+        "fl_zone":   _EINE_FLAECHE,
+        "fl_start":  _EINE_FLAECHE,
+        "fl_orient": [orient],
+        "fl_breite": [sonne.STANDARD_BREITE],
+        "sol":       sonne.strahlung(orient)[None, :],
+        "stunde":    HOURS,
+        "dt":        w[4:5, None],
+        "win":       p["fl_win"],
+        "q_ori":     p["fl_q_ori"],
+        "fc":        p["fl_fc"],
+    })
+    return p
+
+
+def _eine_zone(kern, area, orient, standard, glass, shade, pers, tech, win_area=0.0,
+               bau_m="Mittel (Ziegel/Holz-Beton)"):
+    p = einzelzone_parameter(area, orient, standard, glass, shade, pers, tech, win_area, bau_m)
+    return kern(p)[0]
+
+
+def calc_praktiker(area, orient, standard, glass, shade, pers, tech):
+    """METHODE 1: Praktiker (Heuristik) — q-Wert je Standard, Orientierung, Sonnenschutz REDUZIERT"""
+    return _eine_zone(_praktiker, area, orient, standard, glass, shade, pers, tech)
+
+def calc_recknagel(area, orient, standard, glass, shade, pers, tech, win_area):
+    """METHODE 4: Recknagel — Q_tr (dT standard-abh.) + Q_solar + Q_int"""
+    return _eine_zone(_recknagel, area, orient, standard, glass, shade, pers, tech, win_area)
+
+def calc_vdi_alt(reck_curve):
+    """
+    METHODE 2: VDI 2078 Alt (1996)
+    Pauschaler Zuschlag +15-25% auf Recknagel-Basis
+    """
+    return reck_curve * 1.20
+
+
+def calc_vdi_neu(area, orient, standard, glass, shade, pers, tech, win_area, bau_m):
+    """METHODE 3: VDI 6007 — RC-Tiefpass, gleiche Eingangslast wie Recknagel"""
+    p = einzelzone_parameter(area, orient, standard, glass, shade, pers, tech, win_area, bau_m)
+    return _vdi_filter(_recknagel(p), p["tau"])[0]
+
+
+def calc_kaltluftsee(area, orient, standard, glass, shade, pers, tech, win_area, bau_m, raumhoehe=2.5):
+    """METHODE 5: Kaltluftsee — Recknagel / epsilon (eps=1.3 → 23% Reduktion)"""
+    return calc_recknagel(area, orient, standard, glass, shade, pers, tech, win_area) / 1.3
+
+
+def calc_ki_hybrid(area, orient, standard, glass, shade, pers, tech, win_area, bau_m):
+    """METHODE 6: KI-Hybrid — Phasenverschiebung + Daempfung + Pre-Cooling"""
+    return _eine_zone(_ki_hybrid, area, orient, standard, glass, shade, pers, tech, win_area, bau_m)
+
+
+def zone_profile(area, orient, standard, glass, shade, pers, tech, win_area, bau_m, raumhoehe=2.5,
+                 breite=sonne.STANDARD_BREITE, monat=sonne.STANDARD_MONAT, fenster=()):
+    """Alle 6 Methoden für eine Zone als dict Kürzel -> 24h-Profil [W]."""
+    tensor = berechne_zonen([(area, orient, standard, glass, shade, pers, tech,
+                              win_area, bau_m, raumhoehe, breite, monat, fenster)])
+    return dict(zip(METHODEN, tensor[0]))
+
+
+@traced()
+def zone_berechnen(area, orient="SUED", standard="Bestand", glass="Doppel",
+                   shade="Vorhang (Innen)", pers=0, tech=0.0, win_area=2.4,
+                   bau_m="Mittel (Ziegel/Holz-Beton)", raumhoehe=2.5, serie=None,
+                   breite=sonne.STANDARD_BREITE, monat=sonne.STANDARD_MONAT, fenster=()):
+    """Spitzenlasten [W] je Methode und Samsung-Empfehlung (Basis VDI 6007).
+
+    ``orient``: Name, Azimut [°] oder [Azimut, Neigung]; ``breite`` [°N] und
+    ``monat`` bestimmen den Sonnenstand. ``fenster``: weitere Fassaden als
+    Liste von dicts (orient, win_area, glass, shade).
+    """
+    profile = zone_profile(area, orient, standard, glass, shade, pers, tech,
+                           win_area, bau_m, raumhoehe, breite, monat, fenster)
+    spitzen = {k: int(np.max(v)) for k, v in profile.items()}
+    primary, alt = find_samsung_device(spitzen["VDI_N"], serie=serie)
+    return {
+        "spitzen_w": spitzen,
+        "stunde_max": int(np.argmax(profile["VDI_N"])),
+        "geraet": primary["model"], "geraet_kw": primary["cool_kw"],
+        "geraet_art_nr": primary["art_nr"], "geraet_preis": primary["preis"],
+        "alternative": alt["model"] if alt else "",
+    }
+
+
+# ============================================================
+# 3. INKREMENTELL (Memo je Zone + laufende Gebäudesumme)
+# ============================================================
+class ZonenSpeicher:
+    """Profile (M × 24, M = ``methoden``) je Zone, gemerkt nach Eingabeparametern
+    (LRU), und die Gebäudesumme als laufende Summe der Zonen-Deltas.
+
+    Ein Rerun rechnet nur Zonen, deren Parameter-Tupel (ZONEN_FELDER-Reihenfolge,
+    auch verkürzt) noch nicht im Cache
+    ist; die Summe wird nur um geänderte, neue und entfernte Zonen korrigiert.
+    """
+
+    NEUSUMME_NACH = 256   # Deltas bis zur vollständigen Neusummierung (Rundung)
+
+    def __init__(self, max_eintraege=2048, methoden=None):
+        self.max_eintraege = max_eintraege
+        self.methoden = list(METHODEN if methoden is None else methoden)
+        self._lru = OrderedDict()        # Parameter-Tupel -> Profile (M × 24)
+        self._zonen = {}                 # Zonen-Schlüssel -> (Parameter, Profile)
+        self._deltas = 0
+        self.summe = np.zeros((len(self.methoden), 24))
+        self.gerechnet = 0               # im letzten Aufruf neu gerechnete Zonen
+
+    def _merken(self, param, profile):
+        self._lru[param] = profile
+        self._lru.move_to_end(param)
+        while len(self._lru) > self.max_eintraege:
+            self._lru.popitem(last=False)
+
+    @traced("kuehllast.ZonenSpeicher.aktualisieren")
+    def aktualisieren(self, zonen):
+        """``zonen``: Liste (Schlüssel, Parameter-Tupel) -> Profile je Zone (gleiche Reihenfolge)."""
+        zonen = [(k, tuple(param)) for k, param in zonen]
+        bekannt = {param: profile for param, profile in self._zonen.values()}
+        offen = []
+        for _, param in zonen:
+            if param in self._lru:
+                self._lru.move_to_end(param)
+            elif param not in bekannt and param not in offen:
+                offen.append(param)
+        neu = dict(zip(offen, berechne_zonen(offen, self.methoden))) if offen else {}
+        for param, profile in neu.items():
+            self._merken(param, profile)
+        self.gerechnet = len(offen)
+
+        aktuell = {k for k, _ in zonen}
+        for k in [k for k in self._zonen if k not in aktuell]:
+            self.summe -= self._zonen.pop(k)[1]
+            self._deltas += 1
+        ergebnis = []
+        for k, param in zonen:
+            profile = neu.get(param)
+            if profile is None:
+                profile = self._lru.get(param)
+            if profile is None:
+                profile = bekannt[param]
+            alt = self._zonen.get(k)
+            if alt is None or alt[0] != param:
+                self.summe += profile - (alt[1] if alt else 0.0)
+                self._zonen[k] = (param, profile)
+                self._deltas += 1
+            ergebnis.append(profile)
+
+        if self._deltas >= self.NEUSUMME_NACH:
+            self.summe = sum((p for _, p in self._zonen.values()), np.zeros_like(self.summe))
+            self._deltas = 0
+        return ergebnis
+
+    def summen(self):
+        """Gebäudesumme je Methode als dict Kürzel -> 24h-Profil [W] (Kopien)."""
+        return {m: self.summe[j].copy() for j, m in enumerate(self.methoden)}
+
+
+# ============================================================
+# 4. JAHRESSIMULATION (8760 h, Wetterdatei)
+# ============================================================
+T_INNEN = 26.0          # Raumsolltemperatur Kühlfall [°C]
+STROMPREIS = 0.30       # EUR/kWh
+
+
+def _fassaden_strahlung(orientierungen, breiten, wetter):
+    """Einstrahlung je Fensterfläche (S × 8760) [W/m²].
+
+    Klarhimmel-Einstrahlung der Fläche (Monat, Stunde) × Klarheit der Stunde
+    (gemessene / Klarhimmel-Globalstrahlung horizontal, höchstens 1).
+    """
+    monat, stunde = wetter["monat"] - 1, wetter["stunde"]
+    klarheit = {}
+    for b in set(breiten):
+        bezug = sonne.globalstrahlung_klar(b)[monat, stunde]
+        klarheit[b] = np.clip(np.divide(wetter["global_h"], bezug, out=np.zeros(STUNDEN_JAHR),
+                                        where=bezug > 1.0), 0.0, 1.0)
+    schluessel = list(zip(orientierungen, breiten))
+    sol = {}
+    for o, b in set(schluessel):
+        klar = np.array([sonne.strahlung(o, b, m) for m in range(1, 13)])
+        sol[o, b] = klar[monat, stunde] * klarheit[b]
+    return np.array([sol[k] for k in schluessel]).reshape(len(schluessel), STUNDEN_JAHR)
+
+
+def jahres_parameter(zonen, wetter, t_innen=T_INNEN):
+    """Wie zonen_parameter(), Zeitachse = 8760 h aus ``wetter`` (``monat`` der Zonen entfällt)."""
+    p = zonen_parameter(zonen)
+    p["sol"] = _fassaden_strahlung(p["fl_orient"], p["fl_breite"], wetter)
+    p["dt"] = (wetter["temp"] - t_innen)[None, :]
+    p["stunde"] = wetter["stunde"]
+    return p
+
+
+def _vdi_rekursion(q_ext, tau):
+    """RC-Tiefpass über die Zeitachse; Startwert = eingeschwungener erster Tag."""
+    k = tau + 1.0
+    q_t = np.ascontiguousarray(q_ext.T)
+    y_t = np.empty_like(q_t)
+    y = _vdi_filter(q_ext[:, :24], tau)[:, -1]
+    for t in range(len(q_t)):
+        y = y + (q_t[t] - y) / k
+        y_t[t] = y
+    return y_t.T
+
+
+@traced()
+def berechne_jahr(zonen, wetter, methode="VDI_N", t_innen=T_INNEN):
+    """Stündliche Kühllast einer Methode für N Zonen -> (N × 8760) [W]."""
+    if methode not in METHODEN:
+        raise ValueError(f"Unbekannte Methode: {methode}")
+    p = jahres_parameter(zonen, wetter, t_innen)
+    if p["n"] == 0:
+        return np.zeros((0, STUNDEN_JAHR))
+    return next(_kerne(p, [methode], "kern_jahr"))
+
+
+def jahres_auswertung(lasten_w, geraet_kw, seer=SEER_STANDARD, strompreis=STROMPREIS,
+                      monat=None):
+    """Jahreskennzahlen je Zone aus stündlichen Lasten (N × 8760) [W].
+
+    Gedeckt wird höchstens die Geräteleistung; ``seer`` und ``geraet_kw`` je
+    Zone oder als ein Wert. Liefert dict von Arrays (Länge N), mit ``monat``
+    zusätzlich die gedeckte Kühlenergie des Gebäudes je Monat [kWh].
+    """
+    last = np.clip(lasten_w, 0.0, None)
+    n = len(last)
+    kap_w = np.broadcast_to(np.asarray(geraet_kw, dtype=float), (n,)) * 1000
+    seer = np.broadcast_to(np.asarray(seer, dtype=float), (n,))
+    gedeckt = np.minimum(last, kap_w[:, None])
+    bedarf_kwh = last.sum(axis=1) / 1000
+    kaelte_kwh = gedeckt.sum(axis=1) / 1000
+    strom_kwh = np.divide(kaelte_kwh, seer, out=np.zeros(n), where=seer > 0)
+    ergebnis = {
+        "bedarf_kwh":   bedarf_kwh,
+        "kaelte_kwh":   kaelte_kwh,
+        "strom_kwh":    strom_kwh,
+        "kosten_eur":   strom_kwh * strompreis,
+        "vbh_h":        np.divide(kaelte_kwh, kap_w / 1000, out=np.zeros(n), where=kap_w > 0),
+        "ueberlast_h":  (last > kap_w[:, None]).sum(axis=1),
+        "spitze_w":     last.max(axis=1) if n else np.zeros(0),
+    }
+    if monat is not None:
+        ergebnis["monat_kwh"] = np.bincount(monat - 1, weights=gedeckt.sum(axis=0),
+                                            minlength=12) / 1000
+    return ergebnis
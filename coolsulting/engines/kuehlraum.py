@@ -0,0 +1,45 @@
+# ============================================================================
+# DATEI: coolsulting/engines/kuehlraum.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Kühlraumlast (°coolTEC) ohne Streamlit – Transmission,
+#               Warenabkühlung, 15 % Zuschlag, Umrechnung auf Laufzeit.
+# ============================================================================
+
+from coolsulting.trace import traced
+
+LAMBDA_DAEMMUNG = 0.022      # W/mK (PUR-Paneel)
+ZUSCHLAG = 1.15              # Türöffnung, Personen, Licht, Abtauung
+
+
+def u_wert(damm_mm):
+    """U-Wert des Paneels in W/m²K aus der Dämmstärke."""
+    return round(LAMBDA_DAEMMUNG / (damm_mm / 1000), 3)
+
+
+@traced()
+def raumlast(laenge, breite, hoehe, t_raum, damm_mm=100, t_umg=25.0,
+             t_decke=30.0, t_boden=12.0, laufzeit=18, ware_kg_m2=80.0,
+             dt_ware=15.0):
+    """Kältebedarf eines Kühlraums (Leistungen in W, Energie in kWh/Tag)."""
+    u_val = u_wert(damm_mm)
+    a_decke, a_wand, is_tk = laenge * breite, 2 * (laenge + breite) * hoehe, t_raum < 0
+    q_wand = u_val * a_wand * (t_umg - t_raum)
+    q_decke = u_val * a_decke * (t_decke - t_raum)
+    u_bod = u_val if is_tk else 1.5
+    q_boden = u_bod * a_decke * (t_boden - t_raum)
+    q_trans = max(0, q_wand + q_decke + q_boden)
+    m_ware = ware_kg_m2 * a_decke
+    c_ware = 1.7 if is_tk else 3.2
+    q_ware_24h = (m_ware * c_ware * dt_ware * 1000) / (24 * 3600)
+    q_sum_24h = (q_trans + q_ware_24h) * ZUSCHLAG
+    q_bedarf = q_sum_24h * (24 / laufzeit)
+    return {
+        "u_wert": u_val, "flaeche": a_decke, "volumen": a_decke * hoehe,
+        "q_wand": q_wand, "q_decke": q_decke, "q_boden": q_boden,
+        "q_trans": q_trans, "m_ware": m_ware, "q_ware_24h": q_ware_24h,
+        "q_zuschlag": q_sum_24h * (ZUSCHLAG - 1),
+        "q_sum_24h": q_sum_24h, "q_bedarf": q_bedarf,
+        "energie_kwh_tag": q_sum_24h * 24 / 1000,
+    }
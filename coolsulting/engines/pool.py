@@ -0,0 +1,104 @@
+# ============================================================================
+# DATEI: coolsulting/engines/pool.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Pool-Temperierung (°coolPOOL) ohne Streamlit – Klimaprofil,
+#               Oberflächen-/Hüllverluste, Aufheizung und 24h-Simulation.
+# ============================================================================
+
+from coolsulting.trace import traced
+
+MONATE = ["Jan", "Feb", "Mär", "Apr", "Mai", "Jun", "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"]
+
+REGIONAL_CLIMATE = {
+    "1xxx (Wien/Ost)":        {"Tag": [3.5, 5.8, 11.2, 16.5, 21.8, 24.9, 27.2, 26.9, 21.5, 15.4,  8.5, 4.2],
+                               "Nacht": [-1.2, -0.2, 3.1, 7.2, 11.8, 15.1, 17.0, 16.8, 12.5, 8.1, 3.2, 0.1]},
+    "4xxx (OÖ/Zentralraum)":  {"Tag": [2.9, 5.1, 10.3, 15.2, 20.5, 23.4, 25.6, 25.4, 20.3, 14.2,  7.5, 4.0],
+                               "Nacht": [-2.0, -0.9, 2.4, 5.8, 10.5, 13.5, 15.4, 15.3, 11.7, 7.0, 2.4, -0.5]},
+    "5xxx (Salzburg/Alpin)":  {"Tag": [2.5, 4.8,  9.8, 14.8, 19.8, 22.8, 24.9, 24.7, 19.8, 13.8,  7.1, 3.2],
+                               "Nacht": [-2.5, -1.5, 1.8, 5.4,  9.8, 13.1, 14.9, 14.8, 11.2, 6.5, 2.0, -1.2]},
+    "8xxx (Steiermark)":      {"Tag": [3.4, 5.7, 10.9, 16.1, 21.3, 24.3, 26.5, 26.2, 21.0, 15.0,  8.2, 4.0],
+                               "Nacht": [-2.2, -1.1, 2.1, 6.1, 10.7, 13.9, 15.8, 15.6, 11.5, 7.2, 2.3, -0.8]},
+}
+
+WIND_FAKTOR = {"Gering": 1.2, "Mäßig": 3.0, "Stark": 5.8}
+C_WASSER = 1.162            # kWh/(m³·K)
+
+
+def klimaprofil(region, hoehe):
+    """Monatsmittel Tag/Nacht, korrigiert um ~0,65 K je 100 m über 300 m."""
+    lapse = ((hoehe - 300) / 100) * 0.65
+    base_k = REGIONAL_CLIMATE[region]
+    return ([round(t - lapse, 1) for t in base_k["Tag"]],
+            [round(n - lapse, 1) for n in base_k["Nacht"]])
+
+
+def verluste(flaeche, tiefe, wind, decke, t_luft, t_soll):
+    """(Oberflächen-, Hüllverlust) in kW."""
+    dt = max(0.0, t_soll - t_luft)
+    surf = flaeche * (0.004 + 0.003 * WIND_FAKTOR[wind]) * dt * 0.62 * (0.15 if decke else 1.0)
+    hull = flaeche * tiefe * 0.0015 * (t_soll - 10.0)
+    return surf, hull
+
+
+@traced()
+def aufheizung(volumen, t_soll, t_start, leistung_kw, verlust_kw=0.0):
+    """Energie [kWh] und Dauer [h] (None = Gerät zu schwach)."""
+    energie = volumen * C_WASSER * (t_soll - t_start)
+    netto = leistung_kw * 0.9 - verlust_kw
+    stunden = energie / netto if netto > 0 and leistung_kw > 0 else None
+    return {"energie_kwh": energie, "netto_kw": netto, "stunden": stunden}
+
+
+def ist_heizstunde(hr, tag_von, tag_bis, nacht_on, nacht_von, nacht_bis):
+    is_tag = tag_von <= hr < tag_bis
+    # Nacht: über Mitternacht (z.B. 22→6)
+    if nacht_von > nacht_bis:
+        is_nacht = hr >= nacht_von or hr < nacht_bis
+    else:
+        is_nacht = nacht_von <= hr < nacht_bis
+    return is_tag or (nacht_on and is_nacht)
+
+
+@traced()
+def simulation_24h(flaeche, tiefe, wind, decke, leistung_kw, t_soll, t_soll_n,
+                   t_luft_tag, t_luft_nacht, tag_von=6, tag_bis=22,
+                   nacht_on=True, nacht_von=22, nacht_bis=6):
+    """Stündlicher Wassertemperaturverlauf und Verlustprofil über 24 h."""
+    volumen = flaeche * tiefe
+    temps, power_grid = [t_soll], []
+    for hr in range(24):
+        is_heiz = ist_heizstunde(hr, tag_von, tag_bis, nacht_on, nacht_von, nacht_bis)
+        t_now = t_soll if (6 <= hr < 18) else t_soll_n
+        at_now = t_luft_tag if (6 <= hr < 18) else t_luft_nacht
+        ls_sum = sum(verluste(flaeche, tiefe, wind, decke, at_now, t_now))
+        power_grid.append(ls_sum)
+        gain = (leistung_kw * 0.9 - ls_sum) if is_heiz else -ls_sum
+        new_t = temps[-1] + (gain / (volumen * C_WASSER))
+        temps.append(min(t_now, new_t))
+    return temps, power_grid
+
+
+@traced()
+def pool_analyse(laenge, breite, tiefe, region, hoehe=380, wind="Mäßig",
+                 decke=False, leistung_kw=0.0, t_soll=26.0, t_soll_n=26.0,
+                 monat_von="Apr", monat_bis="Okt", t_fill=11.0):
+    """Kompakte Gesamtauswertung (wie Phase 1–4 in °coolPOOL)."""
+    flaeche, volumen = laenge * breite, laenge * breite * tiefe
+    adj_tag, adj_nacht = klimaprofil(region, hoehe)
+    idx_s, idx_e = MONATE.index(monat_von), MONATE.index(monat_bis)
+    worst_at = min(adj_tag[idx_s:idx_e + 1] + adj_nacht[idx_s:idx_e + 1])
+    ls_t = verluste(flaeche, tiefe, wind, decke, adj_tag[idx_s], t_soll)
+    ls_n = verluste(flaeche, tiefe, wind, decke, adj_nacht[idx_s], t_soll_n)
+    worst_losses = sum(verluste(flaeche, tiefe, wind, decke, worst_at, t_soll))
+    temps, _ = simulation_24h(flaeche, tiefe, wind, decke, leistung_kw, t_soll, t_soll_n,
+                              adj_tag[idx_s], adj_nacht[idx_s])
+    return {
+        "flaeche": flaeche, "volumen": volumen, "worst_at": worst_at,
+        "verlust_tag_kw": sum(ls_t), "verlust_nacht_kw": sum(ls_n),
+        "erhaltungsleistung_kw": worst_losses * 1.2,
+        "aufheizung_worst": aufheizung(volumen, t_soll, 11.0, leistung_kw, worst_losses),
+        "erstbefuellung": aufheizung(volumen, t_soll, t_fill, leistung_kw),
+        "temps_24h": temps[1:],
+    }
@@ -0,0 +1,322 @@
+# ============================================================================
+# DATEI: coolsulting/engines/produkte.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Gemeinsame Samsung-Produktdatenbank für coolMATH PRO,
+#               coolNEIGHBOR und Samsung Quint – EIN Datensatz je
+#               Artikelnummer mit Leistung, Preis, Schalldaten und
+#               Abmessungen, einmal je Prozess aufgebaut (produkte()).
+#
+#   Quellen (je Feld die erste vorhandene):
+#     Listenpreis   Preisliste (coolsulting.preisliste), sonst Tabellen
+#     übrige Felder Tabellen (samsung.py, SCHALL_AG, QUINT_*), fehlende
+#                   Werte aus der Preisliste ergänzt
+#
+#   produkte().get("AR70F09C1AWX/EU")  -> dict | None   (O(1))
+#   produkte().schall("AJ040TXJ2KG/EU")  -> dict | None (nur mit Lw)
+#   schall_pruefung(art_nrn, 5.0, 35.0)   -> Pegel der gewählten AGs am Nachbarn
+# ============================================================================
+
+from collections import Counter
+from functools import lru_cache
+
+from coolsulting.engines.samsung import FJM_AG, RAC_AG_BY_SERIE, SAMSUNG_SERIEN
+from coolsulting.engines.schall import freifeld_pegel, log_add
+from coolsulting.preisliste import preisliste, schluessel
+from coolsulting.trace import traced
+
+FELDER = ("art_nr", "bez", "typ", "serie", "gruppe", "kuehl_kw", "heiz_kw", "preis", "ports",
+          "abmessungen", "gewicht_kg", "lw", "lp_1m", "luft_m3h", "lp_oktav", "schall_serie")
+
+
+# ============================================================
+# 1. SCHALLDATEN AUSSENGERÄTE (°coolNEIGHBOR)
+# ============================================================
+# Quellen:
+#   RAC Single Split: Samsung TDB RAC R32 NASA Single Split 2025, Ver 1.0, Dez 2024
+#   FJM Multi Split:  Samsung TDB Free Joint Multi R32 Europe 2025, Ver 1.0
+# lw = Schallleistungspegel dB(A) Außeneinheit, Cooling
+# lp_oktav = [63, 125, 250, 500, 1000, 2000, 4000, 8000 Hz] aus NR-Kurvenanalyse
+# kw = Nennleistung laut TDB (nur falls keine andere Quelle)
+SCHALL_AG = {
+    "Samsung RAC Elite (AR9500T)": {
+        "AR70F09CAAWX/EU": {"kw": 2.5, "lw": 59, "lp_1m": 45, "luft_m3h": 1800, "gewicht_kg": 30.7,
+            "lp_oktav": [46, 44, 40, 36, 32, 27, 20, 12]},
+        "AR70F12CAAWX/EU": {"kw": 3.5, "lw": 62, "lp_1m": 46, "luft_m3h": 1800, "gewicht_kg": 30.7,
+            "lp_oktav": [48, 46, 42, 38, 34, 29, 22, 14]},
+    },
+    "Samsung RAC Avant (AR7500T)": {
+        "AR70F07C1AWX/EU": {"kw": 2.0, "lw": 59, "lp_1m": 45, "luft_m3h": 1740, "gewicht_kg": 30.7,
+            "lp_oktav": [46, 44, 40, 36, 32, 27, 20, 12]},
+        "AR70F09C1AWX/EU": {"kw": 2.5, "lw": 59, "lp_1m": 45, "luft_m3h": 1740, "gewicht_kg": 30.7,
+            "lp_oktav": [46, 44, 40, 36, 32, 27, 20, 12]},
+        "AR70F12C1AWX/EU": {"kw": 3.5, "lw": 62, "lp_1m": 46, "luft_m3h": 1740, "gewicht_kg": 30.7,
+            "lp_oktav": [48, 46, 42, 38, 34, 29, 22, 14]},
+        "AR70F15C1AWX/EU": {"kw": 4.2, "lw": 65, "lp_1m": 48, "luft_m3h": 2820, "gewicht_kg": 36.8,
+            "lp_oktav": [51, 49, 45, 41, 37, 32, 25, 17]},
+        "AR70F18C1AWX/EU": {"kw": 5.0, "lw": 65, "lp_1m": 51, "luft_m3h": 2820, "gewicht_kg": 36.8,
+            "lp_oktav": [53, 51, 47, 43, 39, 34, 27, 19]},
+        "AR70F24C1AWX/EU": {"kw": 6.8, "lw": 68, "lp_1m": 54, "luft_m3h": 3420, "gewicht_kg": 38.6,
+            "lp_oktav": [56, 54, 50, 46, 42, 37, 30, 22]},
+    },
+    "Samsung RAC Comfort (AR6000T)": {
+        "AR60F09C1AWX/EU": {"kw": 2.5, "lw": 63, "lp_1m": 45, "luft_m3h": 2400, "gewicht_kg": 24.0,
+            "lp_oktav": [46, 44, 40, 37, 33, 28, 21, 13]},
+        "AR60F12C1AWX/EU": {"kw": 3.5, "lw": 63, "lp_1m": 46, "luft_m3h": 2400, "gewicht_kg": 24.0,
+            "lp_oktav": [48, 46, 42, 38, 34, 29, 22, 14]},
+        "AR60F18C1AWX/EU": {"kw": 5.0, "lw": 65, "lp_1m": 51, "luft_m3h": 3000, "gewicht_kg": 36.8,
+            "lp_oktav": [53, 51, 47, 43, 39, 34, 27, 19]},
+        "AR60F24C1AWX/EU": {"kw": 6.8, "lw": 68, "lp_1m": 54, "luft_m3h": 3600, "gewicht_kg": 38.6,
+            "lp_oktav": [56, 54, 50, 46, 42, 37, 30, 22]},
+    },
+    # AR50 = Standard-RAC (NICHT Wind-Free! Wind-Free ist eine Inneneinheitstechnologie)
+    "Samsung RAC Standard (AR5000T)": {
+        "AR50F07C1AHX/EU": {"kw": 2.0, "lw": 60, "lp_1m": 45, "luft_m3h": 1800, "gewicht_kg": 24.0,
+            "lp_oktav": [46, 44, 40, 37, 33, 28, 21, 13]},
+        "AR50F09C1AHX/EU": {"kw": 2.5, "lw": 63, "lp_1m": 45, "luft_m3h": 1800, "gewicht_kg": 24.0,
+            "lp_oktav": [46, 44, 40, 37, 33, 28, 21, 13]},
+        "AR50F12C1AHX/EU": {"kw": 3.5, "lw": 63, "lp_1m": 46, "luft_m3h": 1800, "gewicht_kg": 24.4,
+            "lp_oktav": [48, 46, 42, 38, 34, 29, 22, 14]},
+        "AR50F15C1AHX/EU": {"kw": 4.2, "lw": 65, "lp_1m": 48, "luft_m3h": 2400, "gewicht_kg": 30.7,
+            "lp_oktav": [51, 49, 45, 41, 37, 32, 25, 17]},
+        "AR50F18C1AHX/EU": {"kw": 5.0, "lw": 65, "lp_1m": 51, "luft_m3h": 2400, "gewicht_kg": 36.8,
+            "lp_oktav": [53, 51, 47, 43, 39, 34, 27, 19]},
+        "AR50F24C1AHX/EU": {"kw": 6.8, "lw": 68, "lp_1m": 54, "luft_m3h": 3000, "gewicht_kg": 38.6,
+            "lp_oktav": [56, 54, 50, 46, 42, 37, 30, 22]},
+    },
+    # ── FJM MULTI-SPLIT AUSSENEINHEITEN (Lw aus Spezifikations-Tabelle) ──
+    "Samsung FJM Multi-Split (AJ-Ausseneinheit)": {
+        "AJ040TXJ2KG/EU": {"kw": 4.0, "lw": 61, "lp_1m": 45, "luft_m3h": 1860, "gewicht_kg": 33.0,
+            "lp_oktav": [48, 46, 42, 38, 34, 29, 22, 14]},
+        "AJ050TXJ2KG/EU": {"kw": 5.0, "lw": 61, "lp_1m": 45, "luft_m3h": 2100, "gewicht_kg": 37.0,
+            "lp_oktav": [48, 46, 42, 38, 34, 29, 22, 14]},
+        "AJ052TXJ3KG/EU": {"kw": 5.2, "lw": 61, "lp_1m": 45, "luft_m3h": 2100, "gewicht_kg": 44.0,
+            "lp_oktav": [48, 46, 42, 38, 34, 29, 22, 14]},
+        "AJ068TXJ3KG/EU": {"kw": 6.8, "lw": 64, "lp_1m": 48, "luft_m3h": 2520, "gewicht_kg": 57.5,
+            "lp_oktav": [51, 49, 45, 41, 37, 32, 25, 17]},
+        "AJ080TXJ4KG/EU": {"kw": 8.0, "lw": 66, "lp_1m": 50, "luft_m3h": 3480, "gewicht_kg": 70.0,
+            "lp_oktav": [53, 51, 47, 43, 39, 34, 27, 19]},
+        "AJ100TXJ5KG/EU": {"kw": 10.0, "lw": 70, "lp_1m": 54, "luft_m3h": 4020, "gewicht_kg": 76.5,
+            "lp_oktav": [57, 55, 51, 47, 43, 38, 31, 23]},
+    },
+}
+
+
+# ============================================================
+# 2. SAMSUNG QUINT (EHS-Außengeräte, Hydro Units, DVM-Innengeräte)
+# ============================================================
+QUINT_AUSSENGERAETE = {
+    "ODU 12.5 kW (1-phasig)": {
+        "artikelnr": "AE125HCTPES/EU", "kuehl_kw": 12.5, "heiz_kw": 12.5,
+        "schall_db": "51 / 49", "schallleistung_db": 62,
+        "abmessungen": "1270 × 850 × 500", "gewicht_kg": 126.5,
+        "spannung": "230V / 1Ph", "mca_a": 32.0, "phase": "1-phasig",
+    },
+    "ODU 16.0 kW (1-phasig)": {
+        "artikelnr": "AE160HCTPES/EU", "kuehl_kw": 14.5, "heiz_kw": 16.0,
+        "schall_db": "55 / 49", "schallleistung_db": 62,
+        "abmessungen": "1270 × 850 × 500", "gewicht_kg": 126.5,
+        "spannung": "230V / 1Ph", "mca_a": 32.0, "phase": "1-phasig",
+    },
+    "ODU 12.5 kW (3-phasig)": {
+        "artikelnr": "AE125HCTPGS/EU", "kuehl_kw": 12.5, "heiz_kw": 12.5,
+        "schall_db": "51 / 49", "schallleistung_db": 62,
+        "abmessungen": "1270 × 850 × 500", "gewicht_kg": 126.5,
+        "spannung": "400V / 3Ph", "mca_a": 16.1, "phase": "3-phasig",
+    },
+    "ODU 16.0 kW (3-phasig)": {
+        "artikelnr": "AE160HCTPGS/EU", "kuehl_kw": 14.5, "heiz_kw": 16.0,
+        "schall_db": "55 / 49", "schallleistung_db": 62,
+        "abmessungen": "1270 × 850 × 500", "gewicht_kg": 126.5,
+        "spannung": "400V / 3Ph", "mca_a": 16.1, "phase": "3-phasig",
+    },
+}
+
+QUINT_HYDRO_UNITS = {
+    "ClimateHub 200L – 1 Zone": {
+        "artikelnr": "AE200DNWMPK/EU", "zonen": 1, "typ": "ClimateHub",
+        "speicher_l": 200, "schall_db": 28, "schallleistung_db": 42,
+        "abmessungen": "598 × 1850 × 600", "gewicht_kg": 132,
+        "spannung": "230V / 400V", "mca_a": 18.3,
+        "beschreibung": "Standgerät mit integriertem 200L Warmwasserspeicher – 1 Heizkreis",
+    },
+    "ClimateHub 200L – 2 Zonen": {
+        "artikelnr": "AE200DNXMPK/EU", "zonen": 2, "typ": "ClimateHub",
+        "speicher_l": 200, "schall_db": 30, "schallleistung_db": 44,
+        "abmessungen": "598 × 1850 × 600", "gewicht_kg": 139,
+        "spannung": "230V / 400V", "mca_a": 18.7,
+        "beschreibung": "Standgerät mit integriertem 200L Speicher – 2 Heizkreise",
+    },
+    "Hydro Unit – 1 Zone": {
+        "artikelnr": "AE160DNYMPK/EU", "zonen": 1, "typ": "Hydro Unit",
+        "speicher_l": 0, "schall_db": 28, "schallleistung_db": 42,
+        "abmessungen": "530 × 840 × 350", "gewicht_kg": 43,
+        "spannung": "230V / 400V", "mca_a": 18.3,
+        "beschreibung": "Kompakte Wandmontage, externer Speicher nötig – 1 Heizkreis",
+    },
+    "Hydro Unit – 2 Zonen": {
+        "artikelnr": "AE160DNZMPK/EU", "zonen": 2, "typ": "Hydro Unit",
+        "speicher_l": 0, "schall_db": 30, "schallleistung_db": 44,
+        "abmessungen": "530 × 840 × 350", "gewicht_kg": 54,
+        "spannung": "230V / 400V", "mca_a": 18.7,
+        "beschreibung": "Kompakte Wandmontage, externer Speicher nötig – 2 Heizkreise",
+    },
+}
+
+QUINT_INNENGERAETE = {
+    "DVM Wandgerät 1.5 kW":  {"artikelnr": "AE015HEADKG/EU",  "kategorie": "DVM Wandgerät",  "kuehl_kw": 1.5, "heiz_kw": 1.7, "schall_db": "31/30/29", "abmessungen": "682×299×215",  "gewicht_kg": 7.8,  "mca_a": 0.16},
+    "DVM Wandgerät 2.2 kW":  {"artikelnr": "AE022HEADKG/EU",  "kategorie": "DVM Wandgerät",  "kuehl_kw": 2.2, "heiz_kw": 2.5, "schall_db": "33/31/29", "abmessungen": "682×299×215",  "gewicht_kg": 7.8,  "mca_a": 0.20},
+    "DVM Wandgerät 2.8 kW":  {"artikelnr": "AE028HEADKG/EU",  "kategorie": "DVM Wandgerät",  "kuehl_kw": 2.8, "heiz_kw": 3.2, "schall_db": "34/33/31", "abmessungen": "820×299×215",  "gewicht_kg": 9.2,  "mca_a": 0.25},
+    "DVM Wandgerät 3.6 kW":  {"artikelnr": "AE036HEADKG/EU",  "kategorie": "DVM Wandgerät",  "kuehl_kw": 3.6, "heiz_kw": 4.0, "schall_db": "39/36/33", "abmessungen": "820×299×215",  "gewicht_kg": 9.2,  "mca_a": 0.31},
+    "DVM Wandgerät 5.6 kW":  {"artikelnr": "AM056DNVDKG/EU",  "kategorie": "DVM Wandgerät",  "kuehl_kw": 5.6, "heiz_kw": 6.3, "schall_db": "40/37/34", "abmessungen": "1055×299×215", "gewicht_kg": 12.0, "mca_a": 0.44},
+    "DVM Wandgerät 7.1 kW":  {"artikelnr": "AM071DNVDKG/EU",  "kategorie": "DVM Wandgerät",  "kuehl_kw": 6.8, "heiz_kw": 7.0, "schall_db": "43/40/37", "abmessungen": "1055×299×215", "gewicht_kg": 12.0, "mca_a": 0.50},
+    "1-Weg Kassette 1.7 kW": {"artikelnr": "AM017DN1DKG/EU",  "kategorie": "1-Weg Kassette", "kuehl_kw": 1.7, "heiz_kw": 1.9, "schall_db": "28/26/24", "abmessungen": "740×135×360",  "gewicht_kg": 8.0,  "mca_a": 0.18},
+    "1-Weg Kassette 2.2 kW": {"artikelnr": "AM022DN1DKG/EU",  "kategorie": "1-Weg Kassette", "kuehl_kw": 2.2, "heiz_kw": 2.5, "schall_db": "29/26/24", "abmessungen": "740×135×360",  "gewicht_kg": 8.0,  "mca_a": 0.18},
+    "1-Weg Kassette 2.8 kW": {"artikelnr": "AM028DN1DKG/EU",  "kategorie": "1-Weg Kassette", "kuehl_kw": 2.8, "heiz_kw": 3.2, "schall_db": "32/28/24", "abmessungen": "970×135×410",  "gewicht_kg": 10.0, "mca_a": 0.29},
+    "1-Weg Kassette 3.6 kW": {"artikelnr": "AM036DN1DKG/EU",  "kategorie": "1-Weg Kassette", "kuehl_kw": 3.6, "heiz_kw": 4.0, "schall_db": "37/33/30", "abmessungen": "970×135×410",  "gewicht_kg": 10.0, "mca_a": 0.31},
+    "1-Weg Kassette 5.6 kW": {"artikelnr": "AM056DN1DKG/EU",  "kategorie": "1-Weg Kassette", "kuehl_kw": 5.6, "heiz_kw": 6.3, "schall_db": "41/38/35", "abmessungen": "1200×138×450", "gewicht_kg": 13.5, "mca_a": 0.35},
+    "LSP Kanalgerät 2.2 kW": {"artikelnr": "AM022DNLDKG/EU",  "kategorie": "LSP Kanalgerät", "kuehl_kw": 2.2, "heiz_kw": 2.5, "schall_db": "26/23/19", "abmessungen": "700×199×440",  "gewicht_kg": 15.9, "mca_a": 0.38},
+    "LSP Kanalgerät 2.8 kW": {"artikelnr": "AM028DNLDKG/EU",  "kategorie": "LSP Kanalgerät", "kuehl_kw": 2.8, "heiz_kw": 3.2, "schall_db": "28/24/19", "abmessungen": "700×199×440",  "gewicht_kg": 15.9, "mca_a": 0.45},
+    "LSP Kanalgerät 3.6 kW": {"artikelnr": "AM036DNLDKG/EU",  "kategorie": "LSP Kanalgerät", "kuehl_kw": 3.6, "heiz_kw": 4.0, "schall_db": "31/26/20", "abmessungen": "700×199×440",  "gewicht_kg": 16.3, "mca_a": 0.53},
+    "LSP Kanalgerät 5.6 kW": {"artikelnr": "AM056DNLDKG/EU",  "kategorie": "LSP Kanalgerät", "kuehl_kw": 5.6, "heiz_kw": 6.3, "schall_db": "34/30/26", "abmessungen": "900×199×440",  "gewicht_kg": 19.3, "mca_a": 0.92},
+    "MSP Kanalgerät 3.6 kW": {"artikelnr": "AM036DNMDKG/EU",  "kategorie": "MSP Kanalgerät", "kuehl_kw": 3.6, "heiz_kw": 4.0, "schall_db": "30/27/24", "abmessungen": "850×250×700",  "gewicht_kg": 27.0, "mca_a": 0.81},
+    "MSP Kanalgerät 5.6 kW": {"artikelnr": "AM056DNMDKG/EU",  "kategorie": "MSP Kanalgerät", "kuehl_kw": 5.6, "heiz_kw": 6.3, "schall_db": "32/29/25", "abmessungen": "850×250×700",  "gewicht_kg": 27.0, "mca_a": 1.08},
+    "MSP Kanalgerät 7.1 kW": {"artikelnr": "AM071DNMDKG/EU",  "kategorie": "MSP Kanalgerät", "kuehl_kw": 7.1, "heiz_kw": 8.0, "schall_db": "36/32/27", "abmessungen": "850×250×700",  "gewicht_kg": 27.0, "mca_a": 1.48},
+    "MSP Kanalgerät 9.0 kW": {"artikelnr": "AM090DNMDKG/EU",  "kategorie": "MSP Kanalgerät", "kuehl_kw": 9.0, "heiz_kw": 10.0,"schall_db": "37/33/29", "abmessungen": "1200×250×700", "gewicht_kg": 34.2, "mca_a": 1.78},
+}
+
+QUINT_PANEELE = {
+    "Paneel klein  (960mm)":   {"artikelnr": "PC1MWFMANW", "abmessungen": "960×34×420",  "gewicht_kg": 2.6},
+    "Paneel mittel (1198mm)":  {"artikelnr": "PC1NWFMANW", "abmessungen": "1198×34×500", "gewicht_kg": 4.3},
+    "Paneel groß   (1410mm)":  {"artikelnr": "PC1BWFMANW", "abmessungen": "1410×34×500", "gewicht_kg": 5.0},
+}
+
+QUINT_ZUBEHOER = {
+    "Control Kit (Regeleinheit) – MIM-E03FN": "MIM-E03FN",
+    "Kabelfernbedienung – MWR-WW10N":         "MWR-WW10N",
+}
+
+
+# ============================================================
+# 3. PRODUKTDATENBANK
+# ============================================================
+class ProduktDB:
+    """Ein Datensatz (dict mit FELDER) je Artikelnummer; Schlüssel wie
+    preisliste.schluessel ("AR70F09C1AWX/EU" = "AR70F09C1AWXEU")."""
+
+    def __init__(self):
+        self.artikel = {}
+
+    def eintragen(self, art_nr, **felder):
+        """Felder setzen, die noch leer sind (erste Quelle gewinnt)."""
+        eintrag = self.artikel.setdefault(schluessel(art_nr), dict.fromkeys(FELDER, None))
+        for feld, wert in {"art_nr": art_nr, **felder}.items():
+            if wert is not None and eintrag[feld] is None:
+                eintrag[feld] = wert
+        return eintrag
+
+    def __len__(self):
+        return len(self.artikel)
+
+    def __contains__(self, art_nr):
+        return schluessel(art_nr) in self.artikel
+
+    def __getitem__(self, art_nr):
+        return self.artikel[schluessel(art_nr)]
+
+    def get(self, art_nr, standard=None):
+        return self.artikel.get(schluessel(art_nr), standard)
+
+    def preis(self, art_nr, standard=None):
+        """Listenpreis [EUR netto] oder ``standard``."""
+        eintrag = self.artikel.get(schluessel(art_nr))
+        return standard if eintrag is None or eintrag["preis"] is None else eintrag["preis"]
+
+    def schall(self, art_nr):
+        """Datensatz mit Schalldaten (lw, lp_1m, lp_oktav, luft_m3h) oder None."""
+        eintrag = self.artikel.get(schluessel(art_nr))
+        return eintrag if eintrag is not None and eintrag["lw"] is not None else None
+
+    def schall_auswahl(self):
+        """Außengeräte mit Schalldaten für die coolNEIGHBOR-Auswahl:
+        {Schall-Serie: {"Art.-Nr. (kW)": Datensatz}} in Tabellenreihenfolge."""
+        auswahl = {}
+        for schall_serie, geraete in SCHALL_AG.items():
+            serie = auswahl.setdefault(schall_serie, {})
+            for art_nr in geraete:
+                e = self[art_nr]
+                innen = f" / {e['ports']} Innen" if e["ports"] else ""
+                serie[f"{e['art_nr']}  ({e['kuehl_kw']:.1f} kW{innen})"] = e
+        return auswahl
+
+
+@lru_cache(maxsize=1)
+@traced()
+def produkte():
+    """ProduktDB aus Tabellen + Preisliste, einmal je Prozess.
+    Nach Änderung der Tabellen/Preisliste: ``produkte.cache_clear()``."""
+    db = ProduktDB()
+    liste = preisliste()
+    if liste is not None:                    # Listenpreis hat Vorrang vor den Tabellen
+        for art_nr, preis in zip(liste.spalten["Artikelnummer"], liste.spalten["Listenpreis"]):
+            if preis == preis:               # NaN = ohne Preis
+                db.eintragen(art_nr, preis=float(preis))
+    for serie, geraete in SAMSUNG_SERIEN.items():
+        for kw, d in geraete.items():
+            db.eintragen(d["art_nr"], bez=d["bez"], typ="IG", serie=serie, kuehl_kw=kw, preis=d["preis"])
+    for kw, d in FJM_AG.items():
+        db.eintragen(d["art_nr"], bez=d["bez"], typ="AG", serie="FJM Multi", kuehl_kw=kw,
+                     preis=d["preis"], ports=d["ports"])
+    for serie, geraete in RAC_AG_BY_SERIE.items():
+        for kw, art_nr, bez, preis in geraete:
+            db.eintragen(art_nr, bez=bez, typ="AG", serie=serie, kuehl_kw=kw, preis=preis)
+    for schall_serie, geraete in SCHALL_AG.items():
+        for art_nr, d in geraete.items():
+            db.eintragen(art_nr, typ="AG", schall_serie=schall_serie, kuehl_kw=d["kw"],
+                         lw=d["lw"], lp_1m=d["lp_1m"], luft_m3h=d["luft_m3h"],
+                         gewicht_kg=d["gewicht_kg"], lp_oktav=d["lp_oktav"])
+    for name, d in QUINT_AUSSENGERAETE.items():
+        db.eintragen(d["artikelnr"], bez=name, typ="AG", serie="Quint", kuehl_kw=d["kuehl_kw"],
+                     heiz_kw=d["heiz_kw"], lw=d["schallleistung_db"],
+                     abmessungen=d["abmessungen"], gewicht_kg=d["gewicht_kg"])
+    for name, d in QUINT_HYDRO_UNITS.items():
+        db.eintragen(d["artikelnr"], bez=name, typ="Hydro", serie="Quint", lw=d["schallleistung_db"],
+                     abmessungen=d["abmessungen"], gewicht_kg=d["gewicht_kg"])
+    for name, d in QUINT_INNENGERAETE.items():
+        db.eintragen(d["artikelnr"], bez=name, typ="IG", serie=d["kategorie"], kuehl_kw=d["kuehl_kw"],
+                     heiz_kw=d["heiz_kw"], abmessungen=d["abmessungen"], gewicht_kg=d["gewicht_kg"])
+    for name, d in QUINT_PANEELE.items():
+        db.eintragen(d["artikelnr"], bez=name.strip(), typ="Zubehör", abmessungen=d["abmessungen"],
+                     gewicht_kg=d["gewicht_kg"])
+    for name, art_nr in QUINT_ZUBEHOER.items():
+        db.eintragen(art_nr, bez=name, typ="Zubehör")
+    if liste is not None:                    # restliche Artikel und Lücken aus der Preisliste
+        for i, art_nr in enumerate(liste.spalten["Artikelnummer"]):
+            z = liste._zeile(i)
+            db.eintragen(art_nr, bez=z["Bezeichnung"], gruppe=z["Artikelgruppe"],
+                         kuehl_kw=z["kuehl_kw"], heiz_kw=z["heiz_kw"], ports=z["anschluesse"] or None)
+    return db
+
+
+# ============================================================
+# 4. SCHALL-CHECK DER GERÄTEAUSWAHL (coolMATH PRO)
+# ============================================================
+@traced()
+def schall_pruefung(art_nrn, abstand_m, grenzwert_db, q=2):
+    """Gewählte Außengeräte (eine Art.-Nr. je Gerät) am Immissionsort:
+    gleiche Geräte als Kaskade, alle zusammen energetisch addiert.
+    -> dict mit ``geraete`` (je Art.-Nr.: anzahl, lw, lp, ok), ``lp`` und ``ok``
+    (None, wenn keinem Gerät Schalldaten vorliegen)."""
+    db = produkte()
+    geraete = []
+    for art_nr, anzahl in Counter(art_nrn).items():
+        e = db.schall(art_nr)
+        lp = freifeld_pegel(e["lw"], abstand_m, anzahl, q) if e is not None else None
+        geraete.append({"art_nr": art_nr, "bez": (db.get(art_nr) or {}).get("bez") or art_nr,
+                        "anzahl": anzahl, "lw": e["lw"] if e is not None else None, "lp": lp,
+                        "ok": None if lp is None else lp <= grenzwert_db})
+    pegel = [g["lp"] for g in geraete if g["lp"] is not None]
+    lp = round(log_add(pegel), 1) if pegel else None
+    return {"geraete": geraete, "lp": lp, "ok": None if lp is None else lp <= grenzwert_db,
+            "ohne_daten": [g["art_nr"] for g in geraete if g["lp"] is None]}
@@ -0,0 +1,40 @@
+# ============================================================================
+# DATEI: coolsulting/engines/rohrnetz.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Kältemittel-Rohrdimensionierung für die Engine-API.
+#               Die Physik lebt in coolWIRE/modules/rohrnetz.py (bereits frei
+#               von Streamlit) und wird hier nur unter stabilem Namen geladen.
+# ============================================================================
+
+import importlib.util
+import os
+import sys
+
+from coolsulting.paths import ROOT_DIR
+from coolsulting.trace import traced
+
+_MODUL_NAME = "coolsulting.engines._rohrnetz_coolwire"
+_PFAD = os.path.join(ROOT_DIR, "coolWIRE", "modules", "rohrnetz.py")
+
+
+def _lade():
+    mod = sys.modules.get(_MODUL_NAME)
+    if mod is None:
+        spec = importlib.util.spec_from_file_location(_MODUL_NAME, _PFAD)
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules[_MODUL_NAME] = mod
+        try:
+            spec.loader.exec_module(mod)
+        except BaseException:
+            del sys.modules[_MODUL_NAME]   # kein halb geladenes Modul zurücklassen
+            raise
+    return mod
+
+
+_rn = _lade()
+REFRIGERANTS = _rn.REFRIGERANTS
+get_pipes_for_ref = _rn.get_pipes_for_ref
+select_pipe = _rn.select_pipe
+berechne_leitung = traced("rohrnetz.berechne_leitung")(_rn.berechne_leitung)
@@ -0,0 +1,338 @@
+# ============================================================================
+# DATEI: coolsulting/engines/samsung.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Samsung-Gerätedatenbank (Wandgeräte, Kassetten, Kanal,
+#               Truhe, Außengeräte) und Geräteauswahl für coolMATH PRO –
+#               ohne Streamlit. katalog(): alle Serien einmal je Prozess als
+#               sortierte Leistungsreihen (bisect / vektorisiert).
+# ============================================================================
+
+from bisect import bisect_left
+from functools import lru_cache
+
+import numpy as np
+
+
+# Samsung Wind-Free Standard Wandgeräte (AR-Serie)
+# ==========================================
+# SAMSUNG GERÄTEDATENBANK
+# Quelle: MTF-Samsung-Klima_Artikel_Import-WaWi_2026-02-02-APP.xlsx
+# Gruppen: S_FJM + S_RAC — nur Wandgeräte (Inneneinheiten)
+# ==========================================
+
+# Serien-Datenbank: {serie_name: {kw: {art_nr, bez, preis}}}
+SAMSUNG_SERIEN = {
+    "Wind-Free Standard": {
+        2.0: {"art_nr": "AR60F07C1AWN/EU", "bez": "Wind-Free Standard 2.0kW",  "preis": 693.0},
+        2.5: {"art_nr": "AR60F09C1AWN/EU", "bez": "Wind-Free Standard 2.5kW",  "preis": 768.0},
+        3.5: {"art_nr": "AR60F12C1AWN/EU", "bez": "Wind-Free Standard 3.5kW",  "preis": 843.0},
+        5.0: {"art_nr": "AR60F18C1AWN/EU", "bez": "Wind-Free Standard 5.0kW",  "preis": 1219.0},
+    },
+    "Airise Living": {
+        2.0: {"art_nr": "AR50F07C1BHN/EU", "bez": "Airise Living 2.0kW",       "preis": 554.0},
+        2.5: {"art_nr": "AR50F09C1BHN/EU", "bez": "Airise Living 2.5kW",       "preis": 616.0},
+        3.5: {"art_nr": "AR50F12C1BHN/EU", "bez": "Airise Living 3.5kW",       "preis": 673.0},
+        5.0: {"art_nr": "AR50F18C1BHN/EU", "bez": "Airise Living 5.0kW",       "preis": 1017.0},
+        6.5: {"art_nr": "AR50F24C1BHN/EU", "bez": "Airise Living 6.5kW",       "preis": 1335.0},
+    },
+    "Wind-Free Exklusiv": {
+        2.0: {"art_nr": "AR70F07C1AWN/EU", "bez": "Wind-Free Exklusiv 2.0kW",  "preis": 1048.0},
+        2.5: {"art_nr": "AR70F09C1AWN/EU", "bez": "Wind-Free Exklusiv 2.5kW",  "preis": 1185.0},
+        3.5: {"art_nr": "AR70F12C1AWN/EU", "bez": "Wind-Free Exklusiv 3.5kW",  "preis": 1280.0},
+        5.0: {"art_nr": "AR70F18C1AWN/EU", "bez": "Wind-Free Exklusiv 5.0kW",  "preis": 1726.0},
+        6.5: {"art_nr": "AR70F24C1AWN/EU", "bez": "Wind-Free Exklusiv 6.5kW",  "preis": 2260.0},
+    },
+    "Wind-Free Exklusiv Black": {
+        2.0: {"art_nr": "AR70F07C1ABN/EU", "bez": "WF Exklusiv Black 2.0kW",   "preis": 1178.0},
+        2.5: {"art_nr": "AR70F09C1ABN/EU", "bez": "WF Exklusiv Black 2.5kW",   "preis": 1298.0},
+        3.5: {"art_nr": "AR70F12C1ABN/EU", "bez": "WF Exklusiv Black 3.5kW",   "preis": 1440.0},
+    },
+    "Wind-Free Exklusiv-Premiere": {
+        2.0: {"art_nr": "AR70H07C1AWN/EU", "bez": "WF Exklusiv-Premiere 2.0kW","preis": 1072.0},
+        2.5: {"art_nr": "AR70H09C1AWN/EU", "bez": "WF Exklusiv-Premiere 2.5kW","preis": 1180.0},
+        3.5: {"art_nr": "AR70H12C1AWN/EU", "bez": "WF Exklusiv-Premiere 3.5kW","preis": 1312.0},
+        4.3: {"art_nr": "AR70H15C1AWN/EU", "bez": "WF Exklusiv-Premiere 4.3kW","preis": 1656.0},
+        5.0: {"art_nr": "AR70H18C1AWN/EU", "bez": "WF Exklusiv-Premiere 5.0kW","preis": 1908.0},
+        6.5: {"art_nr": "AR70H24C1AWN/EU", "bez": "WF Exklusiv-Premiere 6.5kW","preis": 2492.0},
+    },
+    "Wind-Free Exklusiv-Premiere Black": {
+        2.0: {"art_nr": "AR70H07C1ABN/EU", "bez": "WF Exkl.-Premiere Blk 2.0kW","preis": 1112.0},
+        2.5: {"art_nr": "AR70H09C1ABN/EU", "bez": "WF Exkl.-Premiere Blk 2.5kW","preis": 1228.0},
+        3.5: {"art_nr": "AR70H12C1ABN/EU", "bez": "WF Exkl.-Premiere Blk 3.5kW","preis": 1364.0},
+    },
+    "Wind-Free Elite": {
+        2.0: {"art_nr": "AR70F07CAAWKN/EU","bez": "Wind-Free Elite 2.0kW",     "preis": 1347.0},
+        2.5: {"art_nr": "AR70F09CAAWKN/EU","bez": "Wind-Free Elite 2.5kW",     "preis": 1487.0},
+        3.5: {"art_nr": "AR70F12CAAWKN/EU","bez": "Wind-Free Elite 3.5kW",     "preis": 1637.0},
+    },
+    "Wind-Free Elite-Premiere Plus": {
+        2.0: {"art_nr": "AR70H07CAAWN/EU", "bez": "WF Elite-Premiere Plus 2.0kW","preis": 1296.0},
+        2.5: {"art_nr": "AR70H09CAAWN/EU", "bez": "WF Elite-Premiere Plus 2.5kW","preis": 1432.0},
+        3.5: {"art_nr": "AR70H12CAAWN/EU", "bez": "WF Elite-Premiere Plus 3.5kW","preis": 1576.0},
+    },
+    "Wind-Free Elite-Premiere Plus Black": {
+        2.0: {"art_nr": "AR70H07CAABN/EU", "bez": "WF Elite-Prem.Plus Blk 2.0kW","preis": 1348.0},
+        2.5: {"art_nr": "AR70H09CAABN/EU", "bez": "WF Elite-Prem.Plus Blk 2.5kW","preis": 1488.0},
+        3.5: {"art_nr": "AR70H12CAABN/EU", "bez": "WF Elite-Prem.Plus Blk 3.5kW","preis": 1640.0},
+    },
+    # --- Kassetten, Kanaleinbau, Standtruhe (FJM IG) ---
+    "Mini-Kassette 620x620": {
+        1.6: {"art_nr": "AJ016TNNDKG/EU", "bez": "FJM Mini-Kassette 1.6kW",  "preis": 902.0},
+        2.0: {"art_nr": "AJ020TNNDKG/EU", "bez": "FJM Mini-Kassette 2.0kW",  "preis": 946.0},
+        2.6: {"art_nr": "AJ026TNNDKG/EU", "bez": "FJM Mini-Kassette 2.6kW",  "preis": 1050.0},
+        3.5: {"art_nr": "AJ035TNNDKG/EU", "bez": "FJM Mini-Kassette 3.5kW",  "preis": 1176.0},
+        5.2: {"art_nr": "AJ052TNNDKG/EU", "bez": "FJM Mini-Kassette 5.2kW",  "preis": 1388.0},
+    },
+    "1-Weg-Kassette": {
+        2.6: {"art_nr": "AJ026TN1DKG/EU", "bez": "FJM 1-Weg-Kassette 2.6kW", "preis": 946.0},
+        3.5: {"art_nr": "AJ035TN1DKG/EU", "bez": "FJM 1-Weg-Kassette 3.5kW", "preis": 1160.0},
+    },
+    "Kanaleinbau": {
+        2.6: {"art_nr": "AJ026TNLPEG/EU", "bez": "FJM Kanaleinbau 2.6kW",    "preis": 1368.0},
+        3.5: {"art_nr": "AJ035TNLPEG/EU", "bez": "FJM Kanaleinbau 3.5kW",    "preis": 1422.0},
+        5.2: {"art_nr": "AJ052BNMDEG/EU", "bez": "FJM Kanaleinbau 5.2kW",    "preis": 1391.0},
+    },
+    "Standtruhe": {
+        2.6: {"art_nr": "AJ026TNJDKG/EU", "bez": "FJM Standtruhe 2.6kW",     "preis": 1074.0},
+        3.5: {"art_nr": "AJ035TNJDKG/EU", "bez": "FJM Standtruhe 3.5kW",     "preis": 1198.0},
+        5.2: {"art_nr": "AJ052TNJDKG/EU", "bez": "FJM Standtruhe 5.2kW",     "preis": 1430.0},
+    },
+}
+
+# Standard-Serie für Erstempfehlung
+SAMSUNG_DEFAULT_SERIE = "Wind-Free Standard"
+
+# Kurznamen für Dropdowns (damit der Text nicht abgeschnitten wird)
+SERIE_SHORT = {
+    "Wind-Free Standard":               "WF Standard",
+    "Airise Living":                    "Airise Living",
+    "Wind-Free Exklusiv":               "WF Exklusiv",
+    "Wind-Free Exklusiv Black":         "WF Exklusiv Blk",
+    "Wind-Free Exklusiv-Premiere":      "WF Exkl.-Prem.",
+    "Wind-Free Exklusiv-Premiere Black":"WF Exkl.-Prem. Blk",
+    "Wind-Free Elite":                  "WF Elite",
+    "Wind-Free Elite-Premiere Plus":    "WF Elite-Prem.+",
+    "Wind-Free Elite-Premiere Plus Black":"WF Elite-Prem.+ Blk",
+    "Mini-Kassette 620x620":            "Mini-Kassette",
+    "1-Weg-Kassette":                   "1-Weg-Kassette",
+    "Kanaleinbau":                      "Kanaleinbau",
+    "Standtruhe":                       "Standtruhe",
+}
+
+
+# ==========================================
+# AUSSENGERÄTE: FJM Multi + RAC Single-Split je IG-Serie
+# ==========================================
+# FJM Multi-Außengeräte (für alle FJM IG-Typen: Kassette, Kanal, Standtruhe, WF-Serien);
+# "ports" = anschließbare Innengeräte (TXJ2 … TXJ5 in der Art.-Nr.)
+FJM_AG = {
+    4.0:  {"art_nr": "AJ040TXJ2KG/EU", "bez": "FJM Multi AG  4,0 kW",   "preis": 2347, "ports": 2},
+    5.0:  {"art_nr": "AJ050TXJ2KG/EU", "bez": "FJM Multi AG  5,0 kW",   "preis": 2706, "ports": 2},
+    5.2:  {"art_nr": "AJ052TXJ3KG/EU", "bez": "FJM Multi AG  5,2 kW",   "preis": 3061, "ports": 3},
+    6.8:  {"art_nr": "AJ068TXJ3KG/EU", "bez": "FJM Multi AG  6,8 kW",   "preis": 3548, "ports": 3},
+    8.0:  {"art_nr": "AJ080TXJ4KG/EU", "bez": "FJM Multi AG  8,0 kW",   "preis": 4494, "ports": 4},
+    10.0: {"art_nr": "AJ100TXJ5KG/EU", "bez": "FJM Multi AG 10,0 kW",   "preis": 5533, "ports": 5},
+}
+
+# RAC Single-Split-AGs je IG-Serie (IG-Artnr Präfix → passende AG-Liste)
+RAC_AG_BY_SERIE = {
+    "Airise Living": [
+        (2.5, "AR50F09C1BHX/EU",  "RAC AG Airise Living 2,5 kW",  984),
+        (3.5, "AR50F12C1BHX/EU",  "RAC AG Airise Living 3,5 kW", 1019),
+        (5.0, "AR50F18C1BHX/EU",  "RAC AG Airise Living 5,0 kW", 1564),
+        (6.5, "AR50F24C1BHX/EU",  "RAC AG Airise Living 6,5 kW", 2056),
+    ],
+    "Wind-Free Standard": [
+        (2.5, "AR60F09C1AWX/EU",  "RAC AG WF Standard 2,5 kW",   1362),
+        (3.5, "AR60F12C1AWX/EU",  "RAC AG WF Standard 3,5 kW",   1540),  # ca.
+        (5.0, "AR60F18C1AWX/EU",  "RAC AG WF Standard 5,0 kW",   1900),
+    ],
+    "Wind-Free Exklusiv": [
+        (2.0, "AR70F07C1AWX/EU",  "RAC AG WF Exklusiv 2,0 kW",   1448),
+        (2.5, "AR70F09C1AWX/EU",  "RAC AG WF Exklusiv 2,5 kW",   1446),
+        (3.5, "AR70F12C1AWX/EU",  "RAC AG WF Exklusiv 3,5 kW",   1540),
+        (4.3, "AR70F15C1AWX/EU",  "RAC AG WF Exklusiv 4,3 kW",   2135),
+        (5.0, "AR70F18C1AWX/EU",  "RAC AG WF Exklusiv 5,0 kW",   2106),
+        (6.5, "AR70F24C1AWX/EU",  "RAC AG WF Exklusiv 6,5 kW",   2761),
+    ],
+    "Wind-Free Exklusiv Black": [
+        (2.0, "AR70F07C1AWX/EU",  "RAC AG WF Exklusiv 2,0 kW",   1448),
+        (2.5, "AR70F09C1AWX/EU",  "RAC AG WF Exklusiv 2,5 kW",   1446),
+        (3.5, "AR70F12C1AWX/EU",  "RAC AG WF Exklusiv 3,5 kW",   1540),
+    ],
+    "Wind-Free Exklusiv-Premiere": [
+        (2.0, "AR70H07C1AWX/EU",  "RAC AG WF Exkl.-Prem. 2,0 kW", 1604),
+        (2.5, "AR70H09C1AWX/EU",  "RAC AG WF Exkl.-Prem. 2,5 kW", 1688),
+        (3.5, "AR70H12C1AWX/EU",  "RAC AG WF Exkl.-Prem. 3,5 kW", 1872),
+        (4.3, "AR70H15C1AWX/EU",  "RAC AG WF Exkl.-Prem. 4,3 kW", 2360),
+        (5.0, "AR70H18C1AWX/EU",  "RAC AG WF Exkl.-Prem. 5,0 kW", 2708),
+        (6.5, "AR70H24C1AWX/EU",  "RAC AG WF Exkl.-Prem. 6,5 kW", 3556),
+    ],
+    "Wind-Free Exklusiv-Premiere Black": [
+        (2.0, "AR70H07C1AWX/EU",  "RAC AG WF Exkl.-Prem. 2,0 kW", 1604),
+        (2.5, "AR70H09C1AWX/EU",  "RAC AG WF Exkl.-Prem. 2,5 kW", 1688),
+        (3.5, "AR70H12C1AWX/EU",  "RAC AG WF Exkl.-Prem. 3,5 kW", 1872),
+    ],
+    "Wind-Free Elite": [
+        (2.5, "AR70F09CAAWKX/EU", "RAC AG WF Elite 2,5 kW",       1752),
+        (3.5, "AR70F12CAAWKX/EU", "RAC AG WF Elite 3,5 kW",       1944),
+    ],
+    "Wind-Free Elite-Premiere Plus": [
+        (2.5, "AR70H09CAAWX/EU",  "RAC AG WF Elite-Prem.Plus 2,5 kW", 1824),
+        (3.5, "AR70H12CAAWX/EU",  "RAC AG WF Elite-Prem.Plus 3,5 kW", 2024),
+    ],
+    "Wind-Free Elite-Premiere Plus Black": [
+        (2.5, "AR70H09CAAWX/EU",  "RAC AG WF Elite-Prem.Plus 2,5 kW", 1824),
+        (3.5, "AR70H12CAAWX/EU",  "RAC AG WF Elite-Prem.Plus 3,5 kW", 2024),
+    ],
+}
+# FJM IG-Typen → immer FJM Multi AG
+FJM_IG_SERIEN = {"Mini-Kassette 620x620", "1-Weg-Kassette", "Kanaleinbau", "Standtruhe"}
+# FJM Wandgeräte-Serien → können RAC AG oder FJM AG bekommen (Umschalter)
+FJM_WAND_SERIEN = {"Wind-Free Standard","Wind-Free Exklusiv","Wind-Free Exklusiv Black",
+                   "Wind-Free Exklusiv-Premiere","Wind-Free Exklusiv-Premiere Black",
+                   "Wind-Free Elite","Wind-Free Elite-Premiere Plus",
+                   "Wind-Free Elite-Premiere Plus Black","Airise Living"}
+
+
+# Jahresarbeitszahl Kühlen (Datenblatt Wind-Free Standard; gilt bis zu
+# seriengenauen Werten für alle Serien)
+SEER_STANDARD = 6.2
+
+# Rückwärtskompatible Flach-DB für find_samsung_device (Standard-Serie)
+SAMSUNG_WINDFREE_WALL = {}
+for kw, d in SAMSUNG_SERIEN[SAMSUNG_DEFAULT_SERIE].items():
+    SAMSUNG_WINDFREE_WALL[kw] = {
+        "model":    d["bez"],
+        "art_nr":   d["art_nr"],
+        "cool_kw":  kw,
+        "heat_kw":  round(kw * 1.2, 1),
+        "seer":     SEER_STANDARD,
+        "scop":     4.6,
+        "eer":      3.50,
+        "preis":    d["preis"],
+        "btus":     str(int(kw * 3412)),
+        "serie":    SAMSUNG_DEFAULT_SERIE,
+    }
+
+SAMSUNG_SIZES_KW = sorted(SAMSUNG_WINDFREE_WALL.keys())
+
+# ============================================================
+# GERÄTEKATALOG (sortierte Leistungsreihen, einmal je Prozess)
+# ============================================================
+class GeraeteKatalog:
+    """Alle Serien als aufsteigende Leistungsreihen für bisect (einzelne Zone)
+    und searchsorted (viele Zonen auf einmal); Aufbau über katalog()."""
+
+    def __init__(self, serien, standard=SAMSUNG_DEFAULT_SERIE, preise=None):
+        self.standard = standard
+        self.kw = {}          # Serie -> [kW, ...] aufsteigend
+        self.geraete = {}     # Serie -> [{art_nr, bez, preis}, ...] wie kw
+        self.kw_np = {}       # Serie -> np.array kW
+        self.preis_np = {}    # Serie -> np.array Preis [EUR]
+        self.optionen = []    # (kW, Serie, Gerät) in Serien-/Leistungsreihenfolge
+        self.nach_art_nr = {}
+        self.ig_preis = {}    # IG-Art.-Nr. -> Preis [EUR]
+        # Preise je Art.-Nr. aus ``preise`` (ProduktDB), sonst aus den Tabellen
+        preis = (lambda art_nr, p: preise.preis(art_nr, p)) if preise is not None else (lambda _, p: p)
+        for name, db in serien.items():
+            groessen = sorted(db)
+            self.kw[name] = groessen
+            self.geraete[name] = [{**db[kw], "preis": preis(db[kw]["art_nr"], db[kw]["preis"])}
+                                  for kw in groessen]
+            self.kw_np[name] = np.array(groessen, dtype=float)
+            self.preis_np[name] = np.array([d["preis"] for d in self.geraete[name]], dtype=float)
+            for kw, d in zip(groessen, self.geraete[name]):
+                self.optionen.append((kw, name, d))
+                self.nach_art_nr.setdefault(d["art_nr"], (name, kw))
+                self.ig_preis.setdefault(d["art_nr"], d["preis"])
+        # Außengeräte: FJM Multi nach Leistung, Preise je Art.-Nr. (FJM + RAC)
+        self.fjm_ag_kw = sorted(FJM_AG)
+        self.ag_preis = {d["art_nr"]: preis(d["art_nr"], d["preis"]) for d in FJM_AG.values()}
+        for liste in RAC_AG_BY_SERIE.values():
+            for _, art_nr, _, p in liste:
+                self.ag_preis.setdefault(art_nr, preis(art_nr, p))
+
+    def serie(self, name):
+        """Serienname, unbekannte Serie -> Standard-Serie."""
+        return name if name in self.kw else self.standard
+
+    def passend(self, serie, bedarf_kw):
+        """Kleinstes Gerät >= bedarf_kw (bisect) -> (Index, kW, Gerät, zu_gross);
+        reicht keines, das größte mit ``zu_gross`` = True."""
+        groessen = self.kw[self.serie(serie)]
+        i = bisect_left(groessen, bedarf_kw)
+        zu_gross = i == len(groessen)
+        i = min(i, len(groessen) - 1)
+        return i, groessen[i], self.geraete[self.serie(serie)][i], zu_gross
+
+    def kleiner(self, serie, i):
+        """Nächstkleineres Gerät zu Index ``i`` -> (kW, Gerät) oder None."""
+        if i <= 0:
+            return None
+        s = self.serie(serie)
+        return self.kw[s][i - 1], self.geraete[s][i - 1]
+
+    def auswahl(self, bedarf_kw, serie=None):
+        """Wie passend(), vektorisiert über beliebige Arrays (searchsorted).
+        -> (Index, kW, Preis, zu_gross) je Element."""
+        s = self.serie(serie or self.standard)
+        groessen = self.kw_np[s]
+        idx = np.searchsorted(groessen, np.asarray(bedarf_kw, dtype=float), side="left")
+        zu_gross = idx >= len(groessen)
+        idx = np.minimum(idx, len(groessen) - 1)
+        return idx, groessen[idx], self.preis_np[s][idx], zu_gross
+
+    def fjm_ag_index(self, bedarf_kw):
+        """Index des kleinsten FJM-Multi-AG >= bedarf_kw (len = keines)."""
+        return bisect_left(self.fjm_ag_kw, bedarf_kw)
+
+
+@lru_cache(maxsize=1)
+def katalog():
+    """GeraeteKatalog über SAMSUNG_SERIEN mit Preisen der Produktdatenbank,
+    einmal je Prozess gebaut. Nach Änderung der Serien-Datenbank:
+    ``katalog.cache_clear()``."""
+    from coolsulting.engines.produkte import produkte     # produkte importiert dieses Modul
+    return GeraeteKatalog(SAMSUNG_SERIEN, preise=produkte())
+
+
+def find_samsung_device(peak_watt, safety_factor=1.10, serie=None):
+    """
+    Findet passendes Samsung Wandgerät für gegebene Spitzenlast.
+    safety_factor: 1.10 = 10% Norm-Zuschlag
+    serie: optionaler Serienname (default = Wind-Free Standard)
+    Gibt primäres und alternatives Gerät zurück.
+    """
+    if serie is None:
+        serie = SAMSUNG_DEFAULT_SERIE
+    # Fallback auf Standard wenn Serie keine passende Größe hat
+    kat = katalog()
+    required_kw = (peak_watt * safety_factor) / 1000.0
+
+    def make_entry(kw, d):
+        return {
+            "model":       d["bez"],
+            "art_nr":      d["art_nr"],
+            "cool_kw":     kw,
+            "heat_kw":     round(kw * 1.2, 1),
+            "preis":       d["preis"],
+            "kw_class":    kw,
+            "required_kw": required_kw,
+            "peak_w":      peak_watt,
+            "serie":       serie,
+        }
+
+    # Primär: kleinstes Gerät >= required_kw, sonst größtes verfügbares
+    idx_p, kw, d, zu_gross = kat.passend(serie, required_kw)
+    primary = make_entry(kw, d)
+    if zu_gross:
+        primary["oversized"] = True
+
+    # Alternativ: nächstkleineres
+    kleiner = kat.kleiner(serie, idx_p)
+    alt = make_entry(*kleiner) if kleiner else None
+
+    return primary, alt
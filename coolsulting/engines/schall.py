@@ -0,0 +1,136 @@
+# ============================================================================
+# DATEI: coolsulting/engines/schall.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Schallimmissions-Prognose (°coolNEIGHBOR) ohne Streamlit –
+#               ISO 9613-2 Ausbreitung, Beugung, Kaskade, NR-Klassen.
+# ============================================================================
+
+import math
+
+from coolsulting.trace import traced
+
+# NR-Kurven Referenzwerte (ISO 1996-1), Frequenzen: [63,125,250,500,1k,2k,4k,8k]
+NR_KURVEN = {
+    15: [51.8, 35.5, 22.1, 12.5,  5.4,  0.1, -3.5, -6.2],
+    20: [55.4, 39.4, 26.5, 17.1, 10.1,  4.9,  1.4, -1.2],
+    25: [59.1, 43.4, 30.9, 21.7, 14.9,  9.7,  6.3,  3.8],
+    30: [62.7, 47.3, 35.3, 26.3, 19.7, 14.5, 11.2,  8.8],
+    35: [66.4, 51.2, 39.7, 30.9, 24.5, 19.3, 16.2, 13.8],
+    40: [70.0, 55.1, 44.1, 35.5, 29.3, 24.1, 21.1, 18.8],
+    45: [73.7, 59.1, 48.5, 40.1, 34.1, 28.9, 26.0, 23.8],
+    50: [77.3, 63.0, 52.9, 44.7, 38.9, 33.7, 31.0, 28.8],
+    55: [81.0, 66.9, 57.3, 49.3, 43.7, 38.5, 36.0, 33.8],
+    60: [84.6, 70.9, 61.7, 53.9, 48.5, 43.3, 41.0, 38.8],
+    65: [88.2, 74.8, 66.1, 58.5, 53.3, 48.1, 46.0, 43.8],
+}
+OKTAV_BANDS = [63, 125, 250, 500, 1000, 2000, 4000, 8000]
+
+
+def log_add(levels):
+    if not levels:
+        return 0.0
+    return 10 * math.log10(sum(10 ** (l / 10) for l in levels))
+
+def kaskaden_zuschlag(n):
+    if n <= 1:
+        return 0.0
+    return round(10 * math.log10(n), 1)
+
+def atm_daempfung(d_m, temp_c, rel_hum):
+    alpha = max(1.9 * (1 + (10 - temp_c) * 0.02) * (1 + (70 - rel_hum) * 0.01), 0.5)
+    return round((alpha * d_m) / 1000.0, 3)
+
+def beugungsdaempfung(umweg_delta, barriere_typ, f_hz=500.0):
+    if umweg_delta <= 0:
+        return 0.0
+    n = 2.0 * umweg_delta / (340.0 / f_hz)
+    if n <= 0:
+        return 0.0
+    dz = 10 * math.log10(3 + 20 * n)
+    limits = {"Massiv & Luftdicht": 25.0, "Leichtbauweise dicht": 15.0,
+              "Teiloffen / Lamellen": 5.0, "Luftdurchlässig (Gitter)": 0.0}
+    lim = next((v for k, v in limits.items() if k in barriere_typ), 25.0)
+    return round(min(dz, lim), 1)
+
+def aero_zuschlag(luft_m3h, qs_m2):
+    if qs_m2 <= 0:
+        return 0.0, 0.0
+    v = luft_m3h / (3600.0 * qs_m2)
+    zs = 0.0 if v <= 3.0 else round(((v - 3.0) / 0.03) * 0.25, 1)
+    return round(v, 2), zs
+
+@traced()
+def berechne_gesamt(lw, anzahl, luft, qs, d_geh, d_koerper, k_t, k_i,
+                    d_total, topologie, b1_mat, b2_mat, b1_lenkt, b2_lenkt,
+                    q, w_dist, temp, hum, raumzuschlag, d_direkt):
+    """
+    ISO 9613-2 Schallausbreitungsrechnung.
+
+    d_total  = entrollter Schallweg entlang der Schallbahn [m]
+               (= Luftlinie bei direktem Weg, laenger bei Beugung)
+    d_direkt = kuerzte Luftlinie Quelle -> Immissionsort [m]
+               (immer <= d_total; bei direktem Weg = d_total)
+    umweg    = d_total - d_direkt = Mehrweg durch Beugung an Kanten [m]
+               WICHTIG: umweg steigt mit groesserer Beugungsbahn,
+               groesserer umweg = staerkere Fresnel-Beugungsdaempfung.
+               d_direkt kleiner bei gleichem d_total = groesserer Umweg = mehr Daempfung.
+               Das ist physikalisch KORREKT (tieferer Schallschatten hinter der Kante).
+    """
+    d_kas = kaskaden_zuschlag(anzahl)
+    v_luft, d_aero = aero_zuschlag(luft, qs)
+    lw_eff = lw + d_kas + d_aero - d_geh - d_koerper
+    q_db = {1: 0, 2: 3, 4: 6, 8: 9}.get(q, 3)
+    # Wandreflexion: nur bei sehr kleinem Wandabstand
+    w_plus = 3.0 if w_dist < 0.5 else (1.5 if w_dist < 1.0 else 0.0)
+    a_atm = atm_daempfung(d_total, temp, hum)
+    # Geometrische Ausbreitung auf d_total (entrollter Weg = massgebend fuer Pegel)
+    a_div = 10 * math.log10(4 * math.pi * max(d_total, 0.001) ** 2)
+    lp_frei = lw_eff + q_db - a_div + w_plus - a_atm + raumzuschlag
+    # Beugungsberechnung: umweg = entrollter Weg - direkte Luftlinie
+    # d_direkt muss <= d_total sein (physikalische Bedingung)
+    d_direkt_safe = min(d_direkt, d_total)
+    umweg = max(d_total - d_direkt_safe, 0.0)
+    dz1 = 0.0
+    dz2 = 0.0
+    d_uml = 0.0
+    if umweg > 0 and "Direkt" not in topologie:
+        # Bei L-foermig: gesamter Umweg an einer Kante
+        # Bei U-foermig: aufgeteilt auf zwei Kanten
+        if "U-foermig" in topologie or "U-förmig" in topologie:
+            dz1 = beugungsdaempfung(umweg * 0.6, b1_mat)
+            dz2 = beugungsdaempfung(umweg * 0.4, b2_mat)
+        else:
+            dz1 = beugungsdaempfung(umweg, b1_mat)
+    if b1_lenkt and "Direkt" not in topologie:
+        d_uml += 2.0
+    if b2_lenkt and ("U-foermig" in topologie or "U-förmig" in topologie):
+        d_uml += 1.5
+    lp = round(lp_frei - dz1 - dz2 - d_uml, 1)
+    lr = round(lp + k_t + k_i, 1)
+    return {
+        "lw_eff": round(lw_eff, 1), "d_kas": d_kas, "d_aero": d_aero,
+        "v_luft": v_luft, "q_db": q_db, "w_plus": w_plus,
+        "a_atm": a_atm, "a_div": round(a_div, 1), "lp_frei": round(lp_frei, 1),
+        "dz1": dz1, "dz2": dz2, "d_uml": d_uml, "umweg": round(umweg, 2),
+        "lp": lp, "lr": lr,
+    }
+
+def freifeld_pegel(lw, d_m, anzahl=1, q=2, temp=10.0, hum=70.0):
+    """Lp am Immissionsort bei direkter Ausbreitung ohne Kapselung, Beugung und
+    Zuschläge (Schnellprüfung der Geräteauswahl in coolMATH PRO)."""
+    return berechne_gesamt(lw, anzahl, 0.0, 0.0, 0.0, 0.0, 0, 0, d_m, "Direkt", "", "",
+                           False, False, q, 1.0, temp, hum, 0.0, d_m)["lp"]
+
+def oktav_am_io(lp_oktav_src, d_total, q, d_geh, anzahl):
+    q_db = {1: 0, 2: 3, 4: 6, 8: 9}.get(q, 3)
+    d_div = 10 * math.log10(4 * math.pi * max(d_total, 0.001) ** 2)
+    d_kas = kaskaden_zuschlag(anzahl)
+    return [round(lp + q_db - d_div + d_kas - d_geh, 1) for lp in lp_oktav_src]
+
+def nr_klasse(lp_io):
+    for nr in sorted(NR_KURVEN.keys()):
+        if all(lp_io[i] <= NR_KURVEN[nr][i] for i in range(8)):
+            return nr
+    return None
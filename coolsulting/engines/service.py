@@ -0,0 +1,166 @@
+# ============================================================================
+# DATEI: coolsulting/engines/service.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Lokale HTTP/JSON-Schnittstelle auf die Rechenkerne – z.B.
+#               für das ERP, um Hunderte Angebote ohne Browser-Session zu
+#               rechnen. Nur Standardbibliothek (http.server).
+#
+#   python -m coolsulting.engines.service --port 8765
+#
+#   GET  /engines                 -> Engines mit Parametern
+#   GET  /metrics                 -> Laufzeiten je Span (Prometheus-Text)
+#   POST /berechne/<engine>       -> Body: {...} oder [{...}, {...}] (Batch)
+#
+#   Optionaler Schutz: Umgebungsvariable CS_API_TOKEN, Header X-API-Token.
+# ============================================================================
+
+import argparse
+import inspect
+import json
+import os
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from coolsulting import trace
+from coolsulting.engines import ENGINES, get_engine
+
+MAX_BODY = 20 * 1024 * 1024   # 20 MB
+
+
+def _json_default(obj):
+    # numpy-Skalare/-Arrays ohne numpy-Import serialisieren
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    return str(obj)
+
+
+def beschreibung():
+    """Engine-Übersicht für GET /engines."""
+    liste = []
+    for name in ENGINES:
+        try:
+            funktion = get_engine(name)
+        except ImportError as e:
+            liste.append({"engine": name, "verfuegbar": False, "fehler": str(e)})
+            continue
+        parameter = {}
+        for p in inspect.signature(funktion).parameters.values():
+            parameter[p.name] = None if p.default is inspect.Parameter.empty else p.default
+        liste.append({"engine": name, "verfuegbar": True,
+                      "beschreibung": (inspect.getdoc(funktion) or "").split("\n")[0],
+                      "parameter": parameter})
+    return liste
+
+
+def berechne_anfrage(name, daten):
+    """Einzel- oder Batch-Anfrage; Fehler pro Zeile statt Abbruch."""
+    funktion = get_engine(name)
+    if isinstance(daten, dict):
+        with trace.span("api.berechne", engine=name):
+            return {"ergebnis": funktion(**daten)}
+    ergebnisse = []
+    t0 = time.perf_counter()
+    with trace.span("api.berechne", engine=name, zeilen=len(daten)):
+        for zeile in daten:
+            try:
+                ergebnisse.append({"ergebnis": funktion(**zeile)})
+            except Exception as e:
+                ergebnisse.append({"fehler": f"{type(e).__name__}: {e}"})
+    return {"anzahl": len(ergebnisse), "dauer_ms": round((time.perf_counter() - t0) * 1000, 2),
+            "ergebnisse": ergebnisse}
+
+
+class EngineHandler(BaseHTTPRequestHandler):
+    server_version = "coolsultingEngines/1.0"
+
+    def _antwort(self, status, daten):
+        body = json.dumps(daten, ensure_ascii=False, default=_json_default).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _autorisiert(self):
+        token = os.environ.get("CS_API_TOKEN")
+        if token and self.headers.get("X-API-Token") != token:
+            self._antwort(401, {"fehler": "X-API-Token fehlt oder ist falsch"})
+            return False
+        return True
+
+    def do_GET(self):
+        if not self._autorisiert():
+            return
+        if self.path.rstrip("/") == "/engines":
+            self._antwort(200, beschreibung())
+        elif self.path.rstrip("/") == "/metrics":
+            body = trace.prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self._antwort(404, {"fehler": f"Unbekannter Pfad {self.path}"})
+
+    def do_POST(self):
+        if not self._autorisiert():
+            return
+        teile = self.path.strip("/").split("/")
+        if len(teile) != 2 or teile[0] != "berechne":
+            self._antwort(404, {"fehler": f"Unbekannter Pfad {self.path}"})
+            return
+        if teile[1] not in ENGINES:
+            self._antwort(404, {"fehler": f"Unbekannte Engine '{teile[1]}'",
+                                "engines": list(ENGINES)})
+            return
+        laenge = int(self.headers.get("Content-Length") or 0)
+        if laenge > MAX_BODY:
+            self._antwort(413, {"fehler": "Anfrage zu groß"})
+            return
+        try:
+            daten = json.loads(self.rfile.read(laenge) or b"{}")
+            if not isinstance(daten, (dict, list)):
+                raise ValueError("Body muss ein Objekt oder eine Liste sein")
+            self._antwort(200, berechne_anfrage(teile[1], daten))
+        except (ValueError, TypeError, KeyError) as e:
+            self._antwort(400, {"fehler": f"{type(e).__name__}: {e}"})
+        except Exception as e:
+            self._antwort(500, {"fehler": f"{type(e).__name__}: {e}"})
+
+    def log_message(self, format, *args):
+        if not self.server.leise:
+            super().log_message(format, *args)
+
+
+def erstelle_server(host="127.0.0.1", port=8765, leise=False):
+    server = ThreadingHTTPServer((host, port), EngineHandler)
+    server.leise = leise
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m coolsulting.engines.service",
+                                     description="HTTP/JSON-Schnittstelle der coolsulting-Rechenkerne.")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind-Adresse (Standard: nur lokal)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--leise", action="store_true", help="Kein Zugriffslog")
+    args = parser.parse_args(argv)
+    server = erstelle_server(args.host, args.port, args.leise)
+    print(f"coolsulting Engine-API läuft auf http://{args.host}:{args.port}  (Strg+C beendet)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+# ============================================================================
+# DATEI: coolsulting/engines/sonne.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Sonnenstand und Einstrahlung auf beliebig orientierte und
+#               geneigte Flächen (wolkenloser Auslegungstag je Monat, ASHRAE-
+#               Klarhimmelmodell, isotroper Himmel, Bodenreflexion 0,2).
+#
+#   Je (Breitengrad, Monat) wird EINMAL eine Tabelle aller Azimut- und
+#   Neigungsstufen gerechnet (72 × 19 × 24, gecacht); die Kühllast-Kerne
+#   lesen daraus nur noch per Index – keine Trigonometrie je Aufruf.
+#
+#   Orientierung: Name ("SUED", "NORD-WEST", "DACH"), Azimut in Grad
+#   (0 = Nord, 90 = Ost, 180 = Süd, 270 = West; senkrechte Fläche) oder
+#   Tupel (Azimut, Neigung) mit Neigung 0 = waagerecht, 90 = senkrecht.
+# ============================================================================
+
+from functools import lru_cache
+
+import numpy as np
+
+STANDARD_BREITE = 51.0    # Mitte Deutschland [°N]
+STANDARD_MONAT = 7        # Auslegungsmonat Kühlfall
+
+AZIMUT_SCHRITT = 5        # Grad je Tabellenstufe
+NEIGUNG_SCHRITT = 5
+BREITE_SCHRITT = 0.5
+ALBEDO = 0.2
+
+# Name -> (Azimut, Neigung)
+RICHTUNGEN = {
+    "NORD":      (0, 90),
+    "NORD-OST":  (45, 90),
+    "OST":       (90, 90),
+    "SUED-OST":  (135, 90),
+    "SUED":      (180, 90),
+    "SUED-WEST": (225, 90),
+    "WEST":      (270, 90),
+    "NORD-WEST": (315, 90),
+    "DACH":      (180, 0),
+}
+
+# ASHRAE-Klarhimmel je Monat (21.): A [W/m²], B [-], C [-]
+_ASHRAE_A = np.array([1230, 1215, 1186, 1136, 1104, 1088, 1085, 1107, 1151, 1192, 1221, 1233], float)
+_ASHRAE_B = np.array([.142, .144, .156, .180, .196, .205, .207, .201, .177, .160, .149, .142])
+_ASHRAE_C = np.array([.058, .060, .071, .097, .121, .134, .136, .122, .092, .073, .063, .057])
+_TAG_IM_JAHR = np.array([21, 52, 80, 111, 141, 172, 202, 233, 264, 294, 325, 355])
+
+_AZIMUTE = np.arange(0, 360, AZIMUT_SCHRITT)
+_NEIGUNGEN = np.arange(0, 90 + NEIGUNG_SCHRITT, NEIGUNG_SCHRITT)
+
+
+def richtung(orient):
+    """Orientierung (Name, Azimut oder (Azimut, Neigung)) -> (Azimut, Neigung) in Grad."""
+    if isinstance(orient, str):
+        return RICHTUNGEN[orient]          # KeyError bei unbekanntem Namen
+    if isinstance(orient, (tuple, list)):
+        return float(orient[0]) % 360, float(orient[1])
+    return float(orient) % 360, 90.0
+
+
+def himmelsrichtung(orient):
+    """Nächstgelegener Name aus RICHTUNGEN (für namensbasierte Tabellen wie Q_ORI)."""
+    if isinstance(orient, str):
+        return orient
+    azimut, neigung = richtung(orient)
+    if neigung < 45:
+        return "DACH"
+    return min((n for n in RICHTUNGEN if n != "DACH"),
+               key=lambda n: abs((RICHTUNGEN[n][0] - azimut + 180) % 360 - 180))
+
+
+# ============================================================
+# 1. SONNENSTAND + KLARHIMMEL
+# ============================================================
+def sonnenstand(breite, monat):
+    """Sonnenhöhe und -azimut [rad] je Stunde (Stundenmitte, wahre Ortszeit)."""
+    phi = np.radians(breite)
+    delta = np.radians(23.45 * np.sin(np.radians(360 * (284 + _TAG_IM_JAHR[monat - 1]) / 365)))
+    omega = np.radians(15 * (np.arange(24) + 0.5 - 12))
+    sin_h = np.sin(phi) * np.sin(delta) + np.cos(phi) * np.cos(delta) * np.cos(omega)
+    hoehe = np.arcsin(np.clip(sin_h, -1, 1))
+    cos_az = ((np.sin(delta) - sin_h * np.sin(phi))
+              / np.maximum(np.cos(hoehe) * np.cos(phi), 1e-9))
+    azimut = np.arccos(np.clip(cos_az, -1, 1))
+    return hoehe, np.where(omega > 0, 2 * np.pi - azimut, azimut)
+
+
+@lru_cache(maxsize=64)
+def _tabelle(breite, monat):
+    hoehe, azimut = sonnenstand(breite, monat)
+    sin_h = np.sin(hoehe)
+    direkt = np.where(sin_h > 0, _ASHRAE_A[monat - 1]
+                      * np.exp(-_ASHRAE_B[monat - 1] / np.maximum(sin_h, 1e-3)), 0.0)
+    diffus = _ASHRAE_C[monat - 1] * direkt
+    gamma = np.radians(_AZIMUTE)[:, None, None]
+    beta = np.radians(_NEIGUNGEN)[None, :, None]
+    cos_theta = (sin_h * np.cos(beta)
+                 + np.cos(hoehe) * np.sin(beta) * np.cos(azimut - gamma))
+    t = (direkt * np.maximum(cos_theta, 0.0)
+         + diffus * (1 + np.cos(beta)) / 2
+         + ALBEDO * (direkt * np.maximum(sin_h, 0.0) + diffus) * (1 - np.cos(beta)) / 2)
+    t.setflags(write=False)
+    return t
+
+
+def strahlungstabelle(breite=STANDARD_BREITE, monat=STANDARD_MONAT):
+    """Einstrahlung [W/m²] für alle Stufen (Azimut × Neigung × 24 h), gecacht."""
+    return _tabelle(round(float(breite) / BREITE_SCHRITT) * BREITE_SCHRITT, int(monat))
+
+
+def _stufe(orient):
+    azimut, neigung = richtung(orient)
+    return (int(round(azimut / AZIMUT_SCHRITT)) % len(_AZIMUTE),
+            int(round(min(max(neigung, 0), 90) / NEIGUNG_SCHRITT)))
+
+
+# ============================================================
+# 2. PROFILE FÜR DIE KÜHLLAST
+# ============================================================
+def strahlung(orient, breite=STANDARD_BREITE, monat=STANDARD_MONAT):
+    """24h-Einstrahlung [W/m²] auf eine Fläche."""
+    i, j = _stufe(orient)
+    return strahlungstabelle(breite, monat)[i, j]
+
+
+def profile(orientierungen, breite, monat):
+    """N × 24 Einstrahlung; nachgeschlagen je eindeutiger (Orientierung, Ort, Monat)."""
+    schluessel = list(zip(orientierungen, breite, monat))
+    cache = {k: strahlung(*k) for k in set(schluessel)}
+    return np.array([cache[k] for k in schluessel]).reshape(len(schluessel), 24)
+
+
+def globalstrahlung_klar(breite=STANDARD_BREITE):
+    """Klarhimmel-Globalstrahlung horizontal [W/m²] je Monat × Stunde (12 × 24)."""
+    return np.array([strahlungstabelle(breite, m)[0, 0] for m in range(1, 13)])
@@ -0,0 +1,105 @@
+# ============================================================================
+# DATEI: coolsulting/engines/studie.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Parameterstudie (Design-Space) für coolMATH PRO – eine oder
+#               zwei Eingaben werden für ALLE Zonen gemeinsam variiert
+#               (z.B. Sonnenschutz × Verglasung). Das ganze Gitter wird als
+#               ein gekachelter Parametersatz mit dem vektorisierten Kern
+#               gerechnet (keine calc_*-Aufrufe je Zelle); Ergebnis je Zelle
+#               und Methode: simultane Gebäudespitze, Geräteleistung und
+#               Gerätekosten (Samsung, Auswahl wie find_samsung_device).
+# ============================================================================
+
+import numpy as np
+
+from coolsulting.engines.kuehllast import (
+    DELTA_T, F_BAU, FC_WERTE, G_WERTE, METHODEN, PHI_BAU, Q_STD, TAU_BAU, U_WERTE,
+    flaechen_summen, methoden_tensor, parameter_kacheln, zonen_parameter,
+)
+from coolsulting.engines.samsung import katalog
+from coolsulting.trace import traced
+
+ZONEN_JE_BLOCK = 8192     # Varianten × Zonen je Rechenblock
+SICHERHEIT = 1.10         # Norm-Zuschlag wie find_samsung_device
+
+# Feld -> (Bezeichnung, Werte); Fenster/Personen als Faktor auf die Planung
+GROESSEN = {
+    "shade":    ("Sonnenschutz", list(FC_WERTE)),
+    "glass":    ("Verglasung", list(G_WERTE)),
+    "standard": ("Gebäudestandard", list(U_WERTE)),
+    "bau_m":    ("Bauweise", list(TAU_BAU)),
+    "win":      ("Fensterfläche ×", [0.5, 0.75, 1.0, 1.25, 1.5]),
+    "pers":     ("Personen ×", [0.5, 1.0, 1.5, 2.0]),
+}
+
+
+def _setzen(q, feld, werte, n, s):
+    """Wert je Variante (Liste, eine Variante = n Zonen / s Flächen am Stück)."""
+    je_zone = lambda tabelle: np.repeat([float(tabelle[w]) for w in werte], n)
+    je_flaeche = lambda tabelle: np.repeat([float(tabelle[w]) for w in werte], s)
+    if feld == "shade":
+        q["fl_fc"] = je_flaeche(FC_WERTE)          # alle Fassaden der Zone
+    elif feld == "glass":
+        q["fl_g"] = je_flaeche(G_WERTE)
+    elif feld == "standard":
+        q["u"], q["delta_t"], q["q_std"] = je_zone(U_WERTE), je_zone(DELTA_T), je_zone(Q_STD)
+        q["dt"] = q["delta_t"][:, None]
+    elif feld == "bau_m":
+        q["tau"], q["phi"], q["f"] = je_zone(TAU_BAU), je_zone(PHI_BAU).astype(int), je_zone(F_BAU)
+    elif feld == "win":
+        q["fl_win"] = q["fl_win"] * np.repeat(np.asarray(werte, dtype=float), s)
+    elif feld == "pers":
+        q["pers"] = q["pers"] * np.repeat(np.asarray(werte, dtype=float), n)
+    else:
+        raise ValueError(f"Unbekannte Studiengröße: {feld}")
+
+
+def geraete_summen(spitzen_w, serie=None):
+    """Kleinstes Gerät ≥ Spitze × SICHERHEIT je Zone (größtes bei Überschreitung),
+    vektorisiert über beliebige Achsen; letzte Achse = Zonen.
+    -> (Summe Preis [EUR], Summe Leistung [kW], Anzahl Zonen über größtem Gerät)."""
+    bedarf = np.asarray(spitzen_w, dtype=float) * SICHERHEIT / 1000.0
+    _, kw, preis, zu_gross = katalog().auswahl(bedarf, serie)
+    return preis.sum(axis=-1), kw.sum(axis=-1), zu_gross.sum(axis=-1)
+
+
+@traced()
+def parameter_studie(zonen, feld_a, feld_b=None, serie=None, methoden=None):
+    """Gitter feld_a × feld_b (ohne feld_b: eine Spalte) für alle Zonen.
+
+    -> dict mit ``a``/``b`` (Werte), ``spitze_w``, ``kosten_eur``, ``geraete_kw``
+    und ``zu_gross`` je (A × B × M Methoden); Methoden-Achse = ``methoden``
+    (Standard: alle METHODEN).
+    """
+    methoden = list(METHODEN if methoden is None else methoden)
+    p = zonen_parameter(zonen)
+    n, s = p["n"], len(p["fl_zone"])
+    if n == 0:
+        raise ValueError("Keine Zonen")
+    a_werte = GROESSEN[feld_a][1]
+    b_werte = GROESSEN[feld_b][1] if feld_b else [None]
+    gitter = [(a, b) for a in a_werte for b in b_werte]
+    block = max(1, ZONEN_JE_BLOCK // n)
+    spitzen, kosten, leistung, zu_gross = [], [], [], []
+    for start in range(0, len(gitter), block):
+        teil = gitter[start:start + block]
+        q = parameter_kacheln(p, len(teil))
+        _setzen(q, feld_a, [a for a, _ in teil], n, s)
+        if feld_b:
+            _setzen(q, feld_b, [b for _, b in teil], n, s)
+        t = methoden_tensor(flaechen_summen(q), methoden).reshape(len(teil), n, len(methoden), -1)
+        spitzen.append(t.sum(axis=1).max(axis=2))                           # (G × M)
+        preis, kw, anzahl = geraete_summen(t.max(axis=3).transpose(0, 2, 1), serie)
+        kosten.append(preis)
+        leistung.append(kw)
+        zu_gross.append(anzahl)
+    form = (len(a_werte), len(b_werte), len(methoden))
+    return {
+        "feld_a": feld_a, "feld_b": feld_b, "a": a_werte, "b": b_werte, "methoden": methoden,
+        "spitze_w":   np.concatenate(spitzen).reshape(form),
+        "kosten_eur": np.concatenate(kosten).reshape(form),
+        "geraete_kw": np.concatenate(leistung).reshape(form),
+        "zu_gross":   np.concatenate(zu_gross).reshape(form),
+    }
@@ -0,0 +1,164 @@
+# ============================================================================
+# DATEI: coolsulting/engines/unsicherheit.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Monte-Carlo-Sensitivität der Kühllast (coolMATH PRO).
+#               Unsichere Eingaben (Personen, Technik, g-Wert, Fc,
+#               Fensterfläche) werden je Zone tausendfach gezogen; gerechnet
+#               wird blockweise mit dem vektorisierten Kern (Stichproben ×
+#               Zonen als eine Zonenliste). Ergebnis: P50/P90/P99 der
+#               simultanen Gebäudespitze je Methode und die Samsung-Geräte
+#               je Zone zu diesen Quantilen.
+#
+#   monte_carlo(zonen, stichproben=2000)   -> dict (blockierend)
+#   MonteCarloLauf(zonen, ...).start()     -> Hintergrund-Thread mit
+#                                             .fortschritt / .ergebnis
+# ============================================================================
+
+import threading
+
+import numpy as np
+
+from coolsulting.engines.kuehllast import (
+    BASIS_METHODE, aktive_methoden, flaechen_summen, methoden_tensor, parameter_kacheln,
+    zonen_parameter,
+)
+from coolsulting.engines.samsung import SAMSUNG_DEFAULT_SERIE, katalog
+from coolsulting.trace import traced
+
+QUANTILE = (50, 90, 99)
+ZONEN_JE_BLOCK = 8192     # Stichproben × Zonen je Rechenblock (~40 MB für VDI 6007)
+
+# Dreiecksverteilung (min, wahrscheinlichster Wert, max) je unsicherer Eingabe.
+# Faktoren auf den Planwert; "fc" ist der Anteil Richtung "kein Sonnenschutz"
+# (0 = wie geplant, 1 = Fc = 1, Sonnenschutz fehlt/wird nicht genutzt).
+VERTEILUNGEN = {
+    "pers": (0.5, 1.0, 2.0),
+    "tech": (0.7, 1.0, 1.5),
+    "g":    (0.9, 1.0, 1.1),
+    "win":  (0.95, 1.0, 1.10),
+    "fc":   (0.0, 0.0, 1.0),
+}
+BEZEICHNUNGEN = {"pers": "Personen (Faktor)", "tech": "Technik (Faktor)",
+                 "g": "g-Wert (Faktor)", "win": "Fensterfläche (Faktor)",
+                 "fc": "Sonnenschutz-Ausfall (Anteil)"}
+
+
+class Abgebrochen(Exception):
+    """Lauf über ``abbruch`` beendet."""
+
+
+# ============================================================
+# 1. STICHPROBEN
+# ============================================================
+def _ziehen(rng, verteilung, anzahl):
+    unten, modus, oben = verteilung
+    if unten == oben:
+        return np.full(anzahl, float(unten))
+    return rng.triangular(unten, modus, oben, size=anzahl)
+
+
+def _stichproben_parameter(p, anzahl, rng, verteilungen):
+    """``anzahl`` gestörte Kopien der Zonenparameter (eine Ziehung je Zone und Kopie)."""
+    q = parameter_kacheln(p, anzahl)
+    f = {k: _ziehen(rng, v, q["n"]) for k, v in verteilungen.items()}
+    zone = q["fl_zone"]
+    q["pers"] = q["pers"] * f["pers"]
+    q["tech"] = q["tech"] * f["tech"]
+    q["fl_g"] = q["fl_g"] * f["g"][zone]
+    q["fl_win"] = q["fl_win"] * f["win"][zone]
+    q["fl_fc"] = q["fl_fc"] + (1.0 - q["fl_fc"]) * f["fc"][zone]
+    return flaechen_summen(q)
+
+
+@traced()
+def monte_carlo(zonen, stichproben=2000, seed=0, verteilungen=None,
+                fortschritt=None, abbruch=None, serie=None, methoden=None):
+    """Quantile der Gebäudespitze je Methode und Geräte je Zone.
+
+    ``zonen`` wie berechne_zonen(); ``verteilungen`` ergänzt/überschreibt
+    VERTEILUNGEN; ``fortschritt(anteil)`` nach jedem Block, ``abbruch()``
+    -> True beendet mit Abgebrochen; ``methoden`` wie aktive_methoden().
+    """
+    verteilungen = {**VERTEILUNGEN, **(verteilungen or {})}
+    methoden = aktive_methoden(methoden)
+    basis = methoden.index(BASIS_METHODE)
+    p = zonen_parameter(zonen)
+    n = p["n"]
+    if n == 0:
+        raise ValueError("Keine Zonen")
+    rng = np.random.default_rng(seed)
+    block = max(1, ZONEN_JE_BLOCK // n)
+    gebaeude, zone_spitze = [], []
+    fertig = 0
+    while fertig < stichproben:
+        if abbruch and abbruch():
+            raise Abgebrochen()
+        k = min(block, stichproben - fertig)
+        t = methoden_tensor(_stichproben_parameter(p, k, rng, verteilungen), methoden)
+        t = t.reshape(k, n, len(methoden), -1)                      # (k × N × M × 24)
+        gebaeude.append(t.sum(axis=1).max(axis=2))                  # (k × M)
+        zone_spitze.append(t[:, :, basis].max(axis=2))              # (k × N), VDI 6007
+        fertig += k
+        if fortschritt:
+            fortschritt(fertig / stichproben)
+
+    gebaeude = np.concatenate(gebaeude)
+    zone_spitze = np.concatenate(zone_spitze)
+    plan = methoden_tensor(p, methoden)
+    q_geb = np.percentile(gebaeude, QUANTILE, axis=0)               # (Q × M)
+    q_zone = np.percentile(zone_spitze, QUANTILE, axis=0)           # (Q × N)
+    # Geräte wie find_samsung_device (ganze Watt, +10 %), alle Zonen und Quantile auf einmal
+    kat = katalog()
+    serie = kat.serie(serie or SAMSUNG_DEFAULT_SERIE)
+    idx, kw, _, _ = kat.auswahl(q_zone.astype(int) * 1.10 / 1000.0, serie)
+    return {
+        "stichproben": fertig,
+        "gebaeude": {m: {"plan": float(plan.sum(axis=0)[mi].max()),
+                         **{f"P{q}": float(q_geb[qi, mi]) for qi, q in enumerate(QUANTILE)}}
+                     for mi, m in enumerate(methoden)},
+        "zonen": [{"plan": float(plan[i, basis].max()),
+                   **{f"P{q}": float(q_zone[qi, i]) for qi, q in enumerate(QUANTILE)},
+                   **{f"geraet_P{q}": kat.geraete[serie][idx[qi, i]]["bez"]
+                      for qi, q in enumerate(QUANTILE)},
+                   **{f"kw_P{q}": float(kw[qi, i]) for qi, q in enumerate(QUANTILE)}}
+                  for i in range(n)],
+        "verteilung_vdi": gebaeude[:, basis],
+    }
+
+
+# ============================================================
+# 2. HINTERGRUND-LAUF (Streamlit bleibt bedienbar)
+# ============================================================
+class MonteCarloLauf(threading.Thread):
+    """monte_carlo() in einem Daemon-Thread; UI fragt ``fortschritt``,
+    ``fertig``, ``ergebnis`` bzw. ``fehler`` ab."""
+
+    def __init__(self, zonen, **optionen):
+        super().__init__(name="coolMATH-MonteCarlo", daemon=True)
+        self.zonen = list(zonen)
+        self.optionen = optionen
+        self.fortschritt = 0.0
+        self.ergebnis = None
+        self.fehler = None
+        self._abbruch = threading.Event()
+
+    def run(self):
+        try:
+            self.ergebnis = monte_carlo(self.zonen, fortschritt=self._melden,
+                                        abbruch=self._abbruch.is_set, **self.optionen)
+        except Abgebrochen:
+            self.fehler = "abgebrochen"
+        except Exception as e:     # Anzeige im UI statt Thread-Traceback
+            self.fehler = f"{type(e).__name__}: {e}"
+
+    def _melden(self, anteil):
+        self.fortschritt = anteil
+
+    def abbrechen(self):
+        self._abbruch.set()
+
+    @property
+    def fertig(self):
+        return not self.is_alive() and (self.ergebnis is not None or self.fehler is not None)
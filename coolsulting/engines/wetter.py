@@ -0,0 +1,116 @@
+# ============================================================================
+# DATEI: coolsulting/engines/wetter.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Stündliche Wetterdaten (8760 h) für die Jahressimulation –
+#               nur lokale Dateien, kein Netzwerk.
+#
+#   EPW  (EnergyPlus Weather, *.epw)    Spalten Temperatur, Global-/Direkt-/
+#                                       Diffusstrahlung horizontal
+#   TRY  (DWD Testreferenzjahr, *.dat)  Kopf bis "***", dann Spalten
+#                                       RW HW MM DD HH t p WR WG N x RF B D ...
+#
+#   lade_wetter(pfad)            -> dict mit NumPy-Spalten (Länge 8760)
+#   referenzjahr_synthetisch()   -> Näherung ohne Wetterdatei (Demo/Tests)
+# ============================================================================
+
+import io
+import os
+
+import numpy as np
+
+STUNDEN_JAHR = 8760
+TAGE_JE_MONAT = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+
+def _kalender():
+    """Monat (1–12) und Stunde des Tages (0–23) je Jahresstunde (ohne 29.2.)."""
+    monat = np.repeat(np.arange(1, 13), np.array(TAGE_JE_MONAT) * 24)
+    stunde = np.tile(np.arange(24), STUNDEN_JAHR // 24)
+    return monat, stunde
+
+
+def _wetter(name, temp, direkt_h, diffus_h, quelle):
+    temp = np.asarray(temp, dtype=float)
+    if len(temp) != STUNDEN_JAHR:
+        raise ValueError(f"{name}: {len(temp)} Stundenwerte statt {STUNDEN_JAHR}")
+    direkt_h = np.clip(np.asarray(direkt_h, dtype=float), 0, None)
+    diffus_h = np.clip(np.asarray(diffus_h, dtype=float), 0, None)
+    monat, stunde = _kalender()
+    return {"name": name, "quelle": quelle, "temp": temp,
+            "direkt_h": direkt_h, "diffus_h": diffus_h, "global_h": direkt_h + diffus_h,
+            "monat": monat, "stunde": stunde}
+
+
+def _text(quelle):
+    if isinstance(quelle, bytes):
+        return quelle.decode("latin-1")
+    with io.open(quelle, encoding="latin-1") as f:
+        return f.read()
+
+
+# ============================================================
+# 1. EINLESEN
+# ============================================================
+def lese_epw(quelle, name=None):
+    """EnergyPlus-Wetterdatei (Pfad oder Bytes); 8 Kopfzeilen, dann 8760 Zeilen."""
+    zeilen = [z for z in _text(quelle).splitlines()[8:] if z.strip()]
+    # Schaltjahre: 29.2. auslassen
+    felder = [z.split(",") for z in zeilen]
+    felder = [f for f in felder if not (f[1].strip() == "2" and f[2].strip() == "29")]
+    ort = name or (os.path.basename(quelle) if isinstance(quelle, str) else "EPW")
+    return _wetter(ort, [float(f[6]) for f in felder],
+                   # Direktnormal (14) -> horizontal über Global - Diffus (13, 15)
+                   [float(f[13]) - float(f[15]) for f in felder],
+                   [float(f[15]) for f in felder], "EPW")
+
+
+def lese_try(quelle, name=None):
+    """DWD-Testreferenzjahr (Pfad oder Bytes); Datenzeilen nach der Zeile '***'."""
+    zeilen = _text(quelle).splitlines()
+    start = next((i + 1 for i, z in enumerate(zeilen) if z.startswith("***")), 0)
+    felder = [z.split() for z in zeilen[start:] if z.strip()]
+    felder = [f for f in felder if not (f[2] == "2" and f[3] == "29")]
+    ort = name or (os.path.basename(quelle) if isinstance(quelle, str) else "TRY")
+    return _wetter(ort, [float(f[5]) for f in felder],
+                   [float(f[12]) for f in felder], [float(f[13]) for f in felder], "TRY")
+
+
+def lade_wetter(quelle, name=None):
+    """EPW oder TRY anhand Endung bzw. Inhalt erkennen."""
+    if isinstance(quelle, str) and quelle.lower().endswith(".epw"):
+        return lese_epw(quelle, name)
+    if isinstance(quelle, bytes) and quelle[:8].upper().startswith(b"LOCATION"):
+        return lese_epw(quelle, name)
+    return lese_try(quelle, name)
+
+
+def wetterdateien(verzeichnis):
+    """EPW/TRY-Dateien in einem Verzeichnis (für die Auswahl im UI)."""
+    if not os.path.isdir(verzeichnis):
+        return []
+    return sorted(os.path.join(verzeichnis, f) for f in os.listdir(verzeichnis)
+                  if f.lower().endswith((".epw", ".dat")))
+
+
+# ============================================================
+# 2. NÄHERUNG OHNE WETTERDATEI
+# ============================================================
+def referenzjahr_synthetisch(t_mittel=10.0, t_amplitude_jahr=9.0, t_amplitude_tag=4.0,
+                             g_max_sommer=850.0, g_max_winter=250.0):
+    """Glattes Referenzjahr (Mitteleuropa): Temperatur als Jahres- plus Tages-
+    sinus (Maximum Ende Juli / 15 Uhr), wolkenlose Globalstrahlung mit
+    saisonaler Spitze. Nur Näherung – für Angebote eine TRY/EPW verwenden.
+    """
+    t = np.arange(STUNDEN_JAHR)
+    tag = t // 24
+    _, stunde = _kalender()
+    jahr = np.cos(2 * np.pi * (tag - 205) / 365)
+    temp = (t_mittel + t_amplitude_jahr * jahr
+            + t_amplitude_tag * np.cos(2 * np.pi * (stunde - 15) / 24))
+    tageslaenge = 12 + 4 * jahr                                  # h
+    g_max = (g_max_sommer + g_max_winter) / 2 + (g_max_sommer - g_max_winter) / 2 * jahr
+    sonne = np.cos(np.pi * (stunde + 0.5 - 12.5) / tageslaenge)
+    global_h = np.where(sonne > 0, g_max * sonne, 0.0)
+    return _wetter("Synthetisches Referenzjahr", temp, global_h * 0.7, global_h * 0.3, "synthetisch")
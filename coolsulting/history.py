@@ -0,0 +1,216 @@
+# ============================================================================
+# DATEI: coolsulting/history.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Persistenter Berechnungsverlauf für °central_STATION_PRO.
+#               Ersetzt die Liste st.session_state.verlauf_heute durch eine
+#               append-only SQLite-Tabelle (Indizes auf Datum, Modul, Projekt)
+#               mit strukturierten Zahlenwerten statt fertiger Strings.
+#               Jeder Eintrag gehört einem Nutzer (eingeloggte Firma bzw.
+#               Browser-Kennung); Abfragen zeigen nur die eigenen Einträge,
+#               alle Nutzer nur für Admins (alle=True).
+# ============================================================================
+
+import json
+import os
+import secrets
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime, timedelta
+
+from coolsulting.paths import ROOT_DIR
+from coolsulting.trace import traced
+
+DB_PATH = os.environ.get("CS_VERLAUF_DB",
+                         os.path.join(ROOT_DIR, "centralstation_verlauf.db"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verlauf (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts          TEXT NOT NULL,
+    datum       TEXT NOT NULL,
+    modul       TEXT NOT NULL,
+    projekt     TEXT NOT NULL DEFAULT '',
+    bezeichnung TEXT NOT NULL DEFAULT '',
+    groesse     TEXT,
+    wert        REAL,
+    einheit     TEXT,
+    werte       TEXT NOT NULL DEFAULT '{}',
+    nutzer      TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_verlauf_datum   ON verlauf(datum);
+CREATE INDEX IF NOT EXISTS idx_verlauf_modul   ON verlauf(modul, datum);
+CREATE INDEX IF NOT EXISTS idx_verlauf_projekt ON verlauf(projekt, datum);
+"""
+# nach Spalte nutzer (ältere Dateien erhalten sie per ALTER TABLE; ihre
+# Einträge ohne Nutzer sieht nur die Admin-Ansicht)
+_INDEX_NUTZER = "CREATE INDEX IF NOT EXISTS idx_verlauf_nutzer ON verlauf(nutzer, datum)"
+
+_INIT_LOCK = threading.Lock()
+_initialisiert = set()
+
+
+def _connect(db_path=None):
+    db_path = db_path or DB_PATH
+    conn = sqlite3.connect(db_path, timeout=5.0)
+    conn.row_factory = sqlite3.Row
+    if db_path not in _initialisiert:
+        with _INIT_LOCK:
+            if db_path not in _initialisiert:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                spalten = {r[1] for r in conn.execute("PRAGMA table_info(verlauf)")}
+                if "nutzer" not in spalten:
+                    conn.execute("ALTER TABLE verlauf ADD COLUMN nutzer TEXT NOT NULL DEFAULT ''")
+                conn.execute(_INDEX_NUTZER)
+                conn.commit()
+                _initialisiert.add(db_path)
+    return conn
+
+
+# ============================================================
+# 1. NUTZER
+# ============================================================
+def _auth_user():
+    try:
+        import streamlit as st
+        return st.session_state.get("auth_user") or {}
+    except Exception:                     # ohne Streamlit / außerhalb einer Session
+        return {}
+
+
+def nutzer():
+    """Eigentümer der Session: "firma:<Firma>" nach Login, sonst eine zufällige
+    Browser-Kennung (Query-Parameter ?vid=, bleibt beim Neuladen erhalten).
+    Außerhalb einer Streamlit-Session "".
+
+    Grenze ohne Login: die Kennung steht in der URL – wer einen Link mit
+    ?vid= bekommt, sieht und ergänzt denselben Verlauf (Abgrenzung je Link,
+    nicht je Person). Vertrauliche Einträge nur mit Login.
+    """
+    firma = _auth_user().get("firma")
+    if firma:
+        return f"firma:{firma}"
+    try:
+        import streamlit as st
+        vid = st.query_params.get("vid", "")
+        if len(vid) != 16 or not all(z in "0123456789abcdef" for z in vid):
+            vid = secrets.token_hex(8)
+            st.query_params["vid"] = vid
+        return f"browser:{vid}"
+    except Exception:
+        return ""
+
+
+def ist_admin():
+    return _auth_user().get("role") == "admin"
+
+
+# ============================================================
+# 2. SCHREIBEN
+# ============================================================
+@traced("db.verlauf.eintragen")
+def eintragen(modul, bezeichnung, werte, projekt="", nutzer_id=None, db_path=None):
+    """Hängt eine Berechnung an den Verlauf an und liefert die ID.
+
+    ``werte``: ``{"Kältebedarf": (3.21, "kW"), ...}`` – Zahlen bleiben Zahlen.
+    Der erste Eintrag ist der Hauptwert (eigene, sortierbare Spalten).
+    Eigentümer ist ``nutzer_id`` bzw. ``nutzer()`` der aktuellen Session.
+    """
+    if nutzer_id is None:
+        nutzer_id = nutzer()
+    werte = {k: [float(v[0]), v[1]] for k, v in werte.items()}
+    groesse, (wert, einheit) = next(iter(werte.items()), (None, (None, None)))
+    jetzt = datetime.now()
+    with closing(_connect(db_path)) as conn:
+        cur = conn.execute(
+            "INSERT INTO verlauf (ts, datum, modul, projekt, bezeichnung,"
+            " groesse, wert, einheit, werte, nutzer) VALUES (?,?,?,?,?,?,?,?,?,?)",
+            (jetzt.isoformat(timespec="seconds"), jetzt.strftime("%Y-%m-%d"),
+             modul, projekt or "", bezeichnung or "", groesse, wert, einheit,
+             json.dumps(werte, ensure_ascii=False), nutzer_id))
+        conn.commit()
+        return cur.lastrowid
+
+
+# ============================================================
+# 3. ABFRAGEN
+# ============================================================
+def _nutzer_filter(nutzer_id, alle):
+    """(where, args) für den Eigentümer; alle=True (alle Nutzer) nur für Admins."""
+    if alle:
+        if not ist_admin():
+            raise PermissionError("Verlauf aller Nutzer nur für Admins")
+        return [], []
+    return ["nutzer = ?"], [nutzer() if nutzer_id is None else nutzer_id]
+
+
+def _filter(datum_von, datum_bis, modul, projekt, suche, nutzer_id=None, alle=False):
+    where, args = _nutzer_filter(nutzer_id, alle)
+    if datum_von:
+        where.append("datum >= ?"); args.append(str(datum_von))
+    if datum_bis:
+        where.append("datum <= ?"); args.append(str(datum_bis))
+    if modul:
+        where.append("modul = ?"); args.append(modul)
+    if projekt:
+        where.append("projekt = ?"); args.append(projekt)
+    if suche:
+        where.append("(bezeichnung LIKE ? OR projekt LIKE ?)")
+        args += [f"%{suche}%", f"%{suche}%"]
+    return (" WHERE " + " AND ".join(where)) if where else "", args
+
+
+def _zeile(row):
+    d = dict(row)
+    d["werte"] = {k: tuple(v) for k, v in json.loads(d["werte"]).items()}
+    d["uhrzeit"] = d["ts"][11:16] + " Uhr"
+    return d
+
+
+@traced("db.verlauf.abfrage")
+def abfrage(datum_von=None, datum_bis=None, modul=None, projekt=None,
+            suche=None, limit=50, offset=0, nutzer_id=None, alle=False, db_path=None):
+    """Eigene Einträge (neueste zuerst) als Liste von Dicts; Datumsangaben ISO."""
+    sql_where, args = _filter(datum_von, datum_bis, modul, projekt, suche, nutzer_id, alle)
+    with closing(_connect(db_path)) as conn:
+        rows = conn.execute(
+            "SELECT * FROM verlauf" + sql_where +
+            " ORDER BY ts DESC, id DESC LIMIT ? OFFSET ?",
+            args + [int(limit), int(offset)]).fetchall()
+    return [_zeile(r) for r in rows]
+
+
+@traced("db.verlauf.anzahl")
+def anzahl(datum_von=None, datum_bis=None, modul=None, projekt=None,
+           suche=None, nutzer_id=None, alle=False, db_path=None):
+    sql_where, args = _filter(datum_von, datum_bis, modul, projekt, suche, nutzer_id, alle)
+    with closing(_connect(db_path)) as conn:
+        return conn.execute("SELECT COUNT(*) FROM verlauf" + sql_where,
+                            args).fetchone()[0]
+
+
+@traced("db.verlauf.module")
+def module(nutzer_id=None, alle=False, db_path=None):
+    """Module, in denen der Nutzer bereits Einträge hat (für Filter-Auswahl)."""
+    sql_where, args = _filter(None, None, None, None, None, nutzer_id, alle)
+    with closing(_connect(db_path)) as conn:
+        return [r[0] for r in conn.execute(
+            "SELECT DISTINCT modul FROM verlauf" + sql_where + " ORDER BY modul", args)]
+
+
+def zeitraum(name, heute=None):
+    """(datum_von, datum_bis) für 'Heute', '7 Tage', '30 Tage' oder 'Alle'."""
+    heute = heute or datetime.now().date()
+    tage = {"Heute": 0, "7 Tage": 6, "30 Tage": 29}.get(name)
+    if tage is None:
+        return None, None
+    return (heute - timedelta(days=tage)).isoformat(), heute.isoformat()
+
+
+def format_werte(eintrag):
+    """Anzeige-String aus den strukturierten Werten (z.B. 'Heizlast: 8.40 kW')."""
+    return " | ".join(f"{k}: {w:.2f} {e}".rstrip()
+                      for k, (w, e) in eintrag["werte"].items())
@@ -0,0 +1,81 @@
+# ============================================================================
+# DATEI: coolsulting/paths.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: App-relative Pfadauflösung für alle Unter-Apps.
+#               Ersetzt os.chdir() im Launcher – das Arbeitsverzeichnis ist
+#               prozessweit und damit bei parallelen Sessions nicht sicher.
+# ============================================================================
+
+import os
+import sys
+import threading
+
+# Wurzelverzeichnis des Repos (Launcher, Logos, Fonts, Preisliste)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class AppPaths:
+    """Löst Dateinamen relativ zum Verzeichnis einer App auf.
+
+    ``datei("Logo.png")`` liefert einen absoluten Pfad. Existiert die Datei
+    nicht im App-Verzeichnis, werden die Fallback-Verzeichnisse (Standard:
+    Repo-Wurzel mit den gemeinsamen Logos/Fonts) geprüft. Absolute Pfade
+    werden unverändert zurückgegeben.
+    """
+
+    def __init__(self, basis, fallbacks=(ROOT_DIR,)):
+        self.basis = os.path.abspath(basis)
+        self.fallbacks = tuple(os.path.abspath(f) for f in fallbacks
+                               if os.path.abspath(f) != self.basis)
+
+    def datei(self, name):
+        if os.path.isabs(name):
+            return name
+        kandidat = os.path.join(self.basis, name)
+        if os.path.exists(kandidat):
+            return kandidat
+        for fb in self.fallbacks:
+            alternativ = os.path.join(fb, name)
+            if os.path.exists(alternativ):
+                return alternativ
+        return kandidat
+
+    def existiert(self, name):
+        return os.path.exists(self.datei(name))
+
+    def __repr__(self):
+        return f"AppPaths({self.basis!r})"
+
+
+_CACHE = {}
+
+
+def fuer_datei(file_path):
+    """``AppPaths`` für das Verzeichnis einer .py-Datei (gecacht)."""
+    basis = os.path.dirname(os.path.abspath(file_path))
+    paths = _CACHE.get(basis)
+    if paths is None:
+        paths = _CACHE.setdefault(basis, AppPaths(basis))
+    return paths
+
+
+# ============================================================
+# SYS.PATH
+# ============================================================
+_SYS_PATH_LOCK = threading.Lock()
+
+
+def sys_path_einmal(verzeichnis):
+    """Fügt ein Verzeichnis genau einmal zu ``sys.path`` hinzu.
+
+    Es wird bewusst nie wieder entfernt: ein Entfernen, während eine andere
+    Session gerade importiert, führt zu sporadischen ImportErrors.
+    """
+    verzeichnis = os.path.abspath(verzeichnis)
+    if verzeichnis in sys.path:
+        return
+    with _SYS_PATH_LOCK:
+        if verzeichnis not in sys.path:
+            sys.path.insert(0, verzeichnis)
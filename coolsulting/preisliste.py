@@ -0,0 +1,274 @@
+# ============================================================================
+# DATEI: coolsulting/preisliste.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Samsung-Preisliste (S_Klima_Artikel_Import_*.xlsx) für alle
+#               Apps (coolMATH PRO, Samsung Quint, coolNEIGHBOR).
+#
+#   Die xlsx wird EINMAL je Dateiinhalt eingelesen (stdlib zipfile + XML,
+#   kein pandas/openpyxl nötig) und als kompaktes Spalten-Artefakt
+#   (NumPy-Arrays, .npz ohne pickle) unter CACHE_DIR abgelegt; Schlüssel ist
+#   der SHA-256 der xlsx. Spätere Prozesse laden nur das Artefakt, innerhalb
+#   eines Prozesses wird es je (Pfad, mtime, Größe) nur einmal geladen.
+#   Alle Artikelgruppen (S_FJM, S_RAC, S_BAC, S_DVM, Zubehör …) sind
+#   enthalten; Kühl-/Heizleistung und IG-Anschlüsse werden beim Einlesen
+#   einmal aus dem Langtext gelesen.
+#
+#   preisliste()                 -> Preisliste | None (Datei fehlt)
+#   preisliste().preis("AJ040TXJ2KG/EU")
+#   preisliste().gruppe("S_FJM") -> [Zeile als dict, …]
+# ============================================================================
+
+import hashlib
+import os
+import re
+import tempfile
+import zipfile
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+
+import numpy as np
+
+from coolsulting.paths import ROOT_DIR
+from coolsulting.trace import traced
+
+PREISLISTE_DATEI = os.environ.get(
+    "CS_PREISLISTE", os.path.join(ROOT_DIR, "S_Klima_Artikel_Import_2026-02-02-APP.xlsx"))
+CACHE_DIR = os.environ.get("CS_CACHE_DIR", os.path.join(ROOT_DIR, ".cache"))
+FORMAT = 3                # bei Änderung der Aufbereitung erhöhen (alte Artefakte ungültig)
+
+SPALTEN = ("Artikelnummer", "Bezeichnung", "Zusatz", "Artikelgruppe", "Listenpreis", "Langtext")
+
+_XL = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# "Kühlen 4.00 kW" bzw. "3.50 KW Kühlen"
+_RE_KUEHLEN = re.compile(r"Kühlen\s+(\d+(?:[.,]\d+)?)\s*kW|(\d+(?:[.,]\d+)?)\s*kW\s+Kühlen", re.I)
+_RE_HEIZEN = re.compile(r"Heizen\s+(\d+(?:[.,]\d+)?)\s*kW|(\d+(?:[.,]\d+)?)\s*kW\s+Heizen", re.I)
+_RE_ANSCHLUESSE = re.compile(r"Anschluss\s+Innenger(?:ä|ae)te\s+(?:\d+\s*~\s*)?(\d+)", re.I)   # "2~5" -> 5
+_RE_AG = re.compile(r"\bAG\b")
+
+
+def schluessel(art_nr):
+    """Artikelnummer vergleichbar machen: "AR70F09C1AWX/EU" = "AR70F09C1AWXEU"."""
+    return str(art_nr).replace("/", "").replace(" ", "").upper()
+
+
+# ============================================================
+# 1. XLSX EINLESEN (stdlib)
+# ============================================================
+def _spalte(ref):
+    """Zellbezug "AB12" -> Spaltenindex 27."""
+    i = 0
+    for zeichen in ref:
+        if not zeichen.isalpha():
+            break
+        i = i * 26 + ord(zeichen.upper()) - 64
+    return i - 1
+
+
+def _text(element):
+    return "".join(t.text or "" for t in element.iter(f"{_XL}t"))
+
+
+def lese_xlsx(pfad, blatt=None):
+    """Zeilen eines Tabellenblatts als Listen (Text bzw. None); Standard: erstes Blatt."""
+    with zipfile.ZipFile(pfad) as z:
+        mappe = ET.fromstring(z.read("xl/workbook.xml"))
+        blaetter = [(b.get("name"), b.get(f"{_REL}id")) for b in mappe.iter(f"{_XL}sheet")]
+        if not blaetter:
+            raise ValueError(f"{pfad}: keine Tabellenblätter")
+        namen = {name.strip(): rid for name, rid in blaetter}
+        if blatt is not None and blatt.strip() not in namen:
+            raise KeyError(f"Blatt {blatt!r} nicht in {list(namen)}")
+        rid = namen[blatt.strip()] if blatt is not None else blaetter[0][1]
+        ziele = {r.get("Id"): r.get("Target")
+                 for r in ET.fromstring(z.read("xl/_rels/workbook.xml.rels")).iter(f"{_PKG}Relationship")}
+        ziel = ziele[rid].lstrip("/")
+        ziel = ziel if ziel.startswith("xl/") else f"xl/{ziel}"
+        texte = ([_text(si) for si in ET.fromstring(z.read("xl/sharedStrings.xml")).iter(f"{_XL}si")]
+                 if "xl/sharedStrings.xml" in z.namelist() else [])
+        zeilen = []
+        for zeile in ET.fromstring(z.read(ziel)).iter(f"{_XL}row"):
+            werte = {}
+            for zelle in zeile.iter(f"{_XL}c"):
+                typ, v = zelle.get("t"), zelle.find(f"{_XL}v")
+                if typ == "inlineStr":
+                    wert = _text(zelle)
+                elif v is None:
+                    continue
+                elif typ == "s":
+                    wert = texte[int(v.text)]
+                else:
+                    wert = v.text
+                werte[_spalte(zelle.get("r"))] = wert
+            zeilen.append([werte.get(i) for i in range(max(werte) + 1)] if werte else [])
+    return zeilen
+
+
+# ============================================================
+# 2. AUFBEREITUNG (einmal je Dateiinhalt)
+# ============================================================
+def _zahl(text):
+    try:
+        return float(str(text).replace(",", "."))
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _treffer(regex, text):
+    m = regex.search(text or "")
+    return _zahl(next(g for g in m.groups() if g)) if m else np.nan
+
+
+def aufbereiten(zeilen):
+    """Kopfzeile + Datenzeilen -> Spalten (Listen; Zahlen als NumPy-Arrays)."""
+    kopf = [str(k).strip() if k is not None else "" for k in zeilen[0]]
+    fehlend = [s for s in SPALTEN if s not in kopf]
+    if fehlend:
+        raise ValueError(f"Preisliste: Spalten fehlen: {fehlend}")
+    daten = [z for z in zeilen[1:] if z and z[kopf.index("Artikelnummer")]]
+    spalten = {s: [z[kopf.index(s)] if kopf.index(s) < len(z) else None for z in daten]
+               for s in SPALTEN}
+    langtext = spalten["Langtext"]
+    spalten["Listenpreis"] = np.array([_zahl(p) for p in spalten["Listenpreis"]])
+    spalten["kuehl_kw"] = np.array([_treffer(_RE_KUEHLEN, t) for t in langtext])
+    spalten["heiz_kw"] = np.array([_treffer(_RE_HEIZEN, t) for t in langtext])
+    spalten["anschluesse"] = np.nan_to_num([_treffer(_RE_ANSCHLUESSE, t) for t in langtext]).astype(int)
+    return spalten
+
+
+class Preisliste:
+    """Spalten der Preisliste mit Index Artikelnummer -> Zeile."""
+
+    def __init__(self, spalten, quelle=None, sha256=None):
+        self.spalten = spalten
+        self.quelle = quelle
+        self.sha256 = sha256
+        self.index = {}
+        for i, art_nr in enumerate(spalten["Artikelnummer"]):
+            self.index.setdefault(schluessel(art_nr), i)      # erste Zeile gewinnt
+
+    def __len__(self):
+        return len(self.spalten["Artikelnummer"])
+
+    def __contains__(self, art_nr):
+        return schluessel(art_nr) in self.index
+
+    def _zeile(self, i):
+        z = {s: w[i] for s, w in self.spalten.items()}
+        for s in ("Listenpreis", "kuehl_kw", "heiz_kw"):
+            z[s] = None if np.isnan(z[s]) else float(z[s])
+        z["anschluesse"] = int(z["anschluesse"])
+        return z
+
+    def zeile(self, art_nr):
+        """Alle Felder eines Artikels als dict oder None."""
+        i = self.index.get(schluessel(art_nr))
+        return None if i is None else self._zeile(i)
+
+    def preis(self, art_nr, standard=None):
+        """Listenpreis [EUR netto] oder ``standard``."""
+        i = self.index.get(schluessel(art_nr))
+        if i is None or np.isnan(self.spalten["Listenpreis"][i]):
+            return standard
+        return float(self.spalten["Listenpreis"][i])
+
+    def gruppen(self):
+        return sorted({g for g in self.spalten["Artikelgruppe"] if g})
+
+    def gruppe(self, name):
+        """Alle Artikel einer Artikelgruppe (z.B. "S_FJM", "S_RAC") als dicts."""
+        return [self._zeile(i) for i, g in enumerate(self.spalten["Artikelgruppe"]) if g == name]
+
+    def fjm_ag_preise(self):
+        """FJM-Multi-Außengeräte: {Kühlleistung kW: {"preis", "art_nr", "anschluesse"}}."""
+        preise = {}
+        for z in self.gruppe("S_FJM"):
+            if (str(z["Artikelnummer"]).startswith("AJ") and _RE_AG.search(z["Bezeichnung"] or "")
+                    and z["kuehl_kw"] is not None and z["Listenpreis"] is not None):
+                preise[z["kuehl_kw"]] = {"preis": z["Listenpreis"], "art_nr": z["Artikelnummer"],
+                                         "anschluesse": z["anschluesse"]}
+        return preise
+
+
+# ============================================================
+# 3. CACHE (Artefakt je SHA-256 der xlsx)
+# ============================================================
+def _sha256(pfad):
+    h = hashlib.sha256()
+    with open(pfad, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def cache_pfad(sha256):
+    return os.path.join(CACHE_DIR, f"preisliste-{sha256[:20]}-v{FORMAT}.npz")
+
+
+_TEXTSPALTEN = ("Artikelnummer", "Bezeichnung", "Zusatz", "Artikelgruppe", "Langtext")
+_ZAHLSPALTEN = ("Listenpreis", "kuehl_kw", "heiz_kw", "anschluesse")
+
+
+def _speichern(datei, spalten, sha256):
+    """Artefakt als .npz: Textspalten als Unicode-Arrays (+ Maske für None),
+    Zahlen als Arrays – nichts, was beim Laden Code ausführt."""
+    arrays = {"format": np.array(FORMAT), "sha256": np.array(sha256)}
+    for s in _TEXTSPALTEN:
+        arrays[s] = np.array(["" if w is None else str(w) for w in spalten[s]], dtype=str)
+        arrays[f"{s}.none"] = np.array([w is None for w in spalten[s]], dtype=bool)
+    arrays.update({s: spalten[s] for s in _ZAHLSPALTEN})
+    np.savez(datei, **arrays)
+
+
+def _lesen(datei, sha256):
+    """Spalten aus dem Artefakt (allow_pickle=False) oder None bei anderem Stand."""
+    with np.load(datei, allow_pickle=False) as a:
+        if int(a["format"]) != FORMAT or str(a["sha256"]) != sha256:
+            return None
+        spalten = {}
+        for s in _TEXTSPALTEN:
+            spalten[s] = [None if leer else w for w, leer in zip(a[s].tolist(), a[f"{s}.none"])]
+        spalten.update({s: a[s] for s in _ZAHLSPALTEN})
+    return spalten
+
+
+@traced()
+def konvertieren(pfad, sha256=None):
+    """xlsx einlesen und Artefakt schreiben (atomar; ohne Schreibrecht nur im Speicher)."""
+    sha256 = sha256 or _sha256(pfad)
+    spalten = aufbereiten(lese_xlsx(pfad))
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            _speichern(f, spalten, sha256)
+        os.replace(tmp, cache_pfad(sha256))
+    except OSError:
+        pass
+    return Preisliste(spalten, pfad, sha256)
+
+
+@lru_cache(maxsize=4)
+def _laden(pfad, mtime_ns, groesse):
+    sha256 = _sha256(pfad)
+    try:
+        spalten = _lesen(cache_pfad(sha256), sha256)
+        if spalten is not None:
+            return Preisliste(spalten, pfad, sha256)
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        pass                               # fehlt, beschädigt oder enthält Objekte
+    return konvertieren(pfad, sha256)
+
+
+def preisliste(pfad=None):
+    """Preisliste aus Artefakt (bzw. einmalig aus der xlsx) oder None, wenn die Datei fehlt."""
+    pfad = os.path.abspath(pfad or PREISLISTE_DATEI)
+    try:
+        st = os.stat(pfad)
+    except OSError:
+        return None
+    return _laden(pfad, st.st_mtime_ns, st.st_size)
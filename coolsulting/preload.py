@@ -0,0 +1,204 @@
+# ============================================================================
+# DATEI: coolsulting/preload.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Warmstart und Startprofil für °central_STATION_PRO.
+#               Lädt schwere Pakete, Datendateien und App-Module nach dem
+#               Serverstart in einem Hintergrund-Thread vor und misst dabei
+#               jeden Schritt. Startprofil auf der Kommandozeile:
+#                   python -m coolsulting.preload --profile-startup
+# ============================================================================
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from coolsulting import assets, registry
+from coolsulting.paths import ROOT_DIR
+
+# Pakete in Ladereihenfolge (abhängige Pakete profitieren von den vorherigen)
+PAKETE = [
+    "numpy", "pandas", "PIL", "streamlit", "plotly.graph_objects",
+    "matplotlib.pyplot", "openpyxl", "reportlab.platypus", "fpdf", "docx",
+    "requests", "anthropic", "google.generativeai",
+]
+
+# Dateien, die jede Session braucht (Asset-Cache wird dabei gefüllt)
+DATEIEN = [
+    "POE Vetica UI.ttf",
+    "Coolsulting_Logo_ohneHG_weiß_grau.png",
+    "Coolsulting_Logo_ohneHG_outlines_weiß.png",
+    "Coolsulting_Logo_ohneHG_blau.png",
+]
+
+# Apps, deren Top-Level Daten lädt (coolMATH_PRO: Preisliste-XLSX)
+APPS = [
+    "coolMATH_PRO.py", "coolNEIGHBOR.py", "coolPOOL.py", "coolTEC.py",
+    "coolINDUTEC.py", "coolFLOW.py", "Waermepumpen_Auslegung.py",
+    "WP_Quick_Kalkulator.py", "Kältemittel_Füllmenge.py", "Samsung_Quint.py",
+    "coolRohr.py", "coolWIRE/coolWIRE_main.py",
+]
+
+
+# ============================================================
+# 1. MESSUNG
+# ============================================================
+def _messen(art, name, funktion):
+    """Führt ``funktion`` aus und liefert ein Mess-Dict (nie eine Exception)."""
+    t0 = time.perf_counter()
+    try:
+        detail = funktion() or ""
+        status = "ok"
+    except ImportError as e:
+        detail, status = str(e), "fehlt"
+    except Exception as e:
+        detail, status = f"{type(e).__name__}: {e}", "fehler"
+    return {"Art": art, "Name": name, "Zeit [ms]": round((time.perf_counter() - t0) * 1000, 1),
+            "Status": status, "Detail": str(detail)}
+
+
+def _importiere(name):
+    if name in sys.modules:
+        return "bereits geladen"
+    if name == "matplotlib.pyplot":
+        import matplotlib
+        matplotlib.use("Agg")   # Server ohne Display, wie in den Apps
+    importlib.import_module(name)
+
+
+def _datei(name):
+    pfad = os.path.join(ROOT_DIR, name)
+    if assets.b64(pfad) is None:
+        raise FileNotFoundError(pfad)
+    return f"{os.path.getsize(pfad) // 1024} kB"
+
+
+def _app(name):
+    """Kompiliert die App; Modul-Apps werden zusätzlich einmal geladen."""
+    app = registry.get_app(os.path.join(ROOT_DIR, name))
+    if app.modul_stil:
+        app._lade_modul()
+        return "Modul geladen"
+    return "kompiliert"
+
+
+def schritte():
+    """Alle Warmstart-Schritte als (Art, Name, Funktion)."""
+    liste = [("Paket", p, lambda p=p: _importiere(p)) for p in PAKETE]
+    liste += [("Datei", d, lambda d=d: _datei(d)) for d in DATEIEN]
+    liste += [("App", a, lambda a=a: _app(a)) for a in APPS
+              if os.path.exists(os.path.join(ROOT_DIR, a))]
+    return liste
+
+
+def vorladen(ergebnisse=None):
+    """Führt alle Schritte synchron aus und liefert die Messungen."""
+    ergebnisse = [] if ergebnisse is None else ergebnisse
+    for art, name, funktion in schritte():
+        ergebnisse.append(_messen(art, name, funktion))
+    return ergebnisse
+
+
+# ============================================================
+# 2. HINTERGRUND-THREAD (einmal pro Prozess)
+# ============================================================
+_LOCK = threading.Lock()
+_THREAD = None
+_MESSUNGEN = []
+_ZEITEN = {}
+
+
+def starte_hintergrund():
+    """Startet den Warmstart-Thread genau einmal pro Prozess.
+
+    Abschaltbar über ``CS_PRELOAD=0``. Die Registry-Locks sorgen dafür, dass
+    eine Session, die eine App parallel öffnet, nicht doppelt lädt.
+    """
+    global _THREAD
+    if os.environ.get("CS_PRELOAD", "1") == "0" or _THREAD is not None:
+        return _THREAD
+    with _LOCK:
+        if _THREAD is None:
+            def _lauf():
+                _ZEITEN["start"] = time.time()
+                vorladen(_MESSUNGEN)
+                _ZEITEN["ende"] = time.time()
+            _THREAD = threading.Thread(target=_lauf, name="cs-preload", daemon=True)
+            _THREAD.start()
+    return _THREAD
+
+
+def status():
+    """Stand des Warmstarts: fertig?, Gesamtzeit [s] und Messungen."""
+    fertig = "ende" in _ZEITEN
+    gesamt = (_ZEITEN.get("ende", time.time()) - _ZEITEN["start"]) if "start" in _ZEITEN else 0.0
+    return {"aktiv": _THREAD is not None, "fertig": fertig,
+            "gesamt_s": round(gesamt, 2), "messungen": list(_MESSUNGEN)}
+
+
+# ============================================================
+# 3. STARTPROFIL (Kommandozeile)
+# ============================================================
+def _isoliert(name):
+    """Kalter Import in einem frischen Interpreter (ohne Vorlauf anderer Pakete)."""
+    code = ("import sys, json; sys.path.insert(0, %r); import coolsulting.preload as p; "
+            "print(json.dumps(p._messen('Paket', %r, lambda: p._importiere(%r))))"
+            % (ROOT_DIR, name, name))
+    ausgabe = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    try:
+        return json.loads(ausgabe.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        return {"Art": "Paket", "Name": name, "Zeit [ms]": 0.0, "Status": "fehler",
+                "Detail": ausgabe.stderr.strip().splitlines()[-1] if ausgabe.stderr.strip() else ""}
+
+
+def bericht_text(messungen):
+    """Tabellarischer Textbericht, langsamste Schritte zuerst."""
+    zeilen = [f"{'Art':<6} {'Name':<48} {'Zeit [ms]':>10}  Status  Detail", "-" * 90]
+    for m in sorted(messungen, key=lambda m: -m["Zeit [ms]"]):
+        zeilen.append(f"{m['Art']:<6} {m['Name'][:48]:<48} {m['Zeit [ms]']:>10.1f}  "
+                      f"{m['Status']:<7} {m['Detail'][:60]}")
+    summe = {}
+    for m in messungen:
+        summe[m["Art"]] = summe.get(m["Art"], 0.0) + m["Zeit [ms]"]
+    zeilen.append("-" * 90)
+    zeilen += [f"Summe {art:<6} {ms:>10.1f} ms" for art, ms in summe.items()]
+    zeilen.append(f"Gesamt       {sum(summe.values()):>10.1f} ms")
+    return "\n".join(zeilen)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m coolsulting.preload",
+        description="Warmstart von °central_STATION_PRO vorladen und messen.")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Startprofil ausgeben (Importzeit je Paket, Ladezeit je Datei/App)")
+    parser.add_argument("--isoliert", action="store_true",
+                        help="Pakete jeweils in frischem Interpreter messen (kalte Einzelzeiten)")
+    parser.add_argument("--json", action="store_true", help="Messungen als JSON ausgeben")
+    args = parser.parse_args(argv)
+
+    if args.isoliert:
+        messungen = [_isoliert(p) for p in PAKETE]
+        messungen += [_messen(art, name, f) for art, name, f in schritte() if art != "Paket"]
+    else:
+        messungen = vorladen()
+
+    if args.json:
+        print(json.dumps(messungen, ensure_ascii=False, indent=2))
+    elif args.profile_startup or args.isoliert:
+        print(bericht_text(messungen))
+    else:
+        fehler = [m for m in messungen if m["Status"] != "ok"]
+        print(f"{len(messungen)} Schritte vorgeladen, {len(fehler)} ohne Erfolg.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
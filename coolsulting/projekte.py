@@ -0,0 +1,228 @@
+# ============================================================================
+# DATEI: coolsulting/projekte.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Projektspeicher für coolMATH PRO (SQLite). Verbindungen
+#               kommen aus einem Pool je Datenbankdatei und Prozess statt
+#               einer neuen, nie geschlossenen Verbindung je Aufruf:
+#               WAL-Journal (Lesen blockiert Schreiben nicht), Busy-Timeout
+#               bei gleichzeitigen Sessions, Schema-Migration einmal je
+#               Prozess (PRAGMA user_version), Schließen bei Prozessende.
+#
+#   speichern(firma, username, projekt, ...) -> projekt_id
+#   projekte(firma, role)                    -> [(projekt_id, firma, projekt, kunde, bearbeiter, datum)]
+#   projekt(projekt_id)                      -> Zeile (Tupel) | None
+# ============================================================================
+
+import atexit
+import json
+import os
+import queue
+import secrets
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from coolsulting.paths import ROOT_DIR
+from coolsulting.trace import traced
+
+DB_PATH = os.environ.get("CS_PROJEKTE_DB", os.path.join(ROOT_DIR, "coolmath_projects.db"))
+BUSY_TIMEOUT = 5.0        # s Warten auf Schreibsperre anderer Sessions
+POOL_GROESSE = 8          # ruhende Verbindungen je Datei (mehr werden nach Gebrauch geschlossen)
+
+# Schema-Stände; Index i hebt PRAGMA user_version von i auf i + 1.
+# Stand 1 = bisherige Tabelle (CREATE IF NOT EXISTS: bestehende Dateien bleiben gültig).
+MIGRATIONEN = [
+    """
+    CREATE TABLE IF NOT EXISTS coolmath_projects (
+        id          INTEGER PRIMARY KEY AUTOINCREMENT,
+        projekt_id  TEXT UNIQUE,
+        firma       TEXT,
+        username    TEXT,
+        projekt     TEXT,
+        kunde       TEXT,
+        bearbeiter  TEXT,
+        datum       TEXT,
+        room_data   TEXT,
+        results     TEXT,
+        devices     TEXT,
+        monday_id   TEXT,
+        created_at  TEXT
+    );
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_projects_firma   ON coolmath_projects(firma, created_at);
+    CREATE INDEX IF NOT EXISTS idx_projects_created ON coolmath_projects(created_at);
+    """,
+]
+
+
+# ============================================================
+# 1. VERBINDUNGSPOOL
+# ============================================================
+class Verbindungspool:
+    """Wiederverwendbare Verbindungen zu einer SQLite-Datei (threadsicher).
+
+    ``with pool.verbindung() as conn:`` leiht eine Verbindung aus; am Ende
+    des Blocks wird committet (bei Fehler zurückgerollt) und die Verbindung
+    zurückgegeben. Höchstens ``groesse`` Verbindungen bleiben offen.
+    """
+
+    def __init__(self, db_path, groesse=POOL_GROESSE, timeout=BUSY_TIMEOUT):
+        self.db_path = db_path
+        self.timeout = timeout
+        self._frei = queue.LifoQueue(maxsize=groesse)
+        self._lock = threading.Lock()
+        self._geschlossen = False
+        self.geoeffnet = 0           # Verbindungen insgesamt geöffnet (Kennzahl)
+        self.offen = 0               # aktuell offen (frei + ausgeliehen)
+        conn = self._neu()
+        self._migrieren(conn)
+        self._zurueck(conn)
+
+    def _neu(self):
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        try:
+            conn.execute(f"PRAGMA busy_timeout = {int(self.timeout * 1000)}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")      # mit WAL absturzsicher
+        except Exception:
+            conn.close()
+            raise
+        with self._lock:
+            self.geoeffnet += 1
+            self.offen += 1
+        return conn
+
+    def _migrieren(self, conn):
+        stand = conn.execute("PRAGMA user_version").fetchone()[0]
+        for nummer in range(stand, len(MIGRATIONEN)):
+            conn.execute("BEGIN IMMEDIATE")                  # andere Prozesse warten
+            if conn.execute("PRAGMA user_version").fetchone()[0] != nummer:
+                conn.rollback()                              # schon von anderem Prozess migriert
+                continue
+            for befehl in MIGRATIONEN[nummer].split(";"):
+                if befehl.strip():
+                    conn.execute(befehl)
+            conn.execute(f"PRAGMA user_version = {nummer + 1}")
+            conn.commit()
+
+    def _schliessen(self, conn):
+        conn.close()
+        with self._lock:
+            self.offen -= 1
+
+    def _zurueck(self, conn):
+        if self._geschlossen:
+            self._schliessen(conn)
+            return
+        try:
+            self._frei.put_nowait(conn)
+        except queue.Full:
+            self._schliessen(conn)
+
+    @contextmanager
+    def verbindung(self):
+        if self._geschlossen:
+            raise RuntimeError(f"Verbindungspool {self.db_path} ist geschlossen")
+        try:
+            conn = self._frei.get_nowait()
+        except queue.Empty:
+            conn = self._neu()
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._zurueck(conn)
+
+    def schliessen(self):
+        """Ruhende Verbindungen schließen; ausgeliehene schließen bei Rückgabe."""
+        self._geschlossen = True
+        while True:
+            try:
+                self._schliessen(self._frei.get_nowait())
+            except queue.Empty:
+                break
+
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def pool(db_path=None):
+    """Verbindungspool je Datenbankdatei, einmal je Prozess (inkl. Migration)."""
+    db_path = os.path.abspath(db_path or DB_PATH)
+    p = _POOLS.get(db_path)
+    if p is None:
+        with _POOLS_LOCK:
+            p = _POOLS.get(db_path)
+            if p is None:
+                p = _POOLS[db_path] = Verbindungspool(db_path)
+    return p
+
+
+def schliessen(db_path=None):
+    """Pool einer Datei (ohne Angabe: alle) schließen; nächster Zugriff öffnet neu."""
+    with _POOLS_LOCK:
+        pfade = [os.path.abspath(db_path)] if db_path else list(_POOLS)
+        for pfad in pfade:
+            p = _POOLS.pop(pfad, None)
+            if p is not None:
+                p.schliessen()
+
+
+atexit.register(schliessen)
+
+
+# ============================================================
+# 2. PROJEKTE
+# ============================================================
+@traced("db.coolmath.save_project")
+def speichern(firma, username, projekt_name, kunde, bearbeiter, room_data, results, devices,
+              db_path=None):
+    """Projekt speichern (room_data/results/devices als JSON) -> projekt_id."""
+    jetzt = datetime.now()
+    pid = secrets.token_hex(6)
+    with pool(db_path).verbindung() as conn:
+        conn.execute("""
+            INSERT OR REPLACE INTO coolmath_projects
+            (projekt_id, firma, username, projekt, kunde, bearbeiter, datum,
+             room_data, results, devices, created_at)
+            VALUES (?,?,?,?,?,?,?,?,?,?,?)""", (
+            pid, firma, username, projekt_name, kunde, bearbeiter,
+            jetzt.strftime("%d.%m.%Y %H:%M"),
+            json.dumps(room_data, ensure_ascii=False),
+            json.dumps(results, ensure_ascii=False),
+            json.dumps(devices, ensure_ascii=False),
+            jetzt.isoformat()))
+    return pid
+
+
+@traced("db.coolmath.load_projects")
+def projekte(firma, role="partner", db_path=None):
+    """Projektliste (neueste zuerst). Admin sieht alle, Partner nur eigene Firma."""
+    sql = "SELECT projekt_id,firma,projekt,kunde,bearbeiter,datum FROM coolmath_projects"
+    with pool(db_path).verbindung() as conn:
+        if role == "admin":
+            return conn.execute(sql + " ORDER BY created_at DESC").fetchall()
+        return conn.execute(sql + " WHERE firma=? ORDER BY created_at DESC", (firma,)).fetchall()
+
+
+@traced("db.coolmath.load_project")
+def projekt(projekt_id, db_path=None):
+    """Ein Projekt vollständig (Zeile wie SELECT *) oder None."""
+    with pool(db_path).verbindung() as conn:
+        return conn.execute("SELECT * FROM coolmath_projects WHERE projekt_id=?",
+                            (projekt_id,)).fetchone()
+
+
+@traced("db.coolmath.update_monday_id")
+def monday_id_setzen(projekt_id, monday_id, db_path=None):
+    with pool(db_path).verbindung() as conn:
+        conn.execute("UPDATE coolmath_projects SET monday_id=? WHERE projekt_id=?",
+                     (monday_id, projekt_id))
@@ -0,0 +1,237 @@
+# ============================================================================
+# DATEI: coolsulting/registry.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Modul-Registry für die Unter-Apps von °central_STATION_PRO.
+#               Jede App wird EINMAL gelesen und kompiliert (Cache pro Pfad +
+#               mtime) und erst bei einer Dateiänderung neu übersetzt.
+#               Jede App läuft in ihrem eigenen Namespace; pro App wird ein
+#               einfacher Speicherbericht geführt.
+# ============================================================================
+
+import ast
+import builtins
+import os
+import sys
+import threading
+import types
+
+from coolsulting import paths as _paths
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# ============================================================
+# 1. AST-TRANSFORMATION
+# ============================================================
+class _StripPageConfig(ast.NodeTransformer):
+    """Ersetzt jeden Aufruf ``st.set_page_config(...)`` durch ``pass``.
+
+    Ersetzt das frühere Regex-Patchen des Quelltextes – mehrzeilige
+    Aufrufe und Klammern in Argumenten sind damit kein Problem mehr.
+    """
+
+    def visit_Expr(self, node):
+        call = node.value
+        if (isinstance(call, ast.Call)
+                and isinstance(call.func, ast.Attribute)
+                and call.func.attr == "set_page_config"):
+            return ast.copy_location(ast.Pass(), node)
+        return node
+
+
+def _ist_modul_stil(tree):
+    """True, wenn die App ``def main()`` plus ``if __name__ == '__main__'`` hat.
+
+    Solche Apps werden wie ein Modul geladen (Top-Level einmal ausführen)
+    und pro Rerun nur noch über ``main()`` gerendert.
+    """
+    hat_main = False
+    hat_guard = False
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "main":
+            hat_main = True
+        elif isinstance(node, ast.If):
+            test = node.test
+            if (isinstance(test, ast.Compare)
+                    and isinstance(test.left, ast.Name)
+                    and test.left.id == "__name__"):
+                hat_guard = True
+    return hat_main and hat_guard
+
+
+# ============================================================
+# 2. SPEICHER-MESSUNG
+# ============================================================
+def rss_kb():
+    """Aktueller Resident Set Size des Prozesses in kB (oder None).
+
+    Reihenfolge: psutil → /proc/self/statm (Linux) → ru_maxrss (Peak).
+    """
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss // 1024
+    try:
+        with open("/proc/self/statm") as f:
+            seiten = int(f.read().split()[1])
+        return seiten * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:
+        return None
+
+
+def _top_pakete():
+    return {name.split(".", 1)[0] for name in list(sys.modules)}
+
+
+# ============================================================
+# 3. APP-EINTRAG
+# ============================================================
+class AppModule:
+    """Kompilierte Unter-App inkl. ``render()``-Einstiegspunkt."""
+
+    def __init__(self, path, code, modul_stil, stempel):
+        self.path = path
+        self.app_dir = os.path.dirname(path)
+        self.name = os.path.splitext(os.path.basename(path))[0]
+        self.paths = _paths.fuer_datei(path)
+        self.code = code
+        self.modul_stil = modul_stil
+        self.stempel = stempel
+        self.modul = None
+        self._lade_lock = threading.Lock()
+        # Speicherbericht (prozessweit gemessen → Näherung bei vielen Sessions)
+        self.renders = 0
+        self.rss_delta_kb = 0
+        self.rss_delta_max_kb = 0
+        self.namen = 0
+        self.pakete = set()
+
+    def _lade_modul(self):
+        """Führt den Top-Level der App genau einmal aus (wie ein Import)."""
+        with self._lade_lock:
+            if self.modul is None:
+                mod_name = f"_csapp_{self.name}"
+                mod = types.ModuleType(mod_name)
+                mod.__file__ = self.path
+                mod.__app_paths__ = self.paths
+                # Unter eigenem Namen registrieren (pickle/dataclasses)
+                sys.modules[mod_name] = mod
+                exec(self.code, mod.__dict__)
+                self.modul = mod
+        return self.modul
+
+    def _neuer_namespace(self):
+        return {"__name__": "__main__", "__file__": self.path,
+                "__app_paths__": self.paths, "__builtins__": builtins}
+
+    def render(self):
+        """Rendert die App für den aktuellen Streamlit-Rerun.
+
+        Jede App bekommt ``__app_paths__`` (``coolsulting.paths.AppPaths``)
+        für app-relative Dateien – das Arbeitsverzeichnis bleibt unberührt.
+        Modul-Apps: ``main()`` des einmalig geladenen Moduls aufrufen.
+        Script-Apps: gecachtes Code-Objekt in einem frischen, nur für diese
+        App bestimmten Namespace ausführen (nach dem Rerun freigegeben,
+        sofern keine Callbacks ihn noch referenzieren).
+        """
+        _paths.sys_path_einmal(self.app_dir)
+        rss_vor = rss_kb()
+        pakete_vor = _top_pakete()
+        try:
+            if self.modul_stil:
+                mod = self._lade_modul()
+                mod.main()
+                self.namen = len(mod.__dict__)
+            else:
+                namespace = self._neuer_namespace()
+                try:
+                    exec(self.code, namespace)
+                finally:
+                    self.namen = len(namespace)
+        finally:
+            self.renders += 1
+            self.pakete |= _top_pakete() - pakete_vor
+            rss_nach = rss_kb()
+            if rss_vor is not None and rss_nach is not None:
+                self.rss_delta_kb = rss_nach - rss_vor
+                self.rss_delta_max_kb = max(self.rss_delta_max_kb, self.rss_delta_kb)
+
+
+# ============================================================
+# 4. REGISTRY
+# ============================================================
+_APPS = {}
+_LOCK = threading.Lock()
+
+
+def _datei_stempel(path):
+    st_ = os.stat(path)
+    return (st_.st_mtime_ns, st_.st_size)
+
+
+def _kompiliere(path, stempel):
+    with open(path, "r", encoding="utf-8") as f:
+        quelltext = f.read()
+    tree = ast.parse(quelltext, filename=path)
+    modul_stil = _ist_modul_stil(tree)
+    tree = ast.fix_missing_locations(_StripPageConfig().visit(tree))
+    code = compile(tree, path, "exec")
+    return AppModule(path, code, modul_stil, stempel)
+
+
+def get_app(file_path):
+    """Liefert den (gecachten) ``AppModule``-Eintrag zu einer App-Datei.
+
+    Neu kompiliert wird nur, wenn sich mtime oder Größe geändert haben.
+    Wirft ``FileNotFoundError``, wenn die Datei nicht existiert.
+    """
+    path = os.path.abspath(file_path)
+    stempel = _datei_stempel(path)
+    app = _APPS.get(path)
+    if app is not None and app.stempel == stempel:
+        return app
+    with _LOCK:
+        app = _APPS.get(path)
+        if app is None or app.stempel != stempel:
+            app = _kompiliere(path, stempel)
+            _APPS[path] = app
+    return app
+
+
+def render(file_path):
+    """Kurzform: App holen und rendern."""
+    get_app(file_path).render()
+
+
+def cache_info():
+    """Übersicht der kompilierten Apps (für Diagnose/Admin)."""
+    return [
+        {"app": a.name, "pfad": a.path, "modul_stil": a.modul_stil,
+         "geladen": a.modul is not None}
+        for a in _APPS.values()
+    ]
+
+
+def speicher_bericht():
+    """Speicherbericht pro App (RSS-Deltas, Namespace-Größe, nachgeladene Pakete).
+
+    Die RSS-Werte sind prozessweit gemessen und damit bei parallelen
+    Sessions nur eine Näherung – Trends sind aber gut erkennbar.
+    """
+    return [
+        {"App": a.name,
+         "Renders": a.renders,
+         "RSS Δ letzter Lauf [kB]": a.rss_delta_kb,
+         "RSS Δ max [kB]": a.rss_delta_max_kb,
+         "Namen im Namespace": a.namen,
+         "Nachgeladene Pakete": ", ".join(sorted(a.pakete)) or "–"}
+        for a in sorted(_APPS.values(), key=lambda a: a.name)
+    ]
@@ -0,0 +1,215 @@
+# ============================================================================
+# DATEI: coolsulting/trace.py
+# VERSION: 1.0.0
+# STAND: 17.10.2026
+# AUTOR: Michael Schäpers, coolsulting
+# BESCHREIBUNG: Leichtgewichtiges Tracing für °central_STATION_PRO.
+#               Spans als Context-Manager (``with span("…")``) oder Dekorator
+#               (``@traced("…")``), verschachtelt je Thread – ein Streamlit-
+#               Rerun ist damit ein Span-Baum. Pro Span-Name werden die
+#               letzten Dauern für p50/p95 gehalten.
+#               Getraced werden nur grobe Einstiegspunkte (Zonenberechnung,
+#               Berichte, DB, HTTP, run_app) – keine Hilfsfunktionen im
+#               µs-Bereich, die je Zone laufen (Overhead ~10 µs je Span,
+#               Wurzelbäume verdrängen sonst die Rerun-Bäume).
+#
+#   CS_TRACE=0            Tracing komplett aus (Dekoratoren liefern die
+#                         Originalfunktion zurück)
+#   CS_TRACE_JSONL=pfad   Jeden abgeschlossenen Baum als JSON-Zeile anhängen
+#
+#   Prometheus-Text: prometheus_text() (Admin-Panel, GET /metrics der API)
+# ============================================================================
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+AKTIV = os.environ.get("CS_TRACE", "1") != "0"
+JSONL_PATH = os.environ.get("CS_TRACE_JSONL")
+
+FENSTER = 2000        # Dauern je Span-Name für p50/p95
+MAX_BAEUME = 50       # zuletzt abgeschlossene Span-Bäume
+MAX_KINDER = 100      # Kind-Spans je Span im Baum (Rest nur gezählt)
+
+
+class Span:
+    """Ein gemessener Abschnitt mit Kind-Spans."""
+
+    __slots__ = ("name", "attrs", "start", "dauer_ms", "kinder", "ausgelassen", "fehler")
+
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = attrs
+        self.start = time.time()
+        self.dauer_ms = 0.0
+        self.kinder = []
+        self.ausgelassen = 0
+        self.fehler = None
+
+    def als_dict(self):
+        d = {"name": self.name, "start": round(self.start, 3),
+             "dauer_ms": round(self.dauer_ms, 3)}
+        if self.attrs:
+            d["attrs"] = self.attrs
+        if self.fehler:
+            d["fehler"] = self.fehler
+        if self.kinder:
+            d["kinder"] = [k.als_dict() for k in self.kinder]
+        if self.ausgelassen:
+            d["ausgelassen"] = self.ausgelassen
+        return d
+
+
+_lokal = threading.local()
+_LOCK = threading.Lock()
+_DAUERN = {}          # name -> deque(ms)
+_SUMMEN = {}          # name -> [anzahl, summe_ms] (kumulativ, für Prometheus)
+_BAEUME = deque(maxlen=MAX_BAEUME)
+
+
+def _stapel():
+    stapel = getattr(_lokal, "stapel", None)
+    if stapel is None:
+        stapel = _lokal.stapel = []
+    return stapel
+
+
+def _erfassen(s):
+    with _LOCK:
+        dauern = _DAUERN.get(s.name)
+        if dauern is None:
+            dauern = _DAUERN[s.name] = deque(maxlen=FENSTER)
+            _SUMMEN[s.name] = [0, 0.0]
+        dauern.append(s.dauer_ms)
+        summe = _SUMMEN[s.name]
+        summe[0] += 1
+        summe[1] += s.dauer_ms
+
+
+def _abschliessen(wurzel):
+    """Wurzel-Span fertig: Baum merken und optional als JSONL exportieren."""
+    eintrag = {"ts": datetime.now().isoformat(timespec="milliseconds"),
+               "thread": threading.current_thread().name, "baum": wurzel.als_dict()}
+    with _LOCK:
+        _BAEUME.append(eintrag)
+        if JSONL_PATH:
+            try:
+                with open(JSONL_PATH, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(eintrag, ensure_ascii=False, default=str) + "\n")
+            except OSError:
+                pass   # Export darf die App nie stören
+
+
+# ============================================================
+# 1. SPANS
+# ============================================================
+@contextmanager
+def span(name, **attrs):
+    """Misst den ``with``-Block als Span (Kind des aktuell offenen Spans)."""
+    if not AKTIV:
+        yield None
+        return
+    s = Span(name, attrs)
+    stapel = _stapel()
+    if stapel:
+        eltern = stapel[-1]
+        if len(eltern.kinder) < MAX_KINDER:
+            eltern.kinder.append(s)
+        else:
+            eltern.ausgelassen += 1   # Statistik zählt trotzdem mit
+    stapel.append(s)
+    t0 = time.perf_counter()
+    try:
+        yield s
+    except BaseException as e:
+        s.fehler = type(e).__name__
+        raise
+    finally:
+        s.dauer_ms = (time.perf_counter() - t0) * 1000
+        stapel.pop()
+        _erfassen(s)
+        if not stapel:
+            _abschliessen(s)
+
+
+def traced(name=None):
+    """Dekorator: jeder Aufruf der Funktion wird ein Span.
+
+    Ohne Namen: ``<letzter Modulteil>.<Funktionsname>``.
+    """
+    def deko(funktion):
+        if not AKTIV:
+            return funktion
+        span_name = name or f"{funktion.__module__.rsplit('.', 1)[-1]}.{funktion.__qualname__}"
+
+        @functools.wraps(funktion)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return funktion(*args, **kwargs)
+        return wrapper
+    return deko
+
+
+# ============================================================
+# 2. AUSWERTUNG
+# ============================================================
+def _perzentil(sortiert, p):
+    return sortiert[min(len(sortiert) - 1, int(len(sortiert) * p))]
+
+
+def statistik():
+    """p50/p95/max je Span-Name (gleitendes Fenster), langsamste p95 zuerst."""
+    with _LOCK:
+        daten = {n: (sorted(d), _SUMMEN[n][0]) for n, d in _DAUERN.items() if d}
+    zeilen = [{"Span": n, "Anzahl": anzahl,
+               "p50 [ms]": round(_perzentil(d, 0.50), 2),
+               "p95 [ms]": round(_perzentil(d, 0.95), 2),
+               "max [ms]": round(d[-1], 2)}
+              for n, (d, anzahl) in daten.items()]
+    return sorted(zeilen, key=lambda z: -z["p95 [ms]"])
+
+
+def letzte_baeume(anzahl=10):
+    """Die zuletzt abgeschlossenen Span-Bäume (neueste zuerst)."""
+    with _LOCK:
+        return list(_BAEUME)[::-1][:anzahl]
+
+
+def baum_text(baum, tiefe=0):
+    """Span-Baum (dict) als eingerückter Text."""
+    attrs = " ".join(f"{k}={v}" for k, v in baum.get("attrs", {}).items())
+    fehler = f"  !{baum['fehler']}" if baum.get("fehler") else ""
+    zeilen = [f"{'  ' * tiefe}{baum['dauer_ms']:>9.1f} ms  {baum['name']} {attrs}".rstrip() + fehler]
+    for kind in baum.get("kinder", []):
+        zeilen.append(baum_text(kind, tiefe + 1))
+    if baum.get("ausgelassen"):
+        zeilen.append(f"{'  ' * (tiefe + 1)}… {baum['ausgelassen']} weitere Spans")
+    return "\n".join(zeilen)
+
+
+def prometheus_text():
+    """Metriken im Prometheus-Textformat (Summary je Span-Name)."""
+    zeilen = ["# HELP cs_span_dauer_sekunden Dauer je Span (Quantile über gleitendes Fenster)",
+              "# TYPE cs_span_dauer_sekunden summary"]
+    with _LOCK:
+        daten = {n: (sorted(d), list(_SUMMEN[n])) for n, d in _DAUERN.items() if d}
+    for n, (d, (anzahl, summe)) in sorted(daten.items()):
+        label = n.replace("\\", "\\\\").replace('"', '\\"')
+        for q in (0.5, 0.95):
+            zeilen.append(f'cs_span_dauer_sekunden{{span="{label}",quantile="{q}"}} '
+                          f"{_perzentil(d, q) / 1000:.6f}")
+        zeilen.append(f'cs_span_dauer_sekunden_count{{span="{label}"}} {anzahl}')
+        zeilen.append(f'cs_span_dauer_sekunden_sum{{span="{label}"}} {summe / 1000:.6f}')
+    return "\n".join(zeilen) + "\n"
+
+
+def zuruecksetzen():
+    with _LOCK:
+        _DAUERN.clear()
+        _SUMMEN.clear()
+        _BAEUME.clear()